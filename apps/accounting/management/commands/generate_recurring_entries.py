@@ -0,0 +1,74 @@
+"""Management command to generate journal entries from recurring templates."""
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.tenants.models import Tenant
+from apps.accounting.services import RecurringEntryGenerator
+from shared.managers import set_current_tenant
+
+
+def _date(value):
+    parsed = parse_date(value)
+    if parsed is None:
+        raise CommandError(f"Invalid date '{value}' (expected YYYY-MM-DD)")
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate every due occurrence of the active recurring journal templates, '
+        'in bulk. Safe to re-run: occurrences already generated are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--through-date', type=_date, default=None,
+            help='Generate occurrences due on or before this date (YYYY-MM-DD, default today)',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='List the entries that would be generated without writing anything',
+        )
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        tenants = Tenant.objects.filter(is_active=True)
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total = total_failed = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            result = RecurringEntryGenerator(tenant).run(options['through_date'], dry_run=dry_run)
+            if not (result.occurrences or result.skipped or result.failed or result.deactivated):
+                continue
+
+            verb = 'Would generate' if dry_run else 'Generated'
+            self.stdout.write(
+                f"  {tenant.name}: {verb} {len(result.occurrences)}, "
+                f"already generated {len(result.skipped)}, failed {len(result.failed)}"
+            )
+            if dry_run:
+                for occurrence in result.occurrences:
+                    mode = 'post' if occurrence.template.auto_post else 'draft'
+                    self.stdout.write(
+                        f"    {occurrence.entry_date}  {occurrence.template.name}  "
+                        f"{occurrence.amount}  ({mode})"
+                    )
+            for template in result.deactivated:
+                state = 'would be deactivated' if dry_run else 'deactivated'
+                self.stdout.write(f"    {template.name}: past end date, {state}")
+            for failure in result.failed:
+                self.stdout.write(self.style.WARNING(f"    {failure['template']}: {failure['error']}"))
+            total += len(result.occurrences)
+            total_failed += len(result.failed)
+
+        style = self.style.WARNING if total_failed else self.style.SUCCESS
+        if dry_run:
+            self.stdout.write(style(f"Done. Dry run: {total} entries would be generated."))
+        else:
+            self.stdout.write(style(f"Done. Generated {total} entries, {total_failed} templates failed."))
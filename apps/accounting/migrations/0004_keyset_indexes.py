@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0003_accountingsettings_default_grir_account'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='journalentry',
+            name='accounting__tenant__e6ad26_idx',
+        ),
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['tenant', 'date', 'entry_number'], name='accounting__tenant__e06acc_idx'),
+        ),
+    ]
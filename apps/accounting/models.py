@@ -22,7 +22,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 
 from shared.models import TenantMixin, TimestampMixin
 
@@ -145,7 +145,7 @@ class Account(TenantMixin, TimestampMixin):
     entity_id = models.PositiveIntegerField(null=True, blank=True)
     entity = GenericForeignKey('entity_type', 'entity_id')
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         ordering = ['code']
@@ -342,14 +342,14 @@ class JournalEntry(TenantMixin, TimestampMixin):
         help_text="User who created this entry"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         ordering = ['-date', '-entry_number']
         unique_together = [('tenant', 'entry_number')]
         indexes = [
             models.Index(fields=['tenant', 'entry_number']),
-            models.Index(fields=['tenant', 'date']),
+            models.Index(fields=['tenant', 'date', 'entry_number']),
             models.Index(fields=['tenant', 'status']),
             models.Index(fields=['tenant', 'entry_type']),
             models.Index(fields=['source_type', 'source_id']),
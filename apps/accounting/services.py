@@ -23,11 +23,12 @@ Usage:
 
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Dict, Optional, Union, Any
-from dataclasses import dataclass
+from typing import Iterable, List, Dict, Optional, Union, Any, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 
 from django.db import transaction
-from django.db.models import Sum, Q
+from django.db.models import Prefetch, Sum, Q
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.contrib.contenttypes.models import ContentType
@@ -45,6 +46,7 @@ from .models import (
     CREDIT_NORMAL_TYPES,
 )
 from apps.tenants.models import Tenant, TenantSequence
+from shared.history import bulk_create_with_history
 
 
 # ─── Data Classes ───────────────────────────────────────────────────────────────
@@ -58,6 +60,7 @@ class EntryLineInput:
     debit: Decimal = Decimal('0.00')
     credit: Decimal = Decimal('0.00')
     entity: Optional[Any] = None  # For sub-ledger tracking
+    account: Optional[Account] = None  # Already-loaded account; skips the lookup
 
 
 @dataclass
@@ -73,6 +76,24 @@ class AccountBalanceResult:
 
 # ─── Exceptions ─────────────────────────────────────────────────────────────────
 
+@dataclass
+class RecurringOccurrence:
+    """One journal entry a recurring template is due to produce."""
+    template: RecurringEntryTemplate
+    entry_date: date
+    amount: Decimal
+
+
+@dataclass
+class RecurringRunResult:
+    """Outcome of RecurringEntryGenerator.run (or its dry-run preview)."""
+    occurrences: list = field(default_factory=list)   # RecurringOccurrence to generate
+    skipped: list = field(default_factory=list)       # RecurringOccurrence already generated
+    failed: list = field(default_factory=list)        # {'template': name, 'error': message}
+    deactivated: list = field(default_factory=list)   # templates past their end_date
+    entries: list = field(default_factory=list)       # JournalEntry rows created
+
+
 class AccountingError(Exception):
     """Base exception for accounting errors."""
     pass
@@ -105,6 +126,283 @@ class ClosedPeriodError(AccountingError):
     pass
 
 
+# ─── GL Posting Engine ──────────────────────────────────────────────────────────
+
+class GLPostingEngine:
+    """
+    Shared write path for journal entries.
+
+    Every module that posts to the GL goes through here, so an entry costs a
+    fixed number of queries however many lines it has: all referenced
+    accounts are resolved in one query, the lines are inserted with one
+    bulk_create, and AccountBalance is updated in one pass.
+
+    Usage:
+        engine = GLPostingEngine(tenant, user)
+        entry = engine.post(
+            entry_date=invoice.invoice_date,
+            memo=f"Invoice {invoice.invoice_number}",
+            lines=[
+                EntryLineInput(account=ar_account, debit=invoice.total_amount),
+                EntryLineInput(account=income_account, credit=invoice.total_amount),
+            ],
+            number_prefix='INV',
+            source_document=invoice,
+        )
+    """
+
+    def __init__(self, tenant: Tenant, user=None):
+        self.tenant = tenant
+        self.user = user
+
+    @transaction.atomic
+    def post(
+        self,
+        entry_date: date,
+        memo: str,
+        lines: List[Union[EntryLineInput, Dict]],
+        reference_number: str = '',
+        entry_type: str = JournalEntry.EntryType.STANDARD,
+        source_document: Optional[Any] = None,
+        number_prefix: str = '',
+        entry_number: str = '',
+    ) -> JournalEntry:
+        """
+        Create a journal entry in POSTED status with its lines and balances.
+
+        Args:
+            entry_date: Date of the transaction
+            memo: Description of the entry
+            lines: Line specs (dicts or EntryLineInput objects)
+            reference_number: External reference (invoice #, check #, etc.)
+            entry_type: Type classification (standard, adjusting, etc.)
+            source_document: Optional source document (Invoice, Payment, etc.)
+            number_prefix: Prefix for the entry number, e.g. 'INV' -> 'INV-JE-000042'
+            entry_number: Explicit entry number (e.g. '<original>-VOID' for a
+                reversal); skips the JE sequence
+
+        Returns:
+            JournalEntry: The posted entry
+
+        Raises:
+            UnbalancedEntryError: If debits don't equal credits
+            InactiveAccountError: If a line posts to an inactive account
+            ClosedPeriodError: If the entry date falls in a closed period
+        """
+        lines = self.normalize_lines(lines)
+        total_debit = sum(line.debit for line in lines)
+        total_credit = sum(line.credit for line in lines)
+        if total_debit != total_credit:
+            raise UnbalancedEntryError(total_debit, total_credit)
+
+        accounts = self.resolve_accounts(lines)
+        inactive = sorted({account.code for account in accounts if not account.is_active})
+        if inactive:
+            raise InactiveAccountError(
+                f"Cannot post with inactive accounts: {', '.join(inactive)}"
+            )
+
+        fiscal_period = self.get_fiscal_period(entry_date)
+        if fiscal_period and fiscal_period.status == FiscalPeriod.PeriodStatus.CLOSED:
+            raise ClosedPeriodError(
+                f"Cannot post to closed period {fiscal_period.name}."
+            )
+
+        now = timezone.now()
+        entry = JournalEntry.objects.create(
+            tenant=self.tenant,
+            entry_number=entry_number or self.next_entry_number(number_prefix),
+            date=entry_date,
+            memo=memo,
+            reference_number=reference_number or '',
+            entry_type=entry_type,
+            fiscal_period=fiscal_period,
+            status=JournalEntry.EntryStatus.POSTED,
+            source_type=ContentType.objects.get_for_model(source_document) if source_document else None,
+            source_id=source_document.pk if source_document else None,
+            posted_at=now,
+            posted_by=self.user,
+            created_by=self.user,
+        )
+        self.create_lines(entry, lines, accounts)
+        self.update_balances(
+            fiscal_period,
+            [(account, line.debit, line.credit) for account, line in zip(accounts, lines)],
+        )
+        return entry
+
+    def normalize_lines(
+        self,
+        lines: List[Union[EntryLineInput, Dict]]
+    ) -> List[EntryLineInput]:
+        """Convert line specs to EntryLineInput with amounts rounded to cents."""
+        normalized = []
+        for line in lines:
+            if isinstance(line, dict):
+                line = EntryLineInput(
+                    account_code=line.get('account_code'),
+                    account_id=line.get('account_id'),
+                    description=line.get('description', ''),
+                    debit=Decimal(str(line.get('debit') or 0)),
+                    credit=Decimal(str(line.get('credit') or 0)),
+                    entity=line.get('entity'),
+                    account=line.get('account'),
+                )
+            normalized.append(replace(
+                line,
+                debit=_to_cents(line.debit),
+                credit=_to_cents(line.credit),
+            ))
+        return normalized
+
+    def resolve_accounts(self, lines: List[EntryLineInput]) -> List[Account]:
+        """
+        Return the Account for each line, loading any not already attached
+        to a line in a single query.
+
+        Raises:
+            ValidationError: If a line has no account reference
+            Account.DoesNotExist: If a referenced account doesn't exist
+        """
+        ids, codes = set(), set()
+        for line in lines:
+            if line.account is not None:
+                continue
+            if line.account_id:
+                ids.add(line.account_id)
+            elif line.account_code:
+                codes.add(line.account_code)
+            else:
+                raise ValidationError("Line must have account_id or account_code")
+
+        by_id, by_code = {}, {}
+        if ids or codes:
+            for account in Account.objects.filter(tenant=self.tenant).filter(
+                Q(id__in=ids) | Q(code__in=codes)
+            ):
+                by_id[account.pk] = account
+                by_code[account.code] = account
+
+        accounts = []
+        for line in lines:
+            if line.account is not None:
+                account = line.account
+            elif line.account_id:
+                account = by_id.get(line.account_id)
+            else:
+                account = by_code.get(line.account_code)
+            if account is None:
+                raise Account.DoesNotExist(
+                    f"Account {line.account_id or line.account_code} does not exist."
+                )
+            accounts.append(account)
+        return accounts
+
+    def create_lines(
+        self,
+        entry: JournalEntry,
+        lines: List[EntryLineInput],
+        accounts: List[Account]
+    ) -> List[JournalEntryLine]:
+        """Insert the entry's lines (numbered 10, 20, 30...) in one query."""
+        rows = []
+        for index, (line, account) in enumerate(zip(lines, accounts), start=1):
+            row = JournalEntryLine(
+                tenant=self.tenant,
+                entry=entry,
+                line_number=index * 10,
+                account=account,
+                description=line.description,
+                debit=line.debit,
+                credit=line.credit,
+            )
+            if line.entity:
+                row.entity_type = ContentType.objects.get_for_model(line.entity)
+                row.entity_id = line.entity.pk
+            rows.append(row)
+        return JournalEntryLine.objects.bulk_create(rows)
+
+    def update_balances(
+        self,
+        fiscal_period: Optional[FiscalPeriod],
+        postings: Iterable[Tuple[Account, Decimal, Decimal]]
+    ) -> None:
+        """
+        Add (account, debit, credit) postings to the AccountBalance cache.
+
+        Amounts are netted per account first, then the affected balance rows
+        are locked, created or updated with one query each.
+        """
+        deltas = {}
+        for account, debit, credit in postings:
+            _, total_debit, total_credit = deltas.get(
+                account.pk, (account, Decimal('0.00'), Decimal('0.00'))
+            )
+            deltas[account.pk] = (account, total_debit + debit, total_credit + credit)
+        if not deltas:
+            return
+
+        existing = {
+            balance.account_id: balance
+            for balance in AccountBalance.objects.select_for_update().filter(
+                tenant=self.tenant,
+                fiscal_period=fiscal_period,
+                account_id__in=deltas,
+            )
+        }
+        now = timezone.now()
+        to_create, to_update = [], []
+        for account_id, (account, debit, credit) in deltas.items():
+            balance = existing.get(account_id)
+            if balance is None:
+                balance = AccountBalance(
+                    tenant=self.tenant,
+                    account=account,
+                    fiscal_period=fiscal_period,
+                )
+                to_create.append(balance)
+            else:
+                to_update.append(balance)
+
+            balance.period_debit += debit
+            balance.period_credit += credit
+            if account.is_debit_normal:
+                balance.ending_balance = (
+                    balance.beginning_balance + balance.period_debit - balance.period_credit
+                )
+            else:
+                balance.ending_balance = (
+                    balance.beginning_balance + balance.period_credit - balance.period_debit
+                )
+            balance.last_updated = now
+
+        if to_create:
+            AccountBalance.objects.bulk_create(to_create)
+        if to_update:
+            AccountBalance.objects.bulk_update(
+                to_update,
+                ['period_debit', 'period_credit', 'ending_balance', 'last_updated'],
+            )
+
+    def get_fiscal_period(self, entry_date: date) -> Optional[FiscalPeriod]:
+        """Get the fiscal period for a date."""
+        return FiscalPeriod.objects.filter(
+            tenant=self.tenant,
+            start_date__lte=entry_date,
+            end_date__gte=entry_date
+        ).first()
+
+    def next_entry_number(self, prefix: str = '') -> str:
+        """Allocate the next entry number from the tenant's JE sequence."""
+        from apps.tenants.models import get_next_sequence_number
+        number = get_next_sequence_number(self.tenant, 'JE')
+        return f"{prefix}-{number}" if prefix else number
+
+
+def _to_cents(amount) -> Decimal:
+    return Decimal(str(amount or 0)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
 # ─── Accounting Service ─────────────────────────────────────────────────────────
 
 class AccountingService:
@@ -120,6 +418,7 @@ class AccountingService:
 
     def __init__(self, tenant: Tenant):
         self.tenant = tenant
+        self.engine = GLPostingEngine(tenant)
 
     # ─── Journal Entry Operations ───────────────────────────────────────────────
 
@@ -610,24 +909,7 @@ class AccountingService:
         lines: List[Union[EntryLineInput, Dict]]
     ) -> List[EntryLineInput]:
         """Convert dict inputs to EntryLineInput objects."""
-        normalized = []
-        for line in lines:
-            if isinstance(line, dict):
-                normalized.append(EntryLineInput(
-                    account_code=line.get('account_code'),
-                    account_id=line.get('account_id'),
-                    description=line.get('description', ''),
-                    debit=Decimal(str(line.get('debit', 0))).quantize(
-                        Decimal('0.01'), rounding=ROUND_HALF_UP
-                    ),
-                    credit=Decimal(str(line.get('credit', 0))).quantize(
-                        Decimal('0.01'), rounding=ROUND_HALF_UP
-                    ),
-                    entity=line.get('entity')
-                ))
-            else:
-                normalized.append(line)
-        return normalized
+        return self.engine.normalize_lines(lines)
 
     def _calculate_totals(
         self,
@@ -647,11 +929,7 @@ class AccountingService:
 
     def _get_fiscal_period(self, entry_date: date) -> Optional[FiscalPeriod]:
         """Get the fiscal period for a date."""
-        return FiscalPeriod.objects.filter(
-            tenant=self.tenant,
-            start_date__lte=entry_date,
-            end_date__gte=entry_date
-        ).first()
+        return self.engine.get_fiscal_period(entry_date)
 
     def _create_entry_lines(
         self,
@@ -659,80 +937,15 @@ class AccountingService:
         lines: List[EntryLineInput]
     ) -> List[JournalEntryLine]:
         """Create JournalEntryLine objects for an entry."""
-        created_lines = []
-        line_number = 10
-
-        for line_input in lines:
-            # Resolve account
-            if line_input.account_id:
-                account = Account.objects.get(
-                    id=line_input.account_id,
-                    tenant=self.tenant
-                )
-            elif line_input.account_code:
-                account = Account.objects.get(
-                    code=line_input.account_code,
-                    tenant=self.tenant
-                )
-            else:
-                raise ValidationError("Line must have account_id or account_code")
-
-            # Build line
-            line_data = {
-                'tenant': self.tenant,
-                'entry': entry,
-                'line_number': line_number,
-                'account': account,
-                'description': line_input.description,
-                'debit': line_input.debit,
-                'credit': line_input.credit
-            }
-
-            # Add entity reference if provided
-            if line_input.entity:
-                line_data['entity_type'] = ContentType.objects.get_for_model(
-                    line_input.entity
-                )
-                line_data['entity_id'] = line_input.entity.pk
-
-            created_lines.append(JournalEntryLine.objects.create(**line_data))
-            line_number += 10
-
-        return created_lines
+        return self.engine.create_lines(entry, lines, self.engine.resolve_accounts(lines))
 
     def _update_balance_cache(self, entry: JournalEntry) -> None:
         """Update AccountBalance cache after posting."""
-        for line in entry.lines.all():
-            balance, created = AccountBalance.objects.get_or_create(
-                tenant=self.tenant,
-                account=line.account,
-                fiscal_period=entry.fiscal_period,
-                defaults={
-                    'period_debit': Decimal('0.00'),
-                    'period_credit': Decimal('0.00'),
-                    'beginning_balance': Decimal('0.00'),
-                    'ending_balance': Decimal('0.00')
-                }
-            )
-
-            balance.period_debit += line.debit
-            balance.period_credit += line.credit
-
-            # Recalculate ending balance
-            if line.account.is_debit_normal:
-                balance.ending_balance = (
-                    balance.beginning_balance +
-                    balance.period_debit -
-                    balance.period_credit
-                )
-            else:
-                balance.ending_balance = (
-                    balance.beginning_balance +
-                    balance.period_credit -
-                    balance.period_debit
-                )
-
-            balance.save()
+        self.engine.update_balances(
+            entry.fiscal_period,
+            [(line.account, line.debit, line.credit)
+             for line in entry.lines.select_related('account')],
+        )
 
     def _calculate_next_date(self, current: date, frequency: str) -> date:
         """Calculate the next occurrence date."""
@@ -749,6 +962,208 @@ class AccountingService:
         return current + freq_map.get(frequency, relativedelta(months=1))
 
 
+# ─── Recurring Entry Generator ──────────────────────────────────────────────────
+
+class RecurringEntryGenerator:
+    """
+    Batched generation of journal entries from recurring templates.
+
+    AccountingService.process_recurring_entries creates one entry at a time
+    (account lookups, a sequence number and a template save per occurrence),
+    which turns catching up after an outage into thousands of round trips.
+    This expands every due occurrence of every template in memory and writes
+    them with a fixed number of queries: templates with their lines and
+    accounts, already-generated entries, fiscal periods, one block of entry
+    numbers, bulk inserts of entries and lines, the balance cache, and one
+    bulk update of the templates.
+
+    Generated entries point at their template (source_type/source_id), so a
+    re-run never duplicates an occurrence even if a template's next_date is
+    moved back. Templates that cannot be generated (unbalanced, or an
+    auto-post template hitting an inactive account or closed period) are
+    reported and left untouched.
+
+    Usage:
+        result = RecurringEntryGenerator(tenant, user).run(through_date, dry_run=True)
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, tenant: Tenant, user=None):
+        self.tenant = tenant
+        self.user = user
+        self.engine = GLPostingEngine(tenant, user)
+
+    def run(self, through_date: Optional[date] = None, dry_run: bool = False) -> RecurringRunResult:
+        """
+        Generate all occurrences due on or before ``through_date``.
+
+        With ``dry_run`` nothing is written; the result lists what would be.
+        """
+        through_date = through_date or date.today()
+        result = RecurringRunResult()
+
+        with transaction.atomic():
+            templates = RecurringEntryTemplate.objects.filter(
+                tenant=self.tenant,
+                is_active=True,
+                next_date__lte=through_date,
+            ).prefetch_related(
+                Prefetch('lines', queryset=RecurringEntryLine.objects.select_related('account'))
+            ).order_by('next_date', 'pk')
+            if not dry_run:
+                templates = templates.select_for_update()
+            templates = list(templates)
+            if not templates:
+                return result
+
+            existing = self._existing(templates, through_date)
+            periods = list(FiscalPeriod.objects.filter(
+                tenant=self.tenant,
+                start_date__lte=through_date,
+                end_date__gte=min(template.next_date for template in templates),
+            ))
+
+            changed = []
+            for template in templates:
+                dates, next_date, expired = self._expand(template, through_date)
+                error = self._validate(template, dates, periods)
+                if error:
+                    result.failed.append({'template': template.name, 'error': error})
+                    continue
+
+                amount = sum((line.debit for line in template.lines.all()), Decimal('0.00'))
+                for entry_date in dates:
+                    occurrence = RecurringOccurrence(template, entry_date, amount)
+                    if (template.pk, entry_date) in existing:
+                        result.skipped.append(occurrence)
+                    else:
+                        result.occurrences.append(occurrence)
+
+                template.next_date = next_date
+                if expired:
+                    template.is_active = False
+                    result.deactivated.append(template)
+                changed.append(template)
+
+            if not dry_run:
+                result.entries = self._write(result.occurrences, periods)
+                now = timezone.now()
+                for template in changed:
+                    template.updated_at = now
+                RecurringEntryTemplate.objects.bulk_update(
+                    changed, ['next_date', 'is_active', 'updated_at'], batch_size=self.BATCH_SIZE,
+                )
+        return result
+
+    def _expand(self, template: RecurringEntryTemplate, through_date: date):
+        """Due dates, the template's new next_date, and whether it has expired."""
+        calculate = AccountingService(self.tenant)._calculate_next_date
+        dates = []
+        current = template.next_date
+        while current <= through_date:
+            if template.end_date and current > template.end_date:
+                return dates, current, True
+            dates.append(current)
+            current = calculate(current, template.frequency)
+        return dates, current, False
+
+    def _validate(self, template: RecurringEntryTemplate, dates: List[date], periods) -> str:
+        """Why ``template`` cannot be generated, or '' if it can."""
+        lines = template.lines.all()
+        if not dates:
+            return ''
+        if len(lines) < 2:
+            return "Journal entry must have at least 2 lines."
+        total_debit = sum((line.debit for line in lines), Decimal('0.00'))
+        total_credit = sum((line.credit for line in lines), Decimal('0.00'))
+        if total_debit != total_credit:
+            return str(UnbalancedEntryError(total_debit, total_credit))
+        if not template.auto_post:
+            return ''
+        inactive = sorted({line.account.code for line in lines if not line.account.is_active})
+        if inactive:
+            return f"Cannot post with inactive accounts: {', '.join(inactive)}"
+        for entry_date in dates:
+            period = self._period_for(entry_date, periods)
+            if period and period.status == FiscalPeriod.PeriodStatus.CLOSED:
+                return f"Cannot post to closed period {period.name}."
+        return ''
+
+    def _existing(self, templates, through_date: date):
+        """(template_id, date) pairs that already have a generated entry."""
+        return set(JournalEntry.objects.filter(
+            tenant=self.tenant,
+            source_type=ContentType.objects.get_for_model(RecurringEntryTemplate),
+            source_id__in=[template.pk for template in templates],
+            date__gte=min(template.next_date for template in templates),
+            date__lte=through_date,
+        ).values_list('source_id', 'date'))
+
+    @staticmethod
+    def _period_for(entry_date: date, periods) -> Optional[FiscalPeriod]:
+        for period in periods:
+            if period.start_date <= entry_date <= period.end_date:
+                return period
+        return None
+
+    def _write(self, occurrences: List[RecurringOccurrence], periods) -> List[JournalEntry]:
+        """Bulk-insert the entries and lines, then post balances for auto-post ones."""
+        if not occurrences:
+            return []
+        from apps.tenants.models import reserve_sequence_numbers
+        numbers = reserve_sequence_numbers(self.tenant, 'JE', len(occurrences))
+        year = date.today().year
+        source_type = ContentType.objects.get_for_model(RecurringEntryTemplate)
+        now = timezone.now()
+
+        entries = []
+        for occurrence, number in zip(occurrences, numbers):
+            template = occurrence.template
+            entries.append(JournalEntry(
+                tenant=self.tenant,
+                entry_number=f"JE-{year}-{number}",
+                date=occurrence.entry_date,
+                memo=template.memo,
+                entry_type=JournalEntry.EntryType.RECURRING,
+                fiscal_period=self._period_for(occurrence.entry_date, periods),
+                status=(JournalEntry.EntryStatus.POSTED if template.auto_post
+                        else JournalEntry.EntryStatus.DRAFT),
+                source_type=source_type,
+                source_id=template.pk,
+                posted_at=now if template.auto_post else None,
+                posted_by=self.user if template.auto_post else None,
+                created_by=self.user,
+            ))
+        entries = bulk_create_with_history(
+            entries, JournalEntry, batch_size=self.BATCH_SIZE, default_user=self.user,
+        )
+
+        rows = []
+        postings = defaultdict(list)
+        for occurrence, entry in zip(occurrences, entries):
+            for index, line in enumerate(occurrence.template.lines.all(), start=1):
+                rows.append(JournalEntryLine(
+                    tenant=self.tenant,
+                    entry=entry,
+                    line_number=index * 10,
+                    account=line.account,
+                    description=line.description,
+                    debit=line.debit,
+                    credit=line.credit,
+                ))
+                if occurrence.template.auto_post:
+                    postings[entry.fiscal_period].append((line.account, line.debit, line.credit))
+        JournalEntryLine.objects.bulk_create(rows, batch_size=self.BATCH_SIZE)
+
+        for fiscal_period, period_postings in postings.items():
+            self.engine.update_balances(fiscal_period, period_postings)
+
+        from apps.search.services import SearchIndexService
+        SearchIndexService(self.tenant).index_created('journal_entry', entries)
+        return entries
+
+
 # ─── Convenience Functions ──────────────────────────────────────────────────────
 
 def get_account_by_code(tenant: Tenant, code: str) -> Account:
@@ -0,0 +1,120 @@
+# apps/accounting/tests/test_posting.py
+"""
+Tests for the shared GL posting engine.
+"""
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounting.models import (
+    Account, AccountBalance, AccountType, FiscalPeriod, JournalEntry,
+)
+from apps.accounting.services import (
+    AccountingService, ClosedPeriodError, EntryLineInput, GLPostingEngine,
+    InactiveAccountError, UnbalancedEntryError,
+)
+from apps.tenants.models import Tenant
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class GLPostingEngineTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Posting Co', subdomain='test-gl-posting')
+        cls.user = User.objects.create_user(username='poster', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.ar = Account.objects.create(
+            tenant=cls.tenant, code='1100', name='A/R', account_type=AccountType.ASSET_CURRENT,
+        )
+        cls.revenue = [
+            Account.objects.create(
+                tenant=cls.tenant, code=f'40{i:02d}', name=f'Revenue {i}', account_type=AccountType.REVENUE,
+            )
+            for i in range(10)
+        ]
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.engine = GLPostingEngine(self.tenant, self.user)
+
+    def _lines(self, n, by_code=False):
+        lines = [{'account': self.ar, 'debit': Decimal('10.00') * n}]
+        for account in self.revenue[:n]:
+            ref = {'account_code': account.code} if by_code else {'account': account}
+            lines.append({**ref, 'credit': Decimal('10.00')})
+        return lines
+
+    def _post_queries(self, lines):
+        with CaptureQueriesContext(connection) as ctx:
+            self.engine.post(date.today(), 'Batch', lines, number_prefix='TST')
+        return len(ctx.captured_queries)
+
+    def test_posts_lines_and_balances(self):
+        entry = self.engine.post(date.today(), 'Sale', self._lines(3, by_code=True), number_prefix='TST')
+
+        self.assertEqual(entry.status, JournalEntry.EntryStatus.POSTED)
+        self.assertEqual(entry.posted_by, self.user)
+        self.assertTrue(entry.entry_number.startswith('TST-JE-'))
+        self.assertEqual(list(entry.lines.values_list('line_number', flat=True)), [10, 20, 30, 40])
+        self.assertEqual(AccountBalance.objects.get(account=self.ar).ending_balance, Decimal('30.00'))
+        self.assertEqual(AccountBalance.objects.get(account=self.revenue[0]).ending_balance, Decimal('10.00'))
+
+        self.engine.post(date.today(), 'Sale', self._lines(1))
+        self.assertEqual(AccountBalance.objects.get(account=self.ar).ending_balance, Decimal('40.00'))
+        self.assertEqual(AccountBalance.objects.get(account=self.revenue[0]).ending_balance, Decimal('20.00'))
+
+    def test_query_count_independent_of_lines(self):
+        # Warm the balance rows so both runs take the update path
+        self.engine.post(date.today(), 'Warm', self._lines(10))
+        self.assertEqual(
+            self._post_queries(self._lines(2, by_code=True)),
+            self._post_queries(self._lines(10, by_code=True)),
+        )
+
+    def test_entry_numbers_come_from_tenant_sequence(self):
+        first = self.engine.post(date.today(), 'One', self._lines(1), number_prefix='TST')
+        second = self.engine.post(date.today(), 'Two', self._lines(1), number_prefix='TST')
+        self.assertEqual(first.entry_number, 'TST-JE-000001')
+        self.assertEqual(second.entry_number, 'TST-JE-000002')
+
+    def test_unbalanced_entry_rolls_back(self):
+        lines = self._lines(2)
+        lines[0]['debit'] = Decimal('5.00')
+        with self.assertRaises(UnbalancedEntryError):
+            self.engine.post(date.today(), 'Bad', lines)
+        self.assertFalse(JournalEntry.objects.exists())
+
+    def test_inactive_account_rejected(self):
+        Account.objects.filter(pk=self.revenue[1].pk).update(is_active=False)
+        with self.assertRaises(InactiveAccountError):
+            self.engine.post(date.today(), 'Bad', self._lines(2, by_code=True))
+
+    def test_closed_period_rejected(self):
+        FiscalPeriod.objects.create(
+            tenant=self.tenant, name='Jan 2020', start_date=date(2020, 1, 1), end_date=date(2020, 1, 31),
+            status=FiscalPeriod.PeriodStatus.CLOSED,
+        )
+        with self.assertRaises(ClosedPeriodError):
+            self.engine.post(date(2020, 1, 15), 'Late', self._lines(1))
+
+    def test_accounting_service_posting_matches_engine(self):
+        service = AccountingService(self.tenant)
+        entry = service.create_entry(
+            entry_date=date.today(),
+            memo='Manual',
+            lines=[
+                EntryLineInput(account_code='1100', debit=Decimal('25.00')),
+                EntryLineInput(account_id=self.revenue[0].pk, credit=Decimal('25.00')),
+            ],
+            auto_post=True,
+        )
+        self.assertEqual(entry.lines.count(), 2)
+        self.assertEqual(AccountBalance.objects.get(account=self.ar).period_debit, Decimal('25.00'))
+        self.assertEqual(AccountBalance.objects.get(account=self.revenue[0]).ending_balance, Decimal('25.00'))
@@ -0,0 +1,180 @@
+# apps/accounting/tests/test_recurring.py
+"""
+Tests for batched recurring journal generation.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounting.models import (
+    Account, AccountBalance, AccountType, FiscalPeriod, JournalEntry,
+    RecurringEntryLine, RecurringEntryTemplate,
+)
+from apps.accounting.services import RecurringEntryGenerator
+from apps.tenants.models import Tenant
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class RecurringEntryGeneratorTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Recurring Co', subdomain='test-recurring')
+        cls.user = User.objects.create_user(username='recurring', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.rent = Account.objects.create(
+            tenant=cls.tenant, code='6100', name='Rent', account_type=AccountType.EXPENSE_OPERATING,
+        )
+        cls.cash = Account.objects.create(
+            tenant=cls.tenant, code='1000', name='Cash', account_type=AccountType.ASSET_CURRENT,
+        )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.start = date(2026, 1, 1)
+
+    def _template(self, name, frequency='daily', amount='10.00', auto_post=False, **kwargs):
+        template = RecurringEntryTemplate.objects.create(
+            tenant=self.tenant, name=name, memo=f'{name} accrual', frequency=frequency,
+            next_date=kwargs.pop('next_date', self.start), auto_post=auto_post, **kwargs,
+        )
+        RecurringEntryLine.objects.create(
+            tenant=self.tenant, template=template, line_number=10,
+            account=self.rent, debit=Decimal(amount),
+        )
+        RecurringEntryLine.objects.create(
+            tenant=self.tenant, template=template, line_number=20,
+            account=self.cash, credit=Decimal(amount),
+        )
+        return template
+
+    def _run(self, through_date, **kwargs):
+        return RecurringEntryGenerator(self.tenant, self.user).run(through_date, **kwargs)
+
+    def test_catches_up_every_occurrence(self):
+        daily = self._template('Daily')
+        monthly = self._template('Monthly', frequency='monthly', amount='100.00')
+
+        result = self._run(self.start + timedelta(days=89))
+
+        self.assertEqual(len(result.entries), 90 + 3)
+        self.assertEqual(JournalEntry.objects.filter(source_id=daily.pk).count(), 90)
+        numbers = list(JournalEntry.objects.values_list('entry_number', flat=True))
+        self.assertEqual(len(set(numbers)), len(numbers))
+        daily.refresh_from_db()
+        monthly.refresh_from_db()
+        self.assertEqual(daily.next_date, self.start + timedelta(days=90))
+        self.assertEqual(monthly.next_date, date(2026, 4, 1))
+
+        entry = JournalEntry.objects.filter(source_id=monthly.pk).order_by('date').last()
+        self.assertEqual(entry.date, date(2026, 3, 1))
+        self.assertEqual(entry.status, JournalEntry.EntryStatus.DRAFT)
+        self.assertEqual(entry.entry_type, JournalEntry.EntryType.RECURRING)
+        self.assertEqual(
+            list(entry.lines.values_list('line_number', 'account__code', 'debit', 'credit')),
+            [(10, '6100', Decimal('100.00'), Decimal('0.00')),
+             (20, '1000', Decimal('0.00'), Decimal('100.00'))],
+        )
+
+    def test_query_count_independent_of_occurrences(self):
+        self._template('Short')
+
+        def count(days):
+            JournalEntry.objects.all().delete()
+            RecurringEntryTemplate.objects.update(next_date=self.start)
+            with CaptureQueriesContext(connection) as ctx:
+                self._run(self.start + timedelta(days=days - 1))
+            return len(ctx.captured_queries)
+
+        # Within one bulk-insert batch (sqlite splits large inserts by its
+        # variable limit), the count is the same however many occurrences.
+        self.assertEqual(count(5), count(40))
+
+    def test_auto_post_updates_balances(self):
+        FiscalPeriod.objects.create(
+            tenant=self.tenant, name='Jan 2026', start_date=date(2026, 1, 1), end_date=date(2026, 1, 31),
+        )
+        self._template('Posted', auto_post=True)
+
+        result = self._run(date(2026, 1, 10))
+
+        self.assertTrue(all(entry.status == JournalEntry.EntryStatus.POSTED for entry in result.entries))
+        balance = AccountBalance.objects.get(account=self.rent, fiscal_period__name='Jan 2026')
+        self.assertEqual(balance.period_debit, Decimal('100.00'))
+
+    def test_rerun_is_idempotent(self):
+        template = self._template('Daily')
+        self._run(date(2026, 1, 5))
+
+        self.assertEqual(self._run(date(2026, 1, 5)).entries, [])
+
+        # Even if next_date is wound back, existing occurrences are skipped
+        RecurringEntryTemplate.objects.filter(pk=template.pk).update(next_date=self.start)
+        result = self._run(date(2026, 1, 7))
+        self.assertEqual(len(result.skipped), 5)
+        self.assertEqual([entry.date for entry in result.entries], [date(2026, 1, 6), date(2026, 1, 7)])
+        self.assertEqual(JournalEntry.objects.count(), 7)
+
+    def test_end_date_deactivates(self):
+        template = self._template('Ending', end_date=date(2026, 1, 3))
+
+        result = self._run(date(2026, 1, 10))
+
+        self.assertEqual(len(result.entries), 3)
+        self.assertEqual(result.deactivated, [template])
+        template.refresh_from_db()
+        self.assertFalse(template.is_active)
+
+    def test_invalid_templates_are_reported_and_left_alone(self):
+        FiscalPeriod.objects.create(
+            tenant=self.tenant, name='Closed Jan', start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31), status=FiscalPeriod.PeriodStatus.CLOSED,
+        )
+        closed = self._template('Closed', auto_post=True)
+        unbalanced = self._template('Unbalanced')
+        unbalanced.lines.filter(line_number=20).update(credit=Decimal('9.00'))
+        self._template('Fine')
+
+        result = self._run(date(2026, 1, 2))
+
+        self.assertEqual(
+            sorted(failure['template'] for failure in result.failed), ['Closed', 'Unbalanced'],
+        )
+        self.assertEqual(len(result.entries), 2)
+        closed.refresh_from_db()
+        self.assertEqual(closed.next_date, self.start)
+
+    def test_dry_run_writes_nothing(self):
+        template = self._template('Preview')
+
+        out = StringIO()
+        call_command(
+            'generate_recurring_entries', '--tenant=test-recurring',
+            '--through-date=2026-01-03', '--dry-run', stdout=out,
+        )
+
+        self.assertIn('2026-01-02  Preview  10.00  (draft)', out.getvalue())
+        self.assertIn('Done. Dry run: 3 entries would be generated.', out.getvalue())
+        self.assertFalse(JournalEntry.objects.exists())
+        template.refresh_from_db()
+        self.assertEqual(template.next_date, self.start)
+
+    def test_command_generates(self):
+        self._template('Command')
+
+        out = StringIO()
+        call_command(
+            'generate_recurring_entries', '--tenant=test-recurring',
+            '--through-date=2026-01-03', stdout=out,
+        )
+
+        self.assertIn('Done. Generated 3 entries, 0 templates failed.', out.getvalue())
+        self.assertEqual(JournalEntry.objects.count(), 3)
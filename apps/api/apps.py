@@ -5,3 +5,7 @@ class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.api'
     verbose_name = 'REST API'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.api.signals
@@ -5,10 +5,16 @@ Custom JWT authentication that supports httpOnly cookies.
 Checks for JWT tokens in the following order:
 1. httpOnly cookie (preferred, more secure)
 2. Authorization header (for backwards compatibility)
+
+The user behind a token is served from the principal cache
+(apps.api.principals) so most requests skip the User query.
 """
 
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.api.principals import get_cached_user
 
 
 ACCESS_TOKEN_COOKIE = 'raven_access'
@@ -36,3 +42,11 @@ class CookieJWTAuthentication(JWTAuthentication):
 
         # Fall back to Authorization header
         return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        """Return the token's user, from the principal cache when possible."""
+        return get_cached_user(
+            validated_token.get(api_settings.USER_ID_CLAIM),
+            validated_token.get(api_settings.JTI_CLAIM),
+            lambda: super(CookieJWTAuthentication, self).get_user(validated_token),
+        )
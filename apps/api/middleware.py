@@ -15,10 +15,14 @@ from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
+from apps.api.authentication import CookieJWTAuthentication
+from apps.api.principals import get_cached_tenant
 from apps.api.websocket_tickets import validate_and_consume_ticket
+from shared.managers import tenant_context
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,10 @@ class JWTAuthMiddleware(BaseMiddleware):
     2. Token-based (DEPRECATED): ws://host/ws/endpoint/?token=<jwt>
        - Kept for backwards compatibility during migration
        - Will log deprecation warnings
+
+    When the ticket names a tenant, it is stored on ``scope['tenant']`` and
+    the connection runs inside ``tenant_context`` so consumers can use
+    TenantManager querysets via ``database_sync_to_async``.
     """
 
     async def __call__(self, scope, receive, send):
@@ -49,7 +57,11 @@ class JWTAuthMiddleware(BaseMiddleware):
         ticket = query_params.get('ticket')
         if ticket:
             scope['user'] = await self.get_user_from_ticket(ticket)
-            return await super().__call__(scope, receive, send)
+            scope['tenant'] = await self.get_tenant(
+                getattr(scope['user'], '_ws_tenant_id', None)
+            )
+            with tenant_context(scope['tenant']):
+                return await super().__call__(scope, receive, send)
 
         # Fall back to token-based auth (deprecated)
         token = query_params.get('token')
@@ -88,6 +100,13 @@ class JWTAuthMiddleware(BaseMiddleware):
         except User.DoesNotExist:
             return AnonymousUser()
 
+    @database_sync_to_async
+    def get_tenant(self, tenant_id):
+        """Return the active Tenant for ``tenant_id``, or None."""
+        if tenant_id is None:
+            return None
+        return get_cached_tenant(id=tenant_id)
+
     @database_sync_to_async
     def get_user_from_token(self, token: str):
         """
@@ -98,17 +117,7 @@ class JWTAuthMiddleware(BaseMiddleware):
         """
         try:
             validated_token = AccessToken(token)
-            user_id = validated_token.get('user_id')
-
-            if user_id is None:
-                return AnonymousUser()
-
-            User = get_user_model()
-            try:
-                user = User.objects.get(id=user_id)
-                return user
-            except User.DoesNotExist:
-                return AnonymousUser()
-
-        except (InvalidToken, TokenError):
+            # Same lookup and principal cache as HTTP requests
+            return CookieJWTAuthentication().get_user(validated_token)
+        except (InvalidToken, TokenError, AuthenticationFailed):
             return AnonymousUser()
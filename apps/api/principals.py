@@ -0,0 +1,87 @@
+"""
+Short-lived cache of authenticated principals (user and tenant lookups).
+
+Every JWT-authenticated API request used to load the User row, and
+TenantMiddleware re-ran its Tenant queries. Both are cached here for
+JWT_PRINCIPAL_CACHE_SECONDS (default 60):
+
+- Users are keyed by user id, the token's ``jti`` and a per-user version.
+  Saving the user (deactivation, password change, profile edits) or
+  changing its groups/permissions bumps the version, so stale entries are
+  never read again and simply expire.
+- Tenant lookups are keyed by the lookup and a global tenant version that
+  is bumped whenever any Tenant is saved or deleted.
+
+The versions live in the cache too, so invalidation only reaches every
+worker through a shared backend (Redis). Settings force the TTL to 0, i.e.
+no caching, when only the per-process LocMemCache is available.
+
+Shared by CookieJWTAuthentication (HTTP) and JWTAuthMiddleware (WebSocket).
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+_USER_VERSION_KEY = 'principal:user-version:{}'
+_USER_KEY = 'principal:user:{}:{}:{}'
+_TENANT_VERSION_KEY = 'principal:tenant-version'
+_TENANT_KEY = 'principal:tenant:{}:{}'
+
+# Cached stand-in for "no tenant matched", distinguishable from a miss
+_NO_TENANT = 'none'
+
+
+def _ttl():
+    return getattr(settings, 'JWT_PRINCIPAL_CACHE_SECONDS', 60)
+
+
+def get_cached_user(user_id, jti, load_user):
+    """
+    Return the user for a validated token, calling ``load_user()`` on a miss.
+
+    ``load_user`` performs the real lookup and checks (and may raise); only
+    successful results are cached. Tokens without a ``jti`` are not cached.
+    """
+    ttl = _ttl()
+    if user_id is None or not jti or not ttl:
+        return load_user()
+
+    version = cache.get(_USER_VERSION_KEY.format(user_id), 0)
+    key = _USER_KEY.format(user_id, version, jti)
+    user = cache.get(key)
+    if user is None:
+        user = load_user()
+        cache.set(key, user, ttl)
+    return user
+
+
+def invalidate_user(user_id):
+    """Drop every cached principal for ``user_id``."""
+    # A fresh version (not an increment) survives the key being evicted.
+    cache.set(_USER_VERSION_KEY.format(user_id), time.time_ns(), None)
+
+
+def get_cached_tenant(**lookup):
+    """
+    Return the first active Tenant matching ``lookup`` (or None), cached.
+    """
+    from apps.tenants.models import Tenant
+
+    ttl = _ttl()
+    if not ttl:
+        return Tenant.objects.filter(is_active=True, **lookup).first()
+
+    version = cache.get(_TENANT_VERSION_KEY, 0)
+    key = _TENANT_KEY.format(version, ','.join(f'{k}={v}' for k, v in sorted(lookup.items())))
+    tenant = cache.get(key)
+    if tenant is None:
+        tenant = Tenant.objects.filter(is_active=True, **lookup).first()
+        cache.set(key, tenant or _NO_TENANT, ttl)
+    return None if tenant == _NO_TENANT else tenant
+
+
+def invalidate_tenants():
+    """Drop every cached tenant lookup."""
+    cache.set(_TENANT_VERSION_KEY, time.time_ns(), None)
@@ -0,0 +1,49 @@
+# apps/api/signals.py
+"""
+Invalidate cached principals (apps.api.principals) when users or tenants change.
+
+User saves cover deactivation and password changes (set_password + save);
+group and permission changes arrive as m2m_changed.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.api.principals import invalidate_tenants, invalidate_user
+from apps.tenants.models import Tenant
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_principal(sender, instance, **kwargs):
+    """Drop cached principals for a saved or deleted user."""
+    invalidate_user(instance.pk)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_user_principal_on_access_change(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Drop cached principals when a user's groups or permissions change."""
+    if not reverse:
+        if action.startswith('post_'):
+            invalidate_user(instance.pk)
+        return
+    # Changed from the group/permission side: every affected user. A clear
+    # sends no pk_set, so note the members before they are removed.
+    if action == 'pre_clear':
+        instance._cleared_user_ids = list(instance.user_set.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        for user_id in getattr(instance, '_cleared_user_ids', []):
+            invalidate_user(user_id)
+    elif action.startswith('post_'):
+        for user_id in pk_set or ():
+            invalidate_user(user_id)
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def invalidate_tenant_lookups(sender, **kwargs):
+    """Drop cached tenant lookups when any tenant changes."""
+    invalidate_tenants()
@@ -121,7 +121,7 @@ class ItemHistoryTests(ItemReportTestCase):
         """Item with no orders returns empty list."""
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data['results'], [])
 
     def test_history_with_estimate(self):
         """History includes estimate entries."""
@@ -145,9 +145,9 @@ class ItemHistoryTests(ItemReportTestCase):
 
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
-        entry = response.data[0]
+        entry = response.data['results'][0]
         self.assertEqual(entry['type'], 'ESTIMATE')
         self.assertEqual(entry['document_number'], 'EST-100')
         self.assertEqual(entry['document_id'], estimate.id)
@@ -177,9 +177,9 @@ class ItemHistoryTests(ItemReportTestCase):
 
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
-        entry = response.data[0]
+        entry = response.data['results'][0]
         self.assertEqual(entry['type'], 'RFQ')
         self.assertEqual(entry['document_number'], 'RFQ-100')
         self.assertEqual(entry['party_name'], 'Test Vendor')
@@ -207,9 +207,9 @@ class ItemHistoryTests(ItemReportTestCase):
 
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
-        entry = response.data[0]
+        entry = response.data['results'][0]
         self.assertEqual(entry['type'], 'SO')
         self.assertEqual(entry['document_number'], 'SO-100')
         self.assertEqual(entry['party_name'], 'Test Customer')
@@ -236,9 +236,9 @@ class ItemHistoryTests(ItemReportTestCase):
 
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
-        entry = response.data[0]
+        entry = response.data['results'][0]
         self.assertEqual(entry['type'], 'PO')
         self.assertEqual(entry['document_number'], 'PO-100')
         self.assertEqual(entry['party_name'], 'Test Vendor')
@@ -296,13 +296,13 @@ class ItemHistoryTests(ItemReportTestCase):
 
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 4)
+        self.assertEqual(len(response.data['results']), 4)
 
         # Most recent first
-        self.assertEqual(response.data[0]['type'], 'PO')
-        self.assertEqual(response.data[1]['type'], 'SO')
-        self.assertEqual(response.data[2]['type'], 'RFQ')
-        self.assertEqual(response.data[3]['type'], 'ESTIMATE')
+        self.assertEqual(response.data['results'][0]['type'], 'PO')
+        self.assertEqual(response.data['results'][1]['type'], 'SO')
+        self.assertEqual(response.data['results'][2]['type'], 'RFQ')
+        self.assertEqual(response.data['results'][3]['type'], 'ESTIMATE')
 
     def test_history_only_shows_this_item(self):
         """History only shows entries for the requested item."""
@@ -322,8 +322,8 @@ class ItemHistoryTests(ItemReportTestCase):
 
         response = self.client.get(f'/api/v1/items/{self.item.id}/history/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['type'], 'SO')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['type'], 'SO')
 
     def test_history_unauthenticated(self):
         """Unauthenticated requests are rejected."""
@@ -0,0 +1,169 @@
+# apps/api/tests/test_pagination.py
+"""
+Tests for keyset (cursor) pagination.
+
+Test coverage:
+- Cursor helpers: round trip, malformed input, ordering with ties and NULLs
+- KeysetPagination: full walk matches page-number order, no COUNT query,
+  page-number mode unchanged, client ordering, invalid cursor
+- SuggestionsAPI browse mode with a cursor
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.accounting.models import JournalEntry
+from apps.api.v1.pagination import (
+    apply_keyset, decode_cursor, encode_cursor, keyset_ordering, keyset_values,
+)
+from apps.items.models import Item, UnitOfMeasure
+from apps.tenants.models import Tenant
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class KeysetTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Keyset Co', subdomain='keyset', is_default=True)
+        cls.user = User.objects.create_user(username='keyset_user', password='x')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        # Few distinct names so the id tie-break matters.
+        cls.items = [
+            Item.objects.create(
+                tenant=cls.tenant, sku=f'SKU-{n:03d}', name=f'Name {n % 3}', base_uom=cls.uom,
+            )
+            for n in range(23)
+        ]
+        start = date(2026, 1, 1)
+        cls.entries = [
+            JournalEntry.objects.create(
+                tenant=cls.tenant, entry_number=f'JE-{n:03d}',
+                date=start + timedelta(days=n // 4), memo=f'Entry {n}',
+                entry_type='standard', status='draft', created_by=cls.user,
+            )
+            for n in range(17)
+        ]
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _walk(self, url, params):
+        ids, pages = [], 0
+        resp = self.client.get(url, {**params, 'cursor': ''})
+        while True:
+            self.assertEqual(resp.status_code, 200, resp.content)
+            data = resp.json()
+            ids.extend(row['id'] for row in data['results'])
+            pages += 1
+            if not data['next']:
+                return ids, pages
+            resp = self.client.get(data['next'])
+
+
+class CursorHelperTest(KeysetTestCase):
+
+    def test_round_trip_keeps_precision(self):
+        values = [date(2026, 1, 2), 'a b', None, 7]
+        self.assertEqual(
+            decode_cursor(encode_cursor(values), 4), ['2026-01-02', 'a b', None, 7],
+        )
+
+    def test_malformed_cursor(self):
+        with self.assertRaises(ValueError):
+            decode_cursor('not-a-cursor', 2)
+        with self.assertRaises(ValueError):
+            decode_cursor(encode_cursor([1, 2, 3]), 2)
+
+    def test_ordering_gets_pk_tiebreak(self):
+        qs = JournalEntry.objects.order_by('-date', '-entry_number')
+        self.assertEqual(keyset_ordering(qs), [('date', True), ('entry_number', True), ('pk', True)])
+        self.assertEqual(keyset_ordering(Item.objects.order_by('sku', 'pk')), [('sku', False), ('pk', False)])
+
+    def test_walk_with_ties_and_nulls(self):
+        for n, item in enumerate(self.items[4:]):
+            item.units_per_layer = n % 2 + 1
+            item.save(update_fields=['units_per_layer'])
+        qs = Item.objects.all()
+        keys = [('units_per_layer', True), ('name', False), ('pk', False)]
+        expected = list(apply_keyset(qs, keys).values_list('pk', flat=True))
+        walked, after = [], None
+        while True:
+            page = list(apply_keyset(qs, keys, after)[:5])
+            if not page:
+                break
+            walked.extend(obj.pk for obj in page)
+            after = decode_cursor(encode_cursor(keyset_values(page[-1], keys)), len(keys))
+        self.assertEqual(walked, expected)
+        self.assertEqual(sorted(walked), sorted(i.pk for i in self.items))
+
+
+class KeysetPaginationTest(KeysetTestCase):
+
+    def test_walk_matches_page_number_order(self):
+        by_page = []
+        for page in (1, 2, 3):
+            resp = self.client.get('/api/v1/items/', {'page': page, 'page_size': 10, 'ordering': 'name'})
+            by_page.extend(row['id'] for row in resp.json()['results'])
+
+        walked, pages = self._walk('/api/v1/items/', {'page_size': 10, 'ordering': 'name'})
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(walked, by_page)
+        self.assertEqual(len(set(walked)), 23)
+
+    def test_multi_key_descending_ordering(self):
+        walked, _ = self._walk('/api/v1/journal-entries/', {'page_size': 5})
+        expected = [e.pk for e in sorted(
+            self.entries, key=lambda e: (e.date, e.entry_number), reverse=True,
+        )]
+        self.assertEqual(walked, expected)
+
+    def test_keyset_page_skips_count_and_offset(self):
+        first = self.client.get('/api/v1/items/', {'cursor': '', 'page_size': 10}).json()
+        self.assertNotIn('count', first)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(first['next'])
+        self.assertEqual(resp.status_code, 200)
+        item_sql = [q['sql'] for q in ctx.captured_queries if 'FROM "items_item"' in q['sql']]
+        self.assertFalse([sql for sql in item_sql if 'COUNT(' in sql.upper() and 'GROUP BY' not in sql.upper()])
+        self.assertFalse([sql for sql in item_sql if 'OFFSET' in sql.upper()])
+
+    def test_page_number_mode_unchanged(self):
+        data = self.client.get('/api/v1/items/', {'page_size': 10}).json()
+        self.assertEqual(data['count'], 23)
+        self.assertIn('page=2', data['next'])
+
+    def test_invalid_cursor(self):
+        resp = self.client.get('/api/v1/items/', {'cursor': '@@@'})
+        self.assertEqual(resp.status_code, 404)
+
+
+class SuggestionsCursorTest(KeysetTestCase):
+
+    def test_browse_with_cursor(self):
+        params = {'entity_type': 'item', 'page': 1, 'page_size': 10, 'cursor': ''}
+        seen = []
+        while True:
+            data = self.client.get('/api/v1/suggestions/', params).json()
+            seen.extend(row['id'] for row in data['results'])
+            if not data['next_cursor']:
+                break
+            params = {**params, 'page': params['page'] + 1, 'cursor': data['next_cursor']}
+        self.assertEqual(seen, [i.pk for i in sorted(self.items, key=lambda i: (i.sku, i.pk))])
+        self.assertFalse(data['has_more'])
+
+    def test_bad_cursor_is_400(self):
+        resp = self.client.get(
+            '/api/v1/suggestions/', {'entity_type': 'item', 'page': 2, 'cursor': '@@@'},
+        )
+        self.assertEqual(resp.status_code, 400)
@@ -0,0 +1,94 @@
+# apps/api/tests/test_principals.py
+"""
+Tests for the cached JWT principal (user and tenant) lookups.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.api.authentication import CookieJWTAuthentication
+from apps.api.principals import get_cached_tenant
+from apps.tenants.models import Tenant
+
+User = get_user_model()
+
+
+# Test runs may fall back to LocMemCache, where settings disable the cache;
+# one process is all these tests use, so LocMem is safe to cache in here.
+@override_settings(JWT_PRINCIPAL_CACHE_SECONDS=60)
+class PrincipalCacheTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Principal Co', subdomain='test-principal')
+        cls.user = User.objects.create_user(username='principal', password='pass')
+
+    def setUp(self):
+        cache.clear()
+        self.token = str(AccessToken.for_user(self.user))
+
+    def authenticate(self, token=None):
+        request = RequestFactory().get('/api/v1/users/me/', HTTP_AUTHORIZATION=f'Bearer {token or self.token}')
+        user, _ = CookieJWTAuthentication().authenticate(request)
+        return user
+
+    def test_repeat_requests_skip_user_query(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(), self.user)
+
+    def test_new_token_is_a_separate_entry(self):
+        self.authenticate()
+        with self.assertNumQueries(1):
+            self.authenticate(str(AccessToken.for_user(self.user)))
+
+    def test_deactivation_invalidates(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_password_change_invalidates(self):
+        self.authenticate()
+        self.user.set_password('changed')
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate()
+        self.assertTrue(user.check_password('changed'))
+
+    def test_group_change_invalidates(self):
+        group = Group.objects.create(name='Principal Test')
+        self.authenticate()
+        self.user.groups.add(group)
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+        # From the group side, including clear()
+        group.user_set.clear()
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+    def test_tenant_lookup_cached_until_tenant_changes(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_cached_tenant(subdomain='test-principal'), self.tenant)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_cached_tenant(subdomain='test-principal'), self.tenant)
+
+        self.tenant.is_active = False
+        self.tenant.save()
+        self.assertIsNone(get_cached_tenant(subdomain='test-principal'))
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_cached_tenant(subdomain='test-principal'))
+
+    @override_settings(JWT_PRINCIPAL_CACHE_SECONDS=0)
+    def test_zero_ttl_disables_cache(self):
+        self.authenticate()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate(), self.user)
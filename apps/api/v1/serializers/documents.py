@@ -30,6 +30,31 @@ def _document_label(obj, content_type):
     return f"{model_label} #{obj.pk}"
 
 
+def document_labels(tenant, keys):
+    """
+    Labels for many documents at once: {(content_type_id, object_id): label}.
+
+    One query per content type, for lineage graphs that span many documents.
+    """
+    by_type = {}
+    for ct_id, object_id in keys:
+        by_type.setdefault(ct_id, set()).add(object_id)
+
+    labels = {}
+    for ct_id, ids in by_type.items():
+        content_type = ContentType.objects.get_for_id(ct_id)
+        model = content_type.model_class()
+        objects = {}
+        if model is not None:
+            queryset = model._base_manager.filter(pk__in=ids)
+            if any(f.name == 'tenant' for f in model._meta.fields):
+                queryset = queryset.filter(tenant=tenant)
+            objects = queryset.in_bulk()
+        for object_id in ids:
+            labels[(ct_id, object_id)] = _document_label(objects.get(object_id), content_type)
+    return labels
+
+
 class AttachmentSerializer(TenantModelSerializer):
     """Serializer for Attachment model."""
     uploaded_by_name = serializers.CharField(
@@ -154,3 +179,33 @@ class GeneratePDFSerializer(serializers.Serializer):
         default=True,
         help_text="Save the generated PDF as an attachment"
     )
+
+
+class DocumentLineageLinkSerializer(DocumentLinkSerializer):
+    """
+    A DocumentLink from DocumentLineageService.walk, with its direction and
+    depth from the root. Types come from the ContentType cache and labels
+    from ``context['labels']`` (see document_labels), so serializing a whole
+    graph adds no per-edge queries.
+    """
+    direction = serializers.CharField(read_only=True)
+    depth = serializers.IntegerField(read_only=True)
+    created_by_name = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta(DocumentLinkSerializer.Meta):
+        fields = DocumentLinkSerializer.Meta.fields + ['direction', 'depth']
+        read_only_fields = fields
+
+    def get_source_type(self, obj):
+        ct = ContentType.objects.get_for_id(obj.source_content_type_id)
+        return f"{ct.app_label}.{ct.model}"
+
+    def get_target_type(self, obj):
+        ct = ContentType.objects.get_for_id(obj.target_content_type_id)
+        return f"{ct.app_label}.{ct.model}"
+
+    def get_source_label(self, obj):
+        return self.context['labels'][(obj.source_content_type_id, obj.source_object_id)]
+
+    def get_target_label(self, obj):
+        return self.context['labels'][(obj.target_content_type_id, obj.target_object_id)]
@@ -247,3 +247,20 @@ class VendorBillDetailSerializer(VendorBillSerializer):
 
     class Meta(VendorBillSerializer.Meta):
         fields = VendorBillSerializer.Meta.fields + ['lines', 'payments']
+
+
+class InvoiceBatchGenerateSerializer(serializers.Serializer):
+    """Input for invoicing every delivered shipment shipped on a date."""
+    ship_date = serializers.DateField()
+    invoice_date = serializers.DateField(required=False)
+    payment_terms = serializers.ChoiceField(choices=Invoice.PAYMENT_TERMS_CHOICES, default='NET30')
+    chunk_size = serializers.IntegerField(required=False, min_value=1, max_value=500)
+
+
+class InvoiceBatchPostSerializer(serializers.Serializer):
+    """Filters selecting the draft invoices to post."""
+    customer = serializers.IntegerField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False)
+    chunk_size = serializers.IntegerField(required=False, min_value=1, max_value=500)
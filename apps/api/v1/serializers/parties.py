@@ -19,9 +19,23 @@ class LocationSerializer(TenantModelSerializer):
             'postal_code', 'country', 'phone', 'email',
             'loading_dock_hours', 'special_instructions',
             'is_default', 'is_active', 'full_address',
+            'latitude', 'longitude', 'geo_source',
             'created_at', 'updated_at',
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['geo_source', 'created_at', 'updated_at']
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        # Coordinates entered by a user outrank postal and delivery GPS ones
+        if 'latitude' in attrs or 'longitude' in attrs:
+            latitude = attrs.get('latitude', getattr(self.instance, 'latitude', None))
+            longitude = attrs.get('longitude', getattr(self.instance, 'longitude', None))
+            if (latitude is None) != (longitude is None):
+                raise serializers.ValidationError(
+                    'Latitude and longitude must be set together.'
+                )
+            attrs['geo_source'] = Location.GEO_MANUAL if latitude is not None else ''
+        return attrs
 
 
 class CustomerSerializer(TenantModelSerializer):
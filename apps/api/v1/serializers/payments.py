@@ -193,3 +193,11 @@ class CheckSerializer(TenantModelSerializer):
             'created_at', 'updated_at',
         ]
         read_only_fields = ['check_number', 'printed_at', 'printed_by', 'voided_at', 'created_at', 'updated_at']
+
+
+class RemittanceUploadSerializer(serializers.Serializer):
+    """Input for applying a remittance/lockbox CSV."""
+    file = serializers.FileField()
+    deposit_account = serializers.IntegerField(required=False, allow_null=True)
+    tolerance = serializers.DecimalField(max_digits=12, decimal_places=2, required=False, min_value=0)
+    commit = serializers.BooleanField(default=False, help_text="False = match and report only")
@@ -43,9 +43,9 @@ class DeliveryRunSerializer(TenantModelSerializer):
         fields = [
             'id', 'name', 'truck', 'truck_name', 'scheduled_date',
             'sequence', 'departure_time', 'notes', 'is_complete',
-            'order_count', 'created_at', 'updated_at'
+            'estimated_miles', 'order_count', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'estimated_miles', 'created_at', 'updated_at']
 
 
 class DeliveryRunCreateSerializer(serializers.Serializer):
@@ -30,11 +30,11 @@ from .views.warehouse import (
     WarehouseLocationViewSet, LotViewSet,
     StockByLocationView, StockMoveView,
     ScannerLocationLookupView, ScannerItemLookupView,
-    CycleCountViewSet,
+    CycleCountViewSet, PickWaveView,
 )
 from .views.logistics import (
     LicensePlateViewSet, DeliveryStopViewSet, InitializeRunView,
-    DriverRunView, ManifestPDFView,
+    SequenceRunView, DriverRunView, ManifestPDFView,
 )
 from .views.importers import DataImportView, DataImportTemplateBundleView
 from .views.inventory import (
@@ -74,6 +74,7 @@ from .views.reporting import (
     ItemQuickReportView,
     ItemQuickReportPDFView,
     ReorderAlertsView,
+    NetRequirementsView,
     GrossMarginView,
     OrdersVsInventoryView,
     SalesCommissionView,
@@ -276,10 +277,12 @@ urlpatterns = [
     path('warehouse/move/', StockMoveView.as_view(), name='stock-move'),
     path('warehouse/scanner/location/', ScannerLocationLookupView.as_view(), name='scanner-location-lookup'),
     path('warehouse/scanner/item/', ScannerItemLookupView.as_view(), name='scanner-item-lookup'),
+    path('warehouse/pick-wave/', PickWaveView.as_view(), name='pick-wave'),
 
     # Logistics endpoints
     path('logistics/my-run/', DriverRunView.as_view(), name='driver-my-run'),
     path('logistics/runs/<int:run_id>/initialize/', InitializeRunView.as_view(), name='initialize-run'),
+    path('logistics/runs/<int:run_id>/sequence/', SequenceRunView.as_view(), name='sequence-run'),
     path('logistics/runs/<int:run_id>/manifest-pdf/', ManifestPDFView.as_view(), name='run-manifest-pdf'),
 
     # Admin Data Import
@@ -328,6 +331,7 @@ urlpatterns = [
 
     # Inventory reorder alerts
     path('inventory/reorder-alerts/', ReorderAlertsView.as_view(), name='reorder-alerts'),
+    path('inventory/net-requirements/', NetRequirementsView.as_view(), name='net-requirements'),
 
     # Inventory warehouse pallet summary
     path('inventory/warehouse-pallet-summary/', WarehousePalletSummaryView.as_view(), name='warehouse-pallet-summary'),
@@ -6,6 +6,7 @@ from rest_framework import viewsets, filters, status, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.api.v1.pagination import KeysetPagination
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django.db.models import Count
 
@@ -67,6 +68,7 @@ class JournalEntryViewSet(viewsets.ModelViewSet):
 
     Provides CRUD operations for journal entries with posting and reversal actions.
     """
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'entry_type', 'date']
     search_fields = ['entry_number', 'memo', 'reference_number']
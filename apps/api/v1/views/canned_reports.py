@@ -11,7 +11,7 @@ from io import StringIO
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
 
 from apps.api.v1.views.base import pdf_response
@@ -58,6 +58,40 @@ class BaseReportView(APIView):
         response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
         return response
 
+    def to_csv_stream_response(self, rows, filename):
+        """Stream an iterator of dicts as CSV without building it in memory."""
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return HttpResponse('No data', content_type='text/csv')
+
+        class Echo:
+            def write(self, value):
+                return value
+
+        writer = csv.DictWriter(Echo(), fieldnames=first.keys())
+
+        def lines():
+            yield writer.writeheader()
+            yield writer.writerow(first)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(lines(), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+        return response
+
+    def parse_valuation_method(self, request):
+        """Read ?method=average|fifo for inventory valuation."""
+        from apps.reporting.queries import VALUATION_METHODS
+        method = request.query_params.get('method', 'average').lower()
+        if method not in VALUATION_METHODS:
+            return None, Response(
+                {'error': f"method must be one of: {', '.join(VALUATION_METHODS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return method, None
+
 
 # ==================== SALES REPORTS ====================
 
@@ -237,12 +271,17 @@ class InventoryValuationView(BaseReportView):
 
     @extend_schema(tags=['canned-reports'], summary='Inventory Valuation')
     def get(self, request):
-        from apps.reporting.queries import inventory_valuation
-        data = inventory_valuation(request.tenant)
+        from apps.reporting.queries import inventory_valuation, iter_inventory_valuation
+        method, err = self.parse_valuation_method(request)
+        if err:
+            return err
 
         if request.query_params.get('format') == 'csv':
-            return self.to_csv_response(data['rows'], self.report_name)
-        return Response(data)
+            return self.to_csv_stream_response(
+                iter_inventory_valuation(request.tenant, method), self.report_name,
+            )
+        data = inventory_valuation(request.tenant, method)
+        return Response({**data, 'method': method})
 
 
 class StockStatusView(BaseReportView):
@@ -250,12 +289,11 @@ class StockStatusView(BaseReportView):
 
     @extend_schema(tags=['canned-reports'], summary='Stock Status')
     def get(self, request):
-        from apps.reporting.queries import stock_status
-        rows = stock_status(request.tenant)
+        from apps.reporting.queries import stock_status, iter_stock_status
 
         if request.query_params.get('format') == 'csv':
-            return self.to_csv_response(rows, self.report_name)
-        return Response({'rows': rows})
+            return self.to_csv_stream_response(iter_stock_status(request.tenant), self.report_name)
+        return Response({'rows': stock_status(request.tenant)})
 
 
 class LowStockAlertView(BaseReportView):
@@ -277,12 +315,11 @@ class DeadStockView(BaseReportView):
     @extend_schema(tags=['canned-reports'], summary='Dead Stock')
     def get(self, request):
         days = int(request.query_params.get('days', 180))
-        from apps.reporting.queries import dead_stock
-        rows = dead_stock(request.tenant, days)
+        from apps.reporting.queries import dead_stock, iter_dead_stock
 
         if request.query_params.get('format') == 'csv':
-            return self.to_csv_response(rows, self.report_name)
-        return Response({'rows': rows, 'days_threshold': days})
+            return self.to_csv_stream_response(iter_dead_stock(request.tenant, days), self.report_name)
+        return Response({'rows': dead_stock(request.tenant, days), 'days_threshold': days})
 
 
 # ==================== FINANCIAL ====================
@@ -423,7 +460,10 @@ class InventoryValuationPDFView(BaseReportView):
     def get(self, request):
         from apps.documents.pdf import PDFService
         from datetime import date as date_cls
-        pdf_bytes = PDFService.render_inventory_valuation(request.tenant)
+        method, err = self.parse_valuation_method(request)
+        if err:
+            return err
+        pdf_bytes = PDFService.render_inventory_valuation(request.tenant, method=method)
         today = date_cls.today()
         return pdf_response(pdf_bytes, f"inventory-valuation-{today}.pdf", inline=True)
 
@@ -12,11 +12,12 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from apps.api.v1.views.base import pdf_response
 from apps.documents.models import Attachment, DocumentLink
+from apps.documents.services import DocumentLineageService, LINEAGE_MAX_DEPTH
 from apps.documents.pdf import PDFService
 from apps.documents.email import EmailService
 from apps.api.v1.serializers.documents import (
     AttachmentSerializer, AttachmentUploadSerializer, GeneratePDFSerializer,
-    DocumentLinkSerializer,
+    DocumentLinkSerializer, DocumentLineageLinkSerializer, document_labels,
 )
 
 
@@ -113,8 +114,9 @@ class DocumentLinkViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Read-only ViewSet exposing document lineage edges.
 
-    Use the ``for-object`` action to fetch the whole chain for a document:
-    all links where the document is either the source OR the target.
+    Use the ``for-object`` action to fetch a document's direct links (where
+    it is either the source OR the target), or ``lineage`` for the whole
+    upstream/downstream chain in one request.
     """
     serializer_class = DocumentLinkSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -167,6 +169,90 @@ class DocumentLinkViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(links, many=True)
         return Response(serializer.data)
 
+    @extend_schema(
+        tags=['documents'],
+        summary='Full upstream/downstream lineage graph for an object',
+        parameters=[
+            {'name': 'app_label', 'in': 'query', 'type': 'string',
+             'description': "App label (e.g., 'orders')"},
+            {'name': 'model', 'in': 'query', 'type': 'string',
+             'description': "Model name (e.g., 'salesorder')"},
+            {'name': 'object_id', 'in': 'query', 'type': 'integer',
+             'description': 'Object ID'},
+            {'name': 'direction', 'in': 'query', 'type': 'string',
+             'description': "'upstream', 'downstream' or 'both' (default)"},
+            {'name': 'max_depth', 'in': 'query', 'type': 'integer',
+             'description': f'Hops to follow each way (default 10, max {LINEAGE_MAX_DEPTH})'},
+        ],
+    )
+    @action(detail=False, methods=['get'], url_path='lineage')
+    def lineage(self, request):
+        """Return every link reachable from the object, with nodes and labels."""
+        app_label = request.query_params.get('app_label')
+        model_name = request.query_params.get('model')
+        object_id = request.query_params.get('object_id')
+        direction = request.query_params.get('direction', 'both')
+
+        if not all([app_label, model_name, object_id]):
+            return Response(
+                {'error': 'app_label, model, and object_id are required'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if direction not in ('both', 'upstream', 'downstream'):
+            return Response(
+                {'error': "direction must be 'upstream', 'downstream' or 'both'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            object_id = int(object_id)
+            max_depth = int(request.query_params.get('max_depth', 10))
+        except ValueError:
+            return Response(
+                {'error': 'object_id and max_depth must be integers'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            ct = ContentType.objects.get_by_natural_key(app_label, model_name)
+        except ContentType.DoesNotExist:
+            return Response(
+                {'error': f'Unknown model: {app_label}.{model_name}'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        links = DocumentLineageService(request.tenant).walk(
+            ct, object_id, direction=direction, max_depth=max_depth,
+        )
+
+        # Every document in the graph, at its shortest distance from the root
+        root = (ct.pk, object_id)
+        depths = {root: ('root', 0)}
+        for link in links:
+            end = (
+                (link.target_content_type_id, link.target_object_id)
+                if link.direction == 'downstream'
+                else (link.source_content_type_id, link.source_object_id)
+            )
+            if end not in depths or link.depth < depths[end][1]:
+                depths[end] = (link.direction, link.depth)
+        labels = document_labels(request.tenant, depths)
+
+        nodes = []
+        for (ct_id, obj_id), (node_direction, depth) in depths.items():
+            node_ct = ContentType.objects.get_for_id(ct_id)
+            nodes.append({
+                'type': f"{node_ct.app_label}.{node_ct.model}",
+                'object_id': obj_id,
+                'label': labels[(ct_id, obj_id)],
+                'direction': node_direction,
+                'depth': depth,
+            })
+        serializer = DocumentLineageLinkSerializer(links, many=True, context={'labels': labels})
+        return Response({
+            'root': nodes[0],
+            'nodes': nodes,
+            'links': serializer.data,
+        })
 
 # ─── PDF Generation Mixin ───────────────────────────────────────────────────
 
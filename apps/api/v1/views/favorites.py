@@ -182,6 +182,12 @@ class SuggestionsAPI(APIView):
            "has_more": bool,       # is there a next page
            "next_page": int|null,  # page number to request next, or null
          }
+
+       Adding ``cursor`` (empty on the first request, then the previous
+       response's ``next_cursor``) pages the unsearched browse list by
+       (name, id) keyset instead of OFFSET, so deep scrolling stays fast on
+       large tables. ``page`` is still sent to select this mode and only
+       controls whether favorites/recents are included.
     """
     permission_classes = [IsAuthenticated]
 
@@ -249,9 +255,16 @@ class SuggestionsAPI(APIView):
         # 3. Results — a paginated slice of the full ordered queryset, with
         # favorites/recents always excluded so they never duplicate the sections.
         exclude_ids = fav_ids | recent_ids
-        results, has_more = self._search_entities(
-            request, entity_type, search, exclude_ids, page, page_size,
-        )
+        cursor = request.query_params.get('cursor') if paginated else None
+        try:
+            results, has_more, next_cursor = self._search_entities(
+                request, entity_type, search, exclude_ids, page, page_size, cursor,
+            )
+        except ValueError:
+            return Response(
+                {'detail': 'Invalid cursor.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         payload = {
             'favorites': favorites,
@@ -261,23 +274,46 @@ class SuggestionsAPI(APIView):
         if paginated:
             payload['has_more'] = has_more
             payload['next_page'] = page + 1 if has_more else None
+            if cursor is not None:
+                payload['next_cursor'] = next_cursor
         return Response(payload)
 
-    def _search_entities(self, request, entity_type, search, exclude_ids, page, page_size):
+    def _search_entities(self, request, entity_type, search, exclude_ids, page, page_size,
+                         cursor=None):
         """
-        Return ``(results, has_more)`` for the given page/page_size window.
+        Return ``(results, has_more, next_cursor)`` for the given page/page_size window.
 
-        Slices the queryset at the DB level (LIMIT/OFFSET) and fetches one extra
-        row to detect a next page without a separate COUNT query.
+        Slices the queryset at the DB level (LIMIT/OFFSET, or a keyset filter
+        in browse mode when ``cursor`` is given) and fetches one extra row to
+        detect a next page without a separate COUNT query. Raises ValueError
+        for a malformed cursor.
         """
         registry = self._get_registry()
         config = registry.get(entity_type)
         if not config:
-            return [], False
+            return [], False, None
 
         model_class, search_fields, label_func = config
         from django.db.models import Q
 
+        offset = (page - 1) * page_size
+
+        from apps.search.services import SearchIndexService
+        index = SearchIndexService(request.tenant)
+        if search and index.is_ready(entity_type):
+            # Indexed lookup: ranked ids for the window (plus one to detect a
+            # next page), then load just those rows in that order.
+            ids = index.search(
+                search, entity_type, exclude_ids=exclude_ids,
+                offset=offset, limit=page_size + 1,
+            )
+            by_id = model_class.objects.in_bulk(ids)
+            results, has_more = self._build_results(
+                request, entity_type, label_func,
+                [by_id[pk] for pk in ids if pk in by_id], page_size,
+            )
+            return results, has_more, None
+
         qs = model_class.objects.exclude(id__in=exclude_ids)
         if search:
             q = Q()
@@ -293,9 +329,26 @@ class SuggestionsAPI(APIView):
             # field so users can scroll the full record set predictably.
             qs = qs.order_by(search_fields[0])
 
-        offset = (page - 1) * page_size
+        if cursor is not None and not search:
+            from apps.api.v1.pagination import (
+                apply_keyset, decode_cursor, encode_cursor, keyset_values,
+            )
+            keys = [(search_fields[0], False), ('pk', False)]
+            after = decode_cursor(cursor, len(keys)) if cursor else None
+            window = list(apply_keyset(qs, keys, after)[:page_size + 1])
+            results, has_more = self._build_results(
+                request, entity_type, label_func, window, page_size,
+            )
+            next_cursor = encode_cursor(keyset_values(window[page_size - 1], keys)) if has_more else None
+            return results, has_more, next_cursor
+
         # Fetch one extra row to determine whether another page exists.
         window = list(qs[offset:offset + page_size + 1])
+        results, has_more = self._build_results(request, entity_type, label_func, window, page_size)
+        return results, has_more, None
+
+    def _build_results(self, request, entity_type, label_func, window, page_size):
+        """Return ``(results, has_more)`` from a window of up to page_size + 1 rows."""
         has_more = len(window) > page_size
         window = window[:page_size]
 
@@ -45,6 +45,9 @@ class DataImportView(APIView):
     Body (multipart/form-data) for POST:
         file: CSV file
         commit: 'true' or 'false' (default: false = dry run)
+        bulk: 'true' or 'false' (default: true). Importers that support it
+              stream the file and write in set-based chunks; 'false' forces
+              the row-by-row path.
     """
     parser_classes = [MultiPartParser]
     permission_classes = [IsAdminUser]
@@ -101,13 +104,14 @@ class DataImportView(APIView):
                 status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             )
 
-        # Parse commit flag
+        # Parse commit / bulk flags
         commit = request.data.get('commit', 'false').lower() == 'true'
+        bulk = request.data.get('bulk', 'true').lower() != 'false'
 
         # Run importer
         ImporterClass = IMPORTER_MAP[import_type]
         importer = ImporterClass(tenant=request.tenant, user=request.user)
-        report = importer.run(file, commit=commit)
+        report = importer.run(file, commit=commit, bulk=bulk)
 
         # Build response
         response_data = {
@@ -9,6 +9,7 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.api.v1.pagination import KeysetPagination
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from django.db.models import Sum
@@ -186,6 +187,7 @@ class InventoryTransactionViewSet(viewsets.ModelViewSet):
         return InventoryTransaction.objects.select_related(
             'item', 'warehouse', 'lot', 'pallet', 'user'
         ).all()
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['transaction_type', 'item', 'warehouse', 'lot', 'reference_type']
     search_fields = ['reference_number', 'item__sku', 'lot__lot_number']
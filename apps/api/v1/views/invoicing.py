@@ -7,6 +7,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.api.v1.pagination import KeysetPagination
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -16,7 +17,7 @@ from apps.invoicing.models import (
     Invoice, InvoiceLine, Payment, TaxZone, TaxRule,
     VendorBill, VendorBillLine, BillPayment,
 )
-from apps.invoicing.services import DunningService, VendorBillService
+from apps.invoicing.services import DunningService, InvoiceBatchService, VendorBillService
 from apps.documents.pdf import PDFService
 from apps.api.v1.serializers.invoicing import (
     InvoiceSerializer, InvoiceListSerializer, InvoiceDetailSerializer,
@@ -24,6 +25,7 @@ from apps.api.v1.serializers.invoicing import (
     TaxZoneSerializer, TaxRuleSerializer,
     VendorBillSerializer, VendorBillListSerializer, VendorBillDetailSerializer,
     VendorBillLineSerializer, BillPaymentSerializer,
+    InvoiceBatchGenerateSerializer, InvoiceBatchPostSerializer,
 )
 from apps.api.v1.views.documents import PDFActionMixin
 
@@ -42,6 +44,7 @@ class InvoiceViewSet(PDFActionMixin, viewsets.ModelViewSet):
 
     Provides CRUD operations for invoices.
     """
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
 
     def _get_pdf_bytes(self, obj):
@@ -189,6 +192,45 @@ class InvoiceViewSet(PDFActionMixin, viewsets.ModelViewSet):
         serializer = InvoiceListSerializer(queryset, many=True, context={'request': request})
         return Response(serializer.data)
 
+    @extend_schema(
+        tags=['invoicing'],
+        summary='Invoice all delivered shipments for a ship date',
+        request=InvoiceBatchGenerateSerializer,
+    )
+    @action(detail=False, methods=['post'], url_path='batch-generate')
+    def batch_generate(self, request):
+        """Create draft invoices for delivered, not-yet-invoiced shipments."""
+        params = InvoiceBatchGenerateSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        batch = InvoiceBatchService(request.tenant, request.user, chunk_size=data.get('chunk_size'))
+        result = batch.invoice_delivered_shipments(
+            data['ship_date'],
+            payment_terms=data['payment_terms'],
+            invoice_date=data.get('invoice_date'),
+        )
+        return Response(result.to_dict())
+
+    @extend_schema(
+        tags=['invoicing'],
+        summary='Post all draft invoices matching a filter',
+        request=InvoiceBatchPostSerializer,
+    )
+    @action(detail=False, methods=['post'], url_path='batch-post')
+    def batch_post(self, request):
+        """Post matching draft invoices to the GL, reporting failures per invoice."""
+        params = InvoiceBatchPostSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        batch = InvoiceBatchService(request.tenant, request.user, chunk_size=data.get('chunk_size'))
+        result = batch.post_draft_invoices(
+            customer=data.get('customer'),
+            date_from=data.get('date_from'),
+            date_to=data.get('date_to'),
+            ids=data.get('ids'),
+        )
+        return Response(result.to_dict())
+
     @extend_schema(tags=['invoicing'], summary='Send dunning notice for overdue invoice')
     @action(detail=True, methods=['post'], url_path='send-dunning')
     def send_dunning(self, request, pk=None):
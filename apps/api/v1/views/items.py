@@ -15,6 +15,7 @@ from rest_framework import serializers as drf_serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.api.v1.pagination import KeysetPagination
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django.db.models import Sum, Subquery, OuterRef, IntegerField, CharField, Count
 from django.db.models.functions import Coalesce
@@ -251,6 +252,7 @@ class ItemViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for product catalog items.
     For corrugated-specific items, use the corrugated item endpoints.
     """
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_active', 'item_type', 'division', 'base_uom', 'customer', 'parent', 'lifecycle_status']
     # Default (no prefix) SearchFilter behaviour is case-insensitive "contains", and
@@ -555,93 +557,41 @@ class ItemViewSet(viewsets.ModelViewSet):
     def history(self, request, pk=None):
         """
         Item 360: Combined transaction history across Estimates, RFQs, SOs, and POs.
-        Returns a unified, date-sorted list of all commercial activity for this item.
+
+        Reads the item activity index newest first, one page at a time; send
+        ``?cursor=`` for keyset pages that cost the same however deep they go.
         """
         item = self.get_object()
 
-        from apps.orders.models import (
-            EstimateLine, RFQLine, SalesOrderLine, PurchaseOrderLine,
-        )
-
-        entries = []
-
-        # Estimates
-        for line in EstimateLine.objects.filter(
-            item=item, tenant=request.tenant
-        ).select_related('estimate__customer__party'):
-            est = line.estimate
-            entries.append({
-                'type': 'ESTIMATE',
-                'date': est.date,
-                'document_number': est.estimate_number,
-                'document_id': est.id,
-                'party_name': est.customer.party.display_name,
-                'quantity': line.quantity,
-                'price': line.unit_price,
-                'line_total': line.amount,
-                'status': est.status,
-                'status_display': est.get_status_display(),
-            })
-
-        # RFQs
-        for line in RFQLine.objects.filter(
-            item=item, tenant=request.tenant
-        ).select_related('rfq__vendor__party'):
-            rfq = line.rfq
-            entries.append({
-                'type': 'RFQ',
-                'date': rfq.date,
-                'document_number': rfq.rfq_number,
-                'document_id': rfq.id,
-                'party_name': rfq.vendor.party.display_name,
-                'quantity': line.quantity,
-                'price': line.quoted_price or line.target_price,
-                'line_total': line.line_total if (line.quoted_price or line.target_price) else None,
-                'status': rfq.status,
-                'status_display': rfq.get_status_display(),
-            })
-
-        # Sales Orders
-        for line in SalesOrderLine.objects.filter(
-            item=item, tenant=request.tenant
-        ).select_related('sales_order__customer__party'):
-            so = line.sales_order
-            entries.append({
-                'type': 'SO',
-                'date': so.order_date,
-                'document_number': so.order_number,
-                'document_id': so.id,
-                'party_name': so.customer.party.display_name,
-                'quantity': line.quantity_ordered,
-                'price': line.unit_price,
-                'line_total': line.line_total,
-                'status': so.status,
-                'status_display': so.get_status_display(),
-            })
+        from apps.items.activity import SOURCES, ItemActivityService
+        from apps.items.models import ItemActivity
 
-        # Purchase Orders
-        for line in PurchaseOrderLine.objects.filter(
-            item=item, tenant=request.tenant
-        ).select_related('purchase_order__vendor__party'):
-            po = line.purchase_order
-            entries.append({
-                'type': 'PO',
-                'date': po.order_date,
-                'document_number': po.po_number,
-                'document_id': po.id,
-                'party_name': po.vendor.party.display_name,
-                'quantity': line.quantity_ordered,
-                'price': line.unit_cost,
-                'line_total': line.line_total,
-                'status': po.status,
-                'status_display': po.get_status_display(),
-            })
+        history_types = {
+            ItemActivity.ESTIMATE: 'ESTIMATE',
+            ItemActivity.RFQ: 'RFQ',
+            ItemActivity.SALES_ORDER: 'SO',
+            ItemActivity.PURCHASE_ORDER: 'PO',
+        }
 
-        # Sort by date descending
-        entries.sort(key=lambda e: e['date'], reverse=True)
+        rows = self.paginate_queryset(ItemActivityService(request.tenant).history(item))
+        entries = [
+            {
+                'type': history_types[row.doc_type],
+                'date': row.date,
+                'document_number': row.doc_number,
+                'document_id': row.doc_id,
+                'party_name': row.party.display_name if row.party else '',
+                'quantity': row.quantity,
+                'price': row.price,
+                'line_total': row.amount,
+                'status': row.status,
+                'status_display': SOURCES[row.doc_type].status_label(row.status),
+            }
+            for row in rows
+        ]
 
         serializer = ItemHistoryEntrySerializer(entries, many=True)
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(
         tags=['items'],
@@ -656,7 +606,7 @@ class ItemViewSet(viewsets.ModelViewSet):
 
         from apps.pricing.models import PriceListHead
         from apps.costing.models import CostListHead
-        from apps.orders.models import RFQLine, PurchaseOrderLine, SalesOrderLine, EstimateLine
+        from apps.orders.models import RFQLine, EstimateLine
 
         # --- Price Lists ---
         price_lists = []
@@ -740,32 +690,29 @@ class ItemViewSet(viewsets.ModelViewSet):
                 'notes': line.notes,
             })
 
-        # --- Last Buy ---
-        last_buy_line = PurchaseOrderLine.objects.filter(
-            item=item, tenant=request.tenant
-        ).select_related('purchase_order__vendor__party').order_by('-purchase_order__order_date').first()
-        if last_buy_line:
-            po = last_buy_line.purchase_order
+        # --- Last Buy / Last Sell (item activity index) ---
+        from apps.items.activity import ItemActivityService
+        from apps.items.models import ItemActivity
+        activity = ItemActivityService(request.tenant)
+
+        last_po = activity.latest(item, ItemActivity.PURCHASE_ORDER)
+        if last_po:
             last_buy = {
-                'price': last_buy_line.unit_cost,
-                'date': po.order_date,
-                'vendor_name': po.vendor.party.display_name,
-                'po_number': po.po_number,
+                'price': last_po.price,
+                'date': last_po.date,
+                'vendor_name': last_po.party.display_name if last_po.party else '',
+                'po_number': last_po.doc_number,
             }
         else:
             last_buy = None
 
-        # --- Last Sell ---
-        last_sell_line = SalesOrderLine.objects.filter(
-            item=item, tenant=request.tenant
-        ).select_related('sales_order__customer__party').order_by('-sales_order__order_date').first()
-        if last_sell_line:
-            so = last_sell_line.sales_order
+        last_so = activity.latest(item, ItemActivity.SALES_ORDER)
+        if last_so:
             last_sell = {
-                'price': last_sell_line.unit_price,
-                'date': so.order_date,
-                'customer_name': so.customer.party.display_name,
-                'so_number': so.order_number,
+                'price': last_so.price,
+                'date': last_so.date,
+                'customer_name': last_so.party.display_name if last_so.party else '',
+                'so_number': last_so.doc_number,
             }
         else:
             last_sell = None
@@ -1,7 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
 
 from apps.api.v1.views.base import pdf_response
@@ -59,6 +59,17 @@ class BinLabelsView(APIView):
             )
 
         service = LabelService(request.tenant)
+
+        if fmt == 'ZPL':
+            # Stream label by label: whole-warehouse jobs never sit in memory
+            labels = service.iter_bin_labels_zpl(
+                warehouse_id=warehouse_id,
+                location_ids=location_ids,
+            )
+            return StreamingHttpResponse(
+                (f'{zpl}\n' for zpl in labels), content_type='text/plain',
+            )
+
         try:
             result = service.generate_bin_labels(
                 warehouse_id=warehouse_id,
@@ -71,9 +82,6 @@ class BinLabelsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if fmt == 'ZPL':
-            return HttpResponse(result, content_type='text/plain')
-
         return pdf_response(result, "bin-labels.pdf", inline=True)
 
 
@@ -4,10 +4,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.cache import quote_etag
+from django.utils.http import parse_etags
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from apps.logistics.models import LicensePlate, DeliveryStop
-from apps.logistics.services import LogisticsService
+from apps.logistics.services import LogisticsService, ManifestService
+from apps.scheduling.models import DeliveryRun
 from apps.api.v1.serializers.logistics import (
     LicensePlateSerializer,
     DeliveryStopListSerializer,
@@ -155,73 +158,61 @@ class InitializeRunView(APIView):
         return Response(result.data, status=status.HTTP_201_CREATED)
 
 
+class SequenceRunView(APIView):
+    """POST /logistics/runs/{run_id}/sequence/ - Re-order a run's pending stops by route."""
+
+    @extend_schema(
+        tags=['logistics'],
+        summary='Sequence delivery stops into a route',
+        responses={200: {'type': 'object'}},
+    )
+    def post(self, request, run_id):
+        service = LogisticsService(request.tenant, request.user)
+        try:
+            result = service.sequence_run(run_id)
+        except DeliveryRun.DoesNotExist:
+            return Response({'detail': 'Run not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        context = {'request': request}
+        return Response({
+            'run': run_id,
+            'estimated_miles': result['estimated_miles'],
+            'stops': DeliveryStopListSerializer(result['stops'], many=True, context=context).data,
+            'unlocated_stops': [stop.pk for stop in result['unlocated']],
+        })
+
+
 class DriverRunView(APIView):
-    """GET /logistics/my-run/ - Get today's run manifest for authenticated driver."""
+    """
+    GET /logistics/my-run/ - Get today's run manifest for authenticated driver.
+
+    Served from the run's RunManifest snapshot with an ETag; polls that send
+    it back in If-None-Match get 304 Not Modified until the run changes.
+    """
 
     @extend_schema(
         tags=['logistics'],
         summary="Get today's delivery run for the authenticated driver",
-        responses={200: {'type': 'object'}},
+        responses={200: {'type': 'object'}, 304: None},
     )
     def get(self, request):
         service = LogisticsService(request.tenant, request.user)
-        result = service.get_my_run(request.user)
+        run = service.get_todays_run()
 
-        if not result:
+        if run is None:
             return Response({'detail': 'No run scheduled for today.'}, status=status.HTTP_404_NOT_FOUND)
 
-        run = result['run']
-        stops_data = []
-        for stop in result['stops']:
-            orders_data = []
-            for order in stop.orders.all():
-                lines_data = []
-                for line in order.lines.all():
-                    lines_data.append({
-                        'item_sku': line.item.sku,
-                        'item_name': line.item.name,
-                        'quantity': line.quantity_ordered,
-                        'uom_code': line.uom.code if line.uom else 'ea',
-                    })
-                orders_data.append({
-                    'id': order.id,
-                    'order_number': order.order_number,
-                    'customer_po': order.customer_po or '',
-                    'lines': lines_data,
-                })
-
-            # Get pallet count from LPNs
-            from apps.logistics.models import LicensePlate
-            pallet_count = LicensePlate.objects.filter(
-                order_id__in=stop.orders.values_list('id', flat=True),
-                run=stop.run,
-            ).count()
-
-            ship_to = stop.ship_to
-            stops_data.append({
-                'id': stop.id,
-                'sequence': stop.sequence,
-                'status': stop.status,
-                'customer_name': stop.customer.party.display_name if stop.customer else '',
-                'address': f"{ship_to.address_line1 or ''}, {ship_to.city or ''}, {ship_to.state or ''} {ship_to.postal_code or ''}".strip(', ') if ship_to else '',
-                'city': ship_to.city if ship_to else '',
-                'delivery_notes': stop.delivery_notes or '',
-                'pallet_count': pallet_count,
-                'orders': orders_data,
-                'arrived_at': stop.arrived_at,
-                'delivered_at': stop.delivered_at,
-            })
-
-        return Response({
-            'run_id': run.id,
-            'run_name': run.name,
-            'truck_name': result['truck_name'],
-            'scheduled_date': str(run.scheduled_date),
-            'total_stops': result['total_stops'],
-            'total_weight_lbs': str(result['total_weight_lbs']),
-            'is_complete': result['is_complete'],
-            'stops': stops_data,
-        })
+        manifest = ManifestService(request.tenant).get(run)
+        headers = {
+            'ETag': quote_etag(manifest.etag),
+            # Clients may keep the body but must revalidate before reuse
+            'Cache-Control': 'private, no-cache',
+        }
+        # If-None-Match uses weak comparison (proxies that compress mark tags W/)
+        sent = {tag.removeprefix('W/') for tag in parse_etags(request.headers.get('If-None-Match', ''))}
+        if headers['ETag'] in sent or '*' in sent:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(manifest.payload, headers=headers)
 
     @extend_schema(
         tags=['logistics'],
@@ -231,11 +222,11 @@ class DriverRunView(APIView):
     def post(self, request):
         """POST /logistics/my-run/ - Start the run (mark as in progress)."""
         service = LogisticsService(request.tenant, request.user)
-        result = service.get_my_run(request.user)
+        run = service.get_todays_run()
 
-        if not result:
+        if run is None:
             return Response({'detail': 'No run scheduled for today.'}, status=status.HTTP_404_NOT_FOUND)
 
         # Run is now active (we don't have a status field on DeliveryRun,
         # but we can track via stop statuses)
-        return Response({'detail': 'Run started.', 'run_id': result['run'].id})
+        return Response({'detail': 'Run started.', 'run_id': run.id})
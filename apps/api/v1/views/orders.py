@@ -7,6 +7,7 @@ from rest_framework import serializers as drf_serializers, viewsets, filters, st
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.api.v1.pagination import KeysetPagination
 from django.db.models import Count, Sum, F, DecimalField, ExpressionWrapper, Value
 from django.db.models.functions import Coalesce
 from drf_spectacular.utils import extend_schema, extend_schema_view, inline_serializer
@@ -236,6 +237,7 @@ class SalesOrderViewSet(viewsets.ModelViewSet):
 
     Provides CRUD operations for sales orders (outbound to customers).
     """
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
 
     def get_queryset(self):
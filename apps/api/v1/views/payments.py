@@ -4,15 +4,18 @@ ViewSets for Customer Payments (Cash Receipts).
 """
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from decimal import Decimal
 
 from apps.payments.models import CustomerPayment, OtherName, Check
-from apps.payments.services import PaymentService
+from apps.payments.services import CashApplicationService, PaymentService
+from apps.core.importers.base import MAX_CSV_BYTES
 from apps.parties.models import Customer
 from apps.accounting.models import Account
 from ..serializers.payments import (
@@ -21,6 +24,7 @@ from ..serializers.payments import (
     CreatePaymentSerializer,
     PostPaymentSerializer,
     OpenInvoiceSerializer,
+    RemittanceUploadSerializer,
     OtherNameSerializer,
     CheckListSerializer,
     CheckSerializer,
@@ -43,6 +47,7 @@ class CustomerPaymentViewSet(viewsets.ModelViewSet):
     - Create draft payments
     - Post payments with invoice applications
     - Void posted payments
+    - Apply remittance files in bulk
     """
     model = CustomerPayment
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -165,6 +170,52 @@ class CustomerPaymentViewSet(viewsets.ModelViewSet):
         return Response(output_serializer.data)
 
 
+    @extend_schema(
+        request={'multipart/form-data': RemittanceUploadSerializer},
+        description=(
+            "Auto-match a remittance/lockbox CSV to open invoices. With commit=true "
+            "the matched payments are posted; unmatched ones are returned as exceptions."
+        ),
+        tags=["Payments"]
+    )
+    @action(detail=False, methods=['post'], url_path='apply-remittance',
+            parser_classes=[MultiPartParser])
+    def apply_remittance(self, request):
+        """Apply a remittance file (dry run unless commit=true)."""
+        serializer = RemittanceUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        file = data['file']
+        if file.size > MAX_CSV_BYTES:
+            return Response(
+                {'detail': 'File exceeds 10 MB limit.'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        deposit_account = None
+        if data.get('deposit_account'):
+            deposit_account = Account.objects.get(
+                id=data['deposit_account'],
+                tenant=request.tenant
+            )
+
+        service = CashApplicationService(
+            tenant=request.tenant, user=request.user, tolerance=data.get('tolerance'),
+        )
+        try:
+            result = service.apply_file(
+                file,
+                deposit_account=deposit_account,
+                file_name=file.name,
+                dry_run=not data['commit'],
+            )
+        except DjangoValidationError as e:
+            msg = e.messages[0] if hasattr(e, 'messages') and e.messages else str(e)
+            return Response({'detail': msg}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result.to_dict())
+
+
 @extend_schema(
     description="Get open invoices for a customer (for payment application)",
     tags=["Payments"]
@@ -6,7 +6,7 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 
 from apps.api.v1.views.base import pdf_response
 from apps.reporting.models import ReportDefinition, ReportSchedule, SavedReport, ReportFavorite
@@ -797,6 +797,57 @@ class ReorderAlertsView(APIView):
         })
 
 
+class NetRequirementsView(APIView):
+    """Time-phased net requirements (MRP): projected balances and planned POs."""
+
+    @extend_schema(
+        tags=['inventory'],
+        summary='Get time-phased net requirements and planned PO suggestions',
+        parameters=[
+            OpenApiParameter('horizon', int, description='Days to plan ahead (default 90, max 365)'),
+            OpenApiParameter('bucket', str, enum=['day', 'week'], description='Bucket size (default day)'),
+            OpenApiParameter('start', str, description='First bucket date, YYYY-MM-DD (default today)'),
+            OpenApiParameter('item', int, many=True, description='Restrict to these item IDs'),
+            OpenApiParameter('shortages_only', bool, description='Only items needing a planned order'),
+        ],
+        responses={200: {'type': 'object'}}
+    )
+    def get(self, request):
+        from apps.inventory.services import NetRequirementsService
+        from django.core.exceptions import ValidationError as DjangoValidationError
+        from django.utils.dateparse import parse_date
+
+        try:
+            horizon = min(int(request.query_params.get('horizon', 90)), 365)
+            item_ids = [int(i) for i in request.query_params.getlist('item')] or None
+        except ValueError:
+            return Response(
+                {'error': 'horizon and item must be integers.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        start = None
+        if request.query_params.get('start'):
+            start = parse_date(request.query_params['start'])
+            if start is None:
+                return Response(
+                    {'error': 'Invalid start date format. Use YYYY-MM-DD.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        svc = NetRequirementsService(request.tenant, request.user)
+        try:
+            plan = svc.plan(
+                horizon_days=max(horizon, 1),
+                bucket=request.query_params.get('bucket', 'day'),
+                start=start,
+                item_ids=item_ids,
+                shortages_only=request.query_params.get('shortages_only', '').lower() in ('1', 'true'),
+            )
+        except DjangoValidationError as e:
+            return Response({'error': e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(plan)
+
+
 class GrossMarginView(APIView):
     """Gross margin report by customer and item."""
 
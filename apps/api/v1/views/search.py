@@ -21,22 +21,57 @@ class GlobalSearchView(APIView):
 
     Searches across Items, Customers, SalesOrders, Invoices.
     Returns grouped results by category, max 5 per category.
+
+    Matches come from the tenant's search index (apps.search) in a single
+    query; entity types not yet indexed fall back to direct lookups.
     """
+    PER_CATEGORY = 5
 
     def get(self, request):
         q = request.query_params.get('q', '').strip()
         if not q or len(q) < 2:
             return Response({'results': []})
 
-        results = []
-
-        # Items - search sku and name
         from apps.items.models import Item
-        items = prefix_ranked(
-            Item.objects.filter(Q(sku__icontains=q) | Q(name__icontains=q)),
-            ['sku', 'name'], q,
-        )[:5]
-        for item in items:
+        from apps.parties.models import Customer
+        from apps.orders.models import SalesOrder
+        from apps.invoicing.models import Invoice
+        from apps.search.services import SearchIndexService
+
+        querysets = {
+            'item': Item.objects.all(),
+            'customer': Customer.objects.select_related('party'),
+            'sales_order': SalesOrder.objects.select_related('customer__party'),
+            'invoice': Invoice.objects.select_related('customer__party'),
+        }
+        legacy_fields = {
+            'item': ['sku', 'name'],
+            'customer': ['party__display_name', 'party__legal_name'],
+            'sales_order': ['order_number'],
+            'invoice': ['invoice_number'],
+        }
+
+        index = SearchIndexService(request.tenant)
+        indexed = [t for t in querysets if index.is_ready(t)]
+        matches = index.top_matches(q, indexed, per_type=self.PER_CATEGORY) if indexed else {}
+
+        found = {}
+        for entity_type, qs in querysets.items():
+            if entity_type in matches:
+                ids = matches[entity_type]
+                by_id = qs.in_bulk(ids)
+                found[entity_type] = [by_id[pk] for pk in ids if pk in by_id]
+            else:
+                fields = legacy_fields[entity_type]
+                match = Q()
+                for field in fields:
+                    match |= Q(**{f'{field}__icontains': q})
+                found[entity_type] = list(
+                    prefix_ranked(qs.filter(match), fields, q)[:self.PER_CATEGORY]
+                )
+
+        results = []
+        for item in found['item']:
             results.append({
                 'category': 'Items',
                 'id': item.id,
@@ -45,32 +80,16 @@ class GlobalSearchView(APIView):
                 'url': f'/items/{item.id}',
             })
 
-        # Customers - search party display_name and party name
-        from apps.parties.models import Customer
-        customers = prefix_ranked(
-            Customer.objects.select_related('party').filter(
-                Q(party__display_name__icontains=q) | Q(party__name__icontains=q)
-            ),
-            ['party__display_name', 'party__name'], q,
-        )[:5]
-        for cust in customers:
+        for cust in found['customer']:
             results.append({
                 'category': 'Customers',
                 'id': cust.id,
-                'title': cust.party.display_name or cust.party.name,
+                'title': cust.party.display_name or cust.party.legal_name,
                 'subtitle': f'Customer #{cust.id}',
                 'url': f'/parties?tab=customers&id={cust.id}',
             })
 
-        # Sales Orders - search order_number
-        from apps.orders.models import SalesOrder
-        orders = prefix_ranked(
-            SalesOrder.objects.select_related('customer__party').filter(
-                Q(order_number__icontains=q)
-            ),
-            ['order_number'], q,
-        )[:5]
-        for order in orders:
+        for order in found['sales_order']:
             customer_name = ''
             if order.customer and order.customer.party:
                 customer_name = order.customer.party.display_name or ''
@@ -82,15 +101,7 @@ class GlobalSearchView(APIView):
                 'url': f'/orders?tab=sales&id={order.id}',
             })
 
-        # Invoices - search invoice_number
-        from apps.invoicing.models import Invoice
-        invoices = prefix_ranked(
-            Invoice.objects.select_related('customer__party').filter(
-                Q(invoice_number__icontains=q)
-            ),
-            ['invoice_number'], q,
-        )[:5]
-        for inv in invoices:
+        for inv in found['invoice']:
             customer_name = ''
             if inv.customer and inv.customer.party:
                 customer_name = inv.customer.party.display_name or ''
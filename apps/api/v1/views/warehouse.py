@@ -7,6 +7,7 @@ Provides endpoints for:
 - Lot tracking (CRUD)
 - Stock queries by location
 - Stock movement operations
+- Pick-path / wave planning
 """
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
@@ -21,7 +22,10 @@ from apps.warehousing.models import (
     CycleCount, CycleCountLine,
 )
 from apps.warehousing.services import StockMoveService, CycleCountService
+from apps.warehousing.pick_path import PickPathPlanner
+from apps.warehousing.models import Warehouse
 from apps.items.models import Item
+from apps.orders.models import SalesOrder
 from apps.api.v1.serializers.warehouse import (
     WarehouseLocationSerializer,
     LotSerializer,
@@ -195,6 +199,85 @@ class ScannerItemLookupView(APIView):
         })
 
 
+class PickWaveView(APIView):
+    """
+    POST /warehouse/pick-wave/ - Plan one walk for several sales orders.
+
+    Body: {"sales_orders": [ids], "warehouse": id (optional)}
+    Stops are in serpentine order; the same item/lot in the same bin is
+    merged into one pick with a per-order breakdown.
+    """
+
+    @extend_schema(
+        tags=['warehouse'],
+        summary='Plan a batch (wave) pick route for sales orders',
+        request={'type': 'object'},
+        responses={200: {'type': 'object'}},
+    )
+    def post(self, request):
+        order_ids = request.data.get('sales_orders') or []
+        if not isinstance(order_ids, list) or not order_ids:
+            return Response({'detail': 'sales_orders must be a non-empty list of ids.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        orders = list(SalesOrder.objects.filter(tenant=request.tenant, pk__in=order_ids))
+        if len(orders) != len(set(order_ids)):
+            return Response({'detail': 'One or more sales orders not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        warehouse = None
+        if request.data.get('warehouse'):
+            try:
+                warehouse = Warehouse.objects.get(pk=request.data['warehouse'], tenant=request.tenant)
+            except Warehouse.DoesNotExist:
+                return Response({'detail': 'Warehouse not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        route = PickPathPlanner(request.tenant).plan_orders(orders, warehouse=warehouse)
+
+        def pick_data(pick):
+            return {
+                'item': pick['item'].id,
+                'sku': pick['item'].sku,
+                'item_name': pick['item'].name,
+                'lot': pick['lot'].lot_number if pick.get('lot') else None,
+                'uom': pick['uom'],
+                'quantity': str(pick['quantity']),
+            }
+
+        return Response({
+            'stop_count': route['stop_count'],
+            'total_distance_ft': str(route['total_distance_ft']),
+            'stops': [
+                {
+                    'sequence': stop['sequence'],
+                    'location': stop['location'].id,
+                    'location_name': stop['location_name'],
+                    'aisle': stop['aisle'],
+                    'rack': stop['rack'],
+                    'level': stop['level'],
+                    'distance_ft': str(stop['distance_ft']),
+                    'picks': [
+                        {
+                            **pick_data(pick),
+                            'orders': [
+                                {**entry, 'quantity': str(entry['quantity'])}
+                                for entry in pick['orders']
+                            ],
+                        }
+                        for pick in stop['picks']
+                    ],
+                }
+                for stop in route['stops']
+            ],
+            'unlocated': [
+                {
+                    **pick_data(pick),
+                    'order_number': pick['order_number'],
+                    'line_number': pick['line_number'],
+                }
+                for pick in route['unlocated']
+            ],
+        })
+
+
 @extend_schema_view(
     list=extend_schema(tags=['warehouse'], summary='List cycle counts'),
     retrieve=extend_schema(tags=['warehouse'], summary='Get cycle count details'),
@@ -12,6 +12,7 @@ in the calling code so that WebSocket failures never break the main
 database transaction flow.
 """
 
+import asyncio
 import logging
 
 from channels.layers import get_channel_layer
@@ -374,3 +375,51 @@ def send_notification(user_id, notification_data):
         )
     except Exception:
         logger.warning(f'Failed to send WebSocket notification to user {user_id}', exc_info=True)
+
+
+def send_notifications(notifications):
+    """
+    Send many real-time notifications in one batch.
+
+    All group_send calls run concurrently inside a single event-loop hop
+    instead of one blocking async_to_sync round trip per recipient, so the
+    Redis layer pipelines them.
+
+    Args:
+        notifications: Iterable of (user_id, notification_data) pairs; see
+            send_notification() for the notification_data shape.
+    """
+    notifications = list(notifications)
+    if not notifications:
+        return
+
+    layer = _get_channel_layer()
+    if not layer:
+        return
+
+    async def _send_all():
+        results = await asyncio.gather(
+            *(
+                layer.group_send(
+                    f'notifications_{user_id}',
+                    {
+                        'type': 'notification.new',
+                        'data': {'type': 'notification_new', **notification_data},
+                    },
+                )
+                for user_id, notification_data in notifications
+            ),
+            return_exceptions=True,
+        )
+        return [
+            user_id
+            for (user_id, _), result in zip(notifications, results)
+            if isinstance(result, Exception)
+        ]
+
+    try:
+        failed = async_to_sync(_send_all)()
+        if failed:
+            logger.warning('Failed to send WebSocket notification to users %s', failed)
+    except Exception:
+        logger.warning('Failed to send batched WebSocket notifications', exc_info=True)
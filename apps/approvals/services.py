@@ -142,16 +142,10 @@ class ApprovalService:
         return Decimal('0')
 
     def _get_customer_outstanding(self, customer):
-        """Calculate total outstanding invoices for a customer."""
-        from apps.invoicing.models import Invoice
-        from django.db.models import Sum
+        """Open A/R balance for a customer, read from the open-items rollup."""
+        from apps.invoicing.services import OpenItemService
 
-        result = Invoice.objects.filter(
-            customer=customer,
-            status__in=['sent', 'partial', 'overdue'],
-        ).aggregate(total=Sum('total_amount'))
-
-        return result['total'] or Decimal('0')
+        return OpenItemService(self.tenant).get_customer_balance(customer)
 
     def create_approval_request(self, order, rule):
         """
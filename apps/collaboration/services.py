@@ -3,7 +3,8 @@
 Collaboration services for comments, mentions, and tasks.
 
 All functions create notifications and broadcast via WebSocket
-using the existing notify_user/notify_group infrastructure.
+using the existing notify_user/notify_group infrastructure; multi-recipient
+fan-out goes through NotificationDispatcher.
 """
 import re
 
@@ -12,7 +13,9 @@ from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 
-from apps.notifications.services import notify_user, notify_group
+from apps.notifications.services import (
+    NotificationDispatcher, notify_user, notify_users, notify_group,
+)
 from .models import Comment, Mention, Task
 
 User = get_user_model()
@@ -91,52 +94,48 @@ def create_comment(tenant, author, content_object, body, parent=None):
     link = _get_transaction_link(content_object)
     label = _get_transaction_label(content_object)
 
+    # Mentions and notifications are written in bulk and pushed in one
+    # batch after commit, so a large @group doesn't stall the request.
+    mentions = []
+    dispatcher = NotificationDispatcher(tenant)
+    notification_kwargs = {
+        'message': body[:200],
+        'link': link,
+        'notification_type': 'MENTION',
+        'content_type': ct,
+        'object_id': content_object.pk,
+    }
+
     # Notify mentioned users
-    mentioned_users = User.objects.filter(id__in=user_ids).exclude(id=author.id)
+    mentioned_users = list(User.objects.filter(id__in=user_ids).exclude(id=author.id))
     for user in mentioned_users:
-        Mention.objects.create(
-            tenant=tenant,
-            comment=comment,
-            mentioned_user=user,
-        )
-        notify_user(
-            tenant=tenant,
-            recipient=user,
-            title=f'{author.name or author.username} mentioned you on {label}',
-            message=body[:200],
-            link=link,
-            notification_type='MENTION',
-            content_type=ct,
-            object_id=content_object.pk,
-        )
+        mentions.append(Mention(tenant=tenant, comment=comment, mentioned_user=user))
+    dispatcher.add_many(
+        mentioned_users,
+        title=f'{author.name or author.username} mentioned you on {label}',
+        **notification_kwargs,
+    )
 
     # Notify mentioned groups
+    groups = Group.objects.in_bulk(group_names, field_name='name')
     for group_name in group_names:
-        try:
-            group = Group.objects.get(name=group_name)
-        except Group.DoesNotExist:
+        group = groups.get(group_name)
+        if group is None:
             continue
 
-        Mention.objects.create(
-            tenant=tenant,
-            comment=comment,
-            mentioned_group=group,
-        )
+        mentions.append(Mention(tenant=tenant, comment=comment, mentioned_group=group))
         # Notify all users in the group except the author
         group_users = User.objects.filter(groups=group).exclude(id=author.id)
         # Exclude users already notified individually
         group_users = group_users.exclude(id__in=user_ids)
-        for user in group_users:
-            notify_user(
-                tenant=tenant,
-                recipient=user,
-                title=f'{author.name or author.username} mentioned @{group_name} on {label}',
-                message=body[:200],
-                link=link,
-                notification_type='MENTION',
-                content_type=ct,
-                object_id=content_object.pk,
-            )
+        dispatcher.add_many(
+            group_users,
+            title=f'{author.name or author.username} mentioned @{group_name} on {label}',
+            **notification_kwargs,
+        )
+
+    Mention.objects.bulk_create(mentions)
+    dispatcher.dispatch()
 
     return comment
 
@@ -208,16 +207,15 @@ def update_task_status(task, user, new_status):
     if task.assigned_to and task.assigned_to != user:
         recipients.add(task.assigned_to)
 
-    for recipient in recipients:
-        notify_user(
-            tenant=task.tenant,
-            recipient=recipient,
-            title=f'Task "{task.title}" marked {status_label} on {label}',
-            message=f'{user.name or user.username} changed status from {old_status} to {new_status}',
-            link=link,
-            notification_type='TASK',
-            content_type=ct,
-            object_id=task.object_id,
-        )
+    notify_users(
+        tenant=task.tenant,
+        recipients=recipients,
+        title=f'Task "{task.title}" marked {status_label} on {label}',
+        message=f'{user.name or user.username} changed status from {old_status} to {new_status}',
+        link=link,
+        notification_type='TASK',
+        content_type=ct,
+        object_id=task.object_id,
+    )
 
     return task
@@ -1,4 +1,3 @@
-# apps/contracts/apps.py
 from django.apps import AppConfig
 
 
@@ -6,3 +5,7 @@ class ContractsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.contracts'
     label = 'contracts'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.contracts.signals
@@ -0,0 +1,38 @@
+"""Management command to verify or rebuild stored contract line release balances."""
+from django.core.management.base import BaseCommand
+from apps.tenants.models import Tenant
+from apps.contracts.services import ContractBalanceService
+from shared.managers import set_current_tenant
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute ContractLine.released_qty from releases, ignoring cancelled '
+        'orders. Use --verify to report drift without writing.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify', action='store_true',
+            help='Report differences without writing anything',
+        )
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total_problems = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            problems = ContractBalanceService(tenant).rebuild(verify_only=options['verify'])
+            for problem in problems:
+                self.stdout.write(f"  {tenant.name}: {problem}")
+            total_problems += len(problems)
+
+        verb = 'Found' if options['verify'] else 'Fixed'
+        self.stdout.write(self.style.SUCCESS(f"Done. {verb} {total_problems} contract balance discrepancies."))
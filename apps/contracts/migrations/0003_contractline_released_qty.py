@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:45
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_released_qty(apps, schema_editor):
+    ContractLine = apps.get_model('contracts', 'ContractLine')
+    ContractRelease = apps.get_model('contracts', 'ContractRelease')
+    released = ContractRelease.objects.filter(
+        contract_line=OuterRef('pk'),
+    ).exclude(
+        sales_order_line__sales_order__status='cancelled',
+    ).order_by().values('contract_line').annotate(
+        total=Sum('quantity_ordered'),
+    ).values('total')
+    ContractLine.objects.update(released_qty=Coalesce(Subquery(released), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0002_contract_type_and_direct_class'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contractline',
+            name='released_qty',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Quantity released on orders that are not cancelled (maintained by signals)'),
+        ),
+        migrations.RunPython(backfill_released_qty, migrations.RunPython.noop),
+    ]
@@ -6,11 +6,14 @@ Models:
 - Contract: Blanket order header with customer commitment
 - ContractLine: Line items with committed quantities per item
 - ContractRelease: Links releases to sales order lines, tracks balance drawdown
+
+ContractLine.released_qty is stored, not computed: signals in
+apps.contracts.signals refresh it whenever a release, its sales order line
+or its sales order's status changes (see ContractBalanceService).
 """
 from django.db import models
-from django.db.models import Sum
 from django.utils import timezone
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 from shared.models import TenantMixin, TimestampMixin
 
 
@@ -98,7 +101,7 @@ class Contract(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Contract"
@@ -126,11 +129,13 @@ class Contract(TenantMixin, TimestampMixin):
             return False
         return True
 
+    # The totals below read self.lines.all() so a prefetch_related('lines')
+    # on list querysets serves every contract without further queries.
+
     @property
     def total_committed_qty(self):
         """Sum of all line blanket quantities."""
-        result = self.lines.aggregate(total=Sum('blanket_qty'))
-        return result['total'] or 0
+        return sum(line.blanket_qty for line in self.lines.all())
 
     @property
     def total_released_qty(self):
@@ -153,7 +158,7 @@ class Contract(TenantMixin, TimestampMixin):
     @property
     def num_lines(self):
         """Count of line items."""
-        return self.lines.count()
+        return len(self.lines.all())
 
     def save(self, *args, **kwargs):
         """Auto-generate contract number if not set."""
@@ -212,6 +217,11 @@ class ContractLine(TenantMixin, TimestampMixin):
         blank=True,
         help_text="Line-specific notes"
     )
+    released_qty = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Quantity released on orders that are not cancelled (maintained by signals)"
+    )
 
     class Meta:
         verbose_name = "Contract Line"
@@ -226,14 +236,6 @@ class ContractLine(TenantMixin, TimestampMixin):
     def __str__(self):
         return f"{self.contract.contract_number} Line {self.line_number}: {self.item.sku}"
 
-    @property
-    def released_qty(self):
-        """Sum of all quantities released against this line (excluding cancelled orders)."""
-        result = self.releases.exclude(
-            sales_order_line__sales_order__status='cancelled'
-        ).aggregate(total=Sum('quantity_ordered'))
-        return result['total'] or 0
-
     @property
     def remaining_qty(self):
         """Balance remaining to be released."""
@@ -297,7 +299,11 @@ class ContractRelease(TenantMixin, TimestampMixin):
     def save(self, *args, **kwargs):
         """Capture balance snapshot before saving."""
         if not self.pk:  # New release
-            # Calculate balance before this release (current remaining + this qty since it hasn't been counted yet)
-            self.balance_before = self.contract_line.remaining_qty
+            # Read the stored balance rather than the (possibly stale) loaded
+            # line; this release is not counted in it yet.
+            blanket_qty, released_qty = ContractLine.objects.all_tenants().values_list(
+                'blanket_qty', 'released_qty',
+            ).get(pk=self.contract_line_id)
+            self.balance_before = max(0, blanket_qty - released_qty)
             self.balance_after = max(0, self.balance_before - self.quantity_ordered)
         super().save(*args, **kwargs)
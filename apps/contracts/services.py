@@ -6,9 +6,13 @@ ContractService handles:
 - Creating releases (sales orders) from contract lines
 - Validating release quantities against remaining balance
 - Auto-expiring contracts past their end date
+
+ContractBalanceService maintains the stored ContractLine.released_qty.
 """
 from decimal import Decimal
 from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
@@ -35,7 +39,7 @@ class ContractService:
         Returns: (SalesOrder, ContractRelease)
         """
         from apps.orders.models import SalesOrder, SalesOrderLine
-        from apps.contracts.models import ContractRelease
+        from apps.contracts.models import ContractLine, ContractRelease
 
         contract = contract_line.contract
 
@@ -90,6 +94,15 @@ class ContractService:
             )
 
         with transaction.atomic():
+            # Lock the line so concurrent releases can't both pass the
+            # balance check, then re-check against the stored balance.
+            locked_line = ContractLine.objects.select_for_update().get(pk=contract_line.pk)
+            if quantity > locked_line.remaining_qty:
+                raise ValidationError(
+                    f"Release quantity ({quantity}) exceeds remaining balance ({locked_line.remaining_qty}) "
+                    f"on contract line {contract_line.line_number}."
+                )
+
             # Generate order number
             order_number = self._generate_order_number()
 
@@ -132,6 +145,9 @@ class ContractService:
             from apps.documents.models import record_link
             record_link(contract, sales_order, 'contract_release', self.tenant, user=self.user)
 
+            # The release signal updated the stored balance; keep the caller's
+            # instance current.
+            contract_line.refresh_from_db(fields=['released_qty'])
             return sales_order, release
 
     def create_multi_line_release(self, release_lines, ship_to=None, scheduled_date=None, notes='', customer_po=''):
@@ -207,6 +223,23 @@ class ContractService:
             raise ValidationError("No ship-to location specified and no default available.")
 
         with transaction.atomic():
+            # Lock the lines (in id order, to avoid deadlocks) and re-check the
+            # stored balances now that no other release can change them.
+            requested = {}
+            for rl in release_lines:
+                requested[rl['contract_line_id']] = requested.get(rl['contract_line_id'], 0) + rl['quantity']
+            locked = ContractLine.objects.select_for_update().filter(
+                id__in=requested,
+            ).order_by('id')
+            for locked_line in locked:
+                if requested[locked_line.id] > locked_line.remaining_qty:
+                    cl = contract_lines[locked_line.id]
+                    raise ValidationError(
+                        f"Release quantity ({requested[locked_line.id]}) exceeds remaining "
+                        f"({locked_line.remaining_qty}) on contract {cl.contract.contract_number} "
+                        f"line {cl.line_number}."
+                    )
+
             order_number = self._generate_order_number()
 
             sales_order = SalesOrder.objects.create(
@@ -313,3 +346,88 @@ class ContractService:
                 if num > max_num:
                     max_num = num
         return f"SO-{str(max_num + 1).zfill(6)}"
+
+
+def _released_qty_subquery():
+    """Released quantity of the outer ContractLine, ignoring cancelled orders."""
+    from apps.contracts.models import ContractRelease
+
+    released = ContractRelease.objects.all_tenants().filter(
+        contract_line=OuterRef('pk'),
+    ).exclude(
+        sales_order_line__sales_order__status='cancelled',
+    ).order_by().values('contract_line').annotate(
+        total=Sum('quantity_ordered'),
+    ).values('total')
+    return Coalesce(Subquery(released), 0)
+
+
+class ContractBalanceService:
+    """
+    Maintains ContractLine.released_qty.
+
+    Signals (see apps.contracts.signals) call ``refresh_lines`` when a
+    release is created, changed or deleted, when a released sales order
+    line changes quantity, and when a sales order is cancelled or
+    reinstated. Each refresh recomputes the affected lines in one UPDATE,
+    inside the caller's transaction. ``rebuild`` checks or repairs every
+    line of a tenant.
+
+    Usage:
+        ContractBalanceService.refresh_lines([line.pk])
+        problems = ContractBalanceService(tenant).rebuild(verify_only=True)
+    """
+
+    def __init__(self, tenant, user=None):
+        self.tenant = tenant
+        self.user = user
+
+    @staticmethod
+    def refresh_lines(line_ids):
+        """
+        Recompute released_qty for the given contract lines.
+
+        Takes ids so signal handlers never load the tenant or lines.
+        """
+        from apps.contracts.models import ContractLine
+
+        line_ids = set(line_ids)
+        if not line_ids:
+            return 0
+        return ContractLine.objects.all_tenants().filter(
+            pk__in=line_ids,
+        ).update(released_qty=_released_qty_subquery())
+
+    def rebuild(self, verify_only=False):
+        """
+        Recompute released_qty for every contract line of this tenant.
+
+        Args:
+            verify_only: Only report differences; write nothing.
+
+        Returns:
+            list of str describing lines whose stored balance was wrong
+            (empty when every line was correct)
+        """
+        from apps.contracts.models import ContractLine
+
+        stale = ContractLine.objects.all_tenants().filter(
+            tenant=self.tenant,
+        ).annotate(
+            expected_qty=_released_qty_subquery(),
+        ).exclude(
+            released_qty=F('expected_qty'),
+        ).select_related('contract')
+
+        problems = []
+        stale_ids = []
+        for line in stale:
+            problems.append(
+                f"contract {line.contract.contract_number} line {line.line_number}: "
+                f"released {line.released_qty} != {line.expected_qty}"
+            )
+            stale_ids.append(line.pk)
+
+        if stale_ids and not verify_only:
+            self.refresh_lines(stale_ids)
+        return problems
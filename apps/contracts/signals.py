@@ -0,0 +1,52 @@
+# apps/contracts/signals.py
+"""
+Signals that keep ContractLine.released_qty in step with releases.
+
+A line's released quantity changes when a release is created, changed or
+deleted (including through its sales order line being deleted), when the
+released sales order line's quantity changes, and when the sales order is
+cancelled or reinstated. Each case refreshes only the affected lines.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.orders.models import SalesOrder, SalesOrderLine
+
+from .models import ContractRelease
+
+
+@receiver(post_save, sender=ContractRelease)
+@receiver(post_delete, sender=ContractRelease)
+def refresh_release_line(sender, instance, raw=False, **kwargs):
+    """Recompute the balance of the release's contract line."""
+    if raw:
+        return
+    from .services import ContractBalanceService
+    ContractBalanceService.refresh_lines([instance.contract_line_id])
+
+
+@receiver(post_save, sender=SalesOrderLine)
+def mirror_release_quantity(sender, instance, raw=False, **kwargs):
+    """Carry a released order line's new quantity onto its release."""
+    if raw:
+        return
+    from .services import ContractBalanceService
+    releases = ContractRelease.objects.all_tenants().filter(
+        sales_order_line_id=instance.pk,
+    ).exclude(quantity_ordered=instance.quantity_ordered)
+    line_ids = list(releases.values_list('contract_line_id', flat=True))
+    if line_ids:
+        releases.update(quantity_ordered=instance.quantity_ordered)
+        ContractBalanceService.refresh_lines(line_ids)
+
+
+@receiver(post_save, sender=SalesOrder)
+def refresh_order_lines(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Recompute lines released on this order, which may have been (un)cancelled."""
+    if raw or created or (update_fields is not None and 'status' not in update_fields):
+        return
+    from .services import ContractBalanceService
+    line_ids = ContractRelease.objects.all_tenants().filter(
+        sales_order_line__sales_order_id=instance.pk,
+    ).values_list('contract_line_id', flat=True)
+    ContractBalanceService.refresh_lines(line_ids)
@@ -0,0 +1,132 @@
+# apps/contracts/tests/test_balances.py
+"""
+Tests for the stored ContractLine.released_qty balance.
+
+Test coverage:
+- Balance follows release create/delete, SO line quantity changes and
+  order cancel/reinstate
+- Services lock and re-check the stored balance
+- Contract totals and the list endpoint read stored values
+- rebuild_contract_balances verify/repair
+"""
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.contracts.models import Contract, ContractLine, ContractRelease
+from apps.contracts.services import ContractBalanceService, ContractService
+
+from .test_contracts import ContractsTestCase
+
+
+class ContractBalanceTests(ContractsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.contract = Contract.objects.create(
+            tenant=self.tenant, customer=self.customer, status='active',
+            ship_to=self.location, blanket_po='BPO-1',
+        )
+        self.line = ContractLine.objects.create(
+            tenant=self.tenant, contract=self.contract, line_number=10,
+            item=self.item1, blanket_qty=1000, uom=self.uom_each, unit_price=2,
+        )
+        self.service = ContractService(self.tenant, self.user)
+
+    def _stored(self, line=None):
+        return ContractLine.objects.get(pk=(line or self.line).pk).released_qty
+
+    def test_release_updates_stored_balance(self):
+        order, release = self.service.create_release(self.line, 300)
+        self.assertEqual(self._stored(), 300)
+        self.assertEqual(self.line.remaining_qty, 700)
+        self.assertEqual((release.balance_before, release.balance_after), (1000, 700))
+
+        _, second = self.service.create_release(self.line, 200)
+        self.assertEqual((second.balance_before, second.balance_after), (700, 500))
+        self.assertEqual(self._stored(), 500)
+
+    def test_so_line_quantity_change_is_mirrored(self):
+        order, release = self.service.create_release(self.line, 300)
+        so_line = order.lines.get()
+        so_line.quantity_ordered = 450
+        so_line.save()
+        release.refresh_from_db()
+        self.assertEqual(release.quantity_ordered, 450)
+        self.assertEqual(self._stored(), 450)
+
+    def test_cancel_and_reinstate_order(self):
+        order, _ = self.service.create_release(self.line, 300)
+        order.status = 'cancelled'
+        order.save()
+        self.assertEqual(self._stored(), 0)
+        order.status = 'confirmed'
+        order.save(update_fields=['status'])
+        self.assertEqual(self._stored(), 300)
+
+    def test_deleting_so_line_removes_release(self):
+        order, _ = self.service.create_release(self.line, 300)
+        order.lines.all().delete()
+        self.assertFalse(ContractRelease.objects.exists())
+        self.assertEqual(self._stored(), 0)
+
+    def test_over_release_rejected_against_stored_balance(self):
+        self.service.create_release(self.line, 900)
+        stale = ContractLine.objects.get(pk=self.line.pk)
+        stale.released_qty = 0   # e.g. loaded before the other release
+        with self.assertRaises(ValidationError):
+            self.service.create_release(stale, 200)
+        with self.assertRaises(ValidationError):
+            self.service.create_multi_line_release([
+                {'contract_line_id': self.line.pk, 'quantity': 60},
+                {'contract_line_id': self.line.pk, 'quantity': 60},
+            ])
+        self.assertEqual(self._stored(), 900)
+
+    def test_contract_totals_use_prefetched_lines(self):
+        ContractLine.objects.create(
+            tenant=self.tenant, contract=self.contract, line_number=20,
+            item=self.item2, blanket_qty=500, uom=self.uom_each, unit_price=1,
+        )
+        self.service.create_release(self.line, 250)
+        contract = Contract.objects.prefetch_related('lines').get(pk=self.contract.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            totals = (
+                contract.total_committed_qty, contract.total_released_qty,
+                contract.total_remaining_qty, contract.completion_percentage,
+                contract.num_lines,
+            )
+        self.assertEqual(totals, (1500, 250, 1250, 16.7, 2))
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_list_endpoint_query_count_is_flat(self):
+        for n in range(3):
+            other = Contract.objects.create(tenant=self.tenant, customer=self.customer, status='active')
+            for ln in (10, 20):
+                ContractLine.objects.create(
+                    tenant=self.tenant, contract=other, line_number=ln,
+                    item=self.item1, blanket_qty=100, uom=self.uom_each,
+                )
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/contracts/')
+        self.assertEqual(response.status_code, 200)
+        line_table = ContractLine._meta.db_table
+        line_queries = [q for q in ctx.captured_queries if f'FROM "{line_table}"' in q['sql']]
+        self.assertEqual(len(line_queries), 1)
+
+    def test_rebuild_command_repairs_drift(self):
+        self.service.create_release(self.line, 300)
+        ContractLine.objects.filter(pk=self.line.pk).update(released_qty=5)
+
+        out = StringIO()
+        call_command('rebuild_contract_balances', '--verify', '--tenant', self.tenant.subdomain, stdout=out)
+        self.assertIn('released 5 != 300', out.getvalue())
+        self.assertEqual(self._stored(), 5)
+
+        problems = ContractBalanceService(self.tenant).rebuild()
+        self.assertEqual(len(problems), 1)
+        self.assertEqual(self._stored(), 300)
+        self.assertEqual(ContractBalanceService(self.tenant).rebuild(verify_only=True), [])
@@ -1,9 +1,15 @@
+import codecs
 import csv
 import io
 from django.db import transaction
 
 MAX_CSV_BYTES = 10 * 1024 * 1024  # 10 MB
 MAX_CSV_ROWS = 50_000
+BULK_CHUNK_SIZE = 1000
+
+
+class CsvStreamError(ValueError):
+    """Raised mid-stream for undecodable content or too many rows."""
 
 
 class BaseCsvImporter:
@@ -14,8 +20,16 @@ class BaseCsvImporter:
     - required_columns: list of required CSV column headers
     - validate_row(row_num, row): validate a single row, return list of error strings
     - process_row(row_num, row): create/update model instance, return created object
+
+    Importers that set ``supports_bulk = True`` also implement the bulk hooks
+    (preload, validate_row_bulk, stage_row, flush) and can be run with
+    ``run(file, bulk=True)``: the CSV is streamed, every referenced key is
+    loaded once into memory, and staged rows are written with
+    ``bulk_create``/``bulk_update`` every ``bulk_chunk_size`` rows.
     """
     required_columns = []
+    supports_bulk = False
+    bulk_chunk_size = BULK_CHUNK_SIZE
 
     def __init__(self, tenant, user=None):
         self.tenant = tenant
@@ -47,6 +61,39 @@ class BaseCsvImporter:
                 raise ValueError('CSV exceeds 50000 row limit.')
         return rows, reader.fieldnames or []
 
+    def iter_csv(self, file):
+        """
+        Stream an uploaded CSV file as dicts without reading it into memory.
+
+        Returns:
+            (fieldnames, rows iterator). Decoding errors and the row cap
+            surface while iterating, as CsvStreamError.
+        """
+        if hasattr(file, 'read'):
+            if isinstance(file.read(0), bytes):
+                lines = codecs.iterdecode(file, 'utf-8-sig')
+            else:
+                lines = file
+        else:
+            lines = io.StringIO(file)
+
+        try:
+            reader = csv.DictReader(lines)
+            fieldnames = reader.fieldnames or []
+        except (UnicodeDecodeError, ValueError):
+            raise ValueError('File is not valid UTF-8 CSV.')
+
+        def rows():
+            try:
+                for count, row in enumerate(reader, start=1):
+                    if count > MAX_CSV_ROWS:
+                        raise CsvStreamError('CSV exceeds 50000 row limit.')
+                    yield row
+            except UnicodeDecodeError:
+                raise CsvStreamError('File is not valid UTF-8 CSV.')
+
+        return fieldnames, rows()
+
     def check_columns(self, fieldnames):
         """Verify required columns are present in CSV."""
         missing = [col for col in self.required_columns if col not in fieldnames]
@@ -73,13 +120,40 @@ class BaseCsvImporter:
         """
         pass
 
-    def run(self, file, commit=False):
+    # -- Bulk mode hooks ---------------------------------------------------
+
+    def preload(self):
+        """Load every key the rows may reference into in-memory indexes."""
+        pass
+
+    def validate_row_bulk(self, row_num, row):
+        """Validate a single row against the preloaded indexes."""
+        raise NotImplementedError
+
+    def stage_row(self, row_num, row):
+        """
+        Build unsaved instances for a valid row and update the indexes so
+        later rows see it (duplicate keys, generated codes).
+        Return 'created' or 'updated'.
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Write staged instances with bulk_create/bulk_update and clear them."""
+        pass
+
+    def discard_staged(self):
+        """Drop staged instances without writing (dry run)."""
+        pass
+
+    def run(self, file, commit=False, bulk=False):
         """
         Orchestrate the import process.
 
         Args:
             file: Uploaded CSV file
             commit: If False, validate only (dry run). If True, save to DB.
+            bulk: Use the bulk engine when the importer supports it.
 
         Returns:
             dict: {
@@ -90,6 +164,9 @@ class BaseCsvImporter:
                 'errors': [{'row': int, 'message': str}, ...],
             }
         """
+        if bulk and self.supports_bulk:
+            return self.run_bulk(file, commit=commit)
+
         # load_csv raises ValueError for encoding errors or row-count exceeded
         try:
             rows, fieldnames = self.load_csv(file)
@@ -163,3 +240,99 @@ class BaseCsvImporter:
             'updated': updated_count,
             'errors': errors,
         }
+
+    def run_bulk(self, file, commit=False):
+        """
+        Bulk variant of ``run`` with the same report shape and
+        all-or-nothing semantics.
+
+        Rows are streamed, validated against ``preload()`` indexes and staged;
+        on commit the staged instances are flushed every ``bulk_chunk_size``
+        rows inside the same savepoint, so any error still rolls back the
+        whole file. Dry runs stage and discard, which also catches duplicate
+        keys within the file.
+        """
+        try:
+            fieldnames, rows = self.iter_csv(file)
+        except ValueError as e:
+            return {
+                'total': 0,
+                'valid': 0,
+                'created': 0,
+                'updated': 0,
+                'errors': [{'row': 0, 'message': str(e)}],
+            }
+
+        missing = self.check_columns(fieldnames)
+        if missing:
+            return {
+                'total': 0,
+                'valid': 0,
+                'created': 0,
+                'updated': 0,
+                'errors': [{'row': 0, 'message': f"Missing required columns: {', '.join(missing)}"}],
+            }
+
+        errors = []
+        total = 0
+        valid_count = 0
+        created_count = 0
+        updated_count = 0
+
+        with transaction.atomic():
+            sid = transaction.savepoint()
+            try:
+                self.preload()
+                staged = 0
+                for i, row in enumerate(rows, start=2):
+                    total += 1
+                    row = {k: (v.strip() if v else '') for k, v in row.items()}
+
+                    row_errors = self.validate_row_bulk(i, row)
+                    if row_errors:
+                        for err in row_errors:
+                            errors.append({'row': i, 'message': err})
+                        continue
+
+                    valid_count += 1
+                    result = self.stage_row(i, row)
+                    if commit and not errors:
+                        if result == 'created':
+                            created_count += 1
+                        elif result == 'updated':
+                            updated_count += 1
+
+                    staged += 1
+                    if staged >= self.bulk_chunk_size:
+                        if commit and not errors:
+                            self.flush()
+                        else:
+                            self.discard_staged()
+                        staged = 0
+
+                if commit and not errors:
+                    self.flush()
+                    self.post_process()
+                else:
+                    self.discard_staged()
+
+                if not commit or errors:
+                    transaction.savepoint_rollback(sid)
+                else:
+                    transaction.savepoint_commit(sid)
+
+            except CsvStreamError as e:
+                # Streaming errors (encoding, row limit) abort the whole file.
+                transaction.savepoint_rollback(sid)
+                errors.append({'row': 0, 'message': str(e)})
+            except Exception as e:
+                transaction.savepoint_rollback(sid)
+                errors.append({'row': 0, 'message': f"Unexpected error: {str(e)}"})
+
+        return {
+            'total': total,
+            'valid': valid_count,
+            'created': created_count,
+            'updated': updated_count,
+            'errors': errors,
+        }
@@ -13,6 +13,8 @@ from ._helpers import (
     validate_phone_lengths,
     upsert_party_address,
     generate_next_party_code,
+    apply_party_row,
+    PartyBulkStager,
 )
 
 
@@ -30,6 +32,12 @@ class CustomerImporter(BaseCsvImporter):
 
     _VALID_CUSTOMER_TYPES = [c[0] for c in Customer.CUSTOMER_TYPE_CHOICES]
 
+    supports_bulk = True
+    _BULK_CUSTOMER_FIELDS = [
+        'payment_terms', 'charge_freight', 'customer_type', 'tax_code',
+        'resale_number', 'credit_limit',
+    ]
+
     def validate_row(self, row_num, row):
         errors = []
         validate_party_basics(row, row_num, errors)
@@ -52,26 +60,11 @@ class CustomerImporter(BaseCsvImporter):
             code = generate_next_party_code(self.tenant, 'CUST-')
         display_name = row['Name']
 
-        # Determine party_type promotion
+        # Existing party: promote party_type and update fields (F6).
         try:
             party = Party.objects.get(tenant=self.tenant, code=code)
             was_created = False
-            if party.party_type == 'VENDOR':
-                party.party_type = 'BOTH'
-            elif party.party_type == 'OTHER':
-                party.party_type = 'CUSTOMER'
-            # Always update display_name (required column).
-            # Only overwrite optional fields when the row provides a value (F6).
-            party.display_name = display_name
-            if row.get('LegalName'):
-                party.legal_name = row['LegalName']
-            if row.get('Email'):
-                party.main_email = row['Email']
-            if row.get('Phone'):
-                party.main_phone = row['Phone']
-            if row.get('Notes'):
-                party.notes = row['Notes']
-            party.is_active = True
+            apply_party_row(party, row, 'CUSTOMER')
             party.save()
         except Party.DoesNotExist:
             # New party — set everything the row provides (F6).
@@ -88,38 +81,67 @@ class CustomerImporter(BaseCsvImporter):
             )
             was_created = True
 
-        # Credit limit
-        credit_limit_str = row.get('CreditLimit', '').strip()
-        credit_limit = Decimal(credit_limit_str) if credit_limit_str else None
-
-        # Customer type (normalise to uppercase)
-        customer_type = row.get('CustomerType', '').strip().upper()
-
         # Use get_or_create so we don't blank-overwrite existing fields (F7).
         customer, was_customer_created = Customer.objects.get_or_create(
             tenant=self.tenant,
             party=party,
-            defaults={
-                'payment_terms': row['PaymentTerms'],
-                'charge_freight': parse_bool_default_true(row.get('ChargeFreight')),
-            },
+            defaults=self._customer_defaults(row),
         )
-        if not was_customer_created:
+        self._apply_customer_row(customer, was_customer_created, row)
+        customer.save()
+
+        upsert_party_address(self.tenant, party, row, location_type='SHIP_TO')
+
+        return 'created' if was_created else 'updated'
+
+    def _customer_defaults(self, row):
+        return {
+            'payment_terms': row['PaymentTerms'],
+            'charge_freight': parse_bool_default_true(row.get('ChargeFreight')),
+        }
+
+    def _apply_customer_row(self, customer, created, row):
+        if not created:
             # Always update required field.
             customer.payment_terms = row['PaymentTerms']
             # Only overwrite optional fields when row provides a value (F7).
             if row.get('ChargeFreight'):
                 customer.charge_freight = parse_bool_default_true(row['ChargeFreight'])
+        # Customer type (normalise to uppercase)
+        customer_type = row.get('CustomerType', '').strip().upper()
         if customer_type:
             customer.customer_type = customer_type
         if row.get('TaxCode'):
             customer.tax_code = row['TaxCode']
         if row.get('ResaleNumber'):
             customer.resale_number = row['ResaleNumber']
-        if credit_limit is not None:
-            customer.credit_limit = credit_limit
-        customer.save()
+        credit_limit_str = row.get('CreditLimit', '').strip()
+        if credit_limit_str:
+            customer.credit_limit = Decimal(credit_limit_str)
 
-        upsert_party_address(self.tenant, party, row, location_type='SHIP_TO')
+    # -- Bulk mode ---------------------------------------------------------
 
+    def preload(self):
+        self._stager = PartyBulkStager(
+            self.tenant, 'CUSTOMER', Customer, self._BULK_CUSTOMER_FIELDS, 'CUST-',
+        )
+        self._stager.preload()
+
+    def validate_row_bulk(self, row_num, row):
+        # Row checks never touch the database.
+        return self.validate_row(row_num, row)
+
+    def stage_row(self, row_num, row):
+        code, party, was_created = self._stager.stage_party(row)
+        customer, was_customer_created = self._stager.stage_role(
+            code, party, self._customer_defaults(row),
+        )
+        self._apply_customer_row(customer, was_customer_created, row)
+        self._stager.stage_address(code, party, row, location_type='SHIP_TO')
         return 'created' if was_created else 'updated'
+
+    def flush(self):
+        self._stager.flush(batch_size=self.bulk_chunk_size)
+
+    def discard_staged(self):
+        self._stager.discard()
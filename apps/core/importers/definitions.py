@@ -5,8 +5,10 @@ from apps.parties.models import Party, Customer, Vendor
 from apps.items.models import Item, UnitOfMeasure
 from apps.warehousing.models import WarehouseLocation, Warehouse
 from apps.accounting.models import Account, JournalEntry, JournalEntryLine
+from apps.search.services import SearchIndexService
+from shared.history import bulk_create_with_history
 from .base import BaseCsvImporter
-from ._helpers import int_or_none
+from ._helpers import int_or_none, CodeSequence
 
 
 VALID_LOCATION_TYPES = ['RECEIVING_DOCK', 'STORAGE', 'PICKING', 'PACKING', 'SHIPPING_DOCK', 'SCRAP']
@@ -145,12 +147,10 @@ class ItemImporter(BaseCsvImporter):
     """
     required_columns = ['Name', 'UOM']
 
+    supports_bulk = True
+
     def validate_row(self, row_num, row):
-        errors = []
-        if not row.get('Name'):
-            errors.append(f"Row {row_num}: Name is required.")
-        if not row.get('UOM'):
-            errors.append(f"Row {row_num}: UOM code is required.")
+        errors = self._validate_fields(row_num, row)
 
         # Validate UOM exists
         uom_code = row.get('UOM', '')
@@ -163,6 +163,16 @@ class ItemImporter(BaseCsvImporter):
         if sku and Item.objects.filter(tenant=self.tenant, sku=sku).exists():
             errors.append(f"Row {row_num}: SKU '{sku}' already exists.")
 
+        return errors
+
+    def _validate_fields(self, row_num, row):
+        """Checks that need no database lookups."""
+        errors = []
+        if not row.get('Name'):
+            errors.append(f"Row {row_num}: Name is required.")
+        if not row.get('UOM'):
+            errors.append(f"Row {row_num}: UOM code is required.")
+
         # Validate division if provided
         division = row.get('Division', '').lower()
         valid_divisions = ['corrugated', 'packaging', 'tooling', 'janitorial', 'misc']
@@ -182,15 +192,11 @@ class ItemImporter(BaseCsvImporter):
 
         return errors
 
-    def process_row(self, row_num, row):
-        uom = UnitOfMeasure.objects.get(tenant=self.tenant, code=row['UOM'])
-        division = row.get('Division', '').lower() or 'misc'
-        sku = row.get('SKU', '').strip()
-
-        common_fields = {
+    def _item_fields(self, row, uom_id):
+        return {
             'name': row['Name'],
-            'base_uom': uom,
-            'division': division,
+            'base_uom_id': uom_id,
+            'division': row.get('Division', '').lower() or 'misc',
             'description': row.get('Description', ''),
             'purch_desc': row.get('PurchDesc', ''),
             'sell_desc': row.get('SellDesc', ''),
@@ -201,6 +207,11 @@ class ItemImporter(BaseCsvImporter):
             'item_type': 'inventory',
         }
 
+    def process_row(self, row_num, row):
+        uom = UnitOfMeasure.objects.get(tenant=self.tenant, code=row['UOM'])
+        sku = row.get('SKU', '').strip()
+        common_fields = self._item_fields(row, uom.pk)
+
         if sku:
             # Explicit SKU → idempotent upsert keyed by (tenant, sku)
             _, created = Item.objects.update_or_create(
@@ -214,6 +225,54 @@ class ItemImporter(BaseCsvImporter):
         Item.objects.create(tenant=self.tenant, **common_fields)
         return 'created'
 
+    # -- Bulk mode ---------------------------------------------------------
+
+    def preload(self):
+        self._uoms = dict(
+            UnitOfMeasure.objects.filter(tenant=self.tenant).values_list('code', 'id')
+        )
+        self._skus = set(
+            Item.objects.filter(tenant=self.tenant).values_list('sku', flat=True)
+        )
+        # Same numbering as Item._generate_mspn(), seeded once.
+        self._mspn = CodeSequence('MSPN-', self._skus, width=6, anchored=False)
+        self._pending_items = []
+
+    def validate_row_bulk(self, row_num, row):
+        errors = self._validate_fields(row_num, row)
+        uom_code = row.get('UOM', '')
+        if uom_code and uom_code not in self._uoms:
+            errors.append(f"Row {row_num}: UOM '{uom_code}' not found. Create it first.")
+        # _skus includes SKUs staged earlier in this file.
+        sku = row.get('SKU', '').strip()
+        if sku and sku in self._skus:
+            errors.append(f"Row {row_num}: SKU '{sku}' already exists.")
+        return errors
+
+    def stage_row(self, row_num, row):
+        sku = row.get('SKU', '').strip() or self._mspn.next(self._skus)
+        self._skus.add(sku)
+        self._pending_items.append(Item(
+            tenant=self.tenant,
+            sku=sku,
+            **self._item_fields(row, self._uoms[row['UOM']]),
+        ))
+        return 'created'
+
+    def flush(self):
+        items = bulk_create_with_history(
+            self._pending_items, Item,
+            batch_size=self.bulk_chunk_size,
+            default_user=self.user,
+            default_change_reason='CSV import',
+        )
+        # bulk_create skips the post_save that indexes items
+        SearchIndexService(self.tenant).index_created('item', items)
+        self._pending_items = []
+
+    def discard_staged(self):
+        self._pending_items = []
+
 
 class GLOpeningBalanceImporter(BaseCsvImporter):
     """
@@ -228,15 +287,37 @@ class GLOpeningBalanceImporter(BaseCsvImporter):
     Optional columns: Description
     """
     required_columns = ['AccountCode', 'Debit', 'Credit']
+    supports_bulk = True
 
     def validate_row(self, row_num, row):
+        code = row.get('AccountCode', '').strip()
+        return self._validate_row(
+            row_num, row,
+            account_exists=not code or Account.objects.filter(tenant=self.tenant, code=code).exists(),
+        )
+
+    def validate_row_bulk(self, row_num, row):
+        code = row.get('AccountCode', '').strip()
+        return self._validate_row(row_num, row, account_exists=not code or code in self._accounts)
+
+    def preload(self):
+        self._accounts = {
+            account.code: account
+            for account in Account.objects.filter(tenant=self.tenant)
+        }
+
+    def stage_row(self, row_num, row):
+        # Lines are accumulated for the single entry built in post_process.
+        return self.process_row(row_num, row)
+
+    def _validate_row(self, row_num, row, account_exists):
         errors = []
         if not row.get('AccountCode'):
             errors.append(f"Row {row_num}: AccountCode is required.")
 
         # Validate account exists
         code = row.get('AccountCode', '').strip()
-        if code and not Account.objects.filter(tenant=self.tenant, code=code).exists():
+        if not account_exists:
             errors.append(f"Row {row_num}: Account '{code}' not found in Chart of Accounts.")
 
         # Validate amounts are valid decimals
@@ -313,13 +394,21 @@ class GLOpeningBalanceImporter(BaseCsvImporter):
             created_by=self.user,
         )
 
+        accounts = getattr(self, '_accounts', None)
+        if accounts is None:
+            accounts = {
+                account.code: account
+                for account in Account.objects.filter(
+                    tenant=self.tenant,
+                    code__in={l['account_code'] for l in self._pending_lines},
+                )
+            }
+
+        lines = []
         line_num = 10
         for line_data in self._pending_lines:
-            account = Account.objects.get(
-                tenant=self.tenant,
-                code=line_data['account_code'],
-            )
-            JournalEntryLine.objects.create(
+            account = accounts[line_data['account_code']]
+            lines.append(JournalEntryLine(
                 tenant=self.tenant,
                 entry=je,
                 line_number=line_num,
@@ -327,8 +416,9 @@ class GLOpeningBalanceImporter(BaseCsvImporter):
                 description=line_data['description'] or f"Opening balance - {account.name}",
                 debit=line_data['debit'],
                 credit=line_data['credit'],
-            )
+            ))
             line_num += 10
+        JournalEntryLine.objects.bulk_create(lines, batch_size=self.bulk_chunk_size)
 
         # Auto-plug if unbalanced
         diff = total_debit - total_credit
@@ -2,6 +2,8 @@
 Inventory importer — snapshot-mode: sets InventoryBalance.on_hand and
 creates an ADJUST InventoryTransaction for the delta.
 """
+from django.utils import timezone
+
 from apps.items.models import Item
 from apps.warehousing.models import Warehouse
 from apps.inventory.models import InventoryBalance, InventoryTransaction
@@ -15,8 +17,20 @@ class InventoryImporter(BaseCsvImporter):
     Required columns: SKU, WarehouseCode, OnHand
     """
     required_columns = ['SKU', 'WarehouseCode', 'OnHand']
+    supports_bulk = True
 
     def validate_row(self, row_num, row):
+        sku = row.get('SKU', '')
+        warehouse_code = row.get('WarehouseCode', '')
+        return self._validate_row(
+            row_num, row,
+            sku_exists=not sku or Item.objects.filter(tenant=self.tenant, sku=sku).exists(),
+            warehouse_exists=not warehouse_code or Warehouse.objects.filter(
+                tenant=self.tenant, code=warehouse_code,
+            ).exists(),
+        )
+
+    def _validate_row(self, row_num, row, sku_exists, warehouse_exists):
         errors = []
 
         sku = row.get('SKU', '')
@@ -30,10 +44,10 @@ class InventoryImporter(BaseCsvImporter):
         if not on_hand_str:
             errors.append(f"Row {row_num}: OnHand is required.")
 
-        if sku and not Item.objects.filter(tenant=self.tenant, sku=sku).exists():
+        if not sku_exists:
             errors.append(f"Row {row_num}: SKU '{sku}' not found.")
 
-        if warehouse_code and not Warehouse.objects.filter(tenant=self.tenant, code=warehouse_code).exists():
+        if not warehouse_exists:
             errors.append(f"Row {row_num}: WarehouseCode '{warehouse_code}' not found.")
 
         if on_hand_str:
@@ -84,3 +98,84 @@ class InventoryImporter(BaseCsvImporter):
             )
 
         return 'created' if was_created else 'updated'
+
+    # -- Bulk mode ---------------------------------------------------------
+
+    def preload(self):
+        self._items = dict(
+            Item.objects.filter(tenant=self.tenant).values_list('sku', 'id')
+        )
+        self._warehouses = dict(
+            Warehouse.objects.filter(tenant=self.tenant).values_list('code', 'id')
+        )
+        self._balances = {
+            (balance.item_id, balance.warehouse_id): balance
+            for balance in InventoryBalance.objects.filter(tenant=self.tenant)
+        }
+        self.discard_staged()
+
+    def validate_row_bulk(self, row_num, row):
+        sku = row.get('SKU', '')
+        warehouse_code = row.get('WarehouseCode', '')
+        return self._validate_row(
+            row_num, row,
+            sku_exists=not sku or sku in self._items,
+            warehouse_exists=not warehouse_code or warehouse_code in self._warehouses,
+        )
+
+    def stage_row(self, row_num, row):
+        item_id = self._items[row['SKU']]
+        warehouse_id = self._warehouses[row['WarehouseCode']]
+        new_on_hand = int(row['OnHand'])
+
+        key = (item_id, warehouse_id)
+        balance = self._balances.get(key)
+        was_created = balance is None
+        if was_created:
+            balance = InventoryBalance(
+                tenant=self.tenant, item_id=item_id, warehouse_id=warehouse_id,
+                on_hand=0, allocated=0, on_order=0,
+            )
+            self._balances[key] = balance
+            self._new_balances.append(balance)
+        elif balance.pk:
+            self._dirty_balances[key] = balance
+
+        delta = new_on_hand - balance.on_hand
+        balance.on_hand = new_on_hand
+
+        # F8: skip ADJUST transaction when delta == 0.
+        if delta != 0:
+            self._transactions.append(InventoryTransaction(
+                tenant=self.tenant,
+                transaction_type='ADJUST',
+                item_id=item_id,
+                warehouse_id=warehouse_id,
+                quantity=delta,
+                reference_type='IMPORT',
+                reference_number='Initial seed import',
+                user=self.user,
+                balance_on_hand=new_on_hand,
+                balance_allocated=balance.allocated,
+                notes='Snapshot CSV import',
+            ))
+
+        return 'created' if was_created else 'updated'
+
+    def flush(self):
+        # bulk_update skips auto_now, so stamp last_updated explicitly.
+        now = timezone.now()
+        for balance in self._dirty_balances.values():
+            balance.last_updated = now
+        InventoryBalance.objects.bulk_create(self._new_balances, batch_size=self.bulk_chunk_size)
+        InventoryBalance.objects.bulk_update(
+            list(self._dirty_balances.values()), ['on_hand', 'last_updated'],
+            batch_size=self.bulk_chunk_size,
+        )
+        InventoryTransaction.objects.bulk_create(self._transactions, batch_size=self.bulk_chunk_size)
+        self.discard_staged()
+
+    def discard_staged(self):
+        self._new_balances = []
+        self._dirty_balances = {}
+        self._transactions = []
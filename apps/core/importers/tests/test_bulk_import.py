@@ -0,0 +1,178 @@
+"""
+Tests for the bulk import engine (BaseCsvImporter.run(bulk=True)).
+"""
+import io
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.tenants.models import Tenant
+from apps.items.models import Item, UnitOfMeasure
+from apps.parties.models import Party, Customer, Vendor, Location
+from apps.warehousing.models import Warehouse
+from apps.inventory.models import InventoryBalance, InventoryTransaction
+from apps.core.importers import (
+    ItemImporter, InventoryImporter, CustomerImporter, VendorImporter,
+)
+from shared.managers import set_current_tenant
+from users.models import User
+
+
+def make_csv(headers, *rows):
+    lines = [','.join(headers)]
+    for row in rows:
+        lines.append(','.join(str(v) for v in row))
+    f = io.BytesIO('\n'.join(lines).encode('utf-8'))
+    f.name = 'test.csv'
+    return f
+
+
+ITEM_HEADERS = ['SKU', 'Name', 'UOM', 'Division']
+PARTY_HEADERS = ['Code', 'Name', 'PaymentTerms', 'Email', 'Address1', 'City', 'State', 'PostalCode']
+
+
+class BulkImportTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Bulk Test Co', subdomain='test-bulk-importer')
+        cls.user = User.objects.create_user(username='bulkuser', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='EA', name='Each')
+        cls.warehouse = Warehouse.objects.create(tenant=cls.tenant, code='MAIN', name='Main WH')
+
+    def setUp(self):
+        # Search readiness is cached per tenant; drop flags from rolled-back tests
+        cache.clear()
+        set_current_tenant(self.tenant)
+
+    def test_items_created_with_generated_skus_and_history(self):
+        Item.objects.create(tenant=self.tenant, sku='MSPN-000007', name='Existing', base_uom=self.uom)
+        f = make_csv(ITEM_HEADERS, ['', 'First', 'EA', ''], ['', 'Second', 'EA', 'packaging'], ['X-1', 'Third', 'EA', ''])
+
+        result = ItemImporter(self.tenant, self.user).run(f, commit=True, bulk=True)
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(result['created'], 3)
+        self.assertEqual(
+            sorted(Item.objects.filter(tenant=self.tenant).values_list('sku', flat=True)),
+            ['MSPN-000007', 'MSPN-000008', 'MSPN-000009', 'X-1'],
+        )
+        self.assertEqual(Item.objects.get(sku='MSPN-000009').division, 'packaging')
+        self.assertEqual(Item.history.filter(sku='X-1', history_type='+').count(), 1)
+
+    def test_query_count_independent_of_row_count(self):
+        counts = []
+        for prefix, size in (('Q', 5), ('P', 20)):
+            rows = [[f'{prefix}-{i}', f'Item {i}', 'EA', ''] for i in range(size)]
+            with CaptureQueriesContext(connection) as ctx:
+                result = ItemImporter(self.tenant, self.user).run(
+                    make_csv(ITEM_HEADERS, *rows), commit=True, bulk=True,
+                )
+            self.assertEqual(result['created'], size)
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_duplicate_sku_in_file_caught_in_dry_run(self):
+        f = make_csv(ITEM_HEADERS, ['D-1', 'One', 'EA', ''], ['D-1', 'Two', 'EA', ''], ['D-2', 'Three', 'BOX', ''])
+
+        result = ItemImporter(self.tenant, self.user).run(f, commit=False, bulk=True)
+
+        self.assertEqual(result['total'], 3)
+        self.assertEqual(result['valid'], 1)
+        self.assertEqual([e['row'] for e in result['errors']], [3, 4])
+        self.assertFalse(Item.objects.filter(sku__startswith='D-').exists())
+
+    def test_error_after_flushed_chunk_rolls_back_everything(self):
+        rows = [[f'R-{i}', f'Item {i}', 'EA', ''] for i in range(5)] + [['R-bad', 'Bad', 'NOPE', '']]
+        importer = ItemImporter(self.tenant, self.user)
+        importer.bulk_chunk_size = 2
+
+        result = importer.run(make_csv(ITEM_HEADERS, *rows), commit=True, bulk=True)
+
+        self.assertEqual(len(result['errors']), 1)
+        self.assertFalse(Item.objects.filter(sku__startswith='R-').exists())
+
+    def test_row_limit_enforced_while_streaming(self):
+        rows = [[f'L-{i}', f'Item {i}', 'EA', ''] for i in range(4)]
+        with mock.patch('apps.core.importers.base.MAX_CSV_ROWS', 3):
+            result = ItemImporter(self.tenant, self.user).run(
+                make_csv(ITEM_HEADERS, *rows), commit=True, bulk=True,
+            )
+        self.assertEqual(result['errors'][0]['row'], 0)
+        self.assertIn('row limit', result['errors'][0]['message'])
+        self.assertFalse(Item.objects.filter(sku__startswith='L-').exists())
+
+    def test_invalid_utf8_returns_row_zero_error(self):
+        f = io.BytesIO(b'SKU,Name,UOM\nA-1,Caf\xe9,EA\n')
+        result = ItemImporter(self.tenant, self.user).run(f, commit=True, bulk=True)
+        self.assertEqual(result['errors'][0]['row'], 0)
+        self.assertIn('UTF-8', result['errors'][0]['message'])
+
+    def test_inventory_snapshot_matches_row_mode(self):
+        item_a = Item.objects.create(tenant=self.tenant, sku='INV-A', name='A', base_uom=self.uom)
+        item_b = Item.objects.create(tenant=self.tenant, sku='INV-B', name='B', base_uom=self.uom)
+        InventoryBalance.objects.create(
+            tenant=self.tenant, item=item_a, warehouse=self.warehouse, on_hand=10,
+        )
+        f = make_csv(['SKU', 'WarehouseCode', 'OnHand'], ['INV-A', 'MAIN', 25], ['INV-B', 'MAIN', 0], ['INV-B', 'MAIN', 4])
+
+        result = InventoryImporter(self.tenant, self.user).run(f, commit=True, bulk=True)
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual((result['created'], result['updated']), (1, 2))
+        self.assertEqual(InventoryBalance.objects.get(item=item_a).on_hand, 25)
+        self.assertEqual(InventoryBalance.objects.get(item=item_b).on_hand, 4)
+        quantities = sorted(
+            InventoryTransaction.objects.filter(reference_type='IMPORT').values_list('quantity', flat=True)
+        )
+        self.assertEqual(quantities, [4, 15])
+
+    def test_customers_create_update_and_promote(self):
+        Party.objects.create(
+            tenant=self.tenant, code='BOTH1', party_type='VENDOR', display_name='Old Name',
+            main_email='keep@example.com',
+        )
+        f = make_csv(
+            PARTY_HEADERS,
+            ['BOTH1', 'New Name', 'NET30', '', '1 Main', 'Chicago', 'IL', '60601'],
+            ['', 'Auto One', 'NET15', '', '', '', '', ''],
+            ['', 'Auto Two', 'NET15', 'two@example.com', '2 Main', 'Austin', 'TX', '73301'],
+        )
+
+        result = CustomerImporter(self.tenant, self.user).run(f, commit=True, bulk=True)
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual((result['created'], result['updated']), (2, 1))
+        promoted = Party.objects.get(code='BOTH1')
+        self.assertEqual(promoted.party_type, 'BOTH')
+        self.assertEqual(promoted.display_name, 'New Name')
+        self.assertEqual(promoted.main_email, 'keep@example.com')
+        self.assertTrue(Customer.objects.filter(party=promoted, payment_terms='NET30').exists())
+        self.assertEqual(
+            sorted(Party.objects.filter(code__startswith='CUST-').values_list('code', flat=True)),
+            ['CUST-001', 'CUST-002'],
+        )
+        self.assertEqual(
+            Location.objects.filter(name='Imported Address', party__code__in=['BOTH1', 'CUST-002']).count(), 2,
+        )
+
+    def test_vendor_rows_for_same_code_merge(self):
+        f = make_csv(
+            PARTY_HEADERS,
+            ['V1', 'Vendor One', 'NET30', '', '1 Dock', 'Reno', 'NV', '89501'],
+            ['V1', 'Vendor One Renamed', 'NET45', '', '9 Dock', 'Reno', 'NV', '89501'],
+        )
+        importer = VendorImporter(self.tenant, self.user)
+        importer.bulk_chunk_size = 1
+
+        result = importer.run(f, commit=True, bulk=True)
+
+        self.assertEqual(result['errors'], [])
+        vendor = Vendor.objects.get(party__code='V1')
+        self.assertEqual(vendor.payment_terms, 'NET45')
+        self.assertEqual(vendor.party.display_name, 'Vendor One Renamed')
+        self.assertEqual(Location.objects.get(party=vendor.party).address_line1, '9 Dock')
@@ -13,6 +13,8 @@ from ._helpers import (
     validate_phone_lengths,
     upsert_party_address,
     generate_next_party_code,
+    apply_party_row,
+    PartyBulkStager,
 )
 
 
@@ -30,6 +32,12 @@ class VendorImporter(BaseCsvImporter):
 
     _VALID_VENDOR_TYPES = [v[0] for v in Vendor.VENDOR_TYPE_CHOICES]
 
+    supports_bulk = True
+    _BULK_VENDOR_FIELDS = [
+        'payment_terms', 'vendor_type', 'charge_freight', 'tax_code',
+        'tax_id', 'credit_limit',
+    ]
+
     def validate_row(self, row_num, row):
         errors = []
         validate_party_basics(row, row_num, errors)
@@ -52,26 +60,11 @@ class VendorImporter(BaseCsvImporter):
             code = generate_next_party_code(self.tenant, 'VEND-')
         display_name = row['Name']
 
-        # Determine party_type promotion
+        # Existing party: promote party_type and update fields (F6).
         try:
             party = Party.objects.get(tenant=self.tenant, code=code)
             was_created = False
-            if party.party_type == 'CUSTOMER':
-                party.party_type = 'BOTH'
-            elif party.party_type == 'OTHER':
-                party.party_type = 'VENDOR'
-            # Always update display_name (required column).
-            # Only overwrite optional fields when the row provides a value (F6).
-            party.display_name = display_name
-            if row.get('LegalName'):
-                party.legal_name = row['LegalName']
-            if row.get('Email'):
-                party.main_email = row['Email']
-            if row.get('Phone'):
-                party.main_phone = row['Phone']
-            if row.get('Notes'):
-                party.notes = row['Notes']
-            party.is_active = True
+            apply_party_row(party, row, 'VENDOR')
             party.save()
         except Party.DoesNotExist:
             # New party — set everything the row provides (F6).
@@ -88,24 +81,31 @@ class VendorImporter(BaseCsvImporter):
             )
             was_created = True
 
-        # Credit limit
-        credit_limit_str = row.get('CreditLimit', '').strip()
-        credit_limit = Decimal(credit_limit_str) if credit_limit_str else None
-
-        # Vendor type — only fall back to SUPPLIER for new records
-        vendor_type = row.get('VendorType', '').strip().upper()
-
         # Use get_or_create so we don't blank-overwrite existing fields (F7).
         vendor, was_vendor_created = Vendor.objects.get_or_create(
             tenant=self.tenant,
             party=party,
-            defaults={
-                'payment_terms': row['PaymentTerms'],
-                'vendor_type': vendor_type or 'SUPPLIER',
-                'charge_freight': parse_bool_default_true(row.get('ChargeFreight')),
-            },
+            defaults=self._vendor_defaults(row),
         )
-        if not was_vendor_created:
+        self._apply_vendor_row(vendor, was_vendor_created, row)
+        vendor.save()
+
+        upsert_party_address(self.tenant, party, row, location_type='WAREHOUSE')
+
+        return 'created' if was_created else 'updated'
+
+    def _vendor_defaults(self, row):
+        # Vendor type — only fall back to SUPPLIER for new records
+        vendor_type = row.get('VendorType', '').strip().upper()
+        return {
+            'payment_terms': row['PaymentTerms'],
+            'vendor_type': vendor_type or 'SUPPLIER',
+            'charge_freight': parse_bool_default_true(row.get('ChargeFreight')),
+        }
+
+    def _apply_vendor_row(self, vendor, created, row):
+        if not created:
+            vendor_type = row.get('VendorType', '').strip().upper()
             # Always update required field.
             vendor.payment_terms = row['PaymentTerms']
             # Only overwrite optional fields when row provides a value (F7).
@@ -117,10 +117,33 @@ class VendorImporter(BaseCsvImporter):
             vendor.tax_code = row['TaxCode']
         if row.get('TaxId'):
             vendor.tax_id = row['TaxId']
-        if credit_limit is not None:
-            vendor.credit_limit = credit_limit
-        vendor.save()
+        credit_limit_str = row.get('CreditLimit', '').strip()
+        if credit_limit_str:
+            vendor.credit_limit = Decimal(credit_limit_str)
 
-        upsert_party_address(self.tenant, party, row, location_type='WAREHOUSE')
+    # -- Bulk mode ---------------------------------------------------------
 
+    def preload(self):
+        self._stager = PartyBulkStager(
+            self.tenant, 'VENDOR', Vendor, self._BULK_VENDOR_FIELDS, 'VEND-',
+        )
+        self._stager.preload()
+
+    def validate_row_bulk(self, row_num, row):
+        # Row checks never touch the database.
+        return self.validate_row(row_num, row)
+
+    def stage_row(self, row_num, row):
+        code, party, was_created = self._stager.stage_party(row)
+        vendor, was_vendor_created = self._stager.stage_role(
+            code, party, self._vendor_defaults(row),
+        )
+        self._apply_vendor_row(vendor, was_vendor_created, row)
+        self._stager.stage_address(code, party, row, location_type='WAREHOUSE')
         return 'created' if was_created else 'updated'
+
+    def flush(self):
+        self._stager.flush(batch_size=self.bulk_chunk_size)
+
+    def discard_staged(self):
+        self._stager.discard()
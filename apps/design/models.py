@@ -1,7 +1,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 
 from shared.models import TenantMixin, TimestampMixin
 from apps.items.models import TEST_TYPES, FLUTE_TYPES, PAPER_TYPES
@@ -183,7 +183,7 @@ class DesignRequest(TenantMixin, TimestampMixin, models.Model):
     )
 
     # History tracking
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'file_number')]
@@ -5,3 +5,7 @@ class DocumentsConfig(AppConfig):
     name = 'apps.documents'
     label = 'documents'
     verbose_name = 'Documents & Attachments'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.documents.signals
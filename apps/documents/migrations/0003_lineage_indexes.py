@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('documents', '0002_documentlink'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentlink',
+            name='documents_d_tenant__10d68c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='documentlink',
+            name='documents_d_tenant__3674c5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='documentlink',
+            index=models.Index(fields=['tenant', 'source_content_type', 'source_object_id', 'target_content_type', 'target_object_id'], name='doclink_downstream_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentlink',
+            index=models.Index(fields=['tenant', 'target_content_type', 'target_object_id', 'source_content_type', 'source_object_id'], name='doclink_upstream_idx'),
+        ),
+    ]
@@ -202,9 +202,19 @@ class DocumentLink(TenantMixin, TimestampMixin):
 
     class Meta:
         ordering = ['-created_at']
+        # Lineage walks join on one end and read the other: each direction's
+        # composite index answers a hop without touching the table.
         indexes = [
-            models.Index(fields=['tenant', 'source_content_type', 'source_object_id']),
-            models.Index(fields=['tenant', 'target_content_type', 'target_object_id']),
+            models.Index(
+                fields=['tenant', 'source_content_type', 'source_object_id',
+                        'target_content_type', 'target_object_id'],
+                name='doclink_downstream_idx',
+            ),
+            models.Index(
+                fields=['tenant', 'target_content_type', 'target_object_id',
+                        'source_content_type', 'source_object_id'],
+                name='doclink_upstream_idx',
+            ),
         ]
         unique_together = [
             (
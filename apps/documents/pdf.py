@@ -5,10 +5,13 @@ PDF generation service using WeasyPrint.
 Renders Django templates to HTML, then converts to PDF bytes.
 """
 import logging
+from decimal import Decimal
 from io import BytesIO
 from django.db.models import Sum
 from django.template.loader import render_to_string
 
+from .pdf_cache import cached_pdf
+
 logger = logging.getLogger(__name__)
 
 def _render_pdf_bytes(html_string):
@@ -45,6 +48,9 @@ class PDFService:
     Usage:
         pdf_bytes = PDFService.render_to_pdf('documents/invoice.html', context)
         pdf_bytes = PDFService.render_invoice(invoice)
+
+    Single-document renders decorated with ``cached_pdf`` are served from
+    the PDF cache (see pdf_cache.py) while the document is unchanged.
     """
 
     @staticmethod
@@ -63,6 +69,8 @@ class PDFService:
         return _render_pdf_bytes(html_string)
 
     @classmethod
+    @cached_pdf('invoice', 'documents/invoice.html', related=('lines',),
+                master=('customer__party', 'lines__item', 'lines__uom'))
     def render_invoice(cls, invoice):
         """
         Generate a PDF for an Invoice.
@@ -134,6 +142,8 @@ class PDFService:
         return cls.render_to_pdf('documents/invoice.html', context)
 
     @classmethod
+    @cached_pdf('purchase_order', 'documents/purchase_order.html', related=('lines',),
+                master=('vendor__party', 'ship_to', 'lines__item', 'lines__uom'))
     def render_purchase_order(cls, purchase_order):
         """
         Generate a PDF for a Purchase Order.
@@ -203,6 +213,8 @@ class PDFService:
         return cls.render_to_pdf('documents/purchase_order.html', context)
 
     @classmethod
+    @cached_pdf('estimate', 'documents/estimate.html', related=('lines',),
+                master=('customer__party', 'ship_to', 'lines__item', 'lines__uom'))
     def render_estimate(cls, estimate):
         """
         Generate a PDF for an Estimate / Quote.
@@ -275,6 +287,8 @@ class PDFService:
         return cls.render_to_pdf('documents/estimate.html', context)
 
     @classmethod
+    @cached_pdf('rfq', 'documents/rfq.html', related=('lines',),
+                master=('vendor__party', 'ship_to', 'lines__item', 'lines__uom'))
     def render_rfq(cls, rfq):
         """
         Generate a PDF for a Request for Quotation.
@@ -349,29 +363,35 @@ class PDFService:
         Returns:
             bytes: PDF file content
         """
-        tenant_settings = sales_order.tenant.settings
-        lines_qs = sales_order.lines.select_related('item', 'uom', 'item__default_bin').all()
+        from apps.warehousing.pick_path import PickPathPlanner
 
-        # Sort lines by location name (warehouse walking path order)
-        def get_location_name(line):
-            bin_obj = getattr(line.item, 'default_bin', None)
-            if bin_obj:
-                return bin_obj.name or ''
-            return ''
+        tenant_settings = sales_order.tenant.settings
 
-        lines_sorted = sorted(lines_qs, key=get_location_name)
+        # Allocate stock and sequence bins in serpentine walk order
+        route = PickPathPlanner(sales_order.tenant).plan_orders([sales_order])
 
         line_data = []
-        for line in lines_sorted:
-            bin_obj = getattr(line.item, 'default_bin', None)
-            location_name = bin_obj.name if bin_obj else ''
+        for stop in route['stops']:
+            for pick in stop['picks']:
+                line_data.append({
+                    'location': stop['location_name'],
+                    'sku': pick['sku'],
+                    'item_name': pick['item_name'],
+                    'lot': pick['lot'].lot_number if pick['lot'] else '',
+                    'quantity': pick['quantity'],
+                    'uom': pick['uom'],
+                    'line_number': pick['orders'][0]['line_number'] if pick['orders'] else None,
+                })
+        # Short / unstocked quantity is still listed, without a bin
+        for pick in route['unlocated']:
             line_data.append({
-                'location': location_name,
-                'sku': line.item.sku,
-                'item_name': line.item.name,
-                'quantity_ordered': line.quantity_ordered,
-                'uom': line.uom.code if line.uom else '',
-                'line_number': line.line_number,
+                'location': '',
+                'sku': pick['item'].sku,
+                'item_name': pick['item'].name,
+                'lot': '',
+                'quantity': pick['quantity'],
+                'uom': pick['uom'],
+                'line_number': pick['line_number'],
             })
 
         customer_party = sales_order.customer.party if sales_order.customer else None
@@ -397,6 +417,10 @@ class PDFService:
             'customer_name': customer_name,
             'ship_to': ship_to_data,
             'lines': line_data,
+            'route': {
+                'stop_count': route['stop_count'],
+                'total_distance_ft': route['total_distance_ft'],
+            },
             'is_rush': (sales_order.priority or 0) > 5,
         }
 
@@ -551,6 +575,9 @@ class PDFService:
         return cls.render_to_pdf('documents/delivery_manifest.html', context)
 
     @classmethod
+    @cached_pdf('item_spec', 'documents/item_spec_sheet.html',
+                related=('vendors', 'uom_conversions'),
+                master=('parent', 'base_uom', 'vendors__vendor', 'uom_conversions__uom'), daily=True)
     def render_item_spec(cls, item):
         """
         Generate a PDF spec sheet for an Item.
@@ -908,21 +935,27 @@ class PDFService:
         return cls.render_to_pdf('documents/reports/open_purchase_orders.html', context)
 
     @classmethod
-    def render_inventory_valuation(cls, tenant):
+    def render_inventory_valuation(cls, tenant, method='average'):
         """
         Generate a PDF for the Inventory Valuation report.
 
         Args:
             tenant: Tenant model instance
+            method: 'average' (PO cost) or 'fifo' (InventoryLayer cost)
 
         Returns:
             bytes: PDF file content
         """
         from datetime import date as date_cls
-        from apps.reporting.queries import inventory_valuation
+        from apps.reporting.queries import iter_inventory_valuation
 
         tenant_settings = tenant.settings
-        data = inventory_valuation(tenant)  # {'rows': [...], 'grand_total': '...'}
+        # Same row stream as the API/CSV report; total accumulated in one pass
+        rows = []
+        grand_total = Decimal('0')
+        for row in iter_inventory_valuation(tenant, method):
+            grand_total += Decimal(row['total_value'])
+            rows.append(row)
 
         context = {
             'company': {
@@ -936,9 +969,10 @@ class PDFService:
                 'email': tenant_settings.email,
             },
             'as_of_date': date_cls.today(),
-            'rows': data['rows'],
-            'row_count': len(data['rows']),
-            'grand_total': data['grand_total'],
+            'valuation_method': method,
+            'rows': rows,
+            'row_count': len(rows),
+            'grand_total': str(grand_total),
         }
 
         return cls.render_to_pdf('documents/reports/inventory_valuation.html', context)
@@ -955,10 +989,10 @@ class PDFService:
             bytes: PDF file content
         """
         from datetime import date as date_cls
-        from apps.reporting.queries import stock_status
+        from apps.reporting.queries import iter_stock_status
 
         tenant_settings = tenant.settings
-        rows = stock_status(tenant)  # plain list of dicts
+        rows = list(iter_stock_status(tenant))
 
         context = {
             'company': {
@@ -1234,10 +1268,10 @@ class PDFService:
     def render_dead_stock(cls, tenant, days=180):
         """Generate a PDF for the Dead Stock report."""
         from datetime import date as date_cls
-        from apps.reporting.queries import dead_stock
+        from apps.reporting.queries import iter_dead_stock
 
         tenant_settings = tenant.settings
-        rows = dead_stock(tenant, days)
+        rows = list(iter_dead_stock(tenant, days))
 
         context = {
             'company': {
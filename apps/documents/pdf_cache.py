@@ -0,0 +1,249 @@
+# apps/documents/pdf_cache.py
+"""
+Content-addressed cache for rendered document PDFs.
+
+Rendering HTML->PDF costs 1-3 seconds of CPU, and the same invoice is
+re-opened many times from emails. Rendered bytes are stored in media storage
+under a digest of everything that feeds the PDF:
+
+- document type and primary key
+- the document row (so ``updated_at``/status/revision changes miss)
+- its line rows (covers line models without ``updated_at``)
+- the master rows it prints: party, ship-to address, items and UoMs
+- the tenant's company settings (letterhead)
+- the template source plus PDF_TEMPLATE_VERSION
+
+Any change therefore produces a new key; stale files are removed by the
+post_save handlers in ``apps.documents.signals``.
+
+Usage:
+    class PDFService:
+        @classmethod
+        @cached_pdf('invoice', 'documents/invoice.html', related=('lines',),
+                    master=('customer__party', 'lines__item', 'lines__uom'))
+        def render_invoice(cls, invoice):
+            ...
+
+Settings:
+    PDF_CACHE_ENABLED (default True)
+    PDF_CACHE_PREWARM (default True): render on a background worker after
+        commit when prewarm() is called (e.g. on invoice posting)
+    PDF_CACHE_PREWARM_WORKERS (default 2): prewarm worker threads
+    PDF_CACHE_PREWARM_QUEUE (default 50): renders that may wait for a
+        worker; prewarm() skips documents beyond that
+"""
+import functools
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.template.loader import get_template
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+PDF_CACHE_DIR = 'pdf_cache'
+
+# Bump when a shared include/base template or the render context changes.
+PDF_TEMPLATE_VERSION = 1
+
+# doc_type -> model label, for save-time invalidation
+CACHED_DOCUMENT_MODELS = {
+    'invoice': 'invoicing.Invoice',
+    'purchase_order': 'orders.PurchaseOrder',
+    'estimate': 'orders.Estimate',
+    'rfq': 'orders.RFQ',
+    'item_spec': 'items.Item',
+}
+
+
+_prewarm_lock = threading.Lock()
+_prewarm_executor = None
+_prewarm_slots = None
+
+
+def _prewarm_pool():
+    """Shared executor and the semaphore bounding its backlog, built on first use."""
+    global _prewarm_executor, _prewarm_slots
+    with _prewarm_lock:
+        if _prewarm_executor is None:
+            _prewarm_executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'PDF_CACHE_PREWARM_WORKERS', 2),
+                thread_name_prefix='pdf-prewarm',
+            )
+            _prewarm_slots = threading.BoundedSemaphore(
+                getattr(settings, 'PDF_CACHE_PREWARM_QUEUE', 50),
+            )
+    return _prewarm_executor, _prewarm_slots
+
+
+def _related_model(model, path):
+    """Model reached from ``model`` by the ``__``-separated relation ``path``."""
+    for name in path.split('__'):
+        model = model._meta.get_field(name).related_model
+    return model
+
+
+def _rows_digest(queryset):
+    rows = queryset.order_by('pk').values_list()
+    return hashlib.sha256(repr(list(rows)).encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def _template_digest(template_name):
+    template = get_template(template_name)
+    source = getattr(getattr(template, 'template', None), 'source', '') or ''
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+class PDFCache:
+    """Storage-backed lookup/store/purge for rendered PDFs."""
+
+    @staticmethod
+    def enabled():
+        return getattr(settings, 'PDF_CACHE_ENABLED', True)
+
+    @staticmethod
+    def fingerprint(doc_type, document, template_name, related=(), master=(), daily=False):
+        """
+        Return the hex digest identifying this exact rendering.
+
+        ``related`` names reverse managers whose rows are hashed (e.g. lines);
+        ``master`` names relation paths to referenced rows that are printed
+        but not owned by the document (e.g. 'customer__party', 'lines__item').
+        """
+        from apps.tenants.models import TenantSettings
+
+        model = type(document)
+        parts = [
+            doc_type,
+            str(document.pk),
+            str(PDF_TEMPLATE_VERSION),
+            _template_digest(template_name),
+            _rows_digest(model._base_manager.filter(pk=document.pk)),
+            _rows_digest(TenantSettings.objects.filter(tenant_id=document.tenant_id)),
+        ]
+        for name in related:
+            parts.append(_rows_digest(getattr(document, name).all()))
+        for path in master:
+            ids = model._base_manager.filter(pk=document.pk).values_list(path, flat=True)
+            parts.append(_rows_digest(
+                _related_model(model, path)._base_manager.filter(pk__in=ids)
+            ))
+        if daily:
+            # Documents that print a generation date are only reusable for the day.
+            parts.append(timezone.localdate().isoformat())
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def directory(doc_type, tenant_id, pk):
+        return f'{PDF_CACHE_DIR}/{tenant_id}/{doc_type}/{pk}'
+
+    @classmethod
+    def path(cls, doc_type, document, digest):
+        return f'{cls.directory(doc_type, document.tenant_id, document.pk)}/{digest}.pdf'
+
+    @staticmethod
+    def get(path):
+        """Return cached bytes, or None on a miss or storage error."""
+        try:
+            if not default_storage.exists(path):
+                return None
+            with default_storage.open(path, 'rb') as fh:
+                return fh.read()
+        except Exception:
+            logger.warning('PDF cache read failed for %s', path, exc_info=True)
+            return None
+
+    @staticmethod
+    def put(path, pdf_bytes):
+        try:
+            if not default_storage.exists(path):
+                default_storage.save(path, ContentFile(pdf_bytes))
+        except Exception:
+            logger.warning('PDF cache write failed for %s', path, exc_info=True)
+
+    @classmethod
+    def purge(cls, doc_type, tenant_id, pk):
+        """
+        Delete every cached rendering of one document.
+
+        Lists the directory directly: object stores such as S3 have no real
+        directories, so an ``exists()`` check there is always False.
+        """
+        directory = cls.directory(doc_type, tenant_id, pk)
+        try:
+            _, files = default_storage.listdir(directory)
+            for name in files:
+                default_storage.delete(f'{directory}/{name}')
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.warning('PDF cache purge failed for %s', directory, exc_info=True)
+
+    @classmethod
+    def prewarm(cls, render, document):
+        """
+        Render ``document`` into the cache after the current transaction
+        commits, on a small shared worker pool so the caller isn't slowed
+        down. When PDF_CACHE_PREWARM_QUEUE renders are already waiting the
+        document is skipped; it renders on first open instead.
+
+        Args:
+            render: A cached PDFService.render_* method
+            document: Model instance to render
+        """
+        if not cls.enabled() or not getattr(settings, 'PDF_CACHE_PREWARM', True):
+            return
+        model, pk, tenant = type(document), document.pk, document.tenant
+
+        executor, slots = _prewarm_pool()
+
+        def _warm():
+            from shared.managers import set_current_tenant
+            try:
+                set_current_tenant(tenant)
+                render(model._base_manager.get(pk=pk))
+            except Exception:
+                logger.warning('PDF pre-warm failed for %s %s', model.__name__, pk, exc_info=True)
+            finally:
+                set_current_tenant(None)
+                connections.close_all()
+                slots.release()
+
+        def _submit():
+            if not slots.acquire(blocking=False):
+                logger.info('PDF pre-warm queue full; skipping %s %s', model.__name__, pk)
+                return
+            try:
+                executor.submit(_warm)
+            except RuntimeError:  # interpreter shutting down
+                slots.release()
+
+        transaction.on_commit(_submit)
+
+
+def cached_pdf(doc_type, template_name, related=(), master=(), daily=False):
+    """
+    Decorator for ``PDFService.render_*(cls, document)`` methods that serves
+    and stores the result through PDFCache. Apply below ``@classmethod``.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(cls, document):
+            if not PDFCache.enabled() or document.pk is None:
+                return func(cls, document)
+            digest = PDFCache.fingerprint(doc_type, document, template_name, related, master, daily)
+            path = PDFCache.path(doc_type, document, digest)
+            pdf_bytes = PDFCache.get(path)
+            if pdf_bytes is None:
+                pdf_bytes = func(cls, document)
+                PDFCache.put(path, pdf_bytes)
+            return pdf_bytes
+        return wrapper
+    return decorator
@@ -4,6 +4,7 @@ Service layer for file attachment management.
 
 Provides:
 - AttachmentService: Upload, delete, and retrieve file attachments
+- DocumentLineageService: Transitive document lineage in one query
 """
 import os
 import logging
@@ -187,3 +188,96 @@ class AttachmentService:
             ContentFile(thumb_buffer.read()),
         )
         logger.debug("Thumbnail saved to %s", saved_path)
+
+
+# Hard cap on lineage depth, whatever the client asks for
+LINEAGE_MAX_DEPTH = 25
+
+_LINEAGE_SQL = """
+WITH RECURSIVE
+downstream (link_id, ct_id, obj_id, depth) AS (
+    SELECT id, target_content_type_id, target_object_id, 1
+    FROM {links}
+    WHERE tenant_id = %(tenant)s
+      AND source_content_type_id = %(ct)s AND source_object_id = %(obj)s
+      AND %(down)s >= 1
+    UNION
+    SELECT l.id, l.target_content_type_id, l.target_object_id, w.depth + 1
+    FROM {links} l
+    JOIN downstream w ON l.source_content_type_id = w.ct_id AND l.source_object_id = w.obj_id
+    WHERE l.tenant_id = %(tenant)s AND w.depth < %(down)s
+),
+upstream (link_id, ct_id, obj_id, depth) AS (
+    SELECT id, source_content_type_id, source_object_id, 1
+    FROM {links}
+    WHERE tenant_id = %(tenant)s
+      AND target_content_type_id = %(ct)s AND target_object_id = %(obj)s
+      AND %(up)s >= 1
+    UNION
+    SELECT l.id, l.source_content_type_id, l.source_object_id, w.depth + 1
+    FROM {links} l
+    JOIN upstream w ON l.target_content_type_id = w.ct_id AND l.target_object_id = w.obj_id
+    WHERE l.tenant_id = %(tenant)s AND w.depth < %(up)s
+),
+walk (link_id, direction, depth) AS (
+    SELECT link_id, 'downstream', MIN(depth) FROM downstream GROUP BY link_id
+    UNION ALL
+    SELECT link_id, 'upstream', MIN(depth) FROM upstream GROUP BY link_id
+)
+SELECT l.*, w.direction, w.depth, u.username AS created_by_name
+FROM walk w
+JOIN {links} l ON l.id = w.link_id
+LEFT JOIN {users} u ON u.id = l.created_by_id
+ORDER BY w.direction, w.depth, l.id
+"""
+
+
+class DocumentLineageService:
+    """
+    Walk DocumentLink edges transitively from one document.
+
+    The whole upstream (what produced it) and downstream (what it produced)
+    graph comes back from one recursive CTE, instead of one query per hop.
+    Edges repeat the depth limit as their only cycle guard, so the limit is
+    always applied (see LINEAGE_MAX_DEPTH).
+
+    Usage:
+        svc = DocumentLineageService(tenant)
+        links = svc.walk(ContentType.objects.get_for_model(order), order.pk)
+        for link in links:
+            link.direction, link.depth   # 'upstream'/'downstream', hops from the root
+    """
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    def walk(self, content_type, object_id, direction='both', max_depth=10):
+        """
+        Return the DocumentLinks reachable from (content_type, object_id).
+
+        Args:
+            content_type: ContentType of the root document
+            object_id: Primary key of the root document
+            direction: 'upstream', 'downstream' or 'both'
+            max_depth: Hops to follow in each direction (capped at LINEAGE_MAX_DEPTH)
+
+        Returns:
+            list of DocumentLink, each annotated with ``direction``, ``depth``
+            and ``created_by_name``; ordered by direction, then depth
+        """
+        from django.contrib.auth import get_user_model
+        from .models import DocumentLink
+
+        depth = max(0, min(int(max_depth), LINEAGE_MAX_DEPTH))
+        sql = _LINEAGE_SQL.format(
+            links=DocumentLink._meta.db_table,
+            users=get_user_model()._meta.db_table,
+        )
+        params = {
+            'tenant': self.tenant.pk,
+            'ct': content_type.pk,
+            'obj': int(object_id),
+            'down': depth if direction in ('both', 'downstream') else 0,
+            'up': depth if direction in ('both', 'upstream') else 0,
+        }
+        return list(DocumentLink.objects.raw(sql, params))
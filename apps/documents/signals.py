@@ -0,0 +1,38 @@
+# apps/documents/signals.py
+"""
+Signals that drop cached PDF renderings when their document changes.
+
+The cache key already covers the document row, so a changed document never
+serves a stale PDF; these handlers just reclaim the storage, after commit so
+saves don't wait on a storage round trip. Receivers are connected for each
+cached model and its concrete subclasses (e.g. DCItem for item specs).
+Queryset ``update()`` calls bypass them and leave orphans until the next save.
+"""
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from .pdf_cache import CACHED_DOCUMENT_MODELS, PDFCache
+
+
+def _purge_handler(doc_type):
+    def purge_cached_pdf(sender, instance, raw=False, created=False, **kwargs):
+        # A new row has no renderings yet
+        if raw or created:
+            return
+        tenant_id, pk = instance.tenant_id, instance.pk
+        transaction.on_commit(lambda: PDFCache.purge(doc_type, tenant_id, pk))
+    return purge_cached_pdf
+
+
+for _doc_type, _label in CACHED_DOCUMENT_MODELS.items():
+    _root = apps.get_model(_label)
+    _handler = _purge_handler(_doc_type)
+    for _model in apps.get_models():
+        if _model is not _root and (_model._meta.proxy or not issubclass(_model, _root)):
+            continue
+        _uid = f'{_doc_type}_{_model._meta.label_lower}'
+        post_save.connect(_handler, sender=_model, weak=False,
+                          dispatch_uid=f'pdf_cache_purge_save_{_uid}')
+        post_delete.connect(_handler, sender=_model, weak=False,
+                            dispatch_uid=f'pdf_cache_purge_delete_{_uid}')
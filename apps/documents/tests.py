@@ -1,10 +1,15 @@
 # apps/documents/tests.py
 """
-Tests for the Attachment model (GenericForeignKey) and DocumentLink lineage.
+Tests for the Attachment model (GenericForeignKey), DocumentLink lineage and the
+PDF render cache.
 """
+import tempfile
+import threading
 from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
@@ -12,6 +17,9 @@ from django.utils import timezone
 from apps.tenants.models import Tenant
 from apps.parties.models import Party
 from apps.documents.models import Attachment, DocumentLink, record_link
+from apps.documents.pdf import PDFService
+from apps.documents.pdf_cache import PDFCache
+from apps.items.models import DCItem, Item, UnitOfMeasure
 from shared.managers import set_current_tenant
 from users.models import User
 
@@ -170,6 +178,96 @@ class DocumentLinkModelTestCase(TestCase):
         )
 
 
+class DocumentLineageTestCase(TestCase):
+    """DocumentLineageService.walk and GET /document-links/lineage/."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Lineage Co', subdomain='test-lineage', is_default=True)
+        cls.other = Tenant.objects.create(name='Other Co', subdomain='test-lineage-other')
+        cls.user = User.objects.create_user(username='lineageuser', password='pass')
+        set_current_tenant(cls.tenant)
+
+        # a -> b -> c -> d, plus b -> e
+        cls.docs = {
+            code: Party.objects.create(
+                tenant=cls.tenant, party_type='CUSTOMER', code=code, display_name=f'Doc {code}',
+            )
+            for code in 'abcde'
+        }
+        for source, target in ('ab', 'bc', 'cd', 'be'):
+            record_link(cls.docs[source], cls.docs[target], 'other', cls.tenant, user=cls.user)
+        # Another tenant's edge into the same ids must not be followed
+        DocumentLink.objects.create(
+            tenant=cls.other,
+            source_content_type=ContentType.objects.get_for_model(Party),
+            source_object_id=cls.docs['c'].pk,
+            target_content_type=ContentType.objects.get_for_model(Party),
+            target_object_id=999999,
+            relation='other',
+        )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.ct = ContentType.objects.get_for_model(Party)
+
+    def _walk(self, code, **kwargs):
+        from apps.documents.services import DocumentLineageService
+        links = DocumentLineageService(self.tenant).walk(self.ct, self.docs[code].pk, **kwargs)
+        codes = {doc.pk: code for code, doc in self.docs.items()}
+        return sorted(
+            (link.direction, link.depth, codes[link.source_object_id], codes[link.target_object_id])
+            for link in links
+        )
+
+    def test_walks_both_directions_in_one_query(self):
+        with self.assertNumQueries(1):
+            walked = self._walk('b')
+        self.assertEqual(walked, [
+            ('downstream', 1, 'b', 'c'),
+            ('downstream', 1, 'b', 'e'),
+            ('downstream', 2, 'c', 'd'),
+            ('upstream', 1, 'a', 'b'),
+        ])
+
+    def test_direction_and_depth_limit(self):
+        self.assertEqual(self._walk('d', direction='upstream', max_depth=2), [
+            ('upstream', 1, 'c', 'd'),
+            ('upstream', 2, 'b', 'c'),
+        ])
+        self.assertEqual(self._walk('a', direction='downstream', max_depth=0), [])
+
+    def test_lineage_endpoint_resolves_labels(self):
+        from rest_framework.test import APIClient
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        resp = client.get('/api/v1/document-links/lineage/', {
+            'app_label': 'parties', 'model': 'party', 'object_id': self.docs['a'].pk,
+        }, HTTP_HOST='localhost')
+
+        self.assertEqual(resp.status_code, 200, resp.data)
+        self.assertEqual(resp.data['root']['label'], 'Party Doc a')
+        self.assertEqual(len(resp.data['links']), 4)
+        self.assertEqual(
+            {(node['label'], node['depth']) for node in resp.data['nodes']},
+            {('Party Doc a', 0), ('Party Doc b', 1), ('Party Doc c', 2),
+             ('Party Doc e', 2), ('Party Doc d', 3)},
+        )
+        link = resp.data['links'][0]
+        self.assertEqual(link['created_by_name'], 'lineageuser')
+        self.assertEqual(link['source_type'], 'parties.party')
+
+    def test_lineage_endpoint_validates_params(self):
+        from rest_framework.test import APIClient
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        resp = client.get('/api/v1/document-links/lineage/', {
+            'app_label': 'parties', 'model': 'party', 'object_id': 1, 'direction': 'sideways',
+        }, HTTP_HOST='localhost')
+        self.assertEqual(resp.status_code, 400)
+
+
 class ConvertCreatesDocumentLinkTestCase(TestCase):
     """convert_estimate_to_order should record an estimate→sales_order link."""
 
@@ -264,3 +362,84 @@ class AttachmentForObjectRouteTestCase(TestCase):
         )
         self.assertEqual(resp.status_code, 200, resp.data if hasattr(resp, 'data') else resp.content)
         self.assertIsInstance(resp.data, list)
+
+
+class PDFCacheTestCase(TestCase):
+    """Tests for the content-addressed PDF render cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='PDF Co', subdomain='test-pdf-cache')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='EA', name='Each')
+        cls.item = Item.objects.create(tenant=cls.tenant, sku='PDF-1', name='Spec Item', base_uom=cls.uom)
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _render(self, item=None):
+        with patch('apps.documents.pdf._render_pdf_bytes', return_value=b'%PDF-fake') as backend:
+            pdf_bytes = PDFService.render_item_spec(item or self.item)
+        return pdf_bytes, backend.call_count
+
+    def test_second_render_served_from_cache(self):
+        self.assertEqual(self._render(), (b'%PDF-fake', 1))
+        self.assertEqual(self._render(), (b'%PDF-fake', 0))
+
+    def test_save_changes_key_and_purges(self):
+        self._render()
+        directory = PDFCache.directory('item_spec', self.tenant.pk, self.item.pk)
+        self.assertEqual(len(default_storage.listdir(directory)[1]), 1)
+
+        self.item.name = 'Renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.save()
+        self.assertEqual(default_storage.listdir(directory)[1], [])
+        self.assertEqual(self._render()[1], 1)
+
+    def test_item_subclass_save_purges(self):
+        item = DCItem.objects.create(
+            tenant=self.tenant, sku='PDF-DC', name='Die Cut', base_uom=self.uom,
+            test='ect32', flute='b', length=Decimal('12'), width=Decimal('8'),
+        )
+        self._render(item)
+        directory = PDFCache.directory('item_spec', self.tenant.pk, item.pk)
+
+        item.name = 'Die Cut Renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            item.save()
+        self.assertEqual(default_storage.listdir(directory)[1], [])
+
+    def test_purge_without_cached_files_is_quiet(self):
+        with self.assertNoLogs('apps.documents.pdf_cache', level='WARNING'):
+            PDFCache.purge('item_spec', self.tenant.pk, 999999)
+
+    def test_master_data_change_misses(self):
+        self._render()
+        self.uom.name = 'Each (unit)'
+        self.uom.save()
+        self.assertEqual(self._render()[1], 1)
+
+    def test_disabled_always_renders(self):
+        with override_settings(PDF_CACHE_ENABLED=False):
+            self.assertEqual(self._render()[1], 1)
+            self.assertEqual(self._render()[1], 1)
+
+    def test_prewarm_scheduled_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            PDFCache.prewarm(PDFService.render_item_spec, self.item)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_prewarm_skipped_when_queue_full(self):
+        executor = MagicMock()
+        pool = (executor, threading.BoundedSemaphore(1))
+        with patch('apps.documents.pdf_cache._prewarm_pool', return_value=pool):
+            with self.captureOnCommitCallbacks(execute=True):
+                PDFCache.prewarm(PDFService.render_item_spec, self.item)
+                PDFCache.prewarm(PDFService.render_item_spec, self.item)
+        self.assertEqual(executor.submit.call_count, 1)
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_historicalpickticket_pickticket_pickticketline_and_more'),
+        ('items', '0016_historicalitem_extra_info_lines_and_more'),
+        ('new_warehousing', '0007_stock_summary'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='inventorytransaction',
+            name='inventory_i_tenant__d4c36e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='inventorytransaction',
+            index=models.Index(fields=['tenant', 'transaction_date', 'id'], name='inventory_i_tenant__9704d7_idx'),
+        ),
+    ]
@@ -22,7 +22,7 @@ from shared.models import TenantMixin, TimestampMixin
 import uuid
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 
 
 class InventoryLot(TenantMixin, TimestampMixin):
@@ -243,8 +243,8 @@ class InventoryBalance(TenantMixin):
         help_text="Last time balance was updated"
     )
 
-    # Audit trail
-    history = HistoricalRecords()
+    # Audit trail. High-churn: skipped in bulk/deferred history writes.
+    history = BatchedHistoricalRecords(bulk_history=False)
 
     class Meta:
         verbose_name = "Inventory Balance"
@@ -392,7 +392,8 @@ class InventoryTransaction(TenantMixin):
         ordering = ['-transaction_date']
         indexes = [
             models.Index(fields=['tenant', 'item', 'warehouse', 'transaction_date']),
-            models.Index(fields=['tenant', 'transaction_date']),
+            # (sort key, id) so keyset pages are a range scan.
+            models.Index(fields=['tenant', 'transaction_date', 'id']),
             models.Index(fields=['reference_type', 'reference_id']),
         ]
 
@@ -591,7 +592,7 @@ class ItemReceipt(TenantMixin, TimestampMixin):
     )
     notes = models.TextField(blank=True)
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Item Receipt"
@@ -777,7 +778,7 @@ class PickTicket(TenantMixin, TimestampMixin):
     )
     notes = models.TextField(blank=True)
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Pick Ticket"
@@ -23,7 +23,8 @@ from .models import (
     InventoryLayer, ItemReceipt, ItemReceiptLine,
     PickTicket, PickTicketLine,
 )
-from apps.accounting.models import AccountingSettings, JournalEntry, JournalEntryLine
+from apps.accounting.models import AccountingSettings, JournalEntry
+from apps.accounting.services import AccountingError, EntryLineInput, GLPostingEngine
 from apps.tenants.models import get_next_sequence_number
 
 
@@ -262,43 +263,23 @@ class InventoryService:
             )
 
             # 3. GL Journal Entry: DEBIT Inventory Asset, CREDIT source
-            je_number = self._generate_inv_je_number()
-            je = JournalEntry.objects.create(
-                tenant=self.tenant,
-                entry_number=je_number,
-                date=received_date,
-                memo=f"Inventory receipt: {item.sku} x{quantity} @ ${unit_cost}",
-                reference_number=lot.lot_number,
-                entry_type='standard',
-                status='posted',
-                source_type=ContentType.objects.get_for_model(InventoryLayer),
-                source_id=layer.pk,
-                posted_at=timezone.now(),
-                posted_by=self.user,
-                created_by=self.user,
-            )
-
-            # DEBIT: Inventory Asset (asset increases)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=10,
-                account=asset_account,
-                description=f"Inventory receipt - {item.sku} x{quantity}",
-                debit=total_cost,
-                credit=Decimal('0.00'),
-            )
-
-            # CREDIT: Source account (A/P or adjustment)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=20,
-                account=credit_account,
-                description=f"Inventory receipt - {item.sku} x{quantity}",
-                debit=Decimal('0.00'),
-                credit=total_cost,
-            )
+            description = f"Inventory receipt - {item.sku} x{quantity}"
+            try:
+                GLPostingEngine(self.tenant, self.user).post(
+                    entry_date=received_date,
+                    memo=f"Inventory receipt: {item.sku} x{quantity} @ ${unit_cost}",
+                    lines=[
+                        # DEBIT: Inventory Asset (asset increases)
+                        EntryLineInput(account=asset_account, description=description, debit=total_cost),
+                        # CREDIT: Source account (A/P or adjustment)
+                        EntryLineInput(account=credit_account, description=description, credit=total_cost),
+                    ],
+                    reference_number=lot.lot_number,
+                    source_document=layer,
+                    number_prefix='INV-RCV',
+                )
+            except AccountingError as e:
+                raise ValidationError(str(e))
 
             # Broadcast inventory change via WebSocket
             try:
@@ -571,62 +552,45 @@ class InventoryService:
                 adjustment_amount = abs(Decimal(str(quantity_change))) * avg_cost
 
                 if adjustment_amount > 0:
-                    je_number = self._generate_adj_je_number()
-                    adj_memo = reason or f"Inventory adjustment: {item.sku} {quantity_change:+d}"
-
-                    je = JournalEntry.objects.create(
-                        tenant=self.tenant,
-                        entry_number=je_number,
-                        date=timezone.now().date(),
-                        memo=adj_memo,
-                        reference_number=reference or f"ADJ-{item.sku}",
-                        entry_type='adjusting',
-                        status='posted',
-                        posted_at=timezone.now(),
-                        posted_by=self.user,
-                        created_by=self.user,
-                    )
-
                     if quantity_change < 0:
                         # Shrinkage: DEBIT Expense, CREDIT Inventory Asset
-                        JournalEntryLine.objects.create(
-                            tenant=self.tenant,
-                            entry=je,
-                            line_number=10,
-                            account=expense_account,
-                            description=f"Inventory shrinkage - {item.sku} x{abs(quantity_change)}",
-                            debit=adjustment_amount,
-                            credit=Decimal('0.00'),
-                        )
-                        JournalEntryLine.objects.create(
-                            tenant=self.tenant,
-                            entry=je,
-                            line_number=20,
-                            account=asset_account,
-                            description=f"Inventory adjustment - {item.sku} x{abs(quantity_change)}",
-                            debit=Decimal('0.00'),
-                            credit=adjustment_amount,
-                        )
+                        lines = [
+                            EntryLineInput(
+                                account=expense_account,
+                                description=f"Inventory shrinkage - {item.sku} x{abs(quantity_change)}",
+                                debit=adjustment_amount,
+                            ),
+                            EntryLineInput(
+                                account=asset_account,
+                                description=f"Inventory adjustment - {item.sku} x{abs(quantity_change)}",
+                                credit=adjustment_amount,
+                            ),
+                        ]
                     else:
                         # Found inventory: DEBIT Inventory Asset, CREDIT Expense
-                        JournalEntryLine.objects.create(
-                            tenant=self.tenant,
-                            entry=je,
-                            line_number=10,
-                            account=asset_account,
-                            description=f"Inventory found - {item.sku} x{quantity_change}",
-                            debit=adjustment_amount,
-                            credit=Decimal('0.00'),
-                        )
-                        JournalEntryLine.objects.create(
-                            tenant=self.tenant,
-                            entry=je,
-                            line_number=20,
-                            account=expense_account,
-                            description=f"Inventory adjustment - {item.sku} x{quantity_change}",
-                            debit=Decimal('0.00'),
-                            credit=adjustment_amount,
+                        lines = [
+                            EntryLineInput(
+                                account=asset_account,
+                                description=f"Inventory found - {item.sku} x{quantity_change}",
+                                debit=adjustment_amount,
+                            ),
+                            EntryLineInput(
+                                account=expense_account,
+                                description=f"Inventory adjustment - {item.sku} x{quantity_change}",
+                                credit=adjustment_amount,
+                            ),
+                        ]
+                    try:
+                        GLPostingEngine(self.tenant, self.user).post(
+                            entry_date=timezone.now().date(),
+                            memo=reason or f"Inventory adjustment: {item.sku} {quantity_change:+d}",
+                            lines=lines,
+                            reference_number=reference or f"ADJ-{item.sku}",
+                            entry_type=JournalEntry.EntryType.ADJUSTING,
+                            number_prefix='ADJ',
                         )
+                    except AccountingError as e:
+                        raise ValidationError(str(e))
 
             return balance
 
@@ -773,41 +737,29 @@ class InventoryService:
             )
 
             # GL Journal Entry: DEBIT COGS, CREDIT Inventory Asset
-            je_number = self._generate_cogs_je_number()
-            je = JournalEntry.objects.create(
-                tenant=self.tenant,
-                entry_number=je_number,
-                date=timezone.now().date(),
-                memo=f"COGS: {item.sku} x{quantity} shipped",
-                reference_number=sales_order.order_number if sales_order else reference,
-                entry_type='standard',
-                status='posted',
-                posted_at=timezone.now(),
-                posted_by=self.user,
-                created_by=self.user,
-            )
-
-            # DEBIT: COGS (expense increases)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=10,
-                account=cogs_account,
-                description=f"COGS - {item.sku} x{quantity} (FIFO)",
-                debit=total_cogs,
-                credit=Decimal('0.00'),
-            )
-
-            # CREDIT: Inventory Asset (asset decreases)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=20,
-                account=asset_account,
-                description=f"Inventory issued - {item.sku} x{quantity}",
-                debit=Decimal('0.00'),
-                credit=total_cogs,
-            )
+            try:
+                je = GLPostingEngine(self.tenant, self.user).post(
+                    entry_date=timezone.now().date(),
+                    memo=f"COGS: {item.sku} x{quantity} shipped",
+                    lines=[
+                        # DEBIT: COGS (expense increases)
+                        EntryLineInput(
+                            account=cogs_account,
+                            description=f"COGS - {item.sku} x{quantity} (FIFO)",
+                            debit=total_cogs,
+                        ),
+                        # CREDIT: Inventory Asset (asset decreases)
+                        EntryLineInput(
+                            account=asset_account,
+                            description=f"Inventory issued - {item.sku} x{quantity}",
+                            credit=total_cogs,
+                        ),
+                    ],
+                    reference_number=sales_order.order_number if sales_order else reference,
+                    number_prefix='COGS',
+                )
+            except AccountingError as e:
+                raise ValidationError(str(e))
 
             # Broadcast inventory change via WebSocket
             try:
@@ -972,24 +924,6 @@ class InventoryService:
         ).count() + 1
         return f"LOT-{date_part}-{seq:04d}"
 
-    def _generate_inv_je_number(self):
-        """Generate unique journal entry number for inventory receipts."""
-        date_part = timezone.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"INV-RCV-{date_part}",
-        ).count() + 1
-        return f"INV-RCV-{date_part}-{count:05d}"
-
-    def _generate_cogs_je_number(self):
-        """Generate unique journal entry number for COGS entries."""
-        date_part = timezone.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"COGS-{date_part}",
-        ).count() + 1
-        return f"COGS-{date_part}-{count:05d}"
-
     def _get_average_cost(self, item, warehouse):
         """Get average unit cost from FIFO layers for an item/warehouse."""
         layers = InventoryLayer.objects.filter(
@@ -1011,14 +945,6 @@ class InventoryService:
             return last_layer.unit_cost
         return Decimal('0.00')
 
-    def _generate_adj_je_number(self):
-        """Generate unique journal entry number for inventory adjustments."""
-        date_part = timezone.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"ADJ-{date_part}",
-        ).count() + 1
-        return f"ADJ-{date_part}-{count:05d}"
 
 
 class ReorderService:
@@ -1035,61 +961,78 @@ class ReorderService:
         Returns list of dicts with item info, current stock, reorder_point,
         preferred vendor, and suggested PO quantity.
         """
-        from apps.items.models import Item
+        from django.db.models import F, Prefetch, Q, Sum, Value
+        from django.db.models.functions import Coalesce
+        from apps.items.models import Item, ItemVendor
 
         alerts = []
 
-        # Get all items with reorder_point set
+        def total(field):
+            return Coalesce(
+                Sum(f'inventory_balances__{field}', filter=Q(inventory_balances__tenant=self.tenant)),
+                Value(0),
+            )
+
+        # One grouped query: per-item totals across warehouses, already
+        # filtered to items at or below their reorder point.
         items_with_reorder = Item.objects.filter(
             tenant=self.tenant,
             is_active=True,
             item_type='inventory',
             reorder_point__isnull=False,
-        ).select_related('base_uom')
+        ).annotate(
+            total_on_hand=total('on_hand'),
+            total_allocated=total('allocated'),
+            total_on_order=total('on_order'),
+        ).filter(
+            total_on_hand__lte=F('reorder_point'),
+        ).select_related('base_uom').prefetch_related(
+            Prefetch(
+                'vendors',
+                queryset=ItemVendor.objects.filter(
+                    tenant=self.tenant, is_preferred=True, is_active=True,
+                ).select_related('vendor'),
+                to_attr='preferred_vendors',
+            ),
+        )
 
         for item in items_with_reorder:
-            # Sum on_hand across all warehouses
-            balances = item.inventory_balances.filter(tenant=self.tenant)
-            total_on_hand = sum(b.on_hand for b in balances)
-            total_allocated = sum(b.allocated for b in balances)
-            total_on_order = sum(b.on_order for b in balances)
+            total_on_hand = item.total_on_hand
+            total_allocated = item.total_allocated
+            total_on_order = item.total_on_order
             total_available = total_on_hand - total_allocated
 
-            if total_on_hand <= item.reorder_point:
-                # Find preferred vendor
-                preferred_vendor = item.vendors.filter(
-                    is_preferred=True, is_active=True
-                ).select_related('vendor__party').first()
+            preferred_vendor = item.preferred_vendors[0] if item.preferred_vendors else None
 
-                # Suggest order quantity: bring up to reorder_point + safety_stock
-                target = item.reorder_point + (item.safety_stock or 0)
-                suggested_qty = max(target - total_on_hand + total_allocated, 0)
+            # Suggest order quantity: bring up to reorder_point + safety_stock
+            target = item.reorder_point + (item.safety_stock or 0)
+            suggested_qty = max(target - total_on_hand + total_allocated, 0)
 
-                # Check vendor min order qty
-                if preferred_vendor and preferred_vendor.min_order_qty:
-                    suggested_qty = max(suggested_qty, preferred_vendor.min_order_qty)
+            # Check vendor min order qty
+            if preferred_vendor and preferred_vendor.min_order_qty:
+                suggested_qty = max(suggested_qty, preferred_vendor.min_order_qty)
 
-                severity = 'critical' if total_available <= 0 else (
-                    'warning' if item.min_stock and total_on_hand <= item.min_stock else 'info'
-                )
+            severity = 'critical' if total_available <= 0 else (
+                'warning' if item.min_stock and total_on_hand <= item.min_stock else 'info'
+            )
 
-                alerts.append({
-                    'item_id': item.id,
-                    'item_sku': item.sku,
-                    'item_name': item.name,
-                    'on_hand': total_on_hand,
-                    'allocated': total_allocated,
-                    'available': total_available,
-                    'on_order': total_on_order,
-                    'reorder_point': item.reorder_point,
-                    'min_stock': item.min_stock,
-                    'safety_stock': item.safety_stock,
-                    'suggested_qty': suggested_qty,
-                    'preferred_vendor_id': preferred_vendor.vendor_id if preferred_vendor else None,
-                    'preferred_vendor_name': preferred_vendor.vendor.party.display_name if preferred_vendor else None,
-                    'lead_time_days': preferred_vendor.lead_time_days if preferred_vendor else None,
-                    'severity': severity,
-                })
+            alerts.append({
+                'item_id': item.id,
+                'item_sku': item.sku,
+                'item_name': item.name,
+                'on_hand': total_on_hand,
+                'allocated': total_allocated,
+                'available': total_available,
+                'on_order': total_on_order,
+                'reorder_point': item.reorder_point,
+                'min_stock': item.min_stock,
+                'safety_stock': item.safety_stock,
+                'suggested_qty': suggested_qty,
+                'preferred_vendor_id': preferred_vendor.vendor_id if preferred_vendor else None,
+                'preferred_vendor_name': preferred_vendor.vendor.display_name if preferred_vendor else None,
+                'lead_time_days': preferred_vendor.lead_time_days if preferred_vendor else None,
+                'severity': severity,
+            })
 
         # Sort: critical first, then warning, then info
         severity_order = {'critical': 0, 'warning': 1, 'info': 2}
@@ -1098,6 +1041,246 @@ class ReorderService:
         return alerts
 
 
+# ─── Net Requirements (MRP) ──────────────────────────────────────────────────
+
+
+class NetRequirementsService:
+    """
+    Time-phased net requirements for every inventory item.
+
+    Demand (open sales order lines, dated by the order's scheduled date),
+    supply (open purchase order lines, dated by scheduled/expected date),
+    on-hand, safety stock and preferred-vendor lead times are each loaded
+    with one grouped query and laid out as per-item arrays of buckets
+    (days or weeks) over the horizon. Netting then walks every item's
+    arrays once:
+
+        projected[t] = on_hand + sum(supply[:t+1]) - sum(demand[:t+1])
+
+    Past-due demand and supply fall into the first bucket. A planned order
+    is suggested in the first bucket where the projected balance (including
+    earlier planned orders) drops below safety stock, sized to restore it
+    (at least the vendor's minimum order quantity) and released lead-time
+    days earlier.
+
+    Usage:
+        svc = NetRequirementsService(tenant)
+        plan = svc.plan(horizon_days=90, bucket='week')
+        plan['planned_orders']   # PO suggestions, earliest release first
+    """
+
+    SO_OPEN_STATUSES = ('confirmed', 'scheduled', 'picking')
+    PO_OPEN_STATUSES = ('confirmed', 'scheduled', 'partially_received')
+    BUCKET_DAYS = {'day': 1, 'week': 7}
+
+    def __init__(self, tenant, user=None):
+        self.tenant = tenant
+        self.user = user
+
+    def plan(self, horizon_days=90, bucket='day', start=None, item_ids=None, shortages_only=False):
+        """
+        Compute projected available balance and planned orders per item.
+
+        Args:
+            horizon_days: Days to plan ahead from ``start``
+            bucket: 'day' or 'week'
+            start: First bucket date (defaults to today)
+            item_ids: Restrict to these items
+            shortages_only: Only return items that need a planned order
+
+        Returns:
+            dict with ``buckets`` (bucket start dates), ``items`` (one row
+            per item with its demand/supply/projected arrays, shortage date
+            and planned orders) and ``planned_orders`` (all items, by
+            release date)
+        """
+        from datetime import timedelta
+
+        if bucket not in self.BUCKET_DAYS:
+            raise ValidationError(f"Unknown bucket '{bucket}' (expected 'day' or 'week')")
+        size = self.BUCKET_DAYS[bucket]
+        start = start or timezone.now().date()
+        count = max(1, -(-horizon_days // size))
+        end = start + timedelta(days=count * size)
+        buckets = [start + timedelta(days=i * size) for i in range(count)]
+
+        item_qs = self._item_queryset(item_ids)
+        items = {
+            row['id']: row
+            for row in item_qs.order_by('pk').values('id', 'sku', 'name', 'safety_stock')
+        }
+        # Loaders filter on the item subquery rather than a list of ids
+        item_qs = item_qs.values('pk')
+        demand = self._bucketed(self._demand_rows(item_qs, end), start, size, count)
+        supply = self._bucketed(self._supply_rows(item_qs, end), start, size, count)
+        on_hand = self._on_hand(item_qs)
+        vendors = self._preferred_vendors(item_qs)
+
+        rows, planned = [], []
+        for item_id, item in items.items():
+            row = self._net(
+                item, buckets, size,
+                demand.get(item_id), supply.get(item_id),
+                on_hand.get(item_id, 0), vendors.get(item_id),
+            )
+            if shortages_only and not row['planned_orders']:
+                continue
+            rows.append(row)
+            planned.extend(
+                {'item_id': item_id, 'item_sku': item['sku'], **order}
+                for order in row['planned_orders']
+            )
+
+        rows.sort(key=lambda r: (r['shortage_date'] is None, r['shortage_date'] or start, r['item_sku']))
+        planned.sort(key=lambda o: (o['order_date'], o['item_sku']))
+        return {
+            'start': start,
+            'end': end,
+            'bucket': bucket,
+            'buckets': buckets,
+            'items': rows,
+            'planned_orders': planned,
+        }
+
+    # ===== NETTING =====
+
+    def _net(self, item, buckets, size, demand, supply, on_hand, vendor):
+        """Net one item's bucket arrays; returns its plan row."""
+        from datetime import timedelta
+        from itertools import accumulate
+
+        count = len(buckets)
+        demand = demand or [0] * count
+        supply = supply or [0] * count
+        safety = item['safety_stock'] or 0
+        lead_time = (vendor or {}).get('lead_time_days') or 0
+        min_qty = (vendor or {}).get('min_order_qty') or 0
+
+        projected = list(accumulate(
+            (s - d for s, d in zip(supply, demand)), initial=on_hand,
+        ))[1:]
+        shortage = next((i for i, qty in enumerate(projected) if qty < 0), None)
+
+        planned_orders = []
+        planned_total = 0
+        for i, qty in enumerate(projected):
+            net = safety - (qty + planned_total)
+            if net <= 0:
+                continue
+            order_qty = max(net, min_qty)
+            planned_total += order_qty
+            order_date = buckets[i] - timedelta(days=lead_time)
+            planned_orders.append({
+                'need_date': buckets[i],
+                'order_date': max(order_date, buckets[0]),
+                'past_due': order_date < buckets[0],
+                'quantity': order_qty,
+                'vendor_id': (vendor or {}).get('vendor_id'),
+                'vendor_name': (vendor or {}).get('vendor_name'),
+            })
+
+        return {
+            'item_id': item['id'],
+            'item_sku': item['sku'],
+            'item_name': item['name'],
+            'on_hand': on_hand,
+            'safety_stock': safety,
+            'lead_time_days': (vendor or {}).get('lead_time_days'),
+            'demand': demand,
+            'supply': supply,
+            'projected_available': projected,
+            'shortage_date': buckets[shortage] if shortage is not None else None,
+            'shortage_qty': -min(projected) if shortage is not None else 0,
+            'planned_orders': planned_orders,
+        }
+
+    # ===== LOADING =====
+
+    def _item_queryset(self, item_ids):
+        from apps.items.models import Item
+
+        items = Item.objects.filter(
+            tenant=self.tenant, is_active=True, item_type='inventory',
+        )
+        if item_ids is not None:
+            items = items.filter(pk__in=item_ids)
+        return items
+
+    def _demand_rows(self, items, end):
+        """(item_id, date, qty) for open sales order lines dated before ``end``."""
+        from django.db.models import Sum
+        from django.db.models.functions import Coalesce
+        from apps.orders.models import SalesOrderLine
+
+        return SalesOrderLine.objects.filter(
+            tenant=self.tenant,
+            item_id__in=items,
+            sales_order__status__in=self.SO_OPEN_STATUSES,
+        ).annotate(
+            need_date=Coalesce('sales_order__scheduled_date', 'sales_order__order_date'),
+        ).filter(need_date__lt=end).values('item_id', 'need_date').annotate(
+            qty=Sum('quantity_ordered'),
+        ).order_by().values_list('item_id', 'need_date', 'qty')
+
+    def _supply_rows(self, items, end):
+        """(item_id, date, qty) for open purchase order lines due before ``end``."""
+        from django.db.models import F, Sum
+        from django.db.models.functions import Coalesce
+        from apps.orders.models import PurchaseOrderLine
+
+        return PurchaseOrderLine.objects.filter(
+            tenant=self.tenant,
+            item_id__in=items,
+            purchase_order__status__in=self.PO_OPEN_STATUSES,
+            quantity_ordered__gt=F('quantity_received'),
+        ).annotate(
+            due_date=Coalesce(
+                'purchase_order__scheduled_date',
+                'purchase_order__expected_date',
+                'purchase_order__order_date',
+            ),
+        ).filter(due_date__lt=end).values('item_id', 'due_date').annotate(
+            qty=Sum(F('quantity_ordered') - F('quantity_received')),
+        ).order_by().values_list('item_id', 'due_date', 'qty')
+
+    def _bucketed(self, rows, start, size, count):
+        """Spread (item_id, date, qty) rows into per-item bucket arrays."""
+        arrays = {}
+        for item_id, day, qty in rows:
+            index = max(0, (day - start).days // size)
+            array = arrays.get(item_id)
+            if array is None:
+                array = arrays[item_id] = [0] * count
+            array[index] += qty
+        return arrays
+
+    def _on_hand(self, items):
+        from django.db.models import Sum
+
+        return dict(
+            InventoryBalance.objects.filter(tenant=self.tenant, item_id__in=items)
+            .values('item_id').annotate(total=Sum('on_hand'))
+            .order_by().values_list('item_id', 'total')
+        )
+
+    def _preferred_vendors(self, items):
+        from apps.items.models import ItemVendor
+
+        vendors = {}
+        for row in ItemVendor.objects.filter(
+            tenant=self.tenant, item_id__in=items, is_preferred=True, is_active=True,
+        ).order_by('pk').values(
+            'item_id', 'vendor_id', 'vendor__display_name', 'lead_time_days', 'min_order_qty',
+        ):
+            vendors.setdefault(row['item_id'], {
+                'vendor_id': row['vendor_id'],
+                'vendor_name': row['vendor__display_name'],
+                'lead_time_days': row['lead_time_days'],
+                'min_order_qty': row['min_order_qty'],
+            })
+        return vendors
+
+
 # ─── Receiving Service ────────────────────────────────────────────────────────
 
 
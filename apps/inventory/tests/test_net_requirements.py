@@ -0,0 +1,135 @@
+# apps/inventory/tests/test_net_requirements.py
+"""
+Tests for NetRequirementsService (time-phased net requirements / MRP).
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.tenants.models import Tenant
+from apps.parties.models import Party, Customer, Vendor, Location
+from apps.items.models import UnitOfMeasure, Item, ItemVendor
+from apps.orders.models import PurchaseOrder, PurchaseOrderLine, SalesOrder, SalesOrderLine
+from apps.warehousing.models import Warehouse
+from apps.inventory.models import InventoryBalance
+from apps.inventory.services import NetRequirementsService
+from shared.managers import set_current_tenant
+
+START = date(2026, 3, 2)
+
+
+class NetRequirementsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='MRP Co', subdomain='test-mrp')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        cls.warehouse = Warehouse.objects.create(tenant=cls.tenant, name='Main', code='MAIN')
+
+        cust_party = Party.objects.create(tenant=cls.tenant, party_type='CUSTOMER', code='C1', display_name='Cust')
+        cls.customer = Customer.objects.create(tenant=cls.tenant, party=cust_party)
+        cls.ship_to = Location.objects.create(
+            tenant=cls.tenant, party=cust_party, location_type='SHIP_TO',
+            name='Ship', address_line1='1 St', city='Chicago', state='IL', postal_code='60601',
+        )
+        cls.vendor_party = Party.objects.create(tenant=cls.tenant, party_type='VENDOR', code='V1', display_name='Vend')
+        cls.vendor = Vendor.objects.create(tenant=cls.tenant, party=cls.vendor_party)
+
+        cls.item = Item.objects.create(
+            tenant=cls.tenant, sku='MRP-1', name='Planned', base_uom=cls.uom,
+            item_type='inventory', safety_stock=10,
+        )
+        cls.idle = Item.objects.create(
+            tenant=cls.tenant, sku='MRP-2', name='Idle', base_uom=cls.uom, item_type='inventory',
+        )
+        InventoryBalance.objects.create(tenant=cls.tenant, item=cls.item, warehouse=cls.warehouse, on_hand=50)
+        InventoryBalance.objects.create(tenant=cls.tenant, item=cls.idle, warehouse=cls.warehouse, on_hand=5)
+        ItemVendor.objects.create(
+            tenant=cls.tenant, item=cls.item, vendor=cls.vendor_party,
+            is_preferred=True, lead_time_days=7, min_order_qty=100,
+        )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.svc = NetRequirementsService(self.tenant)
+
+    def _demand(self, qty, scheduled, status='scheduled'):
+        so = SalesOrder.objects.create(
+            tenant=self.tenant, customer=self.customer, ship_to=self.ship_to,
+            order_number=f'SO-{SalesOrder.objects.count() + 1:05d}',
+            order_date=START - timedelta(days=30), scheduled_date=scheduled, status=status,
+        )
+        SalesOrderLine.objects.create(
+            tenant=self.tenant, sales_order=so, line_number=10, item=self.item,
+            quantity_ordered=qty, uom=self.uom, unit_price=Decimal('1.00'),
+        )
+
+    def _supply(self, qty, expected, received=0):
+        po = PurchaseOrder.objects.create(
+            tenant=self.tenant, vendor=self.vendor, ship_to=self.ship_to,
+            po_number=f'PO-{PurchaseOrder.objects.count() + 1:05d}',
+            order_date=START - timedelta(days=10), expected_date=expected, status='confirmed',
+        )
+        PurchaseOrderLine.objects.create(
+            tenant=self.tenant, purchase_order=po, line_number=10, item=self.item,
+            quantity_ordered=qty, quantity_received=received, uom=self.uom, unit_cost=Decimal('1.00'),
+        )
+
+    def _row(self, plan, item):
+        return next(row for row in plan['items'] if row['item_id'] == item.pk)
+
+    def test_projected_balance_per_day(self):
+        self._demand(30, START + timedelta(days=1))
+        self._demand(40, START + timedelta(days=3))
+        self._supply(25, START + timedelta(days=2), received=5)  # 20 still due
+        self._demand(999, START + timedelta(days=1), status='draft')  # not open demand
+
+        row = self._row(self.svc.plan(horizon_days=5, start=START), self.item)
+        self.assertEqual(row['demand'], [0, 30, 0, 40, 0])
+        self.assertEqual(row['supply'], [0, 0, 20, 0, 0])
+        self.assertEqual(row['projected_available'], [50, 20, 40, 0, 0])
+        self.assertIsNone(row['shortage_date'])
+
+    def test_shortage_date_and_planned_order(self):
+        self._demand(45, START + timedelta(days=10))
+        self._demand(20, START + timedelta(days=20))
+
+        plan = self.svc.plan(horizon_days=30, start=START)
+        row = self._row(plan, self.item)
+        self.assertEqual(row['shortage_date'], START + timedelta(days=20))
+        self.assertEqual(row['shortage_qty'], 15)
+        # Projected 5 < safety 10 on day 10: order min qty 100, released 7 days earlier
+        self.assertEqual(row['planned_orders'], [{
+            'need_date': START + timedelta(days=10),
+            'order_date': START + timedelta(days=3),
+            'past_due': False,
+            'quantity': 100,
+            'vendor_id': self.vendor_party.pk,
+            'vendor_name': 'Vend',
+        }])
+        self.assertEqual(plan['planned_orders'][0]['item_sku'], 'MRP-1')
+
+    def test_past_due_demand_lands_in_first_bucket(self):
+        self._demand(48, START - timedelta(days=5))
+        row = self._row(self.svc.plan(horizon_days=3, start=START), self.item)
+        self.assertEqual(row['projected_available'], [2, 2, 2])
+        self.assertTrue(row['planned_orders'][0]['past_due'])
+        self.assertEqual(row['planned_orders'][0]['order_date'], START)
+
+    def test_weekly_buckets(self):
+        self._demand(10, START + timedelta(days=1))
+        self._demand(10, START + timedelta(days=6))
+        self._demand(10, START + timedelta(days=8))
+        self._demand(10, START + timedelta(days=30))  # beyond horizon
+
+        plan = self.svc.plan(horizon_days=14, bucket='week', start=START)
+        self.assertEqual(plan['buckets'], [START, START + timedelta(days=7)])
+        self.assertEqual(self._row(plan, self.item)['demand'], [20, 10])
+
+    def test_shortages_only_and_constant_queries(self):
+        self._demand(45, START + timedelta(days=2))
+        with self.assertNumQueries(5):  # items, demand, supply, on-hand, vendors
+            plan = self.svc.plan(horizon_days=10, start=START, shortages_only=True)
+        self.assertEqual([row['item_sku'] for row in plan['items']], ['MRP-1'])
@@ -0,0 +1,53 @@
+# apps/inventory/tests/test_reorder.py
+"""
+Tests for ReorderService.get_reorder_alerts.
+"""
+from django.test import TestCase
+
+from apps.tenants.models import Tenant
+from apps.parties.models import Party
+from apps.items.models import UnitOfMeasure, Item, ItemVendor
+from apps.warehousing.models import Warehouse
+from apps.inventory.models import InventoryBalance
+from apps.inventory.services import ReorderService
+from shared.managers import set_current_tenant
+from users.models import User
+
+
+class ReorderAlertsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Reorder Co', subdomain='test-reorder')
+        cls.user = User.objects.create_user(username='reorderuser', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        cls.vendor = Party.objects.create(tenant=cls.tenant, party_type='VENDOR', code='V1', display_name='Vendor One')
+        cls.main = Warehouse.objects.create(tenant=cls.tenant, name='Main', code='MAIN')
+        cls.overflow = Warehouse.objects.create(tenant=cls.tenant, name='Overflow', code='OVF')
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+
+    def test_alerts_from_grouped_balances(self):
+        low = Item.objects.create(
+            tenant=self.tenant, sku='LOW-1', name='Low', base_uom=self.uom,
+            item_type='inventory', reorder_point=20, safety_stock=5,
+        )
+        ok = Item.objects.create(
+            tenant=self.tenant, sku='OK-1', name='Fine', base_uom=self.uom,
+            item_type='inventory', reorder_point=20,
+        )
+        InventoryBalance.objects.create(tenant=self.tenant, item=low, warehouse=self.main, on_hand=8, allocated=3)
+        InventoryBalance.objects.create(tenant=self.tenant, item=low, warehouse=self.overflow, on_hand=4, on_order=10)
+        InventoryBalance.objects.create(tenant=self.tenant, item=ok, warehouse=self.main, on_hand=50)
+        ItemVendor.objects.create(tenant=self.tenant, item=low, vendor=self.vendor, is_preferred=True)
+
+        with self.assertNumQueries(2):  # items with totals + preferred vendors
+            alerts = ReorderService(self.tenant, self.user).get_reorder_alerts()
+
+        self.assertEqual([a['item_sku'] for a in alerts], ['LOW-1'])
+        alert = alerts[0]
+        self.assertEqual((alert['on_hand'], alert['allocated'], alert['on_order']), (12, 3, 10))
+        self.assertEqual(alert['suggested_qty'], 16)
+        self.assertEqual(alert['preferred_vendor_name'], 'Vendor One')
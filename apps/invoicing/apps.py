@@ -5,3 +5,7 @@ class InvoicingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.invoicing'
     verbose_name = 'Invoicing'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.invoicing.signals
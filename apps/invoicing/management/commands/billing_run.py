@@ -0,0 +1,76 @@
+"""Management command for the end-of-day billing run."""
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.tenants.models import Tenant
+from apps.invoicing.services import InvoiceBatchService
+from shared.managers import set_current_tenant
+
+
+def _date(value):
+    parsed = parse_date(value)
+    if parsed is None:
+        raise CommandError(f"Invalid date '{value}' (expected YYYY-MM-DD)")
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        'Invoice delivered shipments for a ship date and/or post draft invoices. '
+        'Work is committed in chunks; failures are reported per document.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ship-date', type=_date, default=None,
+            help='Create draft invoices for shipments delivered with this ship date (YYYY-MM-DD)',
+        )
+        parser.add_argument(
+            '--post', action='store_true',
+            help='Post draft invoices (filtered by --customer/--from/--to)',
+        )
+        parser.add_argument('--customer', type=int, default=None, help='Only post this customer ID')
+        parser.add_argument('--from', dest='date_from', type=_date, default=None,
+                            help='Only post invoices dated on or after this date')
+        parser.add_argument('--to', dest='date_to', type=_date, default=None,
+                            help='Only post invoices dated on or before this date')
+        parser.add_argument('--chunk-size', type=int, default=None,
+                            help='Documents per transaction (default INVOICE_BATCH_CHUNK_SIZE)')
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        if not options['ship_date'] and not options['post']:
+            raise CommandError('Nothing to do: pass --ship-date and/or --post')
+
+        tenants = Tenant.objects.filter(is_active=True)
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total_failed = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            batch = InvoiceBatchService(tenant, chunk_size=options['chunk_size'])
+            runs = []
+            if options['ship_date']:
+                runs.append(('Invoiced', batch.invoice_delivered_shipments(options['ship_date'])))
+            if options['post']:
+                runs.append(('Posted', batch.post_draft_invoices(
+                    customer=options['customer'],
+                    date_from=options['date_from'],
+                    date_to=options['date_to'],
+                )))
+
+            for verb, result in runs:
+                self.stdout.write(
+                    f"  {tenant.name}: {verb} {len(result.succeeded)}, failed {len(result.failed)}"
+                )
+                for failure in result.failed:
+                    ref = failure.get('shipment_number') or failure.get('invoice_number')
+                    self.stdout.write(self.style.WARNING(f"    {ref}: {failure['error']}"))
+                total_failed += len(result.failed)
+
+        style = self.style.WARNING if total_failed else self.style.SUCCESS
+        self.stdout.write(style(f"Done. {total_failed} documents failed."))
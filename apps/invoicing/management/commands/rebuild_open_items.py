@@ -0,0 +1,38 @@
+"""Management command to verify or rebuild the A/R + A/P open-items ledger."""
+from django.core.management.base import BaseCommand
+from apps.tenants.models import Tenant
+from apps.invoicing.services import OpenItemService
+from shared.managers import set_current_tenant
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild OpenItem/PartyOpenBalance from invoices and vendor bills. '
+        'Use --verify to check the ledger without changing it.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify', action='store_true',
+            help='Report differences without writing anything',
+        )
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total_problems = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            problems = OpenItemService(tenant).rebuild(verify_only=options['verify'])
+            for problem in problems:
+                self.stdout.write(f"  {tenant.name}: {problem}")
+            total_problems += len(problems)
+
+        verb = 'Found' if options['verify'] else 'Fixed'
+        self.stdout.write(self.style.SUCCESS(f"Done. {verb} {total_problems} open-item discrepancies."))
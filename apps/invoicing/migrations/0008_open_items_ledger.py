@@ -0,0 +1,62 @@
+# Generated by Django 6.0 on 2026-10-18 21:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invoicing', '0007_invoiceline_pick_ticket_line'),
+        ('parties', '0009_widen_phone_fields'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OpenItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('side', models.CharField(choices=[('AR', 'Receivable'), ('AP', 'Payable')], help_text='A/R (invoice) or A/P (vendor bill)', max_length=2)),
+                ('document_number', models.CharField(help_text='Display number of the source document', max_length=160)),
+                ('document_date', models.DateField(help_text='Invoice/bill date')),
+                ('due_date', models.DateField(help_text='Payment due date')),
+                ('open_amount', models.DecimalField(decimal_places=2, help_text='Outstanding balance (total - paid)', max_digits=12)),
+                ('customer', models.ForeignKey(blank=True, help_text='Customer (A/R)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='open_items', to='parties.customer')),
+                ('invoice', models.OneToOneField(blank=True, help_text='Source invoice (A/R)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='open_item', to='invoicing.invoice')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+                ('vendor', models.ForeignKey(blank=True, help_text='Vendor (A/P)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='open_items', to='parties.vendor')),
+                ('vendor_bill', models.OneToOneField(blank=True, help_text='Source vendor bill (A/P)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='open_item', to='invoicing.vendorbill')),
+            ],
+            options={
+                'verbose_name': 'Open Item',
+                'verbose_name_plural': 'Open Items',
+                'indexes': [models.Index(fields=['tenant', 'side', 'due_date'], name='invoicing_o_tenant__ff1de7_idx'), models.Index(fields=['tenant', 'customer', 'due_date'], name='invoicing_o_tenant__5fd206_idx'), models.Index(fields=['tenant', 'vendor', 'due_date'], name='invoicing_o_tenant__4293a4_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PartyOpenBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('side', models.CharField(choices=[('AR', 'Receivable'), ('AP', 'Payable')], help_text='A/R (customer) or A/P (vendor)', max_length=2)),
+                ('balance', models.DecimalField(decimal_places=2, default=0, help_text='Total open balance', max_digits=14)),
+                ('open_count', models.PositiveIntegerField(default=0, help_text='Number of open documents')),
+                ('oldest_due_date', models.DateField(blank=True, help_text='Earliest due date among open documents', null=True)),
+                ('current_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('days_1_30', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('days_31_60', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('days_61_90', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('days_over_90', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('buckets_as_of', models.DateField(blank=True, help_text='Date the aging buckets were computed for', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('customer', models.OneToOneField(blank=True, help_text='Customer (A/R)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='open_item_balance', to='parties.customer')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+                ('vendor', models.OneToOneField(blank=True, help_text='Vendor (A/P)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='open_item_balance', to='parties.vendor')),
+            ],
+            options={
+                'verbose_name': 'Party Open Balance',
+                'verbose_name_plural': 'Party Open Balances',
+                'indexes': [models.Index(fields=['tenant', 'side', 'oldest_due_date'], name='invoicing_p_tenant__cd9d62_idx')],
+            },
+        ),
+    ]
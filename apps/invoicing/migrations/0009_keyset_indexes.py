@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0004_keyset_indexes'),
+        ('invoicing', '0008_open_items_ledger'),
+        ('orders', '0012_salesorderline_quantity_invoiced'),
+        ('parties', '0009_widen_phone_fields'),
+        ('shipping', '0001_initial'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['tenant', 'invoice_date', 'id'], name='invoicing_i_tenant__bca7f0_idx'),
+        ),
+    ]
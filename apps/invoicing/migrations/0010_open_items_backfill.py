@@ -0,0 +1,105 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:21
+
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Count, DecimalField, Min, Sum, Value
+from django.db.models.functions import Coalesce
+
+AR_OPEN_STATUSES = ('posted', 'sent', 'partial', 'overdue')
+AP_OPEN_STATUSES = ('posted', 'partial')
+
+
+def backfill_open_items(apps, schema_editor):
+    Invoice = apps.get_model('invoicing', 'Invoice')
+    VendorBill = apps.get_model('invoicing', 'VendorBill')
+    OpenItem = apps.get_model('invoicing', 'OpenItem')
+    PartyOpenBalance = apps.get_model('invoicing', 'PartyOpenBalance')
+
+    OpenItem.objects.all().delete()
+    PartyOpenBalance.objects.all().delete()
+
+    items = []
+    for inv in Invoice.objects.filter(status__in=AR_OPEN_STATUSES).values(
+        'pk', 'tenant_id', 'customer_id', 'invoice_number', 'invoice_date', 'due_date',
+        'total_amount', 'amount_paid',
+    ).iterator():
+        balance = inv['total_amount'] - inv['amount_paid']
+        if balance > 0:
+            items.append(OpenItem(
+                tenant_id=inv['tenant_id'], side='AR',
+                invoice_id=inv['pk'], customer_id=inv['customer_id'],
+                document_number=inv['invoice_number'],
+                document_date=inv['invoice_date'], due_date=inv['due_date'],
+                open_amount=balance,
+            ))
+    for bill in VendorBill.objects.filter(status__in=AP_OPEN_STATUSES).values(
+        'pk', 'tenant_id', 'vendor_id', 'bill_number', 'vendor_invoice_number', 'bill_date',
+        'due_date', 'total_amount', 'amount_paid',
+    ).iterator():
+        balance = bill['total_amount'] - bill['amount_paid']
+        if balance > 0:
+            number = bill['bill_number']
+            if bill['vendor_invoice_number']:
+                number = f"{number} / {bill['vendor_invoice_number']}"
+            items.append(OpenItem(
+                tenant_id=bill['tenant_id'], side='AP',
+                vendor_bill_id=bill['pk'], vendor_id=bill['vendor_id'],
+                document_number=number,
+                document_date=bill['bill_date'], due_date=bill['due_date'],
+                open_amount=balance,
+            ))
+    OpenItem.objects.bulk_create(items, batch_size=500)
+
+    balances = []
+    for side, party_field in (('AR', 'customer_id'), ('AP', 'vendor_id')):
+        rows = (
+            OpenItem.objects.filter(side=side)
+            .values('tenant_id', party_field)
+            .annotate(
+                balance=Coalesce(
+                    Sum('open_amount'), Value(Decimal('0')),
+                    output_field=DecimalField(max_digits=14, decimal_places=2),
+                ),
+                open_count=Count('id'),
+                oldest_due_date=Min('due_date'),
+            )
+            .order_by()
+        )
+        balances.extend(PartyOpenBalance(side=side, **row) for row in rows)
+    PartyOpenBalance.objects.bulk_create(balances, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invoicing', '0009_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='partyopenbalance',
+            name='buckets_as_of',
+        ),
+        migrations.RemoveField(
+            model_name='partyopenbalance',
+            name='current_amount',
+        ),
+        migrations.RemoveField(
+            model_name='partyopenbalance',
+            name='days_1_30',
+        ),
+        migrations.RemoveField(
+            model_name='partyopenbalance',
+            name='days_31_60',
+        ),
+        migrations.RemoveField(
+            model_name='partyopenbalance',
+            name='days_61_90',
+        ),
+        migrations.RemoveField(
+            model_name='partyopenbalance',
+            name='days_over_90',
+        ),
+        migrations.RunPython(backfill_open_items, migrations.RunPython.noop),
+    ]
@@ -12,7 +12,7 @@ from django.db import models
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 from shared.models import TenantMixin, TimestampMixin
 
 
@@ -310,7 +310,7 @@ class Invoice(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Invoice"
@@ -319,6 +319,7 @@ class Invoice(TenantMixin, TimestampMixin):
         indexes = [
             models.Index(fields=['tenant', 'invoice_number']),
             models.Index(fields=['tenant', 'customer', 'invoice_date']),
+            models.Index(fields=['tenant', 'invoice_date', 'id']),
             models.Index(fields=['tenant', 'status']),
             models.Index(fields=['tenant', 'due_date']),
         ]
@@ -652,7 +653,7 @@ class VendorBill(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Vendor Bill"
@@ -878,3 +879,147 @@ class BillPayment(TenantMixin, TimestampMixin):
         )['total'] or Decimal('0')
         self.bill.amount_paid = total_paid
         self.bill.save()
+
+
+# ─── Open Items Ledger (A/R + A/P) ───────────────────────────────────────────
+
+class OpenItem(TenantMixin):
+    """
+    One open receivable (Invoice) or payable (VendorBill) with its balance.
+
+    Maintained by OpenItemService from Invoice/VendorBill saves so aging,
+    dunning and credit checks read a narrow indexed table instead of
+    re-scanning every posted document. Rows exist only while the document
+    is open with a positive balance.
+    """
+    SIDE_AR = 'AR'
+    SIDE_AP = 'AP'
+    SIDE_CHOICES = [
+        (SIDE_AR, 'Receivable'),
+        (SIDE_AP, 'Payable'),
+    ]
+
+    side = models.CharField(
+        max_length=2,
+        choices=SIDE_CHOICES,
+        help_text="A/R (invoice) or A/P (vendor bill)"
+    )
+    invoice = models.OneToOneField(
+        Invoice,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='open_item',
+        help_text="Source invoice (A/R)"
+    )
+    vendor_bill = models.OneToOneField(
+        VendorBill,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='open_item',
+        help_text="Source vendor bill (A/P)"
+    )
+    customer = models.ForeignKey(
+        'parties.Customer',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='open_items',
+        help_text="Customer (A/R)"
+    )
+    vendor = models.ForeignKey(
+        'parties.Vendor',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='open_items',
+        help_text="Vendor (A/P)"
+    )
+    document_number = models.CharField(
+        max_length=160,
+        help_text="Display number of the source document"
+    )
+    document_date = models.DateField(
+        help_text="Invoice/bill date"
+    )
+    due_date = models.DateField(
+        help_text="Payment due date"
+    )
+    open_amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        help_text="Outstanding balance (total - paid)"
+    )
+
+    class Meta:
+        verbose_name = "Open Item"
+        verbose_name_plural = "Open Items"
+        indexes = [
+            models.Index(fields=['tenant', 'side', 'due_date']),
+            models.Index(fields=['tenant', 'customer', 'due_date']),
+            models.Index(fields=['tenant', 'vendor', 'due_date']),
+        ]
+
+    def __str__(self):
+        return f"{self.side} {self.document_number}: {self.open_amount}"
+
+
+class PartyOpenBalance(TenantMixin):
+    """
+    Per-customer / per-vendor rollup of open items.
+
+    Holds the total open balance, open document count and oldest due date;
+    aging buckets are computed from OpenItem rows at report time, since their
+    width and as-of date vary per request. Only parties with at least one
+    open item have a row. Refreshed whenever one of the party's open items
+    changes (and by the ``rebuild_open_items`` command).
+    """
+    side = models.CharField(
+        max_length=2,
+        choices=OpenItem.SIDE_CHOICES,
+        help_text="A/R (customer) or A/P (vendor)"
+    )
+    customer = models.OneToOneField(
+        'parties.Customer',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='open_item_balance',
+        help_text="Customer (A/R)"
+    )
+    vendor = models.OneToOneField(
+        'parties.Vendor',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='open_item_balance',
+        help_text="Vendor (A/P)"
+    )
+    balance = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Total open balance"
+    )
+    open_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of open documents"
+    )
+    oldest_due_date = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Earliest due date among open documents"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Party Open Balance"
+        verbose_name_plural = "Party Open Balances"
+        indexes = [
+            models.Index(fields=['tenant', 'side', 'oldest_due_date']),
+        ]
+
+    def __str__(self):
+        party = self.customer if self.side == OpenItem.SIDE_AR else self.vendor
+        return f"{self.side} {party}: {self.balance}"
@@ -9,15 +9,22 @@ InvoicingService handles:
 - Recording payments
 - Calculating due dates based on payment terms
 """
+from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import timedelta
-from django.db import models, transaction
+from django.conf import settings
+from django.db import DatabaseError, models, transaction
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from django.contrib.contenttypes.models import ContentType
 
-from .models import Invoice, InvoiceLine, Payment, VendorBill, VendorBillLine, BillPayment, TaxZone, TaxRule
-from apps.accounting.models import AccountingSettings, JournalEntry, JournalEntryLine
+from .models import (
+    Invoice, InvoiceLine, Payment, VendorBill, VendorBillLine, BillPayment, TaxZone, TaxRule,
+    OpenItem, PartyOpenBalance,
+)
+from apps.accounting.models import AccountingSettings, JournalEntry
+from apps.accounting.services import AccountingError, EntryLineInput, GLPostingEngine
+from apps.items.activity import ItemActivityService
+from apps.items.models import ItemActivity
 
 
 class InvoicingService:
@@ -60,6 +67,34 @@ class InvoicingService:
         """
         self.tenant = tenant
         self.user = user
+        # Batch caches, primed by begin_batch(); None means "look up per call"
+        self._acct_settings = None
+        self._tax_rules = None
+        self._invoice_seq = None
+        self._prewarm_pdfs = True
+
+    def begin_batch(self):
+        """
+        Share lookups across many invoices created or posted by this service.
+
+        Loads AccountingSettings and every active tax rule once, and numbers
+        invoices from a counter instead of counting rows per invoice. Call
+        again at the start of each chunk to re-sync the counter.
+
+        Posted invoices are not queued for PDF pre-rendering; a run of
+        hundreds would flood the render workers, so they render on first open.
+        """
+        self._prewarm_pdfs = False
+        self._acct_settings = AccountingSettings.get_for_tenant(self.tenant)
+        self._tax_rules = {}
+        rules = TaxRule.objects.filter(
+            tenant=self.tenant,
+            tax_zone__is_active=True,
+        ).select_related('tax_zone').order_by('pk')
+        for rule in rules:
+            self._tax_rules.setdefault(rule.postal_code, rule.tax_zone)
+        self._invoice_seq = None
+        self._invoice_seq = int(self._generate_invoice_number().rsplit('-', 1)[1]) - 1
 
     # ===== INVOICE CREATION =====
 
@@ -574,7 +609,7 @@ class InvoicingService:
             )
 
         # Load accounting defaults once
-        acct_settings = AccountingSettings.get_for_tenant(self.tenant)
+        acct_settings = self._acct_settings or AccountingSettings.get_for_tenant(self.tenant)
 
         # Resolve A/R account (fallback chain)
         ar_account = (
@@ -590,7 +625,7 @@ class InvoicingService:
 
         # Resolve income accounts per line (validate before creating anything)
         line_accounts = []
-        for line in invoice.lines.select_related('item').all():
+        for line in invoice.lines.select_related('item__income_account').all():
             income_acct = (
                 line.item.income_account
                 or acct_settings.default_income_account
@@ -605,109 +640,68 @@ class InvoicingService:
         if not line_accounts:
             raise ValidationError("Cannot post invoice with no lines")
 
-        with transaction.atomic():
-            # Generate JE number
-            from django.utils import timezone as tz
-            je_date = invoice.invoice_date
-            je_number = self._generate_je_number()
-
-            # Create the journal entry
-            je = JournalEntry.objects.create(
-                tenant=self.tenant,
-                entry_number=je_number,
-                date=je_date,
-                memo=f"Invoice {invoice.invoice_number} - {invoice.customer}",
-                reference_number=invoice.invoice_number,
-                entry_type='standard',
-                status='posted',
-                source_type=ContentType.objects.get_for_model(Invoice),
-                source_id=invoice.pk,
-                posted_at=tz.now(),
-                posted_by=self.user,
-                created_by=self.user,
-            )
-
-            line_num = 10
-
-            # DEBIT: Accounts Receivable for total amount
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=line_num,
-                account=ar_account,
-                description=f"A/R - Invoice {invoice.invoice_number}",
-                debit=invoice.total_amount,
-                credit=Decimal('0.00'),
-            )
-            line_num += 10
-
-            # CREDIT: Income accounts per invoice line
-            for inv_line, income_acct in line_accounts:
-                JournalEntryLine.objects.create(
-                    tenant=self.tenant,
-                    entry=je,
-                    line_number=line_num,
-                    account=income_acct,
-                    description=f"{inv_line.item.name} x{inv_line.quantity}",
-                    debit=Decimal('0.00'),
-                    credit=inv_line.line_total,
-                )
-                line_num += 10
-
-            # CREDIT: Sales tax liability (if applicable)
-            if invoice.tax_amount > 0:
-                tax_acct = None
-                if invoice.tax_zone and invoice.tax_zone.gl_account:
-                    tax_acct = invoice.tax_zone.gl_account
-                elif acct_settings.default_sales_tax_account:
-                    tax_acct = acct_settings.default_sales_tax_account
-                if tax_acct:
-                    JournalEntryLine.objects.create(
-                        tenant=self.tenant,
-                        entry=je,
-                        line_number=line_num,
-                        account=tax_acct,
-                        description=f"Sales tax - Invoice {invoice.invoice_number}",
-                        debit=Decimal('0.00'),
-                        credit=invoice.tax_amount,
-                    )
-                    line_num += 10
-
-            # CREDIT: Freight income (if applicable)
-            if invoice.freight_amount and invoice.freight_amount > 0:
-                freight_acct = getattr(acct_settings, 'default_freight_income_account', None)
-                if freight_acct:
-                    JournalEntryLine.objects.create(
-                        tenant=self.tenant,
-                        entry=je,
-                        line_number=line_num,
-                        account=freight_acct,
-                        description=f"Freight - Invoice {invoice.invoice_number}",
-                        debit=Decimal('0.00'),
-                        credit=invoice.freight_amount,
-                    )
-                    line_num += 10
-
-            # DEBIT: Sales discount (if applicable)
-            if invoice.discount_amount and invoice.discount_amount > 0:
-                discount_acct = acct_settings.default_sales_discount_account
-                if discount_acct:
-                    JournalEntryLine.objects.create(
-                        tenant=self.tenant,
-                        entry=je,
-                        line_number=line_num,
-                        account=discount_acct,
-                        description=f"Discount - Invoice {invoice.invoice_number}",
-                        debit=invoice.discount_amount,
-                        credit=Decimal('0.00'),
-                    )
-                    line_num += 10
+        # DEBIT: Accounts Receivable for total amount
+        je_lines = [EntryLineInput(
+            account=ar_account,
+            description=f"A/R - Invoice {invoice.invoice_number}",
+            debit=invoice.total_amount,
+        )]
+
+        # CREDIT: Income accounts per invoice line
+        for inv_line, income_acct in line_accounts:
+            je_lines.append(EntryLineInput(
+                account=income_acct,
+                description=f"{inv_line.item.name} x{inv_line.quantity}",
+                credit=inv_line.line_total,
+            ))
+
+        # CREDIT: Sales tax liability (if applicable)
+        if invoice.tax_amount > 0:
+            tax_acct = None
+            if invoice.tax_zone and invoice.tax_zone.gl_account:
+                tax_acct = invoice.tax_zone.gl_account
+            elif acct_settings.default_sales_tax_account:
+                tax_acct = acct_settings.default_sales_tax_account
+            if tax_acct:
+                je_lines.append(EntryLineInput(
+                    account=tax_acct,
+                    description=f"Sales tax - Invoice {invoice.invoice_number}",
+                    credit=invoice.tax_amount,
+                ))
+
+        # CREDIT: Freight income (if applicable)
+        if invoice.freight_amount and invoice.freight_amount > 0:
+            freight_acct = getattr(acct_settings, 'default_freight_income_account', None)
+            if freight_acct:
+                je_lines.append(EntryLineInput(
+                    account=freight_acct,
+                    description=f"Freight - Invoice {invoice.invoice_number}",
+                    credit=invoice.freight_amount,
+                ))
+
+        # DEBIT: Sales discount (if applicable)
+        if invoice.discount_amount and invoice.discount_amount > 0:
+            discount_acct = acct_settings.default_sales_discount_account
+            if discount_acct:
+                je_lines.append(EntryLineInput(
+                    account=discount_acct,
+                    description=f"Discount - Invoice {invoice.invoice_number}",
+                    debit=invoice.discount_amount,
+                ))
 
-            # Verify the entry balances
-            if not je.is_balanced:
-                raise ValidationError(
-                    f"Journal entry is not balanced: DR={je.total_debit} CR={je.total_credit}"
+        with transaction.atomic():
+            # Create the posted journal entry (validates that it balances)
+            try:
+                je = GLPostingEngine(self.tenant, self.user).post(
+                    entry_date=invoice.invoice_date,
+                    memo=f"Invoice {invoice.invoice_number} - {invoice.customer}",
+                    lines=je_lines,
+                    reference_number=invoice.invoice_number,
+                    source_document=invoice,
+                    number_prefix='INV',
                 )
+            except AccountingError as e:
+                raise ValidationError(str(e))
 
             # Lock the invoice to AR account used and link JE
             invoice.ar_account = ar_account
@@ -720,6 +714,14 @@ class InvoicingService:
             )
             # Refresh in-memory object
             invoice.refresh_from_db()
+            OpenItemService(self.tenant).sync_invoice(invoice)
+            ItemActivityService.refresh_document(ItemActivity.INVOICE, invoice)
+
+            # Posted invoices no longer change: render the PDF once, after commit
+            if self._prewarm_pdfs:
+                from apps.documents.pdf import PDFService
+                from apps.documents.pdf_cache import PDFCache
+                PDFCache.prewarm(PDFService.render_invoice, invoice)
 
             # Broadcast invoice update via WebSocket
             try:
@@ -824,44 +826,30 @@ class InvoicingService:
 
         with transaction.atomic():
             if ar_account and bad_debt_account:
-                je_number = self._generate_writeoff_je_number()
-
-                je = JournalEntry.objects.create(
-                    tenant=self.tenant,
-                    entry_number=je_number,
-                    date=timezone.now().date(),
-                    memo=f"Write-off Invoice {invoice.invoice_number} - {reason or 'Uncollectable'}",
-                    reference_number=invoice.invoice_number,
-                    entry_type='standard',
-                    status='posted',
-                    source_type=ContentType.objects.get_for_model(Invoice),
-                    source_id=invoice.pk,
-                    posted_at=timezone.now(),
-                    posted_by=self.user,
-                    created_by=self.user,
-                )
-
-                # DEBIT: Bad Debt Expense
-                JournalEntryLine.objects.create(
-                    tenant=self.tenant,
-                    entry=je,
-                    line_number=10,
-                    account=bad_debt_account,
-                    description=f"Bad debt write-off - {invoice.invoice_number}",
-                    debit=balance_due,
-                    credit=Decimal('0.00'),
-                )
-
-                # CREDIT: A/R (remove receivable)
-                JournalEntryLine.objects.create(
-                    tenant=self.tenant,
-                    entry=je,
-                    line_number=20,
-                    account=ar_account,
-                    description=f"A/R write-off - {invoice.invoice_number}",
-                    debit=Decimal('0.00'),
-                    credit=balance_due,
-                )
+                try:
+                    GLPostingEngine(self.tenant, self.user).post(
+                        entry_date=timezone.now().date(),
+                        memo=f"Write-off Invoice {invoice.invoice_number} - {reason or 'Uncollectable'}",
+                        lines=[
+                            # DEBIT: Bad Debt Expense
+                            EntryLineInput(
+                                account=bad_debt_account,
+                                description=f"Bad debt write-off - {invoice.invoice_number}",
+                                debit=balance_due,
+                            ),
+                            # CREDIT: A/R (remove receivable)
+                            EntryLineInput(
+                                account=ar_account,
+                                description=f"A/R write-off - {invoice.invoice_number}",
+                                credit=balance_due,
+                            ),
+                        ],
+                        reference_number=invoice.invoice_number,
+                        source_document=invoice,
+                        number_prefix='WO',
+                    )
+                except AccountingError as e:
+                    raise ValidationError(str(e))
 
             invoice.status = 'written_off'
             if reason:
@@ -905,11 +893,14 @@ class InvoicingService:
             int: Number of invoices marked overdue
         """
         today = timezone.now().date()
-        count = Invoice.objects.filter(
+        overdue = Invoice.objects.filter(
             tenant=self.tenant,
             status='sent',
             due_date__lt=today,
-        ).update(status='overdue')
+        )
+        invoice_ids = list(overdue.values_list('pk', flat=True))
+        count = overdue.update(status='overdue')
+        ItemActivityService.set_status(ItemActivity.INVOICE, self.tenant.pk, invoice_ids, 'overdue')
         return count
 
     # ===== PAYMENTS =====
@@ -980,48 +971,6 @@ class InvoicingService:
             )
 
         with transaction.atomic():
-            # Create GL journal entry for the payment
-            from django.utils import timezone as tz
-            je_number = self._generate_payment_je_number()
-
-            je = JournalEntry.objects.create(
-                tenant=self.tenant,
-                entry_number=je_number,
-                date=payment_date,
-                memo=f"Payment received - Invoice {invoice.invoice_number}",
-                reference_number=reference_number or invoice.invoice_number,
-                entry_type='standard',
-                status='posted',
-                source_type=ContentType.objects.get_for_model(Payment),
-                source_id=None,  # Will update after payment created
-                posted_at=tz.now(),
-                posted_by=self.user,
-                created_by=self.user,
-            )
-
-            # DEBIT: Bank/Cash (money in)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=10,
-                account=bank_account,
-                description=f"Payment received - {invoice.invoice_number}",
-                debit=amount,
-                credit=Decimal('0.00'),
-            )
-
-            # CREDIT: A/R (reduce what customer owes)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=20,
-                account=ar_account,
-                description=f"A/R payment - {invoice.invoice_number}",
-                debit=Decimal('0.00'),
-                credit=amount,
-            )
-
-            # Create Payment record
             payment = Payment.objects.create(
                 tenant=self.tenant,
                 invoice=invoice,
@@ -1033,10 +982,30 @@ class InvoicingService:
                 recorded_by=self.user,
             )
 
-            # Link JE source to the payment
-            je.source_id = payment.pk
-            je.source_type = ContentType.objects.get_for_model(Payment)
-            je.save(update_fields=['source_id', 'source_type'])
+            try:
+                GLPostingEngine(self.tenant, self.user).post(
+                    entry_date=payment_date,
+                    memo=f"Payment received - Invoice {invoice.invoice_number}",
+                    lines=[
+                        # DEBIT: Bank/Cash (money in)
+                        EntryLineInput(
+                            account=bank_account,
+                            description=f"Payment received - {invoice.invoice_number}",
+                            debit=amount,
+                        ),
+                        # CREDIT: A/R (reduce what customer owes)
+                        EntryLineInput(
+                            account=ar_account,
+                            description=f"A/R payment - {invoice.invoice_number}",
+                            credit=amount,
+                        ),
+                    ],
+                    reference_number=reference_number or invoice.invoice_number,
+                    source_document=payment,
+                    number_prefix='PMT',
+                )
+            except AccountingError as e:
+                raise ValidationError(str(e))
 
             # Broadcast payment received via WebSocket
             try:
@@ -1082,42 +1051,23 @@ class InvoicingService:
 
         with transaction.atomic():
             if ar_account and bank_account:
-                je_number = self._generate_refund_je_number()
-
-                je = JournalEntry.objects.create(
-                    tenant=self.tenant,
-                    entry_number=je_number,
-                    date=timezone.now().date(),
-                    memo=f"Payment reversal - Invoice {invoice.invoice_number} - {reason or 'Refund'}",
-                    reference_number=payment.reference_number or invoice.invoice_number,
-                    entry_type='reversing',
-                    status='posted',
-                    posted_at=timezone.now(),
-                    posted_by=self.user,
-                    created_by=self.user,
-                )
-
-                # DEBIT: A/R (restore what customer owes)
-                JournalEntryLine.objects.create(
-                    tenant=self.tenant,
-                    entry=je,
-                    line_number=10,
-                    account=ar_account,
-                    description=f"Payment reversal - {invoice.invoice_number}",
-                    debit=payment.amount,
-                    credit=Decimal('0.00'),
-                )
-
-                # CREDIT: Bank/Cash (money out)
-                JournalEntryLine.objects.create(
-                    tenant=self.tenant,
-                    entry=je,
-                    line_number=20,
-                    account=bank_account,
-                    description=f"Payment reversal - {invoice.invoice_number}",
-                    debit=Decimal('0.00'),
-                    credit=payment.amount,
-                )
+                description = f"Payment reversal - {invoice.invoice_number}"
+                try:
+                    GLPostingEngine(self.tenant, self.user).post(
+                        entry_date=timezone.now().date(),
+                        memo=f"Payment reversal - Invoice {invoice.invoice_number} - {reason or 'Refund'}",
+                        lines=[
+                            # DEBIT: A/R (restore what customer owes)
+                            EntryLineInput(account=ar_account, description=description, debit=payment.amount),
+                            # CREDIT: Bank/Cash (money out)
+                            EntryLineInput(account=bank_account, description=description, credit=payment.amount),
+                        ],
+                        reference_number=payment.reference_number or invoice.invoice_number,
+                        entry_type=JournalEntry.EntryType.REVERSING,
+                        number_prefix='REF',
+                    )
+                except AccountingError as e:
+                    raise ValidationError(str(e))
 
             # Delete the payment
             payment.delete()
@@ -1165,18 +1115,12 @@ class InvoicingService:
         """
         Get total balance due for a customer.
 
+        Reads the maintained open-items rollup (see OpenItemService).
+
         Returns:
             Decimal: Total balance due
         """
-        from django.db.models import Sum, F
-        result = Invoice.objects.filter(
-            tenant=self.tenant,
-            customer=customer,
-            status__in=['sent', 'partial', 'overdue'],
-        ).aggregate(
-            balance=Sum(F('total_amount') - F('amount_paid'))
-        )
-        return result['balance'] or Decimal('0')
+        return OpenItemService(self.tenant).get_customer_balance(customer)
 
     def get_invoices_for_period(self, start_date, end_date, customer=None):
         """Get invoices for a date range."""
@@ -1194,6 +1138,9 @@ class InvoicingService:
     def _generate_invoice_number(self):
         """Generate unique invoice number."""
         date_part = timezone.now().strftime('%Y%m')
+        if self._invoice_seq is not None:
+            self._invoice_seq += 1
+            return f"{date_part}-{self._invoice_seq:05d}"
         seq = Invoice.objects.filter(
             tenant=self.tenant,
             invoice_number__startswith=date_part,
@@ -1222,7 +1169,14 @@ class InvoicingService:
         Returns:
             TaxZone instance or None
         """
-        if postal_code:
+        if postal_code and self._tax_rules is not None:
+            postal_code = postal_code.strip()
+            # Exact match, then longest prefix, from the preloaded rules
+            for length in range(len(postal_code), 0, -1):
+                tax_zone = self._tax_rules.get(postal_code[:length])
+                if tax_zone:
+                    return tax_zone
+        elif postal_code:
             postal_code = postal_code.strip()
             # Try exact match first
             exact = TaxRule.objects.filter(
@@ -1274,45 +1228,120 @@ class InvoicingService:
 
         return '\n'.join(parts)
 
-    def _generate_je_number(self):
-        """Generate unique journal entry number for invoicing."""
-        from django.utils import timezone as tz
-        date_part = tz.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"INV-JE-{date_part}",
-        ).count() + 1
-        return f"INV-JE-{date_part}-{count:05d}"
 
-    def _generate_payment_je_number(self):
-        """Generate unique journal entry number for payments."""
-        from django.utils import timezone as tz
-        date_part = tz.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"PMT-JE-{date_part}",
-        ).count() + 1
-        return f"PMT-JE-{date_part}-{count:05d}"
+@dataclass
+class BatchResult:
+    """Outcome of a batch run: what succeeded and why the rest failed."""
+    succeeded: list = field(default_factory=list)
+    failed: list = field(default_factory=list)
 
-    def _generate_writeoff_je_number(self):
-        """Generate unique journal entry number for write-offs."""
-        from django.utils import timezone as tz
-        date_part = tz.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"WO-JE-{date_part}",
-        ).count() + 1
-        return f"WO-JE-{date_part}-{count:05d}"
+    def to_dict(self):
+        return {
+            'succeeded': len(self.succeeded),
+            'failed': len(self.failed),
+            'invoices': [
+                {'id': invoice.pk, 'invoice_number': invoice.invoice_number, 'status': invoice.status}
+                for invoice in self.succeeded
+            ],
+            'errors': self.failed,
+        }
 
-    def _generate_refund_je_number(self):
-        """Generate unique journal entry number for payment reversals."""
-        from django.utils import timezone as tz
-        date_part = tz.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"REF-JE-{date_part}",
-        ).count() + 1
-        return f"REF-JE-{date_part}-{count:05d}"
+
+class InvoiceBatchService:
+    """
+    End-of-day billing: invoice delivered shipments and post drafts in bulk.
+
+    One InvoicingService is shared by the whole run, so AccountingSettings,
+    tax rules and invoice numbering are resolved once per chunk rather than
+    per invoice. Each chunk commits in its own transaction and each invoice
+    in its own savepoint, so one bad invoice is reported without undoing
+    the rest.
+
+    Usage:
+        batch = InvoiceBatchService(tenant, user)
+        result = batch.invoice_delivered_shipments(date(2026, 3, 31))
+        result = batch.post_draft_invoices(date_to=date(2026, 3, 31))
+    """
+
+    def __init__(self, tenant, user=None, chunk_size=None):
+        self.tenant = tenant
+        self.user = user
+        self.chunk_size = chunk_size or getattr(settings, 'INVOICE_BATCH_CHUNK_SIZE', 50)
+        self.invoicing = InvoicingService(tenant, user)
+
+    def invoice_delivered_shipments(self, ship_date, payment_terms='NET30', invoice_date=None):
+        """
+        Create a draft invoice for every delivered shipment shipped on
+        ``ship_date`` that doesn't already have a (non-void) invoice.
+        """
+        from apps.shipping.models import Shipment
+
+        invoiced = Invoice.objects.filter(shipment=models.OuterRef('pk')).exclude(status='void')
+        shipment_ids = list(
+            Shipment.objects.filter(
+                tenant=self.tenant,
+                status='delivered',
+                ship_date=ship_date,
+            ).exclude(models.Exists(invoiced)).order_by('pk').values_list('pk', flat=True)
+        )
+
+        def load(ids):
+            return Shipment.objects.filter(pk__in=ids).order_by('pk').prefetch_related(
+                'lines__sales_order__customer__party',
+                'lines__sales_order__bill_to',
+                'lines__sales_order__ship_to',
+                'lines__sales_order__lines__item',
+                'lines__sales_order__lines__uom',
+            )
+
+        def create(shipment):
+            return self.invoicing.create_invoice_from_shipment(
+                shipment,
+                payment_terms=payment_terms,
+                invoice_date=invoice_date,
+            )
+
+        return self._run(shipment_ids, load, create, label='shipment_number')
+
+    def post_draft_invoices(self, customer=None, date_from=None, date_to=None, ids=None):
+        """Post every draft invoice matching the filters to the GL."""
+        invoices = Invoice.objects.filter(tenant=self.tenant, status='draft')
+        if customer:
+            invoices = invoices.filter(customer=customer)
+        if date_from:
+            invoices = invoices.filter(invoice_date__gte=date_from)
+        if date_to:
+            invoices = invoices.filter(invoice_date__lte=date_to)
+        if ids is not None:
+            invoices = invoices.filter(pk__in=ids)
+        invoice_ids = list(invoices.order_by('invoice_date', 'pk').values_list('pk', flat=True))
+
+        def load(ids):
+            # Re-check the status under lock: a concurrent run may have posted some
+            return Invoice.objects.filter(pk__in=ids, status='draft').select_related(
+                'ar_account', 'customer__party', 'customer__receivable_account', 'tax_zone__gl_account',
+            ).select_for_update(of=('self',)).order_by('invoice_date', 'pk')
+
+        return self._run(invoice_ids, load, self.invoicing.post_invoice, label='invoice_number')
+
+    def _run(self, ids, load, process, label):
+        """Apply ``process`` to the objects in ``ids``, chunk by chunk."""
+        result = BatchResult()
+        for start in range(0, len(ids), self.chunk_size):
+            with transaction.atomic():
+                self.invoicing.begin_batch()
+                for obj in load(ids[start:start + self.chunk_size]):
+                    try:
+                        with transaction.atomic():
+                            result.succeeded.append(process(obj))
+                    except (ValidationError, DatabaseError) as e:
+                        message = e.messages[0] if getattr(e, 'messages', None) else str(e)
+                        result.failed.append({
+                            'id': obj.pk,
+                            label: getattr(obj, label),
+                            'error': message,
+                        })
+        return result
 
 
 class VendorBillService:
@@ -1611,58 +1640,34 @@ class VendorBillService:
         if not line_accounts:
             raise ValidationError("Cannot post bill with no lines")
 
-        with transaction.atomic():
-            from django.utils import timezone as tz
-            je_number = self._generate_je_number()
-
-            # Create the journal entry
-            je = JournalEntry.objects.create(
-                tenant=self.tenant,
-                entry_number=je_number,
-                date=bill.bill_date,
-                memo=f"Vendor Bill {bill.bill_number} - {bill.vendor}",
-                reference_number=bill.vendor_invoice_number,
-                entry_type='standard',
-                status='posted',
-                source_type=ContentType.objects.get_for_model(VendorBill),
-                source_id=bill.pk,
-                posted_at=tz.now(),
-                posted_by=self.user,
-                created_by=self.user,
-            )
-
-            line_num = 10
-
-            # CREDIT: Accounts Payable for total amount (liability increases)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=line_num,
-                account=ap_account,
-                description=f"A/P - Bill {bill.bill_number}",
-                debit=Decimal('0.00'),
-                credit=bill.total_amount,
-            )
-            line_num += 10
-
-            # DEBIT: per-line account (GR/IR for receipt-linked lines, otherwise expense/asset)
-            for bill_line, debit_acct in line_accounts:
-                JournalEntryLine.objects.create(
-                    tenant=self.tenant,
-                    entry=je,
-                    line_number=line_num,
-                    account=debit_acct,
-                    description=f"{bill_line.description}",
-                    debit=bill_line.amount,
-                    credit=Decimal('0.00'),
-                )
-                line_num += 10
+        # CREDIT: Accounts Payable for total amount (liability increases)
+        je_lines = [EntryLineInput(
+            account=ap_account,
+            description=f"A/P - Bill {bill.bill_number}",
+            credit=bill.total_amount,
+        )]
+
+        # DEBIT: per-line account (GR/IR for receipt-linked lines, otherwise expense/asset)
+        for bill_line, debit_acct in line_accounts:
+            je_lines.append(EntryLineInput(
+                account=debit_acct,
+                description=f"{bill_line.description}",
+                debit=bill_line.amount,
+            ))
 
-            # Verify the entry balances
-            if not je.is_balanced:
-                raise ValidationError(
-                    f"Journal entry is not balanced: DR={je.total_debit} CR={je.total_credit}"
+        with transaction.atomic():
+            # Create the posted journal entry (validates that it balances)
+            try:
+                je = GLPostingEngine(self.tenant, self.user).post(
+                    entry_date=bill.bill_date,
+                    memo=f"Vendor Bill {bill.bill_number} - {bill.vendor}",
+                    lines=je_lines,
+                    reference_number=bill.vendor_invoice_number,
+                    source_document=bill,
+                    number_prefix='BILL',
                 )
+            except AccountingError as e:
+                raise ValidationError(str(e))
 
             # Lock the bill to AP account used and link JE
             VendorBill.objects.filter(pk=bill.pk).update(
@@ -1671,6 +1676,8 @@ class VendorBillService:
                 status='posted',
             )
             bill.refresh_from_db()
+            OpenItemService(self.tenant).sync_bill(bill)
+            ItemActivityService.refresh_document(ItemActivity.VENDOR_BILL, bill)
 
             return bill
 
@@ -1702,33 +1709,29 @@ class VendorBillService:
             # Reverse the journal entry if one exists (mirrors invoice void pattern).
             je = bill.journal_entry
             if je is not None:
-                rev = JournalEntry.objects.create(
-                    tenant=self.tenant,
-                    entry_number=f"{je.entry_number}-VOID",
-                    date=timezone.now().date(),
-                    memo=f"VOID of {je.memo}",
-                    reference_number=je.reference_number,
-                    entry_type='standard',
-                    status='posted',
-                    posted_at=timezone.now(),
-                    posted_by=self.user,
-                    created_by=self.user,
-                )
-                line_num = 10
-                for line in je.lines.all():
-                    JournalEntryLine.objects.create(
-                        tenant=self.tenant,
-                        entry=rev,
-                        line_number=line_num,
-                        account=line.account,
-                        description=f"VOID: {line.description}",
-                        debit=line.credit,
-                        credit=line.debit,
+                try:
+                    GLPostingEngine(self.tenant, self.user).post(
+                        entry_date=timezone.now().date(),
+                        memo=f"VOID of {je.memo}",
+                        lines=[
+                            EntryLineInput(
+                                account=line.account,
+                                description=f"VOID: {line.description}",
+                                debit=line.credit,
+                                credit=line.debit,
+                            )
+                            for line in je.lines.select_related('account')
+                        ],
+                        reference_number=je.reference_number,
+                        entry_number=f"{je.entry_number}-VOID",
                     )
-                    line_num += 10
+                except AccountingError as e:
+                    raise ValidationError(str(e))
 
             VendorBill.objects.filter(pk=bill.pk).update(status='void')
             bill.refresh_from_db()
+            OpenItemService(self.tenant).sync_bill(bill)
+            ItemActivityService.refresh_document(ItemActivity.VENDOR_BILL, bill)
 
         return bill
 
@@ -1800,47 +1803,6 @@ class VendorBillService:
             )
 
         with transaction.atomic():
-            from django.utils import timezone as tz
-            je_number = self._generate_payment_je_number()
-
-            je = JournalEntry.objects.create(
-                tenant=self.tenant,
-                entry_number=je_number,
-                date=payment_date,
-                memo=f"Payment - Vendor Bill {bill.bill_number}",
-                reference_number=reference_number or bill.vendor_invoice_number,
-                entry_type='standard',
-                status='posted',
-                source_type=ContentType.objects.get_for_model(BillPayment),
-                source_id=None,  # Updated after payment created
-                posted_at=tz.now(),
-                posted_by=self.user,
-                created_by=self.user,
-            )
-
-            # DEBIT: A/P (reduce liability)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=10,
-                account=ap_account,
-                description=f"A/P payment - {bill.bill_number}",
-                debit=amount,
-                credit=Decimal('0.00'),
-            )
-
-            # CREDIT: Bank/Cash (money out)
-            JournalEntryLine.objects.create(
-                tenant=self.tenant,
-                entry=je,
-                line_number=20,
-                account=bank_account,
-                description=f"Payment to vendor - {bill.bill_number}",
-                debit=Decimal('0.00'),
-                credit=amount,
-            )
-
-            # Create BillPayment record
             payment = BillPayment.objects.create(
                 tenant=self.tenant,
                 bill=bill,
@@ -1852,10 +1814,30 @@ class VendorBillService:
                 recorded_by=self.user,
             )
 
-            # Link JE source to the payment
-            je.source_id = payment.pk
-            je.source_type = ContentType.objects.get_for_model(BillPayment)
-            je.save(update_fields=['source_id', 'source_type'])
+            try:
+                GLPostingEngine(self.tenant, self.user).post(
+                    entry_date=payment_date,
+                    memo=f"Payment - Vendor Bill {bill.bill_number}",
+                    lines=[
+                        # DEBIT: A/P (reduce liability)
+                        EntryLineInput(
+                            account=ap_account,
+                            description=f"A/P payment - {bill.bill_number}",
+                            debit=amount,
+                        ),
+                        # CREDIT: Bank/Cash (money out)
+                        EntryLineInput(
+                            account=bank_account,
+                            description=f"Payment to vendor - {bill.bill_number}",
+                            credit=amount,
+                        ),
+                    ],
+                    reference_number=reference_number or bill.vendor_invoice_number,
+                    source_document=payment,
+                    number_prefix='BPMT',
+                )
+            except AccountingError as e:
+                raise ValidationError(str(e))
 
             return payment
 
@@ -1884,16 +1866,8 @@ class VendorBillService:
         return qs.order_by('due_date')
 
     def get_vendor_balance(self, vendor):
-        """Get total balance owed to a vendor."""
-        from django.db.models import Sum, F
-        result = VendorBill.objects.filter(
-            tenant=self.tenant,
-            vendor=vendor,
-            status__in=['posted', 'partial'],
-        ).aggregate(
-            balance=Sum(F('total_amount') - F('amount_paid'))
-        )
-        return result['balance'] or Decimal('0')
+        """Get total balance owed to a vendor (from the open-items rollup)."""
+        return OpenItemService(self.tenant).get_vendor_balance(vendor)
 
     # ===== HELPERS =====
 
@@ -1906,26 +1880,6 @@ class VendorBillService:
         ).count() + 1
         return f"{date_part}-{seq:05d}"
 
-    def _generate_je_number(self):
-        """Generate unique journal entry number for bill postings."""
-        from django.utils import timezone as tz
-        date_part = tz.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"BILL-JE-{date_part}",
-        ).count() + 1
-        return f"BILL-JE-{date_part}-{count:05d}"
-
-    def _generate_payment_je_number(self):
-        """Generate unique journal entry number for bill payments."""
-        from django.utils import timezone as tz
-        date_part = tz.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
-            tenant=self.tenant,
-            entry_number__startswith=f"BPMT-JE-{date_part}",
-        ).count() + 1
-        return f"BPMT-JE-{date_part}-{count:05d}"
-
 
 class DunningService:
     """Service for managing dunning/collections workflow for overdue invoices."""
@@ -1954,19 +1908,22 @@ class DunningService:
         today = timezone.now().date()
         candidates = []
 
-        # Find all overdue/sent invoices with outstanding balance
-        overdue_invoices = Invoice.objects.filter(
+        # Overdue open items (indexed on tenant/side/due_date) joined to their invoice
+        overdue_items = OpenItem.objects.filter(
             tenant=self.tenant,
-            status__in=['sent', 'overdue', 'partial'],
+            side=OpenItem.SIDE_AR,
             due_date__lt=today,
-        ).select_related('customer__party').order_by('due_date')
+            invoice__status__in=['sent', 'overdue', 'partial'],
+        ).select_related('invoice', 'customer__party').order_by('due_date')
+        if min_days_overdue:
+            overdue_items = overdue_items.filter(
+                due_date__lte=today - timedelta(days=min_days_overdue),
+            )
 
-        for invoice in overdue_invoices:
+        for open_item in overdue_items:
+            invoice = open_item.invoice
             days_overdue = (today - invoice.due_date).days
 
-            if min_days_overdue and days_overdue < min_days_overdue:
-                continue
-
             # Determine recommended escalation
             recommended_status = 'none'
             for threshold, status_val in self.ESCALATION_RULES:
@@ -1978,15 +1935,13 @@ class DunningService:
             recommended_level = self._dunning_level(recommended_status)
             needs_escalation = recommended_level > current_level
 
-            balance_due = invoice.balance_due if hasattr(invoice, 'balance_due') else str(
-                Decimal(invoice.total_amount) - Decimal(invoice.amount_paid)
-            )
+            balance_due = open_item.open_amount
 
             candidates.append({
                 'invoice_id': invoice.id,
                 'invoice_number': invoice.invoice_number,
                 'customer_id': invoice.customer_id,
-                'customer_name': invoice.customer.party.display_name,
+                'customer_name': open_item.customer.party.display_name,
                 'invoice_date': str(invoice.invoice_date),
                 'due_date': str(invoice.due_date),
                 'total_amount': str(invoice.total_amount),
@@ -2077,3 +2032,254 @@ class DunningService:
         """Convert dunning status to numeric level for comparison."""
         levels = {'none': 0, 'first_notice': 1, 'second_notice': 2, 'final_notice': 3, 'collections': 4}
         return levels.get(status, 0)
+
+
+class OpenItemService:
+    """
+    Maintains the open-items ledger: one OpenItem per open invoice/bill and a
+    PartyOpenBalance rollup per customer/vendor.
+
+    Invoice and VendorBill saves are mirrored through signals (see
+    apps.invoicing.signals); services that change status with a queryset
+    ``update()`` call ``sync_invoice``/``sync_bill`` themselves. Aging,
+    dunning and credit checks then read these tables instead of scanning
+    and summing documents row by row.
+
+    Usage:
+        svc = OpenItemService(tenant)
+        svc.sync_invoice(invoice)
+        balance = svc.get_customer_balance(customer)
+        problems = svc.rebuild(verify_only=True)
+    """
+
+    AR_OPEN_STATUSES = ('posted', 'sent', 'partial', 'overdue')
+    AP_OPEN_STATUSES = ('posted', 'partial')
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    # ===== MAINTENANCE =====
+
+    def sync_invoice(self, invoice):
+        """Create, update or remove the open item for an invoice."""
+        balance = invoice.total_amount - invoice.amount_paid
+        if invoice.status in self.AR_OPEN_STATUSES and balance > 0:
+            OpenItem.objects.all_tenants().update_or_create(
+                invoice_id=invoice.pk,
+                defaults={
+                    'tenant': self.tenant,
+                    'side': OpenItem.SIDE_AR,
+                    'customer_id': invoice.customer_id,
+                    'document_number': invoice.invoice_number,
+                    'document_date': invoice.invoice_date,
+                    'due_date': invoice.due_date,
+                    'open_amount': balance,
+                },
+            )
+        elif not OpenItem.objects.all_tenants().filter(invoice_id=invoice.pk).delete()[0]:
+            return
+        self.refresh_customer(invoice.customer_id)
+
+    def sync_bill(self, bill):
+        """Create, update or remove the open item for a vendor bill."""
+        balance = bill.total_amount - bill.amount_paid
+        if bill.status in self.AP_OPEN_STATUSES and balance > 0:
+            OpenItem.objects.all_tenants().update_or_create(
+                vendor_bill_id=bill.pk,
+                defaults={
+                    'tenant': self.tenant,
+                    'side': OpenItem.SIDE_AP,
+                    'vendor_id': bill.vendor_id,
+                    'document_number': self._bill_display_number(bill.bill_number, bill.vendor_invoice_number),
+                    'document_date': bill.bill_date,
+                    'due_date': bill.due_date,
+                    'open_amount': balance,
+                },
+            )
+        elif not OpenItem.objects.all_tenants().filter(vendor_bill_id=bill.pk).delete()[0]:
+            return
+        self.refresh_vendor(bill.vendor_id)
+
+    def sync_invoices(self, invoices):
+        """
+        ``sync_invoice`` for many already-open invoices written with
+        ``bulk_update`` (e.g. bulk cash application): closed ones are
+        removed, the rest re-balanced, and each customer re-rolled once.
+        """
+        open_amounts, closed = {}, []
+        for invoice in invoices:
+            balance = invoice.total_amount - invoice.amount_paid
+            if invoice.status in self.AR_OPEN_STATUSES and balance > 0:
+                open_amounts[invoice.pk] = balance
+            else:
+                closed.append(invoice.pk)
+
+        items = OpenItem.objects.all_tenants()
+        if closed:
+            items.filter(invoice_id__in=closed).delete()
+        stale = list(items.filter(invoice_id__in=open_amounts))
+        for item in stale:
+            item.open_amount = open_amounts[item.invoice_id]
+        items.bulk_update(stale, ['open_amount'], batch_size=500)
+
+        synced = {item.invoice_id for item in stale}
+        for invoice in invoices:
+            if invoice.pk in open_amounts and invoice.pk not in synced:
+                self.sync_invoice(invoice)
+        for customer_id in {invoice.customer_id for invoice in invoices}:
+            self.refresh_customer(customer_id)
+
+    def refresh_customer(self, customer_id):
+        """Recompute the PartyOpenBalance row for one customer."""
+        values = self._rollup(OpenItem.objects.all_tenants().filter(
+            tenant=self.tenant, side=OpenItem.SIDE_AR, customer_id=customer_id,
+        ))
+        balances = PartyOpenBalance.objects.all_tenants()
+        if not values['open_count']:
+            balances.filter(customer_id=customer_id).delete()
+            return
+        balances.update_or_create(
+            customer_id=customer_id,
+            defaults={'tenant': self.tenant, 'side': OpenItem.SIDE_AR, **values},
+        )
+
+    def refresh_vendor(self, vendor_id):
+        """Recompute the PartyOpenBalance row for one vendor."""
+        values = self._rollup(OpenItem.objects.all_tenants().filter(
+            tenant=self.tenant, side=OpenItem.SIDE_AP, vendor_id=vendor_id,
+        ))
+        balances = PartyOpenBalance.objects.all_tenants()
+        if not values['open_count']:
+            balances.filter(vendor_id=vendor_id).delete()
+            return
+        balances.update_or_create(
+            vendor_id=vendor_id,
+            defaults={'tenant': self.tenant, 'side': OpenItem.SIDE_AP, **values},
+        )
+
+    def rebuild(self, verify_only=False):
+        """
+        Recompute the ledger for this tenant from Invoice/VendorBill.
+
+        Args:
+            verify_only: Only report differences; write nothing.
+
+        Returns:
+            list of str describing open items that were missing, stale or
+            orphaned before the rebuild (empty when the ledger was correct)
+        """
+        expected = {}
+        for inv in Invoice.objects.filter(
+            tenant=self.tenant, status__in=self.AR_OPEN_STATUSES,
+        ).values('pk', 'customer_id', 'invoice_number', 'invoice_date', 'due_date',
+                 'total_amount', 'amount_paid'):
+            balance = inv['total_amount'] - inv['amount_paid']
+            if balance > 0:
+                expected[('invoice', inv['pk'])] = OpenItem(
+                    tenant=self.tenant, side=OpenItem.SIDE_AR,
+                    invoice_id=inv['pk'], customer_id=inv['customer_id'],
+                    document_number=inv['invoice_number'],
+                    document_date=inv['invoice_date'], due_date=inv['due_date'],
+                    open_amount=balance,
+                )
+        for bill in VendorBill.objects.filter(
+            tenant=self.tenant, status__in=self.AP_OPEN_STATUSES,
+        ).values('pk', 'vendor_id', 'bill_number', 'vendor_invoice_number', 'bill_date',
+                 'due_date', 'total_amount', 'amount_paid'):
+            balance = bill['total_amount'] - bill['amount_paid']
+            if balance > 0:
+                expected[('bill', bill['pk'])] = OpenItem(
+                    tenant=self.tenant, side=OpenItem.SIDE_AP,
+                    vendor_bill_id=bill['pk'], vendor_id=bill['vendor_id'],
+                    document_number=self._bill_display_number(
+                        bill['bill_number'], bill['vendor_invoice_number'],
+                    ),
+                    document_date=bill['bill_date'], due_date=bill['due_date'],
+                    open_amount=balance,
+                )
+
+        problems = []
+        existing = OpenItem.objects.all_tenants().filter(tenant=self.tenant)
+        seen = set()
+        for item in existing:
+            key = ('invoice', item.invoice_id) if item.invoice_id else ('bill', item.vendor_bill_id)
+            seen.add(key)
+            want = expected.get(key)
+            if want is None:
+                problems.append(f"orphaned {item.side} item {item.document_number}")
+            elif want.open_amount != item.open_amount or want.due_date != item.due_date:
+                problems.append(
+                    f"stale {item.side} item {item.document_number}: "
+                    f"{item.open_amount} != {want.open_amount}"
+                )
+        for key, want in expected.items():
+            if key not in seen:
+                problems.append(f"missing {want.side} item {want.document_number}")
+
+        if verify_only:
+            return problems
+
+        with transaction.atomic():
+            existing.delete()
+            OpenItem.objects.bulk_create(expected.values(), batch_size=500)
+
+            PartyOpenBalance.objects.all_tenants().filter(tenant=self.tenant).delete()
+            items = OpenItem.objects.all_tenants().filter(tenant=self.tenant)
+            balances = []
+            for side, party_field in ((OpenItem.SIDE_AR, 'customer_id'), (OpenItem.SIDE_AP, 'vendor_id')):
+                rows = (
+                    items.filter(side=side)
+                    .values(party_field)
+                    .annotate(**self._rollup_expressions())
+                    .order_by()
+                )
+                for row in rows:
+                    party_id = row.pop(party_field)
+                    balances.append(PartyOpenBalance(
+                        tenant=self.tenant, side=side, **{party_field: party_id}, **row,
+                    ))
+            PartyOpenBalance.objects.bulk_create(balances, batch_size=500)
+
+        return problems
+
+    # ===== QUERIES =====
+
+    def get_customer_balance(self, customer):
+        """Open A/R balance for a customer (one indexed read)."""
+        balance = PartyOpenBalance.objects.filter(
+            tenant=self.tenant, customer=customer,
+        ).values_list('balance', flat=True).first()
+        return balance or Decimal('0')
+
+    def get_vendor_balance(self, vendor):
+        """Open A/P balance owed to a vendor (one indexed read)."""
+        balance = PartyOpenBalance.objects.filter(
+            tenant=self.tenant, vendor=vendor,
+        ).values_list('balance', flat=True).first()
+        return balance or Decimal('0')
+
+    # ===== HELPERS =====
+
+    @staticmethod
+    def _bill_display_number(bill_number, vendor_invoice_number):
+        if vendor_invoice_number:
+            return f"{bill_number} / {vendor_invoice_number}"
+        return bill_number
+
+    @staticmethod
+    def _rollup_expressions():
+        """Aggregate expressions for balance, count and oldest due date."""
+        from django.db.models import Sum, Count, Min, DecimalField, Value
+        from django.db.models.functions import Coalesce
+
+        return {
+            'balance': Coalesce(
+                Sum('open_amount'), Value(Decimal('0')),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+            'open_count': Count('id'),
+            'oldest_due_date': Min('due_date'),
+        }
+
+    def _rollup(self, queryset):
+        return queryset.aggregate(**self._rollup_expressions())
@@ -0,0 +1,45 @@
+# apps/invoicing/signals.py
+"""
+Signals that keep the open-items ledger in step with invoices and bills.
+
+Every Invoice/VendorBill save (post, send, payment, refund, write-off, void)
+re-syncs the document's OpenItem and its party's PartyOpenBalance. Status
+changes made with a queryset ``update()`` bypass these handlers, so the
+services that do that call OpenItemService directly.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Invoice, VendorBill
+
+
+@receiver(post_save, sender=Invoice)
+def sync_invoice_open_item(sender, instance, raw=False, **kwargs):
+    """Mirror the invoice's outstanding balance into the open-items ledger."""
+    if raw:
+        return
+    from .services import OpenItemService
+    OpenItemService(instance.tenant).sync_invoice(instance)
+
+
+@receiver(post_save, sender=VendorBill)
+def sync_bill_open_item(sender, instance, raw=False, **kwargs):
+    """Mirror the bill's outstanding balance into the open-items ledger."""
+    if raw:
+        return
+    from .services import OpenItemService
+    OpenItemService(instance.tenant).sync_bill(instance)
+
+
+@receiver(post_delete, sender=Invoice)
+def refresh_customer_open_balance(sender, instance, **kwargs):
+    """The OpenItem cascades away with the invoice; re-roll the customer."""
+    from .services import OpenItemService
+    OpenItemService(instance.tenant).refresh_customer(instance.customer_id)
+
+
+@receiver(post_delete, sender=VendorBill)
+def refresh_vendor_open_balance(sender, instance, **kwargs):
+    """The OpenItem cascades away with the bill; re-roll the vendor."""
+    from .services import OpenItemService
+    OpenItemService(instance.tenant).refresh_vendor(instance.vendor_id)
@@ -0,0 +1,140 @@
+# apps/invoicing/tests/test_batch.py
+"""
+Tests for batch invoice generation and posting.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounting.models import AccountingSettings, JournalEntry
+from apps.invoicing.models import Invoice
+from apps.invoicing.services import InvoiceBatchService, InvoicingService
+from apps.items.models import Item
+from apps.parties.models import Customer, Party, Truck
+from apps.shipping.models import Shipment, ShipmentLine
+
+from .test_services import InvoicingBaseTestCase
+
+
+class InvoiceBatchServiceTest(InvoicingBaseTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.truck = Truck.objects.create(tenant=cls.tenant, name='Truck B', is_active=True)
+        cls.today = timezone.now().date()
+
+    def _shipment(self, status='delivered', orders=None):
+        shipment = Shipment.objects.create(
+            tenant=self.tenant, shipment_number=f'B-{Shipment.objects.count() + 1}',
+            ship_date=self.today, truck=self.truck, status=status,
+        )
+        for so in orders or [self._make_so()]:
+            ShipmentLine.objects.create(tenant=self.tenant, shipment=shipment, sales_order=so)
+        return shipment
+
+    def _drafts(self, n):
+        svc = InvoicingService(self.tenant, self.user)
+        return [svc.create_invoice_from_order(self._make_so()) for _ in range(n)]
+
+    def test_invoices_only_delivered_uninvoiced_shipments(self):
+        delivered = self._shipment()
+        self._shipment(status='in_transit')
+        already = self._shipment()
+        InvoicingService(self.tenant, self.user).create_invoice_from_shipment(already)
+
+        result = InvoiceBatchService(self.tenant, self.user).invoice_delivered_shipments(self.today)
+
+        self.assertEqual([inv.shipment_id for inv in result.succeeded], [delivered.pk])
+        self.assertEqual(result.failed, [])
+        self.assertEqual(result.succeeded[0].total_amount, Decimal('500.00'))
+
+    def test_failed_shipment_reported_without_blocking_chunk(self):
+        other_party = Party.objects.create(
+            tenant=self.tenant, party_type='CUSTOMER', code='C2', display_name='Other',
+        )
+        other = Customer.objects.create(tenant=self.tenant, party=other_party)
+        mixed_so = self._make_so()
+        mixed_so.customer = other
+        mixed_so.save()
+        mixed = self._shipment(orders=[self._make_so(), mixed_so])
+        good = self._shipment()
+
+        result = InvoiceBatchService(self.tenant, self.user, chunk_size=10).invoice_delivered_shipments(self.today)
+
+        self.assertEqual([inv.shipment_id for inv in result.succeeded], [good.pk])
+        self.assertEqual(len(result.failed), 1)
+        self.assertEqual(result.failed[0]['id'], mixed.pk)
+        self.assertIn('multiple customers', result.failed[0]['error'])
+
+    def test_generated_numbers_are_unique_across_chunks(self):
+        for _ in range(5):
+            self._shipment()
+        result = InvoiceBatchService(self.tenant, self.user, chunk_size=2).invoice_delivered_shipments(self.today)
+        numbers = [inv.invoice_number for inv in result.succeeded]
+        self.assertEqual(len(numbers), 5)
+        self.assertEqual(len(set(numbers)), 5)
+
+    def test_posts_drafts_and_reports_failures(self):
+        good, bad, other_day = self._drafts(3)
+        other_day.invoice_date = self.today - timedelta(days=3)
+        other_day.save()
+        no_income = Item.objects.create(tenant=self.tenant, sku='NO-GL', name='No GL', base_uom=self.uom)
+        InvoicingService(self.tenant, self.user).add_line(
+            invoice=bad, item=no_income, quantity=1, unit_price=1, uom=self.uom,
+        )
+        AccountingSettings.objects.filter(tenant=self.tenant).update(default_income_account=None)
+
+        result = InvoiceBatchService(self.tenant, self.user).post_draft_invoices(date_from=self.today)
+
+        self.assertEqual([inv.pk for inv in result.succeeded], [good.pk])
+        self.assertEqual([f['id'] for f in result.failed], [bad.pk])
+        self.assertIn('Missing income account', result.failed[0]['error'])
+        bad.refresh_from_db()
+        other_day.refresh_from_db()
+        self.assertEqual(bad.status, 'draft')
+        self.assertEqual(other_day.status, 'draft')
+        self.assertEqual(JournalEntry.objects.filter(invoice=good).count(), 1)
+
+    def test_settings_loaded_once_per_chunk(self):
+        self._drafts(4)
+        with CaptureQueriesContext(connection) as ctx:
+            result = InvoiceBatchService(self.tenant, self.user, chunk_size=4).post_draft_invoices()
+        self.assertEqual(len(result.succeeded), 4)
+        settings_table = AccountingSettings._meta.db_table
+        settings_queries = [q for q in ctx.captured_queries if f'FROM "{settings_table}"' in q['sql']]
+        self.assertEqual(len(settings_queries), 1)
+
+    def test_batch_posting_skips_pdf_prewarm(self):
+        self._drafts(2)
+        with patch('apps.documents.pdf_cache.PDFCache.prewarm') as prewarm:
+            result = InvoiceBatchService(self.tenant, self.user).post_draft_invoices()
+        self.assertEqual(len(result.succeeded), 2)
+        prewarm.assert_not_called()
+
+        with patch('apps.documents.pdf_cache.PDFCache.prewarm') as prewarm:
+            InvoicingService(self.tenant, self.user).post_invoice(self._drafts(1)[0])
+        prewarm.assert_called_once()
+
+    def test_api_and_command(self):
+        self._shipment()
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post(
+            '/api/v1/invoices/batch-generate/', {'ship_date': self.today.isoformat()},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['succeeded'], 1)
+
+        out = StringIO()
+        call_command('billing_run', '--post', '--tenant', self.tenant.subdomain, stdout=out)
+        self.assertIn('Posted 1, failed 0', out.getvalue())
+        self.assertFalse(Invoice.objects.filter(status='draft').exists())
@@ -0,0 +1,116 @@
+# apps/invoicing/tests/test_open_items.py
+"""
+Tests for the maintained A/R + A/P open-items ledger (OpenItemService).
+"""
+from decimal import Decimal
+from io import StringIO
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.invoicing.models import Invoice, VendorBill, OpenItem, PartyOpenBalance
+from apps.invoicing.services import InvoicingService, VendorBillService, OpenItemService
+from apps.reporting.services import FinancialReportService
+from apps.invoicing.tests.test_services import InvoicingBaseTestCase
+
+
+class OpenItemLedgerTest(InvoicingBaseTestCase):
+    """Open items follow invoice/bill lifecycle events."""
+
+    def _posted_invoice(self):
+        svc = InvoicingService(self.tenant, self.user)
+        invoice = svc.create_invoice_from_order(self._make_so())
+        return svc.post_invoice(invoice)
+
+    def _posted_bill(self, amount=Decimal('100.00')):
+        svc = VendorBillService(self.tenant, self.user)
+        bill = svc.create_bill(
+            vendor=self.vendor, vendor_invoice_number='VOI-1',
+            due_date=timezone.now().date() + timedelta(days=30),
+        )
+        svc.add_line(bill=bill, description='Goods', quantity=1, unit_price=amount, item=self.item)
+        return svc.post_vendor_bill(bill)
+
+    def test_draft_invoice_has_no_open_item(self):
+        svc = InvoicingService(self.tenant, self.user)
+        svc.create_invoice_from_order(self._make_so())
+        self.assertFalse(OpenItem.objects.exists())
+
+    def test_post_creates_open_item_and_rollup(self):
+        invoice = self._posted_invoice()
+        item = OpenItem.objects.get(invoice=invoice)
+        self.assertEqual(item.side, OpenItem.SIDE_AR)
+        self.assertEqual(item.open_amount, invoice.total_amount)
+
+        rollup = PartyOpenBalance.objects.get(customer=self.customer)
+        self.assertEqual(rollup.balance, invoice.total_amount)
+        self.assertEqual(rollup.open_count, 1)
+        self.assertEqual(rollup.oldest_due_date, invoice.due_date)
+
+    def test_payment_refund_and_write_off(self):
+        invoice = self._posted_invoice()
+        svc = InvoicingService(self.tenant, self.user)
+
+        payment = svc.record_payment(invoice, amount=Decimal('200.00'))
+        expected = invoice.total_amount - Decimal('200.00')
+        self.assertEqual(svc.get_customer_balance(self.customer), expected)
+
+        svc.refund_payment(payment)
+        self.assertEqual(svc.get_customer_balance(self.customer), invoice.total_amount)
+
+        invoice.refresh_from_db()
+        svc.write_off(invoice)
+        self.assertFalse(OpenItem.objects.filter(invoice=invoice).exists())
+        self.assertFalse(PartyOpenBalance.objects.filter(customer=self.customer).exists())
+        self.assertEqual(svc.get_customer_balance(self.customer), Decimal('0'))
+
+    def test_void_invoice_removes_open_item(self):
+        invoice = self._posted_invoice()
+        InvoicingService(self.tenant, self.user).void_invoice(invoice)
+        self.assertFalse(OpenItem.objects.filter(invoice=invoice).exists())
+
+    def test_bill_post_pay_void(self):
+        bill = self._posted_bill(Decimal('300.00'))
+        svc = VendorBillService(self.tenant, self.user)
+        self.assertEqual(svc.get_vendor_balance(self.vendor), Decimal('300.00'))
+        self.assertEqual(OpenItem.objects.get(vendor_bill=bill).document_number, f'{bill.bill_number} / VOI-1')
+
+        svc.pay_vendor_bill(bill, amount=Decimal('300.00'), bank_account=self.cash_account)
+        self.assertEqual(svc.get_vendor_balance(self.vendor), Decimal('0'))
+
+        other = self._posted_bill(Decimal('50.00'))
+        svc.void_vendor_bill(other)
+        self.assertFalse(OpenItem.objects.exists())
+
+    def test_ar_aging_reads_ledger(self):
+        today = timezone.now().date()
+        Invoice.objects.create(
+            tenant=self.tenant, customer=self.customer, invoice_number='AG-1',
+            invoice_date=today - timedelta(days=80), due_date=today - timedelta(days=50),
+            status='overdue', total_amount=Decimal('400.00'), amount_paid=Decimal('100.00'),
+        )
+        result = FinancialReportService.get_ar_aging(self.tenant, today)
+        row = result['rows'][0]
+        self.assertEqual(row['party_name'], 'Invoice Customer')
+        self.assertEqual(row['amounts'], ['0.00', '0.00', '300.00', '0.00', '0.00'])
+        self.assertEqual(row['detail'][0]['number'], 'AG-1')
+
+        rollup = PartyOpenBalance.objects.get(customer=self.customer)
+        self.assertEqual(rollup.balance, Decimal('300.00'))
+
+    def test_rebuild_fixes_drift(self):
+        invoice = self._posted_invoice()
+        OpenItem.objects.all().delete()
+        Invoice.objects.filter(pk=invoice.pk).update(amount_paid=Decimal('1.00'))
+
+        problems = OpenItemService(self.tenant).rebuild(verify_only=True)
+        self.assertEqual(len(problems), 1)
+        self.assertFalse(OpenItem.objects.exists())
+
+        call_command('rebuild_open_items', stdout=StringIO())
+        item = OpenItem.objects.get(invoice=invoice)
+        self.assertEqual(item.open_amount, invoice.total_amount - Decimal('1.00'))
+        self.assertEqual(
+            PartyOpenBalance.objects.get(customer=self.customer).balance, item.open_amount,
+        )
+        self.assertEqual(OpenItemService(self.tenant).rebuild(verify_only=True), [])
@@ -12,7 +12,7 @@ from apps.items.models import Item
 from apps.orders.models import SalesOrder, SalesOrderLine
 from apps.invoicing.models import Invoice, InvoiceLine, VendorBill, VendorBillLine
 from apps.invoicing.services import InvoicingService, VendorBillService
-from apps.accounting.models import Account, AccountType, AccountingSettings
+from apps.accounting.models import Account, AccountBalance, AccountType, AccountingSettings, JournalEntry
 from shared.managers import set_current_tenant
 from shared.testing import BaseTestCase
 
@@ -191,6 +191,31 @@ class InvoicingServicePaymentTest(InvoicingBaseTestCase):
         self.assertIsNotNone(payment.pk)
         self.assertEqual(payment.amount, Decimal('200.00'))
 
+    def _balance(self, account):
+        return sum(
+            AccountBalance.objects.filter(account=account).values_list('ending_balance', flat=True),
+            Decimal('0.00'),
+        )
+
+    def test_payment_refund_and_write_off_update_account_balances(self):
+        invoice = self._make_posted_invoice()
+        svc = InvoicingService(self.tenant, self.user)
+        self.assertEqual(self._balance(self.ar_account), invoice.total_amount)
+
+        payment = svc.record_payment(invoice, amount=Decimal('200.00'))
+        self.assertEqual(self._balance(self.ar_account), invoice.total_amount - Decimal('200.00'))
+        self.assertEqual(self._balance(self.cash_account), Decimal('200.00'))
+        entry = JournalEntry.objects.get(reference_number=invoice.invoice_number, memo__startswith='Payment')
+        self.assertEqual((entry.source_id, entry.entry_number.split('-')[0]), (payment.pk, 'PMT'))
+
+        svc.refund_payment(payment)
+        self.assertEqual(self._balance(self.ar_account), invoice.total_amount)
+        self.assertEqual(self._balance(self.cash_account), Decimal('0.00'))
+
+        invoice.refresh_from_db()
+        svc.write_off(invoice)
+        self.assertEqual(self._balance(self.ar_account), Decimal('0.00'))
+
     def test_record_payment_on_draft_raises(self):
         so = self._make_so()
         svc = InvoicingService(self.tenant, self.user)
@@ -223,6 +248,36 @@ class VendorBillServiceTest(InvoicingBaseTestCase):
         self.assertIsNotNone(bill.pk)
         self.assertEqual(bill.status, 'draft')
 
+    def test_pay_and_void_update_account_balances(self):
+        svc = VendorBillService(self.tenant, self.user)
+
+        def posted_bill(number):
+            bill = svc.create_bill(
+                vendor=self.vendor, vendor_invoice_number=number,
+                due_date=timezone.now().date() + timedelta(days=30),
+            )
+            svc.add_line(bill=bill, description='Goods', quantity=1, unit_price=Decimal('80.00'), item=self.item)
+            return svc.post_vendor_bill(bill)
+
+        def balance(account):
+            return sum(
+                AccountBalance.objects.filter(account=account).values_list('ending_balance', flat=True),
+                Decimal('0.00'),
+            )
+
+        paid, voided = posted_bill('VINV-P'), posted_bill('VINV-V')
+        self.assertEqual(balance(self.ap_account), Decimal('160.00'))
+
+        svc.pay_vendor_bill(paid, amount=Decimal('80.00'), bank_account=self.cash_account)
+        self.assertEqual(balance(self.ap_account), Decimal('80.00'))
+        self.assertEqual(balance(self.cash_account), Decimal('-80.00'))
+
+        svc.void_vendor_bill(voided)
+        self.assertEqual(balance(self.ap_account), Decimal('0.00'))
+        self.assertTrue(JournalEntry.objects.filter(
+            entry_number=f'{voided.journal_entry.entry_number}-VOID', status='posted',
+        ).exists())
+
     def test_add_line_to_bill(self):
         svc = VendorBillService(self.tenant, self.user)
         bill = svc.create_bill(
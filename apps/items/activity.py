@@ -0,0 +1,266 @@
+# apps/items/activity.py
+"""
+Per-item activity index: which document lines feed ItemActivity, and the
+service that maintains and queries it.
+
+Every source is a line model with an ``item`` FK and a header document
+(estimate, RFQ, order, invoice, bill). A row mirrors the line's quantity,
+price and amount plus the header's date, number, party and status, so the
+item views read one indexed table instead of joining each line model to
+its header and party.
+
+Maintenance:
+    - Line save/delete: signals (apps.items.signals) upsert/drop the row.
+    - Header save: signals copy date/number/party/status onto its rows.
+    - Header status changes made with a queryset ``update()`` bypass the
+      signals, so those services call refresh_document/set_status.
+    - Migration 0018 fills the index on deploy; ``manage.py
+      rebuild_item_activity`` rebuilds it from scratch.
+
+Usage:
+    svc = ItemActivityService(tenant)
+    rows = svc.history(item)                       # newest first
+    last_po = svc.latest(item, ItemActivity.PURCHASE_ORDER)
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import transaction
+
+from .models import ItemActivity
+
+REBUILD_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ActivitySource:
+    """Where one doc_type's rows come from."""
+    line_model: str             # 'app_label.ModelName' of the line
+    document: str               # FK from the line to its header
+    document_model: str         # 'app_label.ModelName' of the header
+    date: str                   # header date field
+    number: str                 # header number field
+    party: str                  # header FK whose ``party`` is the counterparty
+    quantity: str               # line quantity field
+    price: tuple                # line price fields; first non-null wins
+    amount: str                 # line total (field or property)
+
+    def get_model(self):
+        return apps.get_model(self.line_model)
+
+    def get_document_model(self):
+        return apps.get_model(self.document_model)
+
+    def status_label(self, status):
+        field = self.get_document_model()._meta.get_field('status')
+        return dict(field.flatchoices).get(status, status)
+
+
+SOURCES = {
+    ItemActivity.ESTIMATE: ActivitySource(
+        'orders.EstimateLine', 'estimate', 'orders.Estimate',
+        date='date', number='estimate_number', party='customer',
+        quantity='quantity', price=('unit_price',), amount='amount',
+    ),
+    ItemActivity.RFQ: ActivitySource(
+        'orders.RFQLine', 'rfq', 'orders.RFQ',
+        date='date', number='rfq_number', party='vendor',
+        quantity='quantity', price=('quoted_price', 'target_price'), amount='line_total',
+    ),
+    ItemActivity.SALES_ORDER: ActivitySource(
+        'orders.SalesOrderLine', 'sales_order', 'orders.SalesOrder',
+        date='order_date', number='order_number', party='customer',
+        quantity='quantity_ordered', price=('unit_price',), amount='line_total',
+    ),
+    ItemActivity.PURCHASE_ORDER: ActivitySource(
+        'orders.PurchaseOrderLine', 'purchase_order', 'orders.PurchaseOrder',
+        date='order_date', number='po_number', party='vendor',
+        quantity='quantity_ordered', price=('unit_cost',), amount='line_total',
+    ),
+    ItemActivity.INVOICE: ActivitySource(
+        'invoicing.InvoiceLine', 'invoice', 'invoicing.Invoice',
+        date='invoice_date', number='invoice_number', party='customer',
+        quantity='quantity', price=('unit_price',), amount='line_total',
+    ),
+    ItemActivity.VENDOR_BILL: ActivitySource(
+        'invoicing.VendorBillLine', 'bill', 'invoicing.VendorBill',
+        date='bill_date', number='bill_number', party='vendor',
+        quantity='quantity', price=('unit_price',), amount='amount',
+    ),
+}
+
+# Item 360 history shows commercial activity, not invoices and bills
+HISTORY_DOC_TYPES = (
+    ItemActivity.ESTIMATE,
+    ItemActivity.RFQ,
+    ItemActivity.SALES_ORDER,
+    ItemActivity.PURCHASE_ORDER,
+)
+
+
+def doc_types_for_line(model):
+    """doc_types indexed from line model ``model``."""
+    label = model._meta.label
+    return [name for name, source in SOURCES.items() if source.line_model == label]
+
+
+def doc_types_for_document(model):
+    """doc_types whose header is ``model``."""
+    label = model._meta.label
+    return [name for name, source in SOURCES.items() if source.document_model == label]
+
+
+class ItemActivityService:
+    """
+    Maintain and query the per-item activity index.
+
+    Like SearchIndexService, the static maintenance methods work from the
+    record's tenant_id (signal handlers call them); queries and rebuilds
+    are scoped to ``self.tenant``.
+    """
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    # ===== MAINTENANCE =====
+
+    @staticmethod
+    def document_fields(doc_type, document):
+        """Header-derived row fields for ``document``."""
+        source = SOURCES[doc_type]
+        party_holder = getattr(document, source.party, None)
+        return {
+            'date': getattr(document, source.date),
+            'doc_number': getattr(document, source.number) or '',
+            'party_id': party_holder.party_id if party_holder else None,
+            'status': document.status or '',
+        }
+
+    @staticmethod
+    def build_row(doc_type, line):
+        """Unsaved ItemActivity for ``line`` (its header must be loadable)."""
+        source = SOURCES[doc_type]
+        document = getattr(line, source.document)
+        price = next(
+            (getattr(line, name) for name in source.price if getattr(line, name) is not None),
+            None,
+        )
+        return ItemActivity(
+            tenant_id=line.tenant_id,
+            item_id=line.item_id,
+            doc_type=doc_type,
+            doc_id=document.pk,
+            line_id=line.pk,
+            quantity=getattr(line, source.quantity) or 0,
+            price=price,
+            amount=getattr(line, source.amount) if price is not None else None,
+            **ItemActivityService.document_fields(doc_type, document),
+        )
+
+    @staticmethod
+    def index_line(doc_type, line):
+        """Create or refresh the row for one line."""
+        if line.item_id is None:
+            ItemActivityService.remove_line(doc_type, line.tenant_id, line.pk)
+            return None
+        row = ItemActivityService.build_row(doc_type, line)
+        values = {
+            field: getattr(row, field)
+            for field in ('item_id', 'date', 'doc_id', 'doc_number', 'party_id',
+                          'quantity', 'price', 'amount', 'status')
+        }
+        activity, _ = ItemActivity.objects.all_tenants().update_or_create(
+            tenant_id=line.tenant_id, doc_type=doc_type, line_id=line.pk,
+            defaults=values,
+        )
+        return activity
+
+    @staticmethod
+    def remove_line(doc_type, tenant_id, line_id):
+        """Drop the row for a deleted line."""
+        ItemActivity.objects.all_tenants().filter(
+            tenant_id=tenant_id, doc_type=doc_type, line_id=line_id,
+        ).delete()
+
+    @staticmethod
+    def refresh_document(doc_type, document):
+        """Copy the header's date, number, party and status onto its rows."""
+        ItemActivity.objects.all_tenants().filter(
+            tenant_id=document.tenant_id, doc_type=doc_type, doc_id=document.pk,
+        ).update(**ItemActivityService.document_fields(doc_type, document))
+
+    @staticmethod
+    def set_status(doc_type, tenant_id, doc_ids, status):
+        """Set ``status`` on the rows of headers changed with a queryset ``update()``."""
+        ItemActivity.objects.all_tenants().filter(
+            tenant_id=tenant_id, doc_type=doc_type, doc_id__in=doc_ids,
+        ).update(status=status)
+
+    @staticmethod
+    def refresh_statuses(doc_type, documents):
+        """
+        Copy in-memory statuses onto the rows of many headers, one UPDATE
+        per distinct status (for bulk_update callers).
+        """
+        by_status = defaultdict(list)
+        for document in documents:
+            by_status[(document.tenant_id, document.status or '')].append(document.pk)
+        for (tenant_id, status), doc_ids in by_status.items():
+            ItemActivityService.set_status(doc_type, tenant_id, doc_ids, status)
+
+    def rebuild(self, doc_types=None):
+        """
+        Re-index every line of ``doc_types`` (default: all) for the tenant
+        from scratch. Returns {doc_type: rows indexed}.
+        """
+        counts = {}
+        for doc_type in doc_types or SOURCES:
+            source = SOURCES[doc_type]
+            lines = source.get_model().objects.all_tenants().filter(
+                tenant=self.tenant, item__isnull=False,
+            ).select_related(
+                source.document, f'{source.document}__{source.party}',
+            ).order_by('pk')
+
+            with transaction.atomic():
+                ItemActivity.objects.all_tenants().filter(
+                    tenant=self.tenant, doc_type=doc_type,
+                ).delete()
+                counts[doc_type] = 0
+                batch = []
+                for line in lines.iterator(chunk_size=REBUILD_CHUNK_SIZE):
+                    batch.append(self.build_row(doc_type, line))
+                    if len(batch) >= REBUILD_CHUNK_SIZE:
+                        ItemActivity.objects.all_tenants().bulk_create(batch)
+                        counts[doc_type] += len(batch)
+                        batch = []
+                if batch:
+                    ItemActivity.objects.all_tenants().bulk_create(batch)
+                    counts[doc_type] += len(batch)
+        return counts
+
+    # ===== QUERIES =====
+
+    def activity(self, item, doc_types=None):
+        """Rows for ``item`` (an Item or its id), with the party joined."""
+        rows = ItemActivity.objects.all_tenants().filter(
+            tenant=self.tenant, item=item,
+        ).select_related('party')
+        if doc_types is not None:
+            rows = rows.filter(doc_type__in=doc_types)
+        return rows
+
+    def history(self, item, doc_types=HISTORY_DOC_TYPES):
+        """Item 360 rows, newest first (keyset-paginatable on date, id)."""
+        return self.activity(item, doc_types).order_by('-date', '-id')
+
+    def latest(self, item, doc_type):
+        """The most recent row of ``doc_type`` for ``item``, or None."""
+        return self.activity(item, [doc_type]).order_by('-date', '-id').first()
+
+    def between(self, item, start_date, end_date, doc_types=None):
+        """Rows dated within [start_date, end_date], oldest first."""
+        return self.activity(item, doc_types).filter(
+            date__gte=start_date, date__lte=end_date,
+        ).order_by('date', 'id')
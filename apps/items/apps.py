@@ -6,3 +6,8 @@ class ItemsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.items'
     label = 'items'
+
+    def ready(self):
+        """Connect the item activity index signals."""
+        from apps.items import signals
+        signals.connect()
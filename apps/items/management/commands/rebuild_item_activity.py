@@ -0,0 +1,42 @@
+"""Management command to rebuild the item activity index from document lines."""
+from django.core.management.base import BaseCommand, CommandError
+from apps.tenants.models import Tenant
+from apps.items.activity import SOURCES, ItemActivityService
+from shared.managers import set_current_tenant
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild ItemActivity rows from estimate, RFQ, order, invoice and bill '
+        'lines. Run once after deploying the index, or after changing its sources.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--doc-type', action='append', dest='doc_types', default=None,
+            help='Only rebuild this document type (repeatable)',
+        )
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        doc_types = options['doc_types']
+        unknown = sorted(set(doc_types or []) - set(SOURCES))
+        if unknown:
+            raise CommandError(f"Unknown document type(s): {', '.join(unknown)}")
+
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            counts = ItemActivityService(tenant).rebuild(doc_types)
+            for doc_type, count in counts.items():
+                self.stdout.write(f"  {tenant.name}: {doc_type} {count}")
+            total += sum(counts.values())
+
+        self.stdout.write(self.style.SUCCESS(f"Done. Indexed {total} document lines."))
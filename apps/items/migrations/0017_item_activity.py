@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0016_historicalitem_extra_info_lines_and_more'),
+        ('parties', '0009_widen_phone_fields'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ItemActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Document date')),
+                ('doc_type', models.CharField(choices=[('estimate', 'Estimate'), ('rfq', 'RFQ'), ('sales_order', 'Sales Order'), ('purchase_order', 'Purchase Order'), ('invoice', 'Invoice'), ('vendor_bill', 'Vendor Bill')], max_length=20)),
+                ('doc_id', models.PositiveBigIntegerField(help_text='Header (order, invoice, ...) id')),
+                ('doc_number', models.CharField(blank=True, max_length=50)),
+                ('line_id', models.PositiveBigIntegerField(help_text='Line id within doc_type')),
+                ('quantity', models.DecimalField(decimal_places=4, default=0, max_digits=14)),
+                ('price', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True)),
+                ('amount', models.DecimalField(blank=True, decimal_places=2, max_digits=14, null=True)),
+                ('status', models.CharField(blank=True, max_length=30)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity', to='items.item')),
+                ('party', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='parties.party')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name_plural': 'Item activity',
+                'indexes': [models.Index(fields=['tenant', 'item', 'date', 'id'], name='items_itema_tenant__367591_idx'), models.Index(fields=['tenant', 'item', 'doc_type', 'date'], name='items_itema_tenant__7f79ff_idx'), models.Index(fields=['tenant', 'doc_type', 'doc_id'], name='items_itema_tenant__8fe789_idx')],
+                'unique_together': {('tenant', 'doc_type', 'line_id')},
+            },
+        ),
+    ]
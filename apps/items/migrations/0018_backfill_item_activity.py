@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:10
+
+from decimal import Decimal
+
+from django.db import migrations
+
+CHUNK_SIZE = 1000
+
+# doc_type, line model, header FK, date, number, party FK, quantity,
+# price fields (first non-null wins), amount field (None: quantity * price).
+# Mirrors apps.items.activity.SOURCES; line_total properties are not
+# available on migration models, so those amounts are computed here.
+SOURCES = (
+    ('estimate', 'orders.EstimateLine', 'estimate', 'date', 'estimate_number', 'customer',
+     'quantity', ('unit_price',), 'amount'),
+    ('rfq', 'orders.RFQLine', 'rfq', 'date', 'rfq_number', 'vendor',
+     'quantity', ('quoted_price', 'target_price'), None),
+    ('sales_order', 'orders.SalesOrderLine', 'sales_order', 'order_date', 'order_number', 'customer',
+     'quantity_ordered', ('unit_price',), None),
+    ('purchase_order', 'orders.PurchaseOrderLine', 'purchase_order', 'order_date', 'po_number', 'vendor',
+     'quantity_ordered', ('unit_cost',), None),
+    ('invoice', 'invoicing.InvoiceLine', 'invoice', 'invoice_date', 'invoice_number', 'customer',
+     'quantity', ('unit_price',), 'line_total'),
+    ('vendor_bill', 'invoicing.VendorBillLine', 'bill', 'bill_date', 'bill_number', 'vendor',
+     'quantity', ('unit_price',), 'amount'),
+)
+
+
+def backfill_item_activity(apps, schema_editor):
+    ItemActivity = apps.get_model('items', 'ItemActivity')
+    ItemActivity.objects.all().delete()
+
+    for doc_type, label, doc_field, date, number, party, quantity, prices, amount in SOURCES:
+        lines = apps.get_model(label).objects.filter(item__isnull=False).select_related(
+            doc_field, f'{doc_field}__{party}',
+        ).order_by('pk')
+        batch = []
+        for line in lines.iterator(chunk_size=CHUNK_SIZE):
+            document = getattr(line, doc_field)
+            party_holder = getattr(document, party)
+            qty = getattr(line, quantity) or 0
+            price = next((getattr(line, name) for name in prices if getattr(line, name) is not None), None)
+            if price is None:
+                total = None
+            elif amount:
+                total = getattr(line, amount)
+            else:
+                total = Decimal(qty) * next((getattr(line, name) for name in prices if getattr(line, name)), price)
+            batch.append(ItemActivity(
+                tenant_id=line.tenant_id,
+                item_id=line.item_id,
+                doc_type=doc_type,
+                doc_id=document.pk,
+                doc_number=getattr(document, number) or '',
+                line_id=line.pk,
+                date=getattr(document, date),
+                party_id=party_holder.party_id if party_holder else None,
+                quantity=qty,
+                price=price,
+                amount=total,
+                status=document.status or '',
+            ))
+            if len(batch) >= CHUNK_SIZE:
+                ItemActivity.objects.bulk_create(batch)
+                batch = []
+        ItemActivity.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0017_item_activity'),
+        ('orders', '0013_keyset_indexes'),
+        ('invoicing', '0009_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_item_activity, migrations.RunPython.noop),
+    ]
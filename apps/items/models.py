@@ -11,6 +11,7 @@ Models:
 - CorrugatedFeature: Master list of corrugated features
 - ItemFeature: Through table for item-feature M2M
 - DCItem, RSCItem, HSCItem, FOLItem, TeleItem: Box type subtypes
+- ItemActivity: Per-item index of document lines (estimates through bills)
 
 GL Integration:
 - Items can have optional GL account overrides for income, expense, and asset accounts
@@ -18,7 +19,7 @@ GL Integration:
 """
 from django.db import models
 from shared.models import TenantMixin, TimestampMixin
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 
 
 # =============================================================================
@@ -425,7 +426,7 @@ class Item(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'sku')]
@@ -1155,7 +1156,7 @@ class PackagingItem(Item):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Packaging Item"
@@ -1165,3 +1166,66 @@ class PackagingItem(Item):
         """Ensure division is set to packaging."""
         self.division = 'packaging'
         super().save(*args, **kwargs)
+
+
+class ItemActivity(TenantMixin):
+    """
+    One document line for an item: the per-item activity index.
+
+    Item 360 history, the product card and the Item QuickReport read this
+    table instead of scanning every line model. Each row mirrors one
+    estimate/RFQ/order/invoice/bill line plus the header fields those views
+    show (date, number, party, status). Rows are written by signals on the
+    line and header models (see apps.items.activity) and rebuilt with
+    ``manage.py rebuild_item_activity``.
+    """
+    ESTIMATE = 'estimate'
+    RFQ = 'rfq'
+    SALES_ORDER = 'sales_order'
+    PURCHASE_ORDER = 'purchase_order'
+    INVOICE = 'invoice'
+    VENDOR_BILL = 'vendor_bill'
+    DOC_TYPE_CHOICES = [
+        (ESTIMATE, 'Estimate'),
+        (RFQ, 'RFQ'),
+        (SALES_ORDER, 'Sales Order'),
+        (PURCHASE_ORDER, 'Purchase Order'),
+        (INVOICE, 'Invoice'),
+        (VENDOR_BILL, 'Vendor Bill'),
+    ]
+
+    item = models.ForeignKey(
+        Item,
+        on_delete=models.CASCADE,
+        related_name='activity',
+    )
+    date = models.DateField(help_text="Document date")
+    doc_type = models.CharField(max_length=20, choices=DOC_TYPE_CHOICES)
+    doc_id = models.PositiveBigIntegerField(help_text="Header (order, invoice, ...) id")
+    doc_number = models.CharField(max_length=50, blank=True)
+    line_id = models.PositiveBigIntegerField(help_text="Line id within doc_type")
+    party = models.ForeignKey(
+        'parties.Party',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    quantity = models.DecimalField(max_digits=14, decimal_places=4, default=0)
+    price = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, null=True, blank=True)
+    status = models.CharField(max_length=30, blank=True)
+
+    class Meta:
+        verbose_name_plural = "Item activity"
+        unique_together = [('tenant', 'doc_type', 'line_id')]
+        indexes = [
+            # Item 360 history: newest first, keyset-paginated on (date, id)
+            models.Index(fields=['tenant', 'item', 'date', 'id']),
+            # Per-type lookups: QuickReport sections, last buy/sell
+            models.Index(fields=['tenant', 'item', 'doc_type', 'date']),
+            models.Index(fields=['tenant', 'doc_type', 'doc_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.doc_type} {self.doc_number} / {self.item_id}"
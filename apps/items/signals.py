@@ -0,0 +1,52 @@
+# apps/items/signals.py
+"""
+Signals that keep ItemActivity rows in step with document lines and headers.
+
+Receivers are connected in ``connect()`` (called from ItemsConfig.ready)
+for every source in apps.items.activity.SOURCES.
+"""
+from django.db.models.signals import post_save, post_delete
+
+from .activity import SOURCES, doc_types_for_document, doc_types_for_line
+
+
+def index_line_on_save(sender, instance, raw=False, **kwargs):
+    """Refresh the saved line's activity row."""
+    if raw:
+        return
+    from .activity import ItemActivityService
+    for doc_type in doc_types_for_line(sender):
+        ItemActivityService.index_line(doc_type, instance)
+
+
+def remove_line_on_delete(sender, instance, **kwargs):
+    """Drop the deleted line's activity row."""
+    from .activity import ItemActivityService
+    for doc_type in doc_types_for_line(sender):
+        ItemActivityService.remove_line(doc_type, instance.tenant_id, instance.pk)
+
+
+def refresh_document_on_save(sender, instance, created=False, raw=False, **kwargs):
+    """Copy header changes (date, number, party, status) onto its lines' rows."""
+    if raw or created:
+        return
+    from .activity import ItemActivityService
+    for doc_type in doc_types_for_document(sender):
+        ItemActivityService.refresh_document(doc_type, instance)
+
+
+def connect():
+    """Connect receivers for every activity source."""
+    for doc_type, source in SOURCES.items():
+        post_save.connect(
+            index_line_on_save, sender=source.line_model,
+            dispatch_uid=f'item_activity_line_{doc_type}',
+        )
+        post_delete.connect(
+            remove_line_on_delete, sender=source.line_model,
+            dispatch_uid=f'item_activity_remove_{doc_type}',
+        )
+        post_save.connect(
+            refresh_document_on_save, sender=source.document_model,
+            dispatch_uid=f'item_activity_document_{doc_type}',
+        )
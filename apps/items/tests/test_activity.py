@@ -0,0 +1,182 @@
+# apps/items/tests/test_activity.py
+"""
+Tests for the item activity index (ItemActivity), its signal maintenance,
+the rebuild command and the keyset-paginated Item 360 history.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tenants.models import Tenant
+from apps.parties.models import Party, Customer, Vendor, Location
+from apps.items.models import UnitOfMeasure, Item, ItemActivity
+from apps.items.activity import ItemActivityService
+from apps.orders.models import RFQ, RFQLine, SalesOrder, SalesOrderLine
+from apps.invoicing.models import Invoice, InvoiceLine
+from shared.managers import set_current_tenant
+from users.models import User
+
+
+class ItemActivityTestCase(TestCase):
+    """Index maintenance from document lines and headers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Activity Co', subdomain='test-item-activity', is_default=True)
+        cls.user = User.objects.create_user(username='activityuser', password='pass')
+        set_current_tenant(cls.tenant)
+
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        cls.item = Item.objects.create(
+            tenant=cls.tenant, sku='ACT-1', name='Activity Widget', division='corrugated', base_uom=cls.uom,
+        )
+        cls.other_item = Item.objects.create(
+            tenant=cls.tenant, sku='ACT-2', name='Other Widget', division='corrugated', base_uom=cls.uom,
+        )
+
+        cust_party = Party.objects.create(
+            tenant=cls.tenant, party_type='CUSTOMER', code='ACTC', display_name='Activity Customer',
+        )
+        cls.customer = Customer.objects.create(tenant=cls.tenant, party=cust_party)
+        cls.ship_to = Location.objects.create(
+            tenant=cls.tenant, party=cust_party, name='Main', location_type='shipping',
+        )
+        vend_party = Party.objects.create(
+            tenant=cls.tenant, party_type='VENDOR', code='ACTV', display_name='Activity Vendor',
+        )
+        cls.vendor = Vendor.objects.create(tenant=cls.tenant, party=vend_party)
+        cls.vendor_location = Location.objects.create(
+            tenant=cls.tenant, party=vend_party, name='Dock', location_type='shipping',
+        )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+
+    def _sales_order(self, number, order_date, lines=((10, '12.00'),), item=None):
+        order = SalesOrder.objects.create(
+            tenant=self.tenant, order_number=number, customer=self.customer,
+            order_date=order_date, status='confirmed', ship_to=self.ship_to,
+        )
+        for i, (qty, price) in enumerate(lines, start=1):
+            SalesOrderLine.objects.create(
+                tenant=self.tenant, sales_order=order, line_number=i * 10,
+                item=item or self.item, quantity_ordered=qty, uom=self.uom,
+                unit_price=Decimal(price),
+            )
+        return order
+
+    def _rows(self, **filters):
+        return ItemActivity.objects.filter(tenant=self.tenant, **filters)
+
+    def test_line_save_creates_row_with_header_fields(self):
+        order = self._sales_order('SO-A1', date(2026, 3, 1), lines=((50, '12.00'),))
+
+        row = self._rows(doc_type=ItemActivity.SALES_ORDER).get()
+        self.assertEqual(row.item, self.item)
+        self.assertEqual(row.doc_id, order.pk)
+        self.assertEqual(row.doc_number, 'SO-A1')
+        self.assertEqual(row.date, date(2026, 3, 1))
+        self.assertEqual(row.party_id, self.customer.party_id)
+        self.assertEqual(row.quantity, Decimal('50'))
+        self.assertEqual(row.price, Decimal('12.00'))
+        self.assertEqual(row.amount, Decimal('600.00'))
+        self.assertEqual(row.status, 'confirmed')
+
+    def test_line_update_and_delete(self):
+        order = self._sales_order('SO-A2', date(2026, 3, 1))
+        line = order.lines.get()
+
+        line.quantity_ordered = 20
+        line.item = self.other_item
+        line.save()
+        row = self._rows(doc_type=ItemActivity.SALES_ORDER).get()
+        self.assertEqual(row.item, self.other_item)
+        self.assertEqual(row.amount, Decimal('240.00'))
+
+        line.delete()
+        self.assertFalse(self._rows().exists())
+
+    def test_header_save_refreshes_rows(self):
+        order = self._sales_order('SO-A3', date(2026, 3, 1), lines=((10, '1.00'), (20, '2.00')))
+
+        order.status = 'shipped'
+        order.order_date = date(2026, 3, 5)
+        order.save()
+
+        self.assertEqual(
+            set(self._rows(doc_id=order.pk).values_list('status', 'date')),
+            {('shipped', date(2026, 3, 5))},
+        )
+
+    def test_rfq_price_falls_back_to_target(self):
+        rfq = RFQ.objects.create(
+            tenant=self.tenant, rfq_number='RFQ-A1', vendor=self.vendor,
+            date=date(2026, 2, 1), status='sent', ship_to=self.vendor_location,
+        )
+        line = RFQLine.objects.create(
+            tenant=self.tenant, rfq=rfq, line_number=10, item=self.item,
+            quantity=100, uom=self.uom, target_price=Decimal('2.00'),
+        )
+        row = self._rows(doc_type=ItemActivity.RFQ).get()
+        self.assertEqual((row.price, row.amount), (Decimal('2.00'), Decimal('200.00')))
+
+        line.target_price = None
+        line.save()
+        row.refresh_from_db()
+        self.assertEqual((row.price, row.amount), (None, None))
+
+    def test_bulk_status_refresh(self):
+        invoice = Invoice.objects.create(
+            tenant=self.tenant, invoice_number='INV-A1', customer=self.customer,
+            invoice_date=date(2026, 3, 1), due_date=date(2026, 3, 31), status='sent',
+        )
+        InvoiceLine.objects.create(
+            tenant=self.tenant, invoice=invoice, line_number=10, item=self.item,
+            description='Widget', quantity=5, uom=self.uom,
+            unit_price=Decimal('3.00'), line_total=Decimal('15.00'),
+        )
+        Invoice.objects.filter(pk=invoice.pk).update(status='paid')
+        invoice.status = 'paid'
+
+        ItemActivityService.refresh_statuses(ItemActivity.INVOICE, [invoice])
+
+        self.assertEqual(self._rows(doc_type=ItemActivity.INVOICE).get().status, 'paid')
+
+    def test_rebuild_command_backfills(self):
+        self._sales_order('SO-A4', date(2026, 3, 1), lines=((1, '1.00'), (2, '1.00')))
+        self._sales_order('SO-A5', date(2026, 3, 2), item=self.other_item)
+        ItemActivity.objects.all().delete()
+
+        out = StringIO()
+        call_command('rebuild_item_activity', tenant='test-item-activity', stdout=out)
+
+        self.assertIn('Done. Indexed 3 document lines.', out.getvalue())
+        self.assertEqual(self._rows(item=self.item).count(), 2)
+        self.assertEqual(
+            self._rows(item=self.other_item).get().party_id, self.customer.party_id,
+        )
+
+    def test_history_keyset_pages(self):
+        start = date(2026, 1, 1)
+        for day in range(5):
+            self._sales_order(f'SO-K{day}', start + timedelta(days=day))
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = f'/api/v1/items/{self.item.pk}/history/'
+
+        numbers = []
+        params = {'cursor': '', 'page_size': 2}
+        while True:
+            response = client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            numbers += [entry['document_number'] for entry in response.data['results']]
+            if not response.data['next']:
+                break
+            params['cursor'] = response.data['next'].split('cursor=')[1].split('&')[0]
+
+        self.assertEqual(numbers, ['SO-K4', 'SO-K3', 'SO-K2', 'SO-K1', 'SO-K0'])
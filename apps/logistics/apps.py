@@ -5,3 +5,8 @@ class LogisticsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.logistics'
     verbose_name = 'Logistics'
+
+    def ready(self):
+        """Connect the driver manifest invalidation signals."""
+        from apps.logistics import signals
+        signals.connect()
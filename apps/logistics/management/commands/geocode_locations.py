@@ -0,0 +1,61 @@
+"""Management command to fill Location coordinates for route sequencing."""
+from django.core.management.base import BaseCommand, CommandError
+from apps.tenants.models import Tenant
+from apps.logistics.services import LocationGeocodeService
+from shared.managers import set_current_tenant
+
+
+class Command(BaseCommand):
+    help = (
+        'Set Location latitude/longitude from an offline postal-code centroid '
+        'table and/or the GPS captured on completed deliveries.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--postal-file', type=str, default=None,
+            help='CSV with postal_code, latitude and longitude columns',
+        )
+        parser.add_argument(
+            '--learn-from-deliveries', action='store_true',
+            help='Place ship-tos at the average GPS of their completed deliveries',
+        )
+        parser.add_argument(
+            '--overwrite', action='store_true',
+            help='Also refresh locations placed by an earlier postal-code load',
+        )
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        if not options['postal_file'] and not options['learn_from_deliveries']:
+            raise CommandError('Give --postal-file and/or --learn-from-deliveries.')
+
+        table = None
+        if options['postal_file']:
+            try:
+                table = LocationGeocodeService.read_postal_table(options['postal_file'])
+            except OSError as exc:
+                raise CommandError(f"Cannot read {options['postal_file']}: {exc}")
+            self.stdout.write(f"Loaded {len(table)} postal codes.")
+
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            service = LocationGeocodeService(tenant)
+            if table is not None:
+                count = service.apply_postal_table(table, overwrite=options['overwrite'])
+                self.stdout.write(f"  {tenant.name}: {count} from postal codes")
+                total += count
+            if options['learn_from_deliveries']:
+                count = service.learn_from_deliveries()
+                self.stdout.write(f"  {tenant.name}: {count} from deliveries")
+                total += count
+
+        self.stdout.write(self.style.SUCCESS(f"Done. Updated {total} locations."))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logistics', '0002_deliverystop_arrived_at_deliverystop_gps_lat_and_more'),
+        ('new_scheduling', '0004_deliveryrun_estimated_miles'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RunManifest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('payload', models.JSONField(help_text='Manifest document served to drivers')),
+                ('etag', models.CharField(help_text='Hash of payload, sent as the ETag header', max_length=64)),
+                ('run', models.OneToOneField(help_text='Run this manifest describes', on_delete=django.db.models.deletion.CASCADE, related_name='manifest', to='new_scheduling.deliveryrun')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -1,7 +1,7 @@
 from decimal import Decimal
 from django.db import models
 from django.conf import settings
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 from shared.models import TenantMixin, TimestampMixin
 
 
@@ -51,7 +51,7 @@ class LicensePlate(TenantMixin, TimestampMixin):
         help_text="Pallet notes"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'code')]
@@ -166,7 +166,7 @@ class DeliveryStop(TenantMixin, TimestampMixin):
         help_text="GPS longitude at delivery"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'run', 'customer')]
@@ -179,3 +179,31 @@ class DeliveryStop(TenantMixin, TimestampMixin):
 
     def __str__(self):
         return f"Stop #{self.sequence}: {self.customer.party.display_name} ({self.status})"
+
+
+class RunManifest(TenantMixin, TimestampMixin):
+    """
+    Precomputed driver manifest for a delivery run.
+
+    ``payload`` is the JSON the driver app receives from /logistics/my-run/
+    and ``etag`` a hash of it, so polls are answered from this one row (or
+    with 304 Not Modified). Signals delete the row when the run, its stops,
+    orders, order lines or LPNs change; the next read rebuilds it (see
+    ManifestService).
+    """
+    run = models.OneToOneField(
+        'new_scheduling.DeliveryRun',
+        on_delete=models.CASCADE,
+        related_name='manifest',
+        help_text="Run this manifest describes"
+    )
+    payload = models.JSONField(
+        help_text="Manifest document served to drivers"
+    )
+    etag = models.CharField(
+        max_length=64,
+        help_text="Hash of payload, sent as the ETag header"
+    )
+
+    def __str__(self):
+        return f"Manifest for run {self.run_id}"
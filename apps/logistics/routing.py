@@ -0,0 +1,130 @@
+# apps/logistics/routing.py
+"""
+Stop sequencing for delivery runs.
+
+Points are (latitude, longitude) pairs in degrees. Distances are great-circle
+(haversine) miles, so route lengths are straight-line estimates, not road
+miles.
+
+A route is built by nearest-neighbour construction and then improved with
+2-opt: reversing any segment whose reversal shortens the route, until no
+reversal helps. Runs are tens of stops, where this lands within a few
+percent of optimal in milliseconds.
+
+Usage:
+    order, miles = plan_route(points, start=depot, end=depot)
+    sequenced = [stops[i] for i in order]
+"""
+import math
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+def haversine_miles(a, b):
+    """Great-circle distance in miles between points ``a`` and ``b``."""
+    lat1, lng1 = map(math.radians, a)
+    lat2, lng2 = map(math.radians, b)
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(h)))
+
+
+def distance_matrix(points):
+    """Symmetric matrix of haversine miles between every pair of ``points``."""
+    n = len(points)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            matrix[i][j] = matrix[j][i] = haversine_miles(points[i], points[j])
+    return matrix
+
+
+def route_miles(route, matrix):
+    """Length of the path visiting ``route`` (matrix indexes) in order."""
+    return sum(matrix[a][b] for a, b in zip(route, route[1:]))
+
+
+def nearest_neighbor(matrix, nodes, start):
+    """Path from ``start`` through ``nodes``, always moving to the closest unvisited one."""
+    route = [start]
+    remaining = set(nodes) - {start}
+    while remaining:
+        here = matrix[route[-1]]
+        closest = min(remaining, key=lambda node: (here[node], node))
+        route.append(closest)
+        remaining.remove(closest)
+    return route
+
+
+def two_opt(route, matrix, fixed_start=False, fixed_end=False):
+    """
+    Improve ``route`` by segment reversals until none shortens it.
+
+    A fixed endpoint (depot or last completed stop) never moves; a free end
+    has no outgoing edge, so reversing a segment that ends there changes
+    only one edge.
+    """
+    route = list(route)
+    n = len(route)
+    first = 1 if fixed_start else 0
+    last = n - 2 if fixed_end else n - 1
+    improved = True
+    while improved:
+        improved = False
+        for i in range(first, last):
+            for j in range(i + 1, last + 1):
+                before = matrix[route[i - 1]][route[i]] if i > 0 else 0.0
+                after = matrix[route[j]][route[j + 1]] if j < n - 1 else 0.0
+                new_before = matrix[route[i - 1]][route[j]] if i > 0 else 0.0
+                new_after = matrix[route[i]][route[j + 1]] if j < n - 1 else 0.0
+                if new_before + new_after < before + after - 1e-9:
+                    route[i:j + 1] = reversed(route[i:j + 1])
+                    improved = True
+    return route
+
+
+def plan_route(points, start=None, end=None):
+    """
+    Order ``points`` into a short route.
+
+    Args:
+        points: [(lat, lng), ...] to visit
+        start: Optional fixed origin (e.g. the depot)
+        end: Optional fixed destination (e.g. back to the depot)
+
+    Returns:
+        (order, miles): indexes into ``points`` in visiting order, and the
+        route length including the legs from ``start`` and to ``end``.
+    """
+    if not points:
+        return [], 0.0
+
+    nodes = list(range(len(points)))
+    all_points = list(points)
+    start_node = end_node = None
+    if start is not None:
+        start_node = len(all_points)
+        all_points.append(start)
+    if end is not None:
+        end_node = len(all_points)
+        all_points.append(end)
+    matrix = distance_matrix(all_points)
+
+    if start_node is not None:
+        candidates = [nearest_neighbor(matrix, nodes + [start_node], start_node)]
+    else:
+        # No origin: try every stop as the first one and keep the shortest
+        candidates = [nearest_neighbor(matrix, nodes, node) for node in nodes]
+    if end_node is not None:
+        candidates = [route + [end_node] for route in candidates]
+    route = min(candidates, key=lambda r: route_miles(r, matrix))
+
+    route = two_opt(
+        route, matrix,
+        fixed_start=start_node is not None,
+        fixed_end=end_node is not None,
+    )
+    order = [node for node in route if node < len(points)]
+    return order, route_miles(route, matrix)
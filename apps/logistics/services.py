@@ -1,15 +1,31 @@
 import base64
+import csv
+import hashlib
+import json
 import uuid
+from datetime import timedelta
 from decimal import Decimal
+from django.conf import settings
 from django.db import models, transaction
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.utils import timezone
 from django.template.loader import render_to_string
+from rest_framework.utils.encoders import JSONEncoder
 
-from .models import LicensePlate, DeliveryStop
+from .models import LicensePlate, DeliveryStop, RunManifest
+from .routing import plan_route
+from apps.parties.models import Location
 from apps.scheduling.models import DeliveryRun
 from apps.orders.models import SalesOrder
+from shared.history import bulk_update_with_history
+
+
+def location_point(location):
+    """(lat, lng) floats for a Location, or None if it has no coordinates."""
+    if location is None or location.latitude is None or location.longitude is None:
+        return None
+    return float(location.latitude), float(location.longitude)
 
 
 class LogisticsService:
@@ -24,13 +40,14 @@ class LogisticsService:
         Initialize delivery stops for a run by grouping orders by customer.
 
         Looks at all SalesOrders assigned to the run, groups by customer,
-        and creates DeliveryStop records for each unique customer.
+        and creates DeliveryStop records for each unique customer, then
+        orders them with sequence_run().
 
         Args:
             run_id: DeliveryRun PK
 
         Returns:
-            list[DeliveryStop]: Created stops
+            list[DeliveryStop]: Created stops, in sequence order
         """
         run = DeliveryRun.objects.get(pk=run_id, tenant=self.tenant)
 
@@ -72,8 +89,91 @@ class LogisticsService:
                 stop.orders.set(data['orders'])
                 stops.append(stop)
 
+            stops = self.sequence_run(run.pk)['stops']
+            ManifestService(self.tenant).build(run)
             return stops
 
+    def sequence_run(self, run_id):
+        """
+        Order a run's pending stops into a short route and store the
+        estimated miles on the run.
+
+        The route starts at the default warehouse (or, mid-run, at the last
+        stop already visited) and returns to the warehouse. Stops that are
+        arrived, completed or skipped keep their place at the front; pending
+        stops whose ship-to has no coordinates go last, in their current
+        order.
+
+        Args:
+            run_id: DeliveryRun PK
+
+        Returns:
+            dict: run, stops (in sequence order), estimated_miles (Decimal,
+            None if no stop is located) and unlocated (pending stops that
+            could not be placed)
+        """
+        run = DeliveryRun.objects.get(pk=run_id, tenant=self.tenant)
+        stops = list(DeliveryStop.objects.filter(
+            tenant=self.tenant, run=run,
+        ).select_related('customer', 'customer__party', 'ship_to').order_by('sequence', 'pk'))
+
+        visited = [stop for stop in stops if stop.status != 'PENDING']
+        pending = [stop for stop in stops if stop.status == 'PENDING']
+        located = [stop for stop in pending if location_point(stop.ship_to)]
+        unlocated = [stop for stop in pending if not location_point(stop.ship_to)]
+
+        depot = self._depot_point()
+        start = depot
+        if visited:
+            last = visited[-1]
+            if last.gps_lat is not None and last.gps_lng is not None:
+                start = float(last.gps_lat), float(last.gps_lng)
+            else:
+                start = location_point(last.ship_to) or depot
+
+        order, miles = plan_route(
+            [location_point(stop.ship_to) for stop in located], start=start, end=depot,
+        )
+        ordered = visited + [located[i] for i in order] + unlocated
+
+        now = timezone.now()
+        changed = []
+        for seq, stop in enumerate(ordered, start=1):
+            if stop.sequence != seq:
+                stop.sequence = seq
+                stop.updated_at = now
+                changed.append(stop)
+
+        estimated_miles = Decimal(str(round(miles, 1))) if located else None
+        with transaction.atomic():
+            if changed:
+                bulk_update_with_history(
+                    changed, DeliveryStop, ['sequence', 'updated_at'], default_user=self.user,
+                )
+                # bulk_update sends no post_save for the manifest signals
+                ManifestService.invalidate(self.tenant.pk, [run.pk])
+            if run.estimated_miles != estimated_miles:
+                run.estimated_miles = estimated_miles
+                run.save(update_fields=['estimated_miles', 'updated_at'])
+
+        return {
+            'run': run,
+            'stops': ordered,
+            'estimated_miles': estimated_miles,
+            'unlocated': unlocated,
+        }
+
+    def _depot_point(self):
+        """Coordinates of the default (else first) active warehouse that has them."""
+        from apps.warehousing.models import Warehouse
+        warehouse = Warehouse.objects.filter(
+            tenant=self.tenant,
+            is_active=True,
+            location__latitude__isnull=False,
+            location__longitude__isnull=False,
+        ).select_related('location').order_by('-is_default', 'pk').first()
+        return location_point(warehouse.location) if warehouse else None
+
     def create_lpn(self, order, run=None, weight_lbs=Decimal('0.00'), notes=''):
         """
         Create a new License Plate (LPN) for a sales order.
@@ -146,11 +246,21 @@ class LogisticsService:
             stop.delivered_at = timezone.now()
             stop.save()
 
+            if stop.gps_lat is not None and stop.gps_lng is not None:
+                LocationGeocodeService(self.tenant).record_delivery_fix(
+                    stop.ship_to, stop.gps_lat, stop.gps_lng,
+                )
+
             # Update all linked orders to shipped/complete
             stop.orders.all().update(status='shipped')
+            order_ids = list(stop.orders.values_list('id', flat=True))
+            from apps.items.activity import ItemActivityService
+            from apps.items.models import ItemActivity
+            ItemActivityService.set_status(
+                ItemActivity.SALES_ORDER, self.tenant.pk, order_ids, 'shipped',
+            )
 
             # Update LPNs for these orders
-            order_ids = list(stop.orders.values_list('id', flat=True))
             LicensePlate.objects.filter(
                 tenant=self.tenant,
                 order_id__in=order_ids,
@@ -177,20 +287,31 @@ class LogisticsService:
         run = DeliveryRun.objects.select_related('truck').get(
             pk=run_id, tenant=self.tenant
         )
-        stops = DeliveryStop.objects.filter(
+        stops = list(DeliveryStop.objects.filter(
             tenant=self.tenant,
             run=run,
         ).select_related(
             'customer', 'customer__party', 'ship_to'
-        ).prefetch_related('orders', 'orders__lines').order_by('sequence')
+        ).prefetch_related('orders', 'orders__lines').order_by('sequence'))
 
         return {
             'run': run,
             'stops': stops,
-            'total_stops': stops.count(),
-            'total_orders': sum(s.orders.count() for s in stops),
+            'total_stops': len(stops),
+            'total_orders': sum(len(s.orders.all()) for s in stops),
         }
 
+    def get_todays_run(self):
+        """
+        Today's first incomplete delivery run (drivers get one run at a
+        time), with its truck and manifest joined; None if there is none.
+        """
+        return DeliveryRun.objects.filter(
+            tenant=self.tenant,
+            scheduled_date=timezone.now().date(),
+            is_complete=False,
+        ).select_related('truck', 'manifest').order_by('sequence').first()
+
     def get_my_run(self, user):
         """
         Get today's delivery run for the authenticated driver.
@@ -200,31 +321,20 @@ class LogisticsService:
 
         Returns dict with run info, stops, and aggregated stats.
         """
-        from apps.scheduling.models import DeliveryRun
-        today = timezone.now().date()
-
-        # Find runs for today - driver is identified by being the user
-        # who started/was assigned the run. We look for runs on today's trucks.
-        runs = DeliveryRun.objects.filter(
-            tenant=self.tenant,
-            scheduled_date=today,
-            is_complete=False,
-        ).select_related('truck').order_by('sequence')
-
-        if not runs.exists():
+        # Driver is identified by being the user who started/was assigned
+        # the run. We look for runs on today's trucks.
+        run = self.get_todays_run()
+        if run is None:
             return None
 
-        # For now, return the first available run (drivers get one run at a time)
-        run = runs.first()
-
-        stops = DeliveryStop.objects.filter(
+        stops = list(DeliveryStop.objects.filter(
             tenant=self.tenant,
             run=run,
         ).select_related(
             'customer', 'customer__party', 'ship_to'
         ).prefetch_related(
             'orders', 'orders__lines', 'orders__lines__item', 'orders__lines__uom'
-        ).order_by('sequence')
+        ).order_by('sequence'))
 
         # Calculate total weight from LPNs
         total_weight = LicensePlate.objects.filter(
@@ -235,7 +345,7 @@ class LogisticsService:
         return {
             'run': run,
             'truck_name': str(run.truck) if run.truck else 'Unassigned',
-            'total_stops': stops.count(),
+            'total_stops': len(stops),
             'total_weight_lbs': total_weight,
             'is_complete': run.is_complete,
             'stops': stops,
@@ -284,3 +394,256 @@ class LogisticsService:
             num = 10001
 
         return f"LPN-{num}"
+
+
+class ManifestService:
+    """
+    Build and serve RunManifest snapshots of the driver manifest.
+
+    Drivers poll /logistics/my-run/ every few seconds. Instead of re-reading
+    the run's stops, orders, lines and LPNs on each poll, the manifest is
+    built once into a RunManifest row and served from it, with an ETag so
+    unchanged polls get 304 Not Modified.
+
+    Signals (apps.logistics.signals) delete the row when the run, a stop, a
+    stop's orders or their lines, or an LPN changes; the next read rebuilds
+    it. Snapshots older than DRIVER_MANIFEST_MAX_AGE seconds (default 300)
+    are rebuilt as well, which bounds staleness from edits no signal covers
+    (e.g. renaming a customer or item).
+
+    Usage:
+        manifest = ManifestService(tenant).get(run)
+        manifest.payload, manifest.etag
+    """
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    @staticmethod
+    def invalidate(tenant_id, run_ids):
+        """Drop the snapshots of ``run_ids``."""
+        RunManifest.objects.all_tenants().filter(
+            tenant_id=tenant_id, run_id__in=run_ids,
+        ).delete()
+
+    @staticmethod
+    def invalidate_for_orders(tenant_id, order_ids):
+        """Drop the snapshots of runs with a stop delivering any of ``order_ids``."""
+        RunManifest.objects.all_tenants().filter(
+            tenant_id=tenant_id,
+            run__stops__orders__in=order_ids,
+        ).delete()
+
+    def get(self, run):
+        """
+        The current snapshot for ``run``, rebuilt if missing or expired.
+
+        Load the run with select_related('manifest') to make a fresh
+        snapshot cost no extra query.
+        """
+        try:
+            manifest = run.manifest
+        except RunManifest.DoesNotExist:
+            return self.build(run)
+        max_age = getattr(settings, 'DRIVER_MANIFEST_MAX_AGE', 300)
+        if timezone.now() - manifest.updated_at > timedelta(seconds=max_age):
+            return self.build(run)
+        return manifest
+
+    def build(self, run):
+        """Build and store the snapshot for ``run``."""
+        payload = self.build_payload(run)
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        manifest, _ = RunManifest.objects.all_tenants().update_or_create(
+            run=run,
+            defaults={
+                'tenant': self.tenant,
+                'payload': payload,
+                'etag': hashlib.sha256(canonical.encode()).hexdigest(),
+            },
+        )
+        run.manifest = manifest
+        return manifest
+
+    def build_payload(self, run):
+        """
+        The manifest document: run header, totals and the ordered stops with
+        their orders, lines and pallet counts. Returns JSON-ready data in
+        the API's wire format.
+        """
+        stops = DeliveryStop.objects.filter(
+            tenant=self.tenant, run=run,
+        ).select_related(
+            'customer', 'customer__party', 'ship_to',
+        ).prefetch_related(
+            'orders', 'orders__lines', 'orders__lines__item', 'orders__lines__uom',
+        ).order_by('sequence')
+
+        lpns = LicensePlate.objects.filter(tenant=self.tenant, run=run)
+        pallets_by_order = dict(
+            lpns.filter(order__isnull=False).values('order').annotate(
+                pallets=models.Count('id'),
+            ).values_list('order', 'pallets')
+        )
+        total_weight = lpns.aggregate(total=models.Sum('weight_lbs'))['total'] or Decimal('0')
+
+        stops_data = []
+        for stop in stops:
+            orders = stop.orders.all()
+            ship_to = stop.ship_to
+            stops_data.append({
+                'id': stop.id,
+                'sequence': stop.sequence,
+                'status': stop.status,
+                'customer_name': stop.customer.party.display_name if stop.customer else '',
+                'address': f"{ship_to.address_line1 or ''}, {ship_to.city or ''}, {ship_to.state or ''} {ship_to.postal_code or ''}".strip(', ') if ship_to else '',
+                'city': ship_to.city if ship_to else '',
+                'delivery_notes': stop.delivery_notes or '',
+                'pallet_count': sum(pallets_by_order.get(order.id, 0) for order in orders),
+                'orders': [
+                    {
+                        'id': order.id,
+                        'order_number': order.order_number,
+                        'customer_po': order.customer_po or '',
+                        'lines': [
+                            {
+                                'item_sku': line.item.sku,
+                                'item_name': line.item.name,
+                                'quantity': line.quantity_ordered,
+                                'uom_code': line.uom.code if line.uom else 'ea',
+                            }
+                            for line in order.lines.all()
+                        ],
+                    }
+                    for order in orders
+                ],
+                'arrived_at': stop.arrived_at,
+                'delivered_at': stop.delivered_at,
+            })
+
+        payload = {
+            'run_id': run.id,
+            'run_name': run.name,
+            'truck_name': str(run.truck) if run.truck else 'Unassigned',
+            'scheduled_date': str(run.scheduled_date),
+            'total_stops': len(stops_data),
+            'total_weight_lbs': str(total_weight),
+            'is_complete': run.is_complete,
+            'stops': stops_data,
+        }
+        # Normalise with the API renderer's encoder so stored and served
+        # values match (decimals as numbers, datetimes as ISO strings)
+        return json.loads(json.dumps(payload, cls=JSONEncoder))
+
+
+class LocationGeocodeService:
+    """
+    Fill Location coordinates without an online geocoder.
+
+    Sources, from least to most trusted (Location.geo_source):
+        - postal: centroid of the postal code, from an offline table
+        - delivery: GPS captured when drivers sign for deliveries there
+        - manual: entered by a user; never overwritten
+
+    A location is only updated from a source at least as trusted as the one
+    that set its current coordinates.
+    """
+
+    TRUST = {'': 0, Location.GEO_POSTAL: 1, Location.GEO_DELIVERY: 2, Location.GEO_MANUAL: 3}
+    BATCH_SIZE = 500
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    @staticmethod
+    def read_postal_table(path):
+        """
+        Load {postal_code: (lat, lng)} from a CSV with postal_code, latitude
+        and longitude columns. US ZIP+4 codes are reduced to the 5-digit ZIP.
+        """
+        table = {}
+        with open(path, newline='', encoding='utf-8-sig') as handle:
+            for row in csv.DictReader(handle):
+                code = LocationGeocodeService.normalize_postal_code(row.get('postal_code'))
+                try:
+                    point = (Decimal(row['latitude']), Decimal(row['longitude']))
+                except (KeyError, TypeError, ArithmeticError):
+                    continue
+                if code:
+                    table[code] = point
+        return table
+
+    @staticmethod
+    def normalize_postal_code(code):
+        code = (code or '').strip().upper()
+        if len(code) == 10 and code[5] == '-' and code[:5].isdigit():
+            return code[:5]
+        return code
+
+    def apply_postal_table(self, table, overwrite=False):
+        """
+        Set postal-centroid coordinates on locations with none.
+
+        With ``overwrite``, locations placed by an earlier postal load are
+        refreshed too. Returns the number of locations updated.
+        """
+        sources = [''] + ([Location.GEO_POSTAL] if overwrite else [])
+        locations = Location.objects.filter(
+            tenant=self.tenant, geo_source__in=sources,
+        ).exclude(postal_code='')
+        updated = []
+        for location in locations.iterator(chunk_size=self.BATCH_SIZE):
+            point = table.get(self.normalize_postal_code(location.postal_code))
+            if point is None:
+                continue
+            location.latitude, location.longitude = point
+            location.geo_source = Location.GEO_POSTAL
+            updated.append(location)
+        return self._save(updated)
+
+    def learn_from_deliveries(self):
+        """
+        Set each ship-to's coordinates to the average GPS of the completed
+        deliveries made there. Manually placed locations are left alone.
+        Returns the number of locations updated.
+        """
+        fixes = DeliveryStop.objects.filter(
+            tenant=self.tenant,
+            status='COMPLETED',
+            ship_to__isnull=False,
+            gps_lat__isnull=False,
+            gps_lng__isnull=False,
+        ).exclude(
+            ship_to__geo_source=Location.GEO_MANUAL,
+        ).values('ship_to').annotate(
+            lat=models.Avg('gps_lat'), lng=models.Avg('gps_lng'),
+        )
+        averages = {row['ship_to']: (row['lat'], row['lng']) for row in fixes}
+
+        updated = []
+        for location in Location.objects.filter(tenant=self.tenant, pk__in=averages):
+            lat, lng = (Decimal(value).quantize(Decimal('0.000001')) for value in averages[location.pk])
+            location.latitude, location.longitude = lat, lng
+            location.geo_source = Location.GEO_DELIVERY
+            updated.append(location)
+        return self._save(updated)
+
+    def record_delivery_fix(self, location, lat, lng):
+        """Place a location from one delivery's GPS if nothing better has."""
+        if location is None or self.TRUST[location.geo_source] > self.TRUST[Location.GEO_POSTAL]:
+            return False
+        location.latitude = Decimal(lat).quantize(Decimal('0.000001'))
+        location.longitude = Decimal(lng).quantize(Decimal('0.000001'))
+        location.geo_source = Location.GEO_DELIVERY
+        location.save(update_fields=['latitude', 'longitude', 'geo_source', 'updated_at'])
+        return True
+
+    def _save(self, locations):
+        now = timezone.now()
+        for location in locations:
+            location.updated_at = now
+        Location.objects.bulk_update(
+            locations, ['latitude', 'longitude', 'geo_source', 'updated_at'],
+            batch_size=self.BATCH_SIZE,
+        )
+        return len(locations)
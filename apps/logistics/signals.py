@@ -0,0 +1,99 @@
+# apps/logistics/signals.py
+"""
+Signals that drop RunManifest snapshots when what they describe changes.
+
+Receivers are connected in ``connect()`` (called from LogisticsConfig.ready).
+Changes made with a queryset ``update()`` or ``bulk_update`` bypass them;
+those callers invalidate with ManifestService directly.
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+
+def invalidate_run_on_save(sender, instance, raw=False, **kwargs):
+    """A run was saved: drop its own snapshot."""
+    if raw:
+        return
+    from .services import ManifestService
+    ManifestService.invalidate(instance.tenant_id, [instance.pk])
+
+
+def invalidate_stop_run(sender, instance, raw=False, **kwargs):
+    """A stop or LPN changed: drop its run's snapshot."""
+    if raw or instance.run_id is None:
+        return
+    from .services import ManifestService
+    ManifestService.invalidate(instance.tenant_id, [instance.run_id])
+
+
+def invalidate_order_runs(sender, instance, created=False, raw=False, **kwargs):
+    """An order changed: drop the snapshots of runs with a stop delivering it."""
+    if raw or created:
+        return
+    from .services import ManifestService
+    ManifestService.invalidate_for_orders(instance.tenant_id, [instance.pk])
+
+
+def invalidate_line_runs(sender, instance, raw=False, **kwargs):
+    """An order line changed: drop the snapshots of runs delivering its order."""
+    if raw:
+        return
+    from .services import ManifestService
+    ManifestService.invalidate_for_orders(instance.tenant_id, [instance.sales_order_id])
+
+
+def invalidate_stop_orders(sender, instance, action, reverse, pk_set, **kwargs):
+    """Orders were added to or removed from a stop."""
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    from .services import ManifestService
+    if not reverse:
+        ManifestService.invalidate(instance.tenant_id, [instance.run_id])
+    elif pk_set:
+        # ``instance`` is the order and pk_set the stops, on any runs
+        from .models import DeliveryStop
+        run_ids = DeliveryStop.objects.all_tenants().filter(
+            pk__in=pk_set,
+        ).values_list('run_id', flat=True)
+        ManifestService.invalidate(instance.tenant_id, list(run_ids))
+    else:
+        ManifestService.invalidate_for_orders(instance.tenant_id, [instance.pk])
+
+
+def connect():
+    """Connect the manifest invalidation receivers."""
+    from .models import DeliveryStop
+
+    post_save.connect(
+        invalidate_run_on_save, sender='new_scheduling.DeliveryRun',
+        dispatch_uid='run_manifest_run',
+    )
+    for model in ('logistics.DeliveryStop', 'logistics.LicensePlate'):
+        post_save.connect(
+            invalidate_stop_run, sender=model,
+            dispatch_uid=f'run_manifest_save_{model}',
+        )
+        post_delete.connect(
+            invalidate_stop_run, sender=model,
+            dispatch_uid=f'run_manifest_delete_{model}',
+        )
+    post_save.connect(
+        invalidate_order_runs, sender='orders.SalesOrder',
+        dispatch_uid='run_manifest_order',
+    )
+    # Before the delete cascades away the order's stop links
+    pre_delete.connect(
+        invalidate_order_runs, sender='orders.SalesOrder',
+        dispatch_uid='run_manifest_order_delete',
+    )
+    post_save.connect(
+        invalidate_line_runs, sender='orders.SalesOrderLine',
+        dispatch_uid='run_manifest_line',
+    )
+    post_delete.connect(
+        invalidate_line_runs, sender='orders.SalesOrderLine',
+        dispatch_uid='run_manifest_line_delete',
+    )
+    m2m_changed.connect(
+        invalidate_stop_orders, sender=DeliveryStop.orders.through,
+        dispatch_uid='run_manifest_stop_orders',
+    )
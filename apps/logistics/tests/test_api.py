@@ -4,6 +4,7 @@ Comprehensive API endpoint tests for the Driver App backend.
 
 Tests cover:
 - Driver manifest API (GET/POST /api/v1/logistics/my-run/)
+- Driver manifest snapshot, ETag and invalidation
 - Arrive at stop API (POST /api/v1/logistics/stops/{id}/arrive/)
 - Sign delivery API (POST /api/v1/logistics/stops/{id}/sign/)
 - Initialize run API (POST /api/v1/logistics/runs/{run_id}/initialize/)
@@ -14,7 +15,9 @@ Tests cover:
 import base64
 from datetime import date
 from decimal import Decimal
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -25,7 +28,7 @@ from apps.parties.models import Party, Customer, Location, Truck
 from apps.items.models import UnitOfMeasure, Item
 from apps.orders.models import SalesOrder, SalesOrderLine
 from apps.scheduling.models import DeliveryRun
-from apps.logistics.models import DeliveryStop, LicensePlate
+from apps.logistics.models import DeliveryStop, LicensePlate, RunManifest
 from shared.managers import set_current_tenant
 
 
@@ -844,3 +847,88 @@ class AuthenticationTests(DriverAPITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class DriverManifestSnapshotTests(DriverAPITestCase):
+    """GET /api/v1/logistics/my-run/ served from RunManifest with an ETag."""
+
+    url = '/api/v1/logistics/my-run/'
+
+    def _etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response['ETag']
+
+    def test_unchanged_poll_returns_304(self):
+        etag = self._etag()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertFalse(response.content)
+
+    def test_fresh_snapshot_poll_is_cheap(self):
+        self._etag()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        manifest_queries = [
+            q['sql'] for q in queries.captured_queries
+            if 'logistics_' in q['sql'] or 'orders_' in q['sql']
+        ]
+        # Only the run + manifest join; no stop, order, line or LPN reads
+        self.assertEqual(len(manifest_queries), 1)
+        self.assertEqual(response.data['total_stops'], 2)
+
+    def test_stop_change_invalidates(self):
+        etag = self._etag()
+
+        self.client.post(f'/api/v1/logistics/stops/{self.stop1.id}/arrive/', {}, format='json')
+
+        self.assertFalse(RunManifest.objects.filter(run=self.delivery_run).exists())
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['stops'][0]['status'], 'ARRIVED')
+
+    def test_line_and_lpn_changes_invalidate(self):
+        etag = self._etag()
+        line = self.order3.lines.get()
+        line.quantity_ordered = 80
+        line.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['stops'][1]['orders'][0]['lines'][0]['quantity'], 80)
+
+        LicensePlate.objects.create(
+            tenant=self.tenant, code='LPN-10004', order=self.order3,
+            run=self.delivery_run, weight_lbs=Decimal('100.00'), status='STAGED',
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['stops'][1]['pallet_count'], 2)
+        self.assertEqual(Decimal(response.data['total_weight_lbs']), Decimal('1300.00'))
+
+    def test_stop_order_links_invalidate(self):
+        self._etag()
+
+        self.stop2.orders.remove(self.order3)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['stops'][1]['orders'], [])
+
+    def test_expired_snapshot_is_rebuilt(self):
+        self._etag()
+        first = RunManifest.objects.get(run=self.delivery_run)
+        # A rename no signal watches
+        Party.objects.filter(pk=self.customer_party.pk).update(display_name='Renamed Co')
+
+        with override_settings(DRIVER_MANIFEST_MAX_AGE=0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.data['stops'][0]['customer_name'], 'Renamed Co')
+        self.assertGreater(RunManifest.objects.get(run=self.delivery_run).updated_at, first.updated_at)
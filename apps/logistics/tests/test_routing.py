@@ -0,0 +1,211 @@
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.tenants.models import Tenant
+from apps.parties.models import Truck, Party, Customer, Location
+from apps.scheduling.models import DeliveryRun
+from apps.orders.models import SalesOrder
+from apps.warehousing.models import Warehouse
+from apps.logistics.models import DeliveryStop
+from apps.logistics.routing import haversine_miles, plan_route, route_miles, distance_matrix
+from apps.logistics.services import LogisticsService, LocationGeocodeService
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class RoutePlanningTests(SimpleTestCase):
+    """Pure routing functions."""
+
+    def test_haversine_known_distance(self):
+        # Los Angeles to New York, about 2,445 great-circle miles
+        miles = haversine_miles((34.0522, -118.2437), (40.7128, -74.0060))
+        self.assertAlmostEqual(miles, 2445, delta=5)
+        self.assertEqual(haversine_miles((34.0, -118.0), (34.0, -118.0)), 0)
+
+    def test_points_on_a_line_visited_in_order(self):
+        # Shuffled points along a meridian, depot at the south end
+        lats = [34.5, 34.1, 34.9, 34.3, 34.7]
+        points = [(lat, -118.0) for lat in lats]
+        order, miles = plan_route(points, start=(34.0, -118.0), end=(34.0, -118.0))
+
+        self.assertEqual([lats[i] for i in order], [34.1, 34.3, 34.5, 34.7, 34.9])
+        # Out and back along the line
+        self.assertAlmostEqual(miles, 2 * haversine_miles((34.0, -118.0), (34.9, -118.0)), places=6)
+
+    def test_two_opt_removes_crossing(self):
+        # Square corners; the nearest-neighbour start alone can cross itself
+        points = [(0.0, 0.0), (1.0, 1.0), (0.0, 1.0), (1.0, 0.0)]
+        order, miles = plan_route(points, start=(0.0, -0.1), end=(0.0, -0.1))
+
+        square = distance_matrix([(0.0, -0.1), (0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)])
+        self.assertAlmostEqual(miles, route_miles([0, 1, 2, 3, 4, 0], square), places=6)
+        self.assertEqual(len(order), 4)
+
+    def test_open_route_without_depot(self):
+        points = [(34.2, -118.0), (34.0, -118.0), (34.1, -118.0)]
+        order, miles = plan_route(points)
+
+        self.assertIn([points[i] for i in order][0], [(34.0, -118.0), (34.2, -118.0)])
+        self.assertAlmostEqual(miles, haversine_miles((34.0, -118.0), (34.2, -118.0)), places=6)
+        self.assertEqual(plan_route([]), ([], 0.0))
+
+
+class SequenceRunTests(TestCase):
+    """LogisticsService.sequence_run() and location geocoding."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Route Co', subdomain='test-routing', is_default=True)
+        set_current_tenant(cls.tenant)
+        cls.user = User.objects.create_user(username='route_user', password='pass')
+
+        depot_party = Party.objects.create(
+            tenant=cls.tenant, party_type='OTHER', display_name='Route Co', code='ROUTECO',
+        )
+        depot = Location.objects.create(
+            tenant=cls.tenant, party=depot_party, location_type='WAREHOUSE',
+            address_line1='1 Depot Way', city='Depot', state='CA', postal_code='90000',
+            latitude=Decimal('34.000000'), longitude=Decimal('-118.000000'),
+            geo_source=Location.GEO_MANUAL,
+        )
+        Warehouse.objects.create(tenant=cls.tenant, name='Main', code='MAIN', location=depot, is_default=True)
+
+        truck = Truck.objects.create(tenant=cls.tenant, name='Truck R', license_plate='RTE1')
+        cls.delivery_run = DeliveryRun.objects.create(
+            tenant=cls.tenant, name='Run R', truck=truck, scheduled_date=timezone.now().date(), sequence=1,
+        )
+
+        # Customers created far-near-middle so creation order is a bad route
+        cls.ship_tos = {}
+        for code, lat in (('FAR', '34.300000'), ('NEAR', '34.100000'), ('MID', '34.200000'), ('NOGEO', None)):
+            party = Party.objects.create(
+                tenant=cls.tenant, party_type='CUSTOMER', display_name=code, code=code,
+            )
+            customer = Customer.objects.create(tenant=cls.tenant, party=party)
+            ship_to = Location.objects.create(
+                tenant=cls.tenant, party=party, location_type='SHIP_TO',
+                address_line1=f'{code} St', city='Town', state='CA', postal_code=f'9010{len(cls.ship_tos)}',
+                latitude=Decimal(lat) if lat else None,
+                longitude=Decimal('-118.000000') if lat else None,
+                geo_source=Location.GEO_POSTAL if lat else '',
+            )
+            cls.ship_tos[code] = ship_to
+            SalesOrder.objects.create(
+                tenant=cls.tenant, customer=customer, order_number=f'SO-{code}',
+                order_date=timezone.now().date(), ship_to=ship_to,
+                delivery_run=cls.delivery_run, status='confirmed',
+            )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.service = LogisticsService(self.tenant, self.user)
+
+    def _names(self, stops):
+        return [stop.customer.party.code for stop in stops]
+
+    def test_initialize_sequences_by_route(self):
+        stops = self.service.initialize_run_logistics(self.delivery_run.pk)
+
+        self.assertEqual(self._names(stops), ['NEAR', 'MID', 'FAR', 'NOGEO'])
+        stored = DeliveryStop.objects.filter(run=self.delivery_run).order_by('sequence')
+        self.assertEqual(self._names(stored), ['NEAR', 'MID', 'FAR', 'NOGEO'])
+        self.assertEqual([stop.sequence for stop in stored], [1, 2, 3, 4])
+
+        self.delivery_run.refresh_from_db()
+        expected = 2 * haversine_miles((34.0, -118.0), (34.3, -118.0))
+        self.assertEqual(self.delivery_run.estimated_miles, Decimal(str(round(expected, 1))))
+
+    def test_visited_stops_keep_their_place(self):
+        self.service.initialize_run_logistics(self.delivery_run.pk)
+        # Driver went to FAR first
+        far = DeliveryStop.objects.get(run=self.delivery_run, customer__party__code='FAR')
+        near = DeliveryStop.objects.get(run=self.delivery_run, customer__party__code='NEAR')
+        far.sequence, near.sequence = 1, 3
+        far.status = 'COMPLETED'
+        far.save()
+        near.save()
+
+        result = self.service.sequence_run(self.delivery_run.pk)
+
+        self.assertEqual(self._names(result['stops']), ['FAR', 'MID', 'NEAR', 'NOGEO'])
+        self.assertEqual(self._names(result['unlocated']), ['NOGEO'])
+
+    def test_sequence_endpoint(self):
+        self.service.initialize_run_logistics(self.delivery_run.pk)
+        DeliveryStop.objects.filter(run=self.delivery_run).update(sequence=1)
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.post(f'/api/v1/logistics/runs/{self.delivery_run.pk}/sequence/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([stop['customer_name'] for stop in response.data['stops']],
+                         ['NEAR', 'MID', 'FAR', 'NOGEO'])
+        self.assertEqual(len(response.data['unlocated_stops']), 1)
+        self.assertIsNotNone(response.data['estimated_miles'])
+
+    def test_delivery_gps_places_postal_located_ship_to(self):
+        stops = self.service.initialize_run_logistics(self.delivery_run.pk)
+        near = next(stop for stop in stops if stop.customer.party.code == 'NEAR')
+
+        self.service.sign_delivery(near.pk, None, 'Dock', gps_lat=Decimal('34.1005000'), gps_lng=Decimal('-118.0010000'))
+
+        ship_to = self.ship_tos['NEAR']
+        ship_to.refresh_from_db()
+        self.assertEqual(ship_to.geo_source, Location.GEO_DELIVERY)
+        self.assertEqual(ship_to.latitude, Decimal('34.100500'))
+
+    def test_geocode_command(self):
+        manual = self.ship_tos['MID']
+        Location.objects.filter(pk=manual.pk).update(geo_source=Location.GEO_MANUAL)
+        nogeo = self.ship_tos['NOGEO']
+
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as table:
+            table.write('postal_code,latitude,longitude\n')
+            table.write(f'{nogeo.postal_code},34.050000,-118.050000\n')
+            table.write(f'{manual.postal_code},1.000000,1.000000\n')
+        self.addCleanup(os.remove, path)
+
+        out = StringIO()
+        call_command('geocode_locations', f'--postal-file={path}', '--tenant=test-routing', stdout=out)
+
+        self.assertIn('Done. Updated 1 locations.', out.getvalue())
+        nogeo.refresh_from_db()
+        manual.refresh_from_db()
+        self.assertEqual((nogeo.latitude, nogeo.geo_source), (Decimal('34.050000'), Location.GEO_POSTAL))
+        self.assertEqual(manual.latitude, Decimal('34.200000'))
+
+    def test_learn_from_deliveries_averages_gps(self):
+        stops = self.service.initialize_run_logistics(self.delivery_run.pk)
+        far = next(stop for stop in stops if stop.customer.party.code == 'FAR')
+        earlier_run = DeliveryRun.objects.create(
+            tenant=self.tenant, name='Run Q', truck=self.delivery_run.truck,
+            scheduled_date=timezone.now().date(), sequence=2,
+        )
+        DeliveryStop.objects.create(
+            tenant=self.tenant, run=earlier_run, customer=far.customer, ship_to=far.ship_to,
+            status='COMPLETED', gps_lat=Decimal('34.3100000'), gps_lng=Decimal('-118.0000000'),
+        )
+        DeliveryStop.objects.filter(pk=far.pk).update(
+            status='COMPLETED', gps_lat=Decimal('34.2900000'), gps_lng=Decimal('-118.0200000'),
+        )
+
+        updated = LocationGeocodeService(self.tenant).learn_from_deliveries()
+
+        self.assertEqual(updated, 1)
+        ship_to = self.ship_tos['FAR']
+        ship_to.refresh_from_db()
+        self.assertEqual(
+            (ship_to.latitude, ship_to.longitude, ship_to.geo_source),
+            (Decimal('34.300000'), Decimal('-118.010000'), Location.GEO_DELIVERY),
+        )
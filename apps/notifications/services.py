@@ -1,51 +1,50 @@
+from django.db import transaction
+
 from .models import Notification
 
+# Max event titles listed in a digest notification's message
+DIGEST_MAX_LINES = 5
 
-def notify_user(tenant, recipient, title, message='', link='', notification_type='INFO',
-                content_type=None, object_id=None):
-    """Create a notification for a user and broadcast via WebSocket."""
-    notification = Notification.objects.create(
-        tenant=tenant,
-        recipient=recipient,
-        title=title,
-        message=message,
-        link=link,
-        notification_type=notification_type,
-        content_type=content_type,
-        object_id=object_id,
-    )
 
-    # Also push via WebSocket for real-time delivery
-    try:
-        from apps.api.ws_signals import send_notification
-        send_notification(
-            user_id=recipient.pk,
-            notification_data={
-                'id': notification.pk,
-                'title': title,
-                'message': message,
-                'link': link,
-                'type': notification_type,
-                'created_at': notification.created_at.isoformat() if hasattr(notification, 'created_at') else '',
-            },
-        )
-    except Exception:
-        pass  # Never break the main flow
+class NotificationDispatcher:
+    """
+    Collect notifications for many recipients and deliver them together.
 
-    return notification
+    Queued notifications are written with one bulk_create; the WebSocket
+    pushes go out in one batched channel-layer call after the surrounding
+    transaction commits (immediately when not in a transaction), so a
+    rolled-back request never pushes a notification that doesn't exist.
 
+    With ``digest=True`` several events queued for the same user are
+    coalesced into a single "N new notifications" row.
 
-def notify_group(tenant, group_name, title, message='', link='', notification_type='INFO',
-                 content_type=None, object_id=None):
-    """Create notifications for all users in a group/role and broadcast via WebSocket."""
-    from django.contrib.auth import get_user_model
-    User = get_user_model()
-    users = User.objects.filter(groups__name=group_name)
-    notifications = []
-    for user in users:
-        notifications.append(Notification(
-            tenant=tenant,
-            recipient=user,
+    Usage:
+        with NotificationDispatcher(tenant) as dispatcher:
+            dispatcher.add_many(users, title='...', link='...')
+            dispatcher.add(owner, title='...')
+    """
+
+    def __init__(self, tenant, digest=False):
+        self.tenant = tenant
+        self.digest = digest
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.dispatch()
+        else:
+            self._pending = []
+        return False
+
+    def add(self, recipient, title, message='', link='', notification_type='INFO',
+            content_type=None, object_id=None):
+        """Queue one notification."""
+        self._pending.append(Notification(
+            tenant=self.tenant,
+            recipient=recipient,
             title=title,
             message=message,
             link=link,
@@ -53,27 +52,117 @@ def notify_group(tenant, group_name, title, message='', link='', notification_ty
             content_type=content_type,
             object_id=object_id,
         ))
-    created = Notification.objects.bulk_create(notifications)
 
-    # Also push each via WebSocket for real-time delivery
+    def add_many(self, recipients, title, message='', link='', notification_type='INFO',
+                 content_type=None, object_id=None):
+        """Queue the same notification for every recipient."""
+        for recipient in recipients:
+            self.add(
+                recipient, title, message=message, link=link,
+                notification_type=notification_type,
+                content_type=content_type, object_id=object_id,
+            )
+
+    def dispatch(self):
+        """Write queued notifications and schedule their WebSocket push."""
+        pending, self._pending = self._pending, []
+        if self.digest:
+            pending = self._coalesce(pending)
+        if not pending:
+            return []
+
+        created = Notification.objects.bulk_create(pending)
+        messages = [
+            (notif.recipient_id, _notification_data(notif))
+            for notif in created
+        ]
+        transaction.on_commit(lambda: _publish(messages))
+        return created
+
+    def _coalesce(self, pending):
+        """Merge notifications per recipient, keeping first-seen order."""
+        by_recipient = {}
+        for notif in pending:
+            by_recipient.setdefault(notif.recipient_id, []).append(notif)
+
+        merged = []
+        for notifs in by_recipient.values():
+            if len(notifs) == 1:
+                merged.append(notifs[0])
+                continue
+            first = notifs[0]
+            lines = [n.title for n in notifs[:DIGEST_MAX_LINES]]
+            if len(notifs) > DIGEST_MAX_LINES:
+                lines.append(f'...and {len(notifs) - DIGEST_MAX_LINES} more')
+            same_object = _all_same(notifs, 'content_type_id') and _all_same(notifs, 'object_id')
+            merged.append(Notification(
+                tenant=self.tenant,
+                recipient=first.recipient,
+                title=f'{len(notifs)} new notifications',
+                message='\n'.join(lines),
+                link=first.link if _all_same(notifs, 'link') else '',
+                notification_type=first.notification_type if _all_same(notifs, 'notification_type') else 'INFO',
+                content_type=first.content_type if same_object else None,
+                object_id=first.object_id if same_object else None,
+            ))
+        return merged
+
+
+def _all_same(notifications, attr):
+    return len({getattr(n, attr) for n in notifications}) == 1
+
+
+def _notification_data(notification):
+    return {
+        'id': notification.pk,
+        'title': notification.title,
+        'message': notification.message,
+        'link': notification.link,
+        'type': notification.notification_type,
+        'created_at': notification.created_at.isoformat() if notification.created_at else '',
+    }
+
+
+def _publish(messages):
     try:
-        from apps.api.ws_signals import send_notification
-        for notif in created:
-            try:
-                send_notification(
-                    user_id=notif.recipient_id,
-                    notification_data={
-                        'id': notif.pk,
-                        'title': title,
-                        'message': message,
-                        'link': link,
-                        'type': notification_type,
-                        'created_at': notif.created_at.isoformat() if hasattr(notif, 'created_at') else '',
-                    },
-                )
-            except Exception:
-                pass  # Skip individual failures
+        from apps.api.ws_signals import send_notifications
+        send_notifications(messages)
     except Exception:
         pass  # Never break the main flow
 
-    return created
+
+def notify_user(tenant, recipient, title, message='', link='', notification_type='INFO',
+                content_type=None, object_id=None):
+    """Create a notification for a user and broadcast via WebSocket."""
+    dispatcher = NotificationDispatcher(tenant)
+    dispatcher.add(
+        recipient, title, message=message, link=link,
+        notification_type=notification_type,
+        content_type=content_type, object_id=object_id,
+    )
+    return dispatcher.dispatch()[0]
+
+
+def notify_users(tenant, recipients, title, message='', link='', notification_type='INFO',
+                 content_type=None, object_id=None):
+    """Create the same notification for many users in one write and one broadcast."""
+    dispatcher = NotificationDispatcher(tenant)
+    dispatcher.add_many(
+        recipients, title, message=message, link=link,
+        notification_type=notification_type,
+        content_type=content_type, object_id=object_id,
+    )
+    return dispatcher.dispatch()
+
+
+def notify_group(tenant, group_name, title, message='', link='', notification_type='INFO',
+                 content_type=None, object_id=None):
+    """Create notifications for all users in a group/role and broadcast via WebSocket."""
+    from django.contrib.auth import get_user_model
+    User = get_user_model()
+    return notify_users(
+        tenant, User.objects.filter(groups__name=group_name),
+        title, message=message, link=link,
+        notification_type=notification_type,
+        content_type=content_type, object_id=object_id,
+    )
@@ -0,0 +1,69 @@
+"""
+Tests for notification fan-out (NotificationDispatcher, notify_group).
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+
+from apps.notifications.models import Notification
+from apps.notifications.services import NotificationDispatcher, notify_group, notify_user
+from shared.testing import BaseTestCase
+
+User = get_user_model()
+
+
+class NotificationDispatcherTestCase(BaseTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.group, _ = Group.objects.get_or_create(name='Purchasing')
+        cls.members = []
+        for i in range(3):
+            member = User.objects.create_user(username=f'buyer{i}', password='pass')
+            member.groups.add(cls.group)
+            cls.members.append(member)
+
+    @patch('apps.api.ws_signals.send_notifications')
+    def test_group_fan_out_single_write_and_single_push(self, mock_send):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(2):  # user query + bulk insert
+                created = notify_group(self.tenant, 'Purchasing', 'Reorder Alert', link='/items/1')
+
+        self.assertEqual(len(created), 3)
+        mock_send.assert_called_once()
+        messages = mock_send.call_args[0][0]
+        self.assertEqual(sorted(uid for uid, _ in messages), sorted(m.pk for m in self.members))
+        self.assertEqual(messages[0][1]['title'], 'Reorder Alert')
+
+    @patch('apps.api.ws_signals.send_notifications')
+    def test_push_waits_for_commit(self, mock_send):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            notify_user(self.tenant, self.user, 'Hello')
+        mock_send.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+
+    @patch('apps.api.ws_signals.send_notifications')
+    def test_digest_coalesces_per_user(self, mock_send):
+        with self.captureOnCommitCallbacks(execute=True):
+            with NotificationDispatcher(self.tenant, digest=True) as dispatcher:
+                for i in range(7):
+                    dispatcher.add(self.user, f'Event {i}', link='/orders/1')
+                dispatcher.add(self.members[0], 'Only one')
+
+        digest = Notification.objects.get(recipient=self.user)
+        self.assertEqual(digest.title, '7 new notifications')
+        self.assertEqual(digest.link, '/orders/1')
+        self.assertIn('...and 2 more', digest.message)
+        self.assertEqual(Notification.objects.get(recipient=self.members[0]).title, 'Only one')
+        self.assertEqual(len(mock_send.call_args[0][0]), 2)
+
+    @patch('apps.api.ws_signals.send_notifications')
+    def test_exception_in_block_discards_queue(self, mock_send):
+        with self.assertRaises(RuntimeError):
+            with NotificationDispatcher(self.tenant) as dispatcher:
+                dispatcher.add(self.user, 'Lost')
+                raise RuntimeError
+        self.assertFalse(Notification.objects.exists())
+        mock_send.assert_not_called()
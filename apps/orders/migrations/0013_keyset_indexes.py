@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('new_scheduling', '0003_priority_list_models'),
+        ('orders', '0012_salesorderline_quantity_invoiced'),
+        ('parties', '0009_widen_phone_fields'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='salesorder',
+            index=models.Index(fields=['tenant', 'order_date', 'id'], name='orders_sale_tenant__c4792e_idx'),
+        ),
+    ]
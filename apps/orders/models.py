@@ -12,7 +12,7 @@ Models:
 from decimal import Decimal
 from django.db import models
 from django.utils import timezone
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 from shared.models import TenantMixin, TimestampMixin
 
 
@@ -145,7 +145,7 @@ class PurchaseOrder(BaseOrder):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'po_number')]
@@ -321,13 +321,14 @@ class SalesOrder(BaseOrder):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'order_number')]
         indexes = [
             models.Index(fields=['tenant', 'order_number']),
             models.Index(fields=['tenant', 'customer', 'order_date']),
+            models.Index(fields=['tenant', 'order_date', 'id']),
             models.Index(fields=['tenant', 'scheduled_date', 'scheduled_truck']),
             models.Index(fields=['tenant', 'status']),
         ]
@@ -541,7 +542,7 @@ class Estimate(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'estimate_number')]
@@ -707,7 +708,7 @@ class RFQ(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'rfq_number')]
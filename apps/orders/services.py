@@ -136,6 +136,10 @@ def convert_estimate_to_order(estimate, tenant, user=None):
 
         # Mark estimate as converted
         Estimate.objects.filter(pk=estimate.pk).update(status='converted')
+        estimate.status = 'converted'
+        from apps.items.activity import ItemActivityService
+        from apps.items.models import ItemActivity
+        ItemActivityService.refresh_document(ItemActivity.ESTIMATE, estimate)
 
         # Record document lineage: estimate produced this sales order
         from apps.documents.models import record_link
@@ -199,6 +203,10 @@ def convert_estimate_to_contract(estimate, tenant, user=None):
 
         # Mark estimate as converted
         Estimate.objects.filter(pk=estimate.pk).update(status='converted')
+        estimate.status = 'converted'
+        from apps.items.activity import ItemActivityService
+        from apps.items.models import ItemActivity
+        ItemActivityService.refresh_document(ItemActivity.ESTIMATE, estimate)
 
         # Record document lineage: estimate produced this contract
         from apps.documents.models import record_link
@@ -291,6 +299,10 @@ def convert_rfq_to_po(rfq, tenant, user=None):
 
         # Mark RFQ as converted
         RFQ.objects.filter(pk=rfq.pk).update(status='converted')
+        rfq.status = 'converted'
+        from apps.items.activity import ItemActivityService
+        from apps.items.models import ItemActivity
+        ItemActivityService.refresh_document(ItemActivity.RFQ, rfq)
 
         # Record document lineage: RFQ produced this purchase order
         from apps.documents.models import record_link
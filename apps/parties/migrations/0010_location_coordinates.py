@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parties', '0009_widen_phone_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='geo_source',
+            field=models.CharField(blank=True, choices=[('postal', 'Postal code centroid'), ('delivery', 'Delivery GPS'), ('manual', 'Manual')], help_text='Where latitude/longitude came from', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Latitude for route sequencing', max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Longitude for route sequencing', max_digits=9, null=True),
+        ),
+    ]
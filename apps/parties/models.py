@@ -374,6 +374,11 @@ class Location(TenantMixin, TimestampMixin):
     - BILL_TO: Billing addresses
     - WAREHOUSE: Vendor's warehouse locations
     - OFFICE: Office locations
+
+    latitude/longitude place the location for route sequencing. geo_source
+    records where they came from, in increasing order of trust: a postal
+    code centroid, delivery GPS captures, or a manual entry (see
+    apps.logistics.services.LocationGeocodeService).
     """
     LOCATION_TYPES = [
         ('SHIP_TO', 'Ship To'),
@@ -382,6 +387,15 @@ class Location(TenantMixin, TimestampMixin):
         ('OFFICE', 'Office'),
     ]
 
+    GEO_POSTAL = 'postal'
+    GEO_DELIVERY = 'delivery'
+    GEO_MANUAL = 'manual'
+    GEO_SOURCE_CHOICES = [
+        (GEO_POSTAL, 'Postal code centroid'),
+        (GEO_DELIVERY, 'Delivery GPS'),
+        (GEO_MANUAL, 'Manual'),
+    ]
+
     party = models.ForeignKey(
         Party,
         on_delete=models.CASCADE,
@@ -442,6 +456,26 @@ class Location(TenantMixin, TimestampMixin):
         default=True,
         help_text="Inactive locations are hidden from selections"
     )
+    latitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        help_text="Latitude for route sequencing"
+    )
+    longitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        help_text="Longitude for route sequencing"
+    )
+    geo_source = models.CharField(
+        max_length=20,
+        choices=GEO_SOURCE_CHOICES,
+        blank=True,
+        help_text="Where latitude/longitude came from"
+    )
 
     class Meta:
         indexes = [
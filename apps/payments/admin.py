@@ -1,12 +1,12 @@
 # apps/payments/admin.py
 from django.contrib import admin
-from .models import CustomerPayment, PaymentApplication
+from .models import CustomerPayment, PaymentApplication, RemittanceBatch, RemittanceException
 
 
 class PaymentApplicationInline(admin.TabularInline):
     model = PaymentApplication
     extra = 0
-    fields = ['invoice', 'amount_applied']
+    fields = ['invoice', 'amount_applied', 'writeoff_amount']
     readonly_fields = ['invoice']
 
 
@@ -39,3 +39,17 @@ class PaymentApplicationAdmin(admin.ModelAdmin):
     list_display = ['payment', 'invoice', 'amount_applied']
     list_filter = ['payment__status']
     search_fields = ['payment__payment_number', 'invoice__invoice_number']
+
+
+class RemittanceExceptionInline(admin.TabularInline):
+    model = RemittanceException
+    extra = 0
+    fields = ['row_number', 'customer_code', 'reference_number', 'invoice_number', 'amount', 'reason']
+    readonly_fields = fields
+
+
+@admin.register(RemittanceBatch)
+class RemittanceBatchAdmin(admin.ModelAdmin):
+    list_display = ['id', 'file_name', 'payment_count', 'exception_count', 'total_amount', 'applied_amount', 'created_at']
+    readonly_fields = ['created_at', 'updated_at']
+    inlines = [RemittanceExceptionInline]
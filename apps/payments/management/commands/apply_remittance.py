@@ -0,0 +1,85 @@
+"""Management command to apply a bank remittance/lockbox file to open invoices."""
+import csv
+import os
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounting.models import Account
+from apps.payments.services import CashApplicationService
+from apps.tenants.models import Tenant
+from shared.managers import set_current_tenant
+
+EXCEPTION_COLUMNS = ['row', 'customer', 'reference', 'payment_date', 'invoice_number', 'amount', 'reason']
+
+
+class Command(BaseCommand):
+    help = (
+        'Auto-match a remittance CSV (reference, amount, and optionally customer, '
+        'invoice_number, payment_date, check_amount, payment_method) to open invoices '
+        'and post the matched payments. Unmatched payments are reported as exceptions.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='Path to the remittance CSV')
+        parser.add_argument(
+            '--tenant', type=str, required=True,
+            help='Subdomain of the tenant the remittance belongs to',
+        )
+        parser.add_argument('--deposit-account', type=str, default=None,
+                            help='Bank account code (default: the tenant\'s default cash account)')
+        parser.add_argument('--tolerance', type=str, default=None,
+                            help='Short/over-payment tolerance (default CASH_APPLICATION_TOLERANCE)')
+        parser.add_argument('--chunk-size', type=int, default=None,
+                            help='Payments per transaction (default CASH_APPLICATION_CHUNK_SIZE)')
+        parser.add_argument('--exceptions', type=str, default=None,
+                            help='Write the exceptions report to this CSV path')
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Match and report without posting anything',
+        )
+
+    def handle(self, *args, **options):
+        tenant = Tenant.objects.filter(subdomain=options['tenant']).first()
+        if tenant is None:
+            raise CommandError(f"Unknown tenant '{options['tenant']}'")
+        set_current_tenant(tenant)
+
+        deposit_account = None
+        if options['deposit_account']:
+            deposit_account = Account.objects.filter(tenant=tenant, code=options['deposit_account']).first()
+            if deposit_account is None:
+                raise CommandError(f"Unknown account '{options['deposit_account']}'")
+
+        service = CashApplicationService(
+            tenant, chunk_size=options['chunk_size'], tolerance=options['tolerance'],
+        )
+        try:
+            with open(options['file'], 'rb') as f:
+                result = service.apply_file(
+                    f,
+                    deposit_account=deposit_account,
+                    file_name=os.path.basename(options['file']),
+                    dry_run=options['dry_run'],
+                )
+        except (OSError, ValidationError) as e:
+            raise CommandError(e.messages[0] if isinstance(e, ValidationError) else str(e))
+
+        summary = result.to_dict()
+        verb = 'Matched' if options['dry_run'] else 'Posted'
+        self.stdout.write(
+            f"  {tenant.name}: {verb} {summary['matched']} payments ({summary['matched_amount']}), "
+            f"exceptions {summary['exceptions']} ({summary['exception_amount']})"
+        )
+        rows = result.exception_rows()
+        if options['exceptions']:
+            with open(options['exceptions'], 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=EXCEPTION_COLUMNS)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            for row in rows:
+                self.stdout.write(self.style.WARNING(f"    row {row['row']}: {row['reason']}"))
+
+        style = self.style.WARNING if rows else self.style.SUCCESS
+        self.stdout.write(style(f"Done. {summary['exceptions']} payments need manual application."))
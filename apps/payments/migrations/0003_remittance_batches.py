@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0004_keyset_indexes'),
+        ('payments', '0002_othername_check'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentapplication',
+            name='writeoff_amount',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Short-payment within tolerance written off to sales discounts', max_digits=12),
+        ),
+        migrations.CreateModel(
+            name='RemittanceBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('file_name', models.CharField(blank=True, max_length=255)),
+                ('payment_count', models.PositiveIntegerField(default=0, help_text='Payments posted from this file')),
+                ('exception_count', models.PositiveIntegerField(default=0, help_text='Payments left for manual application')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, help_text='Total of all payments in the file', max_digits=14)),
+                ('applied_amount', models.DecimalField(decimal_places=2, default=0, help_text='Total of the payments posted', max_digits=14)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='remittance_batches', to=settings.AUTH_USER_MODEL)),
+                ('deposit_account', models.ForeignKey(blank=True, help_text='Bank account the remittance was deposited into', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='remittance_batches', to='accounting.account')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name': 'Remittance Batch',
+                'verbose_name_plural': 'Remittance Batches',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='customerpayment',
+            name='remittance_batch',
+            field=models.ForeignKey(blank=True, help_text='Remittance file this payment was applied from (GL posted per batch)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payments', to='payments.remittancebatch'),
+        ),
+        migrations.AddField(
+            model_name='historicalcustomerpayment',
+            name='remittance_batch',
+            field=models.ForeignKey(blank=True, db_constraint=False, help_text='Remittance file this payment was applied from (GL posted per batch)', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='payments.remittancebatch'),
+        ),
+        migrations.CreateModel(
+            name='RemittanceException',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('row_number', models.PositiveIntegerField(help_text='Line number in the file')),
+                ('customer_code', models.CharField(blank=True, max_length=50)),
+                ('reference_number', models.CharField(blank=True, max_length=100)),
+                ('payment_date', models.DateField(blank=True, null=True)),
+                ('invoice_number', models.CharField(blank=True, max_length=50)),
+                ('amount', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('reason', models.CharField(max_length=255)),
+                ('batch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exceptions', to='payments.remittancebatch')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name': 'Remittance Exception',
+                'verbose_name_plural': 'Remittance Exceptions',
+                'ordering': ['batch', 'row_number'],
+            },
+        ),
+    ]
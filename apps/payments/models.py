@@ -5,12 +5,14 @@ Customer Payment (Cash Receipts) models.
 Models:
 - CustomerPayment: A single check/ACH payment from a customer
 - PaymentApplication: Links a payment to an invoice with an applied amount
+- RemittanceBatch: One bank remittance/lockbox file applied in bulk
+- RemittanceException: A remittance line that could not be auto-matched
 """
 from decimal import Decimal
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 from shared.models import TenantMixin, TimestampMixin
 
 
@@ -116,8 +118,16 @@ class CustomerPayment(TenantMixin, TimestampMixin):
         related_name='recorded_customer_payments',
         help_text="User who recorded this payment"
     )
+    remittance_batch = models.ForeignKey(
+        'RemittanceBatch',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='payments',
+        help_text="Remittance file this payment was applied from (GL posted per batch)"
+    )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Customer Payment"
@@ -163,6 +173,12 @@ class PaymentApplication(TenantMixin):
         decimal_places=2,
         help_text="Amount of this payment applied to this invoice"
     )
+    writeoff_amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        help_text="Short-payment within tolerance written off to sales discounts"
+    )
 
     class Meta:
         verbose_name = "Payment Application"
@@ -177,6 +193,90 @@ class PaymentApplication(TenantMixin):
         return f"{self.payment.payment_number} → {self.invoice.invoice_number}: ${self.amount_applied}"
 
 
+class RemittanceBatch(TenantMixin, TimestampMixin):
+    """
+    One remittance/lockbox file applied by CashApplicationService.
+
+    Matched payments point back here, and their GL impact is posted as one
+    journal entry per deposit account and payment date with this batch as
+    the source document.
+    """
+    file_name = models.CharField(max_length=255, blank=True)
+    deposit_account = models.ForeignKey(
+        'accounting.Account',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='remittance_batches',
+        help_text="Bank account the remittance was deposited into"
+    )
+    payment_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Payments posted from this file"
+    )
+    exception_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Payments left for manual application"
+    )
+    total_amount = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Total of all payments in the file"
+    )
+    applied_amount = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Total of the payments posted"
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='remittance_batches',
+    )
+
+    class Meta:
+        verbose_name = "Remittance Batch"
+        verbose_name_plural = "Remittance Batches"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Remittance {self.pk} ({self.file_name or 'upload'})"
+
+
+class RemittanceException(TenantMixin):
+    """
+    A remittance line the cash application engine could not match.
+
+    Every line of a payment with any unmatched line is recorded here and
+    nothing is posted for that payment, so the clerk can apply the whole
+    check by hand.
+    """
+    batch = models.ForeignKey(
+        RemittanceBatch,
+        on_delete=models.CASCADE,
+        related_name='exceptions',
+    )
+    row_number = models.PositiveIntegerField(help_text="Line number in the file")
+    customer_code = models.CharField(max_length=50, blank=True)
+    reference_number = models.CharField(max_length=100, blank=True)
+    payment_date = models.DateField(null=True, blank=True)
+    invoice_number = models.CharField(max_length=50, blank=True)
+    amount = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    reason = models.CharField(max_length=255)
+
+    class Meta:
+        verbose_name = "Remittance Exception"
+        verbose_name_plural = "Remittance Exceptions"
+        ordering = ['batch', 'row_number']
+
+    def __str__(self):
+        return f"Row {self.row_number}: {self.reason}"
+
+
 class OtherName(TenantMixin, TimestampMixin):
     """
     Outside service providers (not vendors) that checks can be written to.
@@ -7,18 +7,29 @@ PaymentService handles:
 - Posting payments (apply to invoices and create GL entries)
 - Voiding payments
 - Querying open invoices
+
+CashApplicationService applies whole remittance/lockbox files in bulk.
 """
-from decimal import Decimal
-from django.db import transaction
-from django.db.models import F
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F, Q
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.core.exceptions import ValidationError
-from django.contrib.contenttypes.models import ContentType
 
-from .models import CustomerPayment, PaymentApplication
-from apps.accounting.models import AccountingSettings, JournalEntry, JournalEntryLine
-from apps.accounting.services import AccountingService
+from .models import (
+    CustomerPayment, PaymentApplication, RemittanceBatch, RemittanceException,
+)
+from apps.accounting.models import AccountingSettings, JournalEntry
+from apps.accounting.services import AccountingError, AccountingService, EntryLineInput, GLPostingEngine
 from apps.documents.models import record_link
+from apps.items.activity import ItemActivityService
+from apps.items.models import ItemActivity
+from shared.history import bulk_create_with_history, bulk_update_with_history, deferred_history
 
 
 class PaymentService:
@@ -242,44 +253,30 @@ class PaymentService:
         unapplied = payment.amount - total_applied
 
         # Create GL journal entry
-        je_number = self._generate_je_number()
-
-        je = JournalEntry.objects.create(
-            tenant=self.tenant,
-            entry_number=je_number,
-            date=payment.payment_date,
-            memo=f"Cash receipt {payment.payment_number} - {payment.customer}",
-            reference_number=payment.reference_number,
-            entry_type='standard',
-            status='posted',
-            source_type=ContentType.objects.get_for_model(CustomerPayment),
-            source_id=payment.pk,
-            posted_at=timezone.now(),
-            posted_by=self.user,
-            created_by=self.user,
-        )
-
-        # DEBIT: Bank/Cash (money in)
-        JournalEntryLine.objects.create(
-            tenant=self.tenant,
-            entry=je,
-            line_number=10,
-            account=deposit_account,
-            description=f"Cash receipt {payment.payment_number}",
-            debit=payment.amount,
-            credit=Decimal('0.00'),
-        )
-
-        # CREDIT: A/R (reduce what customer owes)
-        JournalEntryLine.objects.create(
-            tenant=self.tenant,
-            entry=je,
-            line_number=20,
-            account=ar_account,
-            description=f"A/R - Customer payment {payment.payment_number}",
-            debit=Decimal('0.00'),
-            credit=payment.amount,
-        )
+        try:
+            je = GLPostingEngine(self.tenant, self.user).post(
+                entry_date=payment.payment_date,
+                memo=f"Cash receipt {payment.payment_number} - {payment.customer}",
+                lines=[
+                    # DEBIT: Bank/Cash (money in)
+                    EntryLineInput(
+                        account=deposit_account,
+                        description=f"Cash receipt {payment.payment_number}",
+                        debit=payment.amount,
+                    ),
+                    # CREDIT: A/R (reduce what customer owes)
+                    EntryLineInput(
+                        account=ar_account,
+                        description=f"A/R - Customer payment {payment.payment_number}",
+                        credit=payment.amount,
+                    ),
+                ],
+                reference_number=payment.reference_number,
+                source_document=payment,
+                number_prefix='CR',
+            )
+        except AccountingError as e:
+            raise ValidationError(str(e))
 
         # Update payment
         payment.status = 'posted'
@@ -321,9 +318,10 @@ class PaymentService:
             )
 
         # Reverse each application
-        for application in payment.applications.select_related('invoice').all():
+        applications = list(payment.applications.select_related('invoice').all())
+        for application in applications:
             invoice = Invoice.objects.select_for_update().get(pk=application.invoice_id)
-            invoice.amount_paid -= application.amount_applied
+            invoice.amount_paid -= application.amount_applied + application.writeoff_amount
             # Explicitly handle status reversal (save() only transitions forward)
             if invoice.amount_paid <= 0:
                 invoice.amount_paid = Decimal('0.00')
@@ -343,6 +341,10 @@ class PaymentService:
                 memo=f"Void customer payment {payment.payment_number}",
                 created_by=self.user
             )
+        elif payment.remittance_batch_id:
+            # Posted inside a consolidated remittance entry: reverse this
+            # payment's share of it
+            self._reverse_batch_payment(payment, applications)
 
         # Update payment status
         payment.status = 'void'
@@ -351,6 +353,47 @@ class PaymentService:
 
         return payment
 
+    def _reverse_batch_payment(self, payment, applications):
+        """Post the reversal of one payment's lines in its remittance entry."""
+        acct_settings = AccountingSettings.get_for_tenant(self.tenant)
+        writeoff = sum((app.writeoff_amount for app in applications), Decimal('0.00'))
+        invoice = applications[0].invoice if applications else None
+        ar_account_id = (
+            (invoice and invoice.ar_account_id)
+            or payment.customer.receivable_account_id
+            or acct_settings.default_ar_account_id
+        )
+        lines = [
+            EntryLineInput(
+                account_id=ar_account_id,
+                description=f"A/R - Void customer payment {payment.payment_number}",
+                debit=payment.amount + writeoff,
+            ),
+            EntryLineInput(
+                account_id=payment.deposit_account_id,
+                description=f"Void cash receipt {payment.payment_number}",
+                credit=payment.amount,
+            ),
+        ]
+        if writeoff:
+            lines.append(EntryLineInput(
+                account_id=acct_settings.default_sales_discount_account_id,
+                description=f"Void short-pay write-off {payment.payment_number}",
+                credit=writeoff,
+            ))
+        try:
+            GLPostingEngine(self.tenant, self.user).post(
+                entry_date=timezone.now().date(),
+                memo=f"Void customer payment {payment.payment_number}",
+                lines=lines,
+                reference_number=payment.reference_number,
+                entry_type=JournalEntry.EntryType.REVERSING,
+                source_document=payment,
+                number_prefix='CR',
+            )
+        except AccountingError as e:
+            raise ValidationError(str(e))
+
     # ===== QUERIES =====
 
     def get_open_invoices(self, customer_id):
@@ -386,11 +429,550 @@ class PaymentService:
         ).count() + 1
         return f"{date_part}-{count:05d}"
 
-    def _generate_je_number(self):
-        """Generate unique journal entry number for cash receipts."""
-        date_part = timezone.now().strftime('%Y%m')
-        count = JournalEntry.objects.filter(
+
+# =============================================================================
+# BULK CASH APPLICATION
+# =============================================================================
+
+REMITTANCE_REQUIRED_COLUMNS = ('reference', 'amount')
+REMITTANCE_COLUMNS = REMITTANCE_REQUIRED_COLUMNS + (
+    'customer', 'invoice_number', 'payment_date', 'check_amount', 'payment_method',
+)
+
+
+def _parse_amount(value):
+    """Decimal from a file cell ('1,250.00', '$80'); None if not a number."""
+    try:
+        return Decimal((value or '').replace(',', '').replace('$', '')).quantize(Decimal('0.01'))
+    except InvalidOperation:
+        return None
+
+
+@dataclass(eq=False)
+class _OpenInvoice:
+    """An indexed open invoice; ``balance`` shrinks as the file is matched."""
+    id: int
+    number: str
+    customer_id: int
+    due_date: date
+    balance: Decimal
+    ar_account_id: int
+
+
+@dataclass
+class Remittance:
+    """One check/ACH payment in a remittance file and how it was matched."""
+    reference: str
+    customer_code: str = ''
+    payment_date: date = None
+    payment_method: str = 'CHECK'
+    check_amount: Decimal = None
+    lines: list = field(default_factory=list)         # {'row', 'invoice_number', 'amount'}
+    customer_id: int = None
+    applications: dict = field(default_factory=dict)  # _OpenInvoice -> [applied, writeoff]
+    rules: list = field(default_factory=list)
+    reason: str = ''
+    payment: CustomerPayment = None
+
+    @property
+    def amount(self):
+        return sum((line['amount'] or Decimal('0.00') for line in self.lines), Decimal('0.00'))
+
+    @property
+    def applied(self):
+        return sum((applied for applied, _ in self.applications.values()), Decimal('0.00'))
+
+    @property
+    def writeoff(self):
+        return sum((writeoff for _, writeoff in self.applications.values()), Decimal('0.00'))
+
+
+@dataclass
+class CashApplicationResult:
+    """Payments posted (or, on a dry run, matched) and the exceptions report."""
+    batch: RemittanceBatch = None
+    matched: list = field(default_factory=list)
+    exceptions: list = field(default_factory=list)
+
+    def exception_rows(self):
+        """One row per file line of every unmatched payment, in file order."""
+        rows = []
+        for remittance in self.exceptions:
+            for line in remittance.lines:
+                rows.append({
+                    'row': line['row'],
+                    'customer': remittance.customer_code,
+                    'reference': remittance.reference,
+                    'payment_date': remittance.payment_date,
+                    'invoice_number': line['invoice_number'],
+                    'amount': line['amount'],
+                    'reason': remittance.reason,
+                })
+        return sorted(rows, key=lambda row: row['row'])
+
+    def to_dict(self):
+        return {
+            'batch': self.batch.pk if self.batch else None,
+            'matched': len(self.matched),
+            'exceptions': len(self.exceptions),
+            'matched_amount': sum((r.amount for r in self.matched), Decimal('0.00')),
+            'exception_amount': sum((r.amount for r in self.exceptions), Decimal('0.00')),
+            'payments': [
+                {
+                    'id': r.payment.pk if r.payment else None,
+                    'payment_number': r.payment.payment_number if r.payment else None,
+                    'reference': r.reference,
+                    'customer': r.customer_id,
+                    'amount': r.amount,
+                    'applied': r.applied,
+                    'writeoff': r.writeoff,
+                    'rules': sorted(set(r.rules)),
+                }
+                for r in self.matched
+            ],
+            'exception_rows': self.exception_rows(),
+        }
+
+
+class CashApplicationService:
+    """
+    Apply a bank remittance/lockbox file to open invoices in bulk.
+
+    Each file line is one payment (check/ACH, grouped by customer and
+    ``reference``) applied to one invoice. Open invoices for every customer
+    and invoice number in the file are loaded in one query and indexed by
+    invoice number, by customer (oldest due first) and by
+    (customer, balance), so matching thousands of payments needs no
+    further reads. Rules, per line:
+
+    - invoice number given: apply the line to that invoice. A short-pay
+      within ``tolerance`` is written off to the sales discount account;
+      an overpayment within ``tolerance`` stays unapplied on the payment;
+      a larger short-pay is applied as a partial payment.
+    - amount only: the oldest invoice with exactly that balance, else the
+      only invoice within ``tolerance`` of it, else the customer's whole
+      open balance if the amount settles it.
+
+    A payment posts only if every one of its lines matches (and its
+    ``check_amount``, when given, equals their total); otherwise all its
+    lines go to the exceptions report for manual application.
+
+    Matched payments post in chunks of ``chunk_size``, each in one
+    transaction: invoices are locked and re-checked in one query, payments,
+    applications and invoice balances are written in bulk, and the GL gets
+    one consolidated entry per payment date (DEBIT bank, DEBIT sales
+    discounts for write-offs, CREDIT A/R) instead of one per payment.
+
+    Usage:
+        svc = CashApplicationService(tenant, user)
+        result = svc.apply_file(upload, deposit_account=bank, file_name='lockbox.csv')
+        result.exception_rows()
+    """
+
+    def __init__(self, tenant, user=None, chunk_size=None, tolerance=None):
+        self.tenant = tenant
+        self.user = user
+        self.chunk_size = chunk_size or getattr(settings, 'CASH_APPLICATION_CHUNK_SIZE', 200)
+        if tolerance is None:
+            tolerance = getattr(settings, 'CASH_APPLICATION_TOLERANCE', '1.00')
+        self.tolerance = Decimal(str(tolerance))
+
+    # ===== ENTRY POINTS =====
+
+    def apply_file(self, file, deposit_account=None, file_name='', dry_run=False):
+        """
+        Parse a remittance CSV and apply it (see ``apply``).
+
+        Raises:
+            ValidationError: If the file can't be read or lacks required columns
+        """
+        from apps.core.importers.base import BaseCsvImporter
+
+        try:
+            rows, columns = BaseCsvImporter(self.tenant, self.user).load_csv(file)
+        except ValueError as e:
+            raise ValidationError(str(e))
+        columns = {(column or '').strip().lower() for column in columns}
+        missing = [column for column in REMITTANCE_REQUIRED_COLUMNS if column not in columns]
+        if missing:
+            raise ValidationError(f"Remittance file is missing columns: {', '.join(missing)}")
+        return self.apply(self.parse(rows), deposit_account, file_name=file_name, dry_run=dry_run)
+
+    def parse(self, rows):
+        """Group file rows (dicts) into Remittance objects; row 1 is the header."""
+        methods = {code for code, _ in CustomerPayment.PAYMENT_METHOD_CHOICES}
+        today = timezone.now().date()
+        remittances = {}
+        for row_number, raw in enumerate(rows, start=2):
+            row = {(key or '').strip().lower(): (value or '').strip() for key, value in raw.items()}
+            reference = row.get('reference', '')
+            customer_code = row.get('customer', '')
+            # Lines without a reference can't be grouped: each is its own payment
+            key = (customer_code, reference) if reference else (customer_code, row_number)
+            remittance = remittances.get(key)
+            if remittance is None:
+                remittance = remittances[key] = Remittance(
+                    reference=reference, customer_code=customer_code, payment_date=today,
+                )
+
+            amount = _parse_amount(row.get('amount'))
+            remittance.lines.append({
+                'row': row_number,
+                'invoice_number': row.get('invoice_number', ''),
+                'amount': amount,
+            })
+            if amount is None or amount <= 0:
+                remittance.reason = remittance.reason or (
+                    f"Row {row_number}: invalid amount '{row.get('amount', '')}'"
+                )
+            if row.get('payment_date'):
+                payment_date = parse_date(row['payment_date'])
+                if payment_date is None:
+                    remittance.reason = remittance.reason or (
+                        f"Row {row_number}: invalid payment date '{row['payment_date']}'"
+                    )
+                else:
+                    remittance.payment_date = payment_date
+            if row.get('check_amount'):
+                remittance.check_amount = _parse_amount(row['check_amount'])
+            if row.get('payment_method', '').upper() in methods:
+                remittance.payment_method = row['payment_method'].upper()
+        return list(remittances.values())
+
+    def apply(self, remittances, deposit_account=None, file_name='', dry_run=False):
+        """
+        Match ``remittances`` to open invoices and post the matched ones.
+
+        Args:
+            remittances: Remittance objects (see ``parse``)
+            deposit_account: Bank Account (falls back to the tenant default)
+            file_name: Recorded on the RemittanceBatch
+            dry_run: Only match; write nothing
+
+        Returns:
+            CashApplicationResult
+        """
+        acct_settings = AccountingSettings.get_for_tenant(self.tenant)
+        deposit_account = deposit_account or acct_settings.default_cash_account
+        if not deposit_account:
+            raise ValidationError(
+                "No deposit account specified and no default configured in Accounting Settings."
+            )
+        self._writeoff_account_id = acct_settings.default_sales_discount_account_id
+        self._load_indexes(remittances, acct_settings.default_ar_account_id)
+
+        result = CashApplicationResult()
+        for remittance in remittances:
+            if not remittance.reason:
+                self._match(remittance)
+            (result.exceptions if remittance.reason else result.matched).append(remittance)
+        if dry_run:
+            return result
+
+        batch = RemittanceBatch.objects.create(
             tenant=self.tenant,
-            entry_number__startswith=f"CR-JE-{date_part}",
-        ).count() + 1
-        return f"CR-JE-{date_part}-{count:05d}"
+            file_name=file_name[:255],
+            deposit_account=deposit_account,
+            total_amount=sum((r.amount for r in remittances), Decimal('0.00')),
+            created_by=self.user,
+        )
+        result.batch = batch
+        matched, result.matched = result.matched, []
+        for start in range(0, len(matched), self.chunk_size):
+            chunk = matched[start:start + self.chunk_size]
+            try:
+                self._post_chunk(batch, chunk, deposit_account)
+            except (ValidationError, AccountingError, DatabaseError) as e:
+                message = e.messages[0] if getattr(e, 'messages', None) else str(e)
+                for remittance in chunk:
+                    remittance.payment = None
+                    remittance.reason = remittance.reason or f"Posting failed: {message}"
+            for remittance in chunk:
+                (result.matched if remittance.payment else result.exceptions).append(remittance)
+
+        RemittanceException.objects.bulk_create([
+            RemittanceException(tenant=self.tenant, batch=batch, **{
+                'row_number': row['row'],
+                'customer_code': row['customer'][:50],
+                'reference_number': row['reference'][:100],
+                'payment_date': row['payment_date'],
+                'invoice_number': row['invoice_number'][:50],
+                'amount': row['amount'],
+                'reason': row['reason'][:255],
+            })
+            for row in result.exception_rows()
+        ], batch_size=500)
+        batch.payment_count = len(result.matched)
+        batch.exception_count = len(result.exceptions)
+        batch.applied_amount = sum((r.amount for r in result.matched), Decimal('0.00'))
+        batch.save(update_fields=['payment_count', 'exception_count', 'applied_amount', 'updated_at'])
+        return result
+
+    # ===== MATCHING =====
+
+    def _load_indexes(self, remittances, default_ar_account_id):
+        """Load every open invoice the file can refer to, in one query."""
+        from apps.invoicing.models import Invoice
+        from apps.invoicing.services import OpenItemService
+        from apps.parties.models import Customer
+
+        codes = {r.customer_code for r in remittances if r.customer_code}
+        self._customers = dict(
+            Customer.objects.filter(tenant=self.tenant, party__code__in=codes)
+            .values_list('party__code', 'pk')
+        )
+        numbers = {line['invoice_number'] for r in remittances for line in r.lines if line['invoice_number']}
+        rows = Invoice.objects.filter(
+            tenant=self.tenant,
+            status__in=OpenItemService.AR_OPEN_STATUSES,
+            total_amount__gt=F('amount_paid'),
+        ).filter(
+            Q(customer_id__in=self._customers.values()) | Q(invoice_number__in=numbers)
+        ).order_by('due_date', 'pk').values_list(
+            'pk', 'invoice_number', 'customer_id', 'due_date', 'total_amount', 'amount_paid',
+            'ar_account_id', 'customer__receivable_account_id',
+        )
+
+        self._by_number = {}
+        self._by_customer = defaultdict(list)
+        self._by_amount = defaultdict(list)
+        for pk, number, customer_id, due_date, total, paid, ar_id, customer_ar_id in rows:
+            invoice = _OpenInvoice(
+                pk, number, customer_id, due_date, total - paid,
+                ar_id or customer_ar_id or default_ar_account_id,
+            )
+            self._by_number[number] = invoice
+            self._by_customer[customer_id].append(invoice)
+            self._by_amount[(customer_id, invoice.balance)].append(invoice)
+
+    def _match(self, remittance):
+        """Fill ``remittance.applications``, or set ``remittance.reason``."""
+        if remittance.customer_code:
+            remittance.customer_id = self._customers.get(remittance.customer_code)
+            if remittance.customer_id is None:
+                remittance.reason = f"Unknown customer code '{remittance.customer_code}'"
+                return
+        if remittance.check_amount is not None and remittance.check_amount != remittance.amount:
+            remittance.reason = (
+                f"Check amount {remittance.check_amount} does not equal "
+                f"remittance detail total {remittance.amount}"
+            )
+            return
+
+        pending = defaultdict(lambda: [Decimal('0.00'), Decimal('0.00')])
+        for line in remittance.lines:
+            if line['invoice_number']:
+                reason = self._match_invoice_number(remittance, line, pending)
+            else:
+                reason = self._match_amount(remittance, line['amount'], pending)
+            if reason:
+                remittance.reason = f"Row {line['row']}: {reason}"
+                remittance.rules = []
+                return
+
+        # Commit the match to the in-memory balances so later payments in
+        # the file can't claim the same open amount.
+        remittance.applications = {
+            invoice: amounts for invoice, amounts in pending.items() if any(amounts)
+        }
+        for invoice, (applied, writeoff) in remittance.applications.items():
+            candidates = self._by_amount[(invoice.customer_id, invoice.balance)]
+            if invoice in candidates:
+                candidates.remove(invoice)
+            invoice.balance -= applied + writeoff
+            if invoice.balance > 0:
+                self._by_amount[(invoice.customer_id, invoice.balance)].append(invoice)
+
+    def _match_invoice_number(self, remittance, line, pending):
+        invoice = self._by_number.get(line['invoice_number'])
+        if invoice is None:
+            return f"invoice {line['invoice_number']} not found or not open"
+        if remittance.customer_id is None:
+            remittance.customer_id = invoice.customer_id
+        elif invoice.customer_id != remittance.customer_id:
+            return f"invoice {invoice.number} belongs to another customer"
+        return self._apply_line(remittance, invoice, line['amount'], pending)
+
+    def _match_amount(self, remittance, amount, pending):
+        if remittance.customer_id is None:
+            return "no invoice number or customer code to match on"
+
+        def open_balance(invoice):
+            return invoice.balance - sum(pending[invoice])
+
+        for invoice in self._by_amount.get((remittance.customer_id, amount), []):
+            if open_balance(invoice) == amount:
+                return self._apply_line(remittance, invoice, amount, pending)
+
+        invoices = [i for i in self._by_customer.get(remittance.customer_id, []) if open_balance(i) > 0]
+        near = [i for i in invoices if 0 < open_balance(i) - amount <= self.tolerance]
+        if len(near) == 1:
+            return self._apply_line(remittance, near[0], amount, pending)
+        if invoices and sum(open_balance(i) for i in invoices) == amount:
+            for invoice in invoices:
+                self._apply_line(remittance, invoice, open_balance(invoice), pending)
+            remittance.rules.append('account_balance')
+            return None
+        return f"no open invoice matches {amount}"
+
+    def _apply_line(self, remittance, invoice, amount, pending):
+        """Apply ``amount`` to ``invoice``; returns a reason if it can't."""
+        open_balance = invoice.balance - sum(pending[invoice])
+        if open_balance <= 0:
+            return f"invoice {invoice.number} is already paid"
+        difference = open_balance - amount
+        if difference < -self.tolerance:
+            return f"{amount} exceeds the {open_balance} due on invoice {invoice.number}"
+        if difference < 0:
+            applied, writeoff, rule = open_balance, Decimal('0.00'), 'overpaid'
+        elif difference == 0:
+            applied, writeoff, rule = amount, Decimal('0.00'), 'exact'
+        elif difference <= self.tolerance and self._writeoff_account_id:
+            applied, writeoff, rule = amount, difference, 'short_pay'
+        else:
+            applied, writeoff, rule = amount, Decimal('0.00'), 'partial'
+        pending[invoice][0] += applied
+        pending[invoice][1] += writeoff
+        remittance.rules.append(rule)
+        return None
+
+    # ===== POSTING =====
+
+    def _post_chunk(self, batch, chunk, deposit_account):
+        """Post one chunk of matched remittances in a single transaction."""
+        from django.contrib.contenttypes.models import ContentType
+        from apps.documents.models import DocumentLink
+        from apps.invoicing.models import Invoice
+        from apps.invoicing.services import OpenItemService
+
+        with transaction.atomic(), deferred_history():
+            invoices = Invoice.objects.select_for_update().filter(
+                tenant=self.tenant,
+                pk__in={invoice.id for r in chunk for invoice in r.applications},
+            ).in_bulk()
+
+            # Cash may have been applied by hand since the file was matched
+            ready = []
+            for remittance in chunk:
+                stale = [
+                    invoice.number for invoice, (applied, writeoff) in remittance.applications.items()
+                    if invoices[invoice.id].status not in OpenItemService.AR_OPEN_STATUSES
+                    or invoices[invoice.id].total_amount - invoices[invoice.id].amount_paid < applied + writeoff
+                ]
+                if stale:
+                    remittance.reason = f"Invoice {stale[0]} changed while the file was being applied"
+                    continue
+                for invoice, (applied, writeoff) in remittance.applications.items():
+                    invoices[invoice.id].amount_paid += applied + writeoff
+                ready.append(remittance)
+            if not ready:
+                return
+
+            numbers = self._payment_numbers(len(ready))
+            payments = bulk_create_with_history([
+                CustomerPayment(
+                    tenant=self.tenant,
+                    customer_id=remittance.customer_id,
+                    payment_number=next(numbers),
+                    payment_date=remittance.payment_date,
+                    amount=remittance.amount,
+                    payment_method=remittance.payment_method,
+                    reference_number=remittance.reference[:100],
+                    deposit_account=deposit_account,
+                    status='posted',
+                    unapplied_amount=remittance.amount - remittance.applied,
+                    recorded_by=self.user,
+                    remittance_batch=batch,
+                )
+                for remittance in ready
+            ], CustomerPayment, batch_size=500, default_user=self.user)
+
+            applications, links, touched = [], [], {}
+            payment_ct = ContentType.objects.get_for_model(CustomerPayment)
+            invoice_ct = ContentType.objects.get_for_model(Invoice)
+            for remittance, payment in zip(ready, payments):
+                remittance.payment = payment
+                for invoice, (applied, writeoff) in remittance.applications.items():
+                    touched[invoice.id] = invoices[invoice.id]
+                    applications.append(PaymentApplication(
+                        tenant=self.tenant,
+                        payment=payment,
+                        invoice_id=invoice.id,
+                        amount_applied=applied,
+                        writeoff_amount=writeoff,
+                    ))
+                    links.append(DocumentLink(
+                        tenant=self.tenant,
+                        source_content_type=payment_ct,
+                        source_object_id=payment.pk,
+                        target_content_type=invoice_ct,
+                        target_object_id=invoice.id,
+                        relation='payment_for_invoice',
+                        created_by=self.user,
+                    ))
+            PaymentApplication.objects.bulk_create(applications, batch_size=500)
+            DocumentLink.objects.bulk_create(links, batch_size=500, ignore_conflicts=True)
+
+            # Same status transitions as Invoice.save(), which bulk_update skips
+            now = timezone.now()
+            for invoice in touched.values():
+                if invoice.amount_paid >= invoice.total_amount:
+                    invoice.status = 'paid'
+                elif invoice.status in ('posted', 'sent', 'overdue'):
+                    invoice.status = 'partial'
+                invoice.updated_at = now
+            bulk_update_with_history(
+                list(touched.values()), Invoice, ['amount_paid', 'status', 'updated_at'],
+                batch_size=500, default_user=self.user,
+            )
+            OpenItemService(self.tenant).sync_invoices(list(touched.values()))
+            ItemActivityService.refresh_statuses(ItemActivity.INVOICE, touched.values())
+
+            self._post_gl(batch, ready, deposit_account)
+
+    def _post_gl(self, batch, remittances, deposit_account):
+        """One journal entry per payment date for the chunk."""
+        by_date = defaultdict(list)
+        for remittance in remittances:
+            by_date[remittance.payment_date].append(remittance)
+
+        engine = GLPostingEngine(self.tenant, self.user)
+        for payment_date, group in sorted(by_date.items()):
+            received = sum((r.amount for r in group), Decimal('0.00'))
+            writeoff = sum((r.writeoff for r in group), Decimal('0.00'))
+            ar_credits = defaultdict(Decimal)
+            for remittance in group:
+                # As in post_payment, a payment's A/R account is its first invoice's
+                ar_account_id = next(iter(remittance.applications)).ar_account_id
+                ar_credits[ar_account_id] += remittance.amount + remittance.writeoff
+
+            lines = [EntryLineInput(
+                account=deposit_account,
+                description=f"Cash receipts - remittance {batch.pk}",
+                debit=received,
+            )]
+            if writeoff:
+                lines.append(EntryLineInput(
+                    account_id=self._writeoff_account_id,
+                    description=f"Short-pay write-offs - remittance {batch.pk}",
+                    debit=writeoff,
+                ))
+            for ar_account_id, credit in ar_credits.items():
+                lines.append(EntryLineInput(
+                    account_id=ar_account_id,
+                    description=f"A/R - {len(group)} customer payments",
+                    credit=credit,
+                ))
+            engine.post(
+                entry_date=payment_date,
+                memo=f"Remittance {batch.pk}: {len(group)} cash receipts",
+                lines=lines,
+                reference_number=batch.file_name[:100],
+                source_document=batch,
+                number_prefix='CR',
+            )
+
+    def _payment_numbers(self, count):
+        """``count`` consecutive payment numbers, counted once per chunk."""
+        date_part, first = PaymentService(self.tenant)._generate_payment_number().rsplit('-', 1)
+        return iter([f"{date_part}-{seq:05d}" for seq in range(int(first), int(first) + count)])
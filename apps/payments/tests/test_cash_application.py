@@ -0,0 +1,188 @@
+# apps/payments/tests/test_cash_application.py
+"""
+Tests for CashApplicationService: remittance matching rules, bulk posting,
+consolidated GL entries and the exceptions report.
+"""
+import io
+from decimal import Decimal
+
+from apps.accounting.models import Account, AccountType, AccountingSettings, JournalEntry
+from apps.invoicing.models import Invoice, OpenItem
+from apps.payments.models import CustomerPayment, PaymentApplication, RemittanceBatch, RemittanceException
+from apps.payments.services import CashApplicationService
+
+from .test_services import PaymentBaseTestCase
+
+HEADER = 'customer,reference,invoice_number,amount,payment_date,check_amount\n'
+
+
+def remittance(*rows):
+    return io.BytesIO((HEADER + ''.join(f'{row}\n' for row in rows)).encode())
+
+
+class CashApplicationTest(PaymentBaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.discount_account = Account.objects.create(
+            tenant=self.tenant, code='4900', name='Sales Discounts',
+            account_type=AccountType.REVENUE,
+        )
+        acct = AccountingSettings.get_for_tenant(self.tenant)
+        acct.default_sales_discount_account = self.discount_account
+        acct.save()
+        self.cash_app = CashApplicationService(self.tenant, self.user, tolerance='5.00')
+
+    def _apply(self, *rows, **kwargs):
+        return self.cash_app.apply_file(remittance(*rows), file_name='lockbox.csv', **kwargs)
+
+    def test_exact_invoice_number_match_posts_payment(self):
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(f'PC1,1001,{invoice.invoice_number},500.00,,')
+
+        self.assertEqual(len(result.matched), 1)
+        self.assertEqual(result.exceptions, [])
+        payment = result.matched[0].payment
+        self.assertEqual(payment.status, 'posted')
+        self.assertEqual(payment.remittance_batch, result.batch)
+        invoice.refresh_from_db()
+        self.assertEqual(invoice.status, 'paid')
+        self.assertEqual(invoice.amount_paid, Decimal('500.00'))
+        self.assertFalse(OpenItem.objects.filter(invoice=invoice).exists())
+
+    def test_one_check_across_several_invoices(self):
+        first = self._make_posted_invoice(Decimal('300.00'))
+        second = self._make_posted_invoice(Decimal('200.00'))
+        result = self._apply(
+            f'PC1,1002,{first.invoice_number},300.00,,450.00',
+            f'PC1,1002,{second.invoice_number},150.00,,',
+        )
+        self.assertEqual(len(result.matched), 1)
+        payment = result.matched[0].payment
+        self.assertEqual(payment.amount, Decimal('450.00'))
+        self.assertEqual(payment.applications.count(), 2)
+        second.refresh_from_db()
+        self.assertEqual(second.status, 'partial')
+        self.assertEqual(OpenItem.objects.get(invoice=second).open_amount, Decimal('50.00'))
+
+    def test_check_amount_mismatch_is_exception(self):
+        invoice = self._make_posted_invoice(Decimal('300.00'))
+        result = self._apply(f'PC1,1003,{invoice.invoice_number},300.00,,310.00')
+        self.assertEqual(result.matched, [])
+        self.assertIn('Check amount', result.exceptions[0].reason)
+
+    def test_short_pay_within_tolerance_is_written_off(self):
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(f'PC1,1004,{invoice.invoice_number},497.00,,')
+
+        application = PaymentApplication.objects.get(invoice=invoice)
+        self.assertEqual(application.amount_applied, Decimal('497.00'))
+        self.assertEqual(application.writeoff_amount, Decimal('3.00'))
+        invoice.refresh_from_db()
+        self.assertEqual(invoice.status, 'paid')
+        self.assertEqual(result.matched[0].rules, ['short_pay'])
+
+    def test_overpay_within_tolerance_stays_unapplied(self):
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(f'PC1,1005,{invoice.invoice_number},502.00,,')
+        payment = result.matched[0].payment
+        self.assertEqual(payment.unapplied_amount, Decimal('2.00'))
+        self.assertEqual(PaymentApplication.objects.get(invoice=invoice).amount_applied, Decimal('500.00'))
+
+    def test_overpay_beyond_tolerance_is_exception(self):
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(f'PC1,1006,{invoice.invoice_number},600.00,,')
+        self.assertEqual(result.matched, [])
+        self.assertIn('exceeds', result.exceptions[0].reason)
+
+    def test_amount_only_matches_oldest_invoice_with_that_balance(self):
+        first = self._make_posted_invoice(Decimal('200.00'))
+        self._make_posted_invoice(Decimal('300.00'))
+        second = self._make_posted_invoice(Decimal('200.00'))
+        Invoice.objects.filter(pk=second.pk).update(due_date=first.due_date.replace(year=first.due_date.year + 1))
+
+        self._apply('PC1,1007,,200.00,,', 'PC1,1008,,200.00,,')
+        self.assertEqual(
+            list(PaymentApplication.objects.order_by('payment__reference_number').values_list('invoice_id', flat=True)),
+            [first.pk, second.pk],
+        )
+
+    def test_amount_only_settles_whole_account_balance(self):
+        self._make_posted_invoice(Decimal('200.00'))
+        self._make_posted_invoice(Decimal('300.00'))
+        result = self._apply('PC1,1009,,500.00,,')
+        self.assertIn('account_balance', result.matched[0].rules)
+        self.assertEqual(PaymentApplication.objects.count(), 2)
+
+    def test_unmatched_lines_go_to_exceptions_report(self):
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(
+            f'PC1,1010,{invoice.invoice_number},100.00,,',
+            'PC1,1010,NOPE-1,50.00,,',
+            'ZZZ,1011,,75.00,,',
+            'PC1,1012,,abc,,',
+        )
+        self.assertEqual(result.matched, [])
+        rows = result.exception_rows()
+        self.assertEqual([row['row'] for row in rows], [2, 3, 4, 5])
+        self.assertIn('NOPE-1 not found', rows[0]['reason'])
+        self.assertIn("Unknown customer code 'ZZZ'", rows[2]['reason'])
+        self.assertIn('invalid amount', rows[3]['reason'])
+        # Nothing was posted for the partly-matched check
+        invoice.refresh_from_db()
+        self.assertEqual(invoice.amount_paid, Decimal('0.00'))
+        self.assertEqual(RemittanceException.objects.filter(batch=result.batch).count(), 4)
+        self.assertEqual(result.batch.exception_count, 3)
+
+    def test_dry_run_writes_nothing(self):
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(f'PC1,1013,{invoice.invoice_number},500.00,,', dry_run=True)
+        self.assertEqual(len(result.matched), 1)
+        self.assertIsNone(result.batch)
+        self.assertFalse(CustomerPayment.objects.exists())
+        self.assertFalse(RemittanceBatch.objects.exists())
+
+    def test_gl_consolidated_per_payment_date_and_chunk(self):
+        invoices = [self._make_posted_invoice(Decimal('100.00')) for _ in range(3)]
+        self._apply(
+            f'PC1,2001,{invoices[0].invoice_number},100.00,2026-03-02,',
+            f'PC1,2002,{invoices[1].invoice_number},98.00,2026-03-02,',
+            f'PC1,2003,{invoices[2].invoice_number},100.00,2026-03-03,',
+        )
+        entries = JournalEntry.objects.filter(entry_number__startswith='CR').order_by('date')
+        self.assertEqual(entries.count(), 2)
+        lines = {(line.account_id, line.debit, line.credit) for line in entries[0].lines.all()}
+        self.assertEqual(lines, {
+            (self.cash_account.pk, Decimal('198.00'), Decimal('0.00')),
+            (self.discount_account.pk, Decimal('2.00'), Decimal('0.00')),
+            (self.ar_account.pk, Decimal('0.00'), Decimal('200.00')),
+        })
+
+    def test_payments_post_in_chunks(self):
+        invoices = [self._make_posted_invoice(Decimal('100.00')) for _ in range(5)]
+        service = CashApplicationService(self.tenant, self.user, chunk_size=2)
+        result = service.apply_file(remittance(*[
+            f'PC1,{3000 + i},{invoice.invoice_number},100.00,,' for i, invoice in enumerate(invoices)
+        ]))
+        self.assertEqual(len(result.matched), 5)
+        self.assertEqual(
+            len({p.payment_number for p in CustomerPayment.objects.all()}), 5,
+        )
+        self.assertEqual(JournalEntry.objects.filter(entry_number__startswith='CR').count(), 3)
+
+    def test_void_batch_payment_reverses_its_share(self):
+        from apps.payments.services import PaymentService
+
+        invoice = self._make_posted_invoice(Decimal('500.00'))
+        result = self._apply(f'PC1,4001,{invoice.invoice_number},497.00,,')
+        payment = result.matched[0].payment
+
+        PaymentService(self.tenant, self.user).void_payment(payment.pk)
+        invoice.refresh_from_db()
+        self.assertEqual(invoice.amount_paid, Decimal('0.00'))
+        self.assertEqual(invoice.status, 'posted')
+        reversal = JournalEntry.objects.get(entry_type=JournalEntry.EntryType.REVERSING)
+        self.assertEqual(
+            sum(line.debit for line in reversal.lines.filter(account=self.ar_account)),
+            Decimal('500.00'),
+        )
@@ -15,7 +15,7 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from shared.models import TenantMixin, TimestampMixin
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 
 
 class PriceListHead(TenantMixin, TimestampMixin):
@@ -66,7 +66,7 @@ class PriceListHead(TenantMixin, TimestampMixin):
     )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         verbose_name = "Price List"
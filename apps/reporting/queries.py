@@ -6,7 +6,9 @@ suitable for JSON serialization.
 """
 from decimal import Decimal
 from datetime import date, timedelta
-from django.db.models import Sum, Count, Avg, F, Q, Min, Max, DecimalField
+from django.db.models import (
+    Sum, Count, Avg, F, Q, Min, Max, DecimalField, ExpressionWrapper, OuterRef, Subquery,
+)
 from django.db.models.functions import Coalesce
 
 
@@ -240,159 +242,183 @@ def purchase_history(tenant, start_date, end_date):
 
 # ==================== WAREHOUSE & INVENTORY REPORTS ====================
 
-def inventory_valuation(tenant):
-    """List all items -> Qty * Cost = Total Value."""
+# The warehouse reports are each one SQL statement over Item, with per-item
+# totals joined in as correlated subqueries, streamed through generators
+# (iter_*). The list-returning functions wrap the generators for the JSON
+# views; CSV exports and PDFs consume the same streams.
+
+_QTY = DecimalField(max_digits=14, decimal_places=4)
+_ZERO = Decimal('0')
+
+VALUATION_METHODS = ('average', 'fifo')
+
+
+def _per_item(queryset, expression, aggregate=Sum):
+    """Correlated subquery: ``aggregate(expression)`` of queryset rows for the outer item."""
+    return Subquery(
+        queryset.filter(item=OuterRef('pk')).order_by().values('item').annotate(
+            value=aggregate(expression),
+        ).values('value')[:1],
+        output_field=_QTY,
+    )
+
+
+def _stocked_items(tenant, **totals):
+    """Items with positive on-hand stock, annotated with qty_on_hand and ``totals``."""
+    from apps.items.models import Item
     from apps.warehousing.models import StockQuant
+
+    quants = StockQuant.objects.filter(tenant=tenant, quantity__gt=0)
+    return Item.objects.filter(tenant=tenant).annotate(
+        qty_on_hand=_per_item(quants, 'quantity'),
+        **totals,
+    ).filter(qty_on_hand__gt=0)
+
+
+def iter_inventory_valuation(tenant, method='average'):
+    """
+    Yield valuation rows (qty x unit cost) per stocked item, by SKU.
+
+    ``method='average'`` costs at the average PO line unit cost.
+    ``method='fifo'`` costs at the remaining FIFO ``InventoryLayer`` cost
+    (weighted over layers still holding stock), falling back to the average
+    PO cost for items without open layers.
+    """
+    from apps.inventory.models import InventoryLayer
     from apps.orders.models import PurchaseOrderLine
+    from apps.warehousing.models import StockQuant
 
-    # Get on-hand quantities by item
-    quants = StockQuant.objects.filter(
-        tenant=tenant,
-        quantity__gt=0,
-    ).values(
-        item_sku=F('item__sku'),
-        item_name=F('item__name'),
-    ).annotate(
-        qty_on_hand=Sum('quantity'),
-    ).order_by('item_sku')
+    if method not in VALUATION_METHODS:
+        raise ValueError(f'Unknown valuation method {method!r}')
 
-    # Get average cost per item from purchase history
-    costs = PurchaseOrderLine.objects.filter(
-        tenant=tenant,
-    ).values('item__sku').annotate(
-        latest_cost=Avg('unit_cost'),
-    )
-    cost_map = {c['item__sku']: c['latest_cost'] for c in costs}
+    totals = {
+        'avg_cost': _per_item(PurchaseOrderLine.objects.filter(tenant=tenant), 'unit_cost', Avg),
+    }
+    if method == 'fifo':
+        layers = InventoryLayer.objects.filter(tenant=tenant, quantity_remaining__gt=0)
+        totals['layer_qty'] = _per_item(layers, 'quantity_remaining')
+        totals['layer_value'] = _per_item(layers, F('quantity_remaining') * F('unit_cost'))
 
-    rows = []
-    grand_total = Decimal('0')
-    for q in quants:
-        cost = cost_map.get(q['item_sku'], Decimal('0'))
-        value = q['qty_on_hand'] * cost
-        grand_total += value
-        rows.append({
-            'item_sku': q['item_sku'],
-            'item_name': q['item_name'],
-            'qty_on_hand': str(q['qty_on_hand']),
+    rows = _stocked_items(tenant, **totals).order_by('sku').values(
+        'sku', 'name', 'qty_on_hand', *totals,
+    )
+    for row in rows.iterator(chunk_size=500):
+        cost = row['avg_cost'] or _ZERO
+        if row.get('layer_qty'):
+            cost = row['layer_value'] / row['layer_qty']
+        yield {
+            'item_sku': row['sku'],
+            'item_name': row['name'],
+            'qty_on_hand': str(row['qty_on_hand']),
             'unit_cost': str(cost),
-            'total_value': str(value),
-        })
+            'total_value': str(row['qty_on_hand'] * cost),
+        }
 
+
+def inventory_valuation(tenant, method='average'):
+    """List all items -> Qty * Cost = Total Value."""
+    rows = list(iter_inventory_valuation(tenant, method))
+    grand_total = sum((Decimal(r['total_value']) for r in rows), _ZERO)
     return {'rows': rows, 'grand_total': str(grand_total)}
 
 
-def stock_status(tenant):
-    """Qty on Hand, Qty Reserved, Qty Available, Qty on Order per item."""
-    from apps.warehousing.models import StockQuant
+def iter_stock_status(tenant):
+    """Yield Qty on Hand, Reserved, Available and on Order per stocked item."""
     from apps.orders.models import PurchaseOrderLine
+    from apps.warehousing.models import StockQuant
 
-    on_hand = StockQuant.objects.filter(
-        tenant=tenant,
-        quantity__gt=0,
-    ).values(
-        item_sku=F('item__sku'),
-        item_name=F('item__name'),
-    ).annotate(
-        qty_on_hand=Sum('quantity'),
-        qty_reserved=Sum('reserved_quantity'),
-    ).order_by('item_sku')
-
-    # Qty on order (open POs)
-    on_order = PurchaseOrderLine.objects.filter(
+    open_po_lines = PurchaseOrderLine.objects.filter(
         tenant=tenant,
         purchase_order__status__in=['confirmed', 'scheduled'],
-    ).values(item_sku=F('item__sku')).annotate(
-        qty_on_order=Sum('quantity_ordered'),
     )
-    on_order_map = {r['item_sku']: r['qty_on_order'] for r in on_order}
-
-    rows = []
-    for r in on_hand:
-        oh = r['qty_on_hand'] or 0
-        res = r['qty_reserved'] or 0
-        oo = on_order_map.get(r['item_sku'], 0)
-        rows.append({
-            'item_sku': r['item_sku'],
-            'item_name': r['item_name'],
+    rows = _stocked_items(
+        tenant,
+        qty_reserved=_per_item(
+            StockQuant.objects.filter(tenant=tenant, quantity__gt=0), 'reserved_quantity',
+        ),
+        qty_on_order=_per_item(open_po_lines, 'quantity_ordered'),
+    ).order_by('sku').values('sku', 'name', 'qty_on_hand', 'qty_reserved', 'qty_on_order')
+
+    for row in rows.iterator(chunk_size=500):
+        oh = row['qty_on_hand']
+        res = row['qty_reserved'] or 0
+        yield {
+            'item_sku': row['sku'],
+            'item_name': row['name'],
             'qty_on_hand': str(oh),
             'qty_reserved': str(res),
             'qty_available': str(oh - res),
-            'qty_on_order': str(oo),
-        })
-    return rows
+            'qty_on_order': str(row['qty_on_order'] or 0),
+        }
+
+
+def stock_status(tenant):
+    """Qty on Hand, Qty Reserved, Qty Available, Qty on Order per item."""
+    return list(iter_stock_status(tenant))
 
 
 def low_stock_alert(tenant):
-    """Items where Qty Available < Reorder Point."""
-    from apps.warehousing.models import StockQuant
+    """Items where Qty Available < Reorder Point (reads StockSummary)."""
     from apps.items.models import Item
 
-    items_with_reorder = Item.objects.filter(
+    qty = DecimalField(max_digits=14, decimal_places=4)
+    items = Item.objects.filter(
         tenant=tenant,
         reorder_point__isnull=False,
         reorder_point__gt=0,
-    )
-
-    rows = []
-    for item in items_with_reorder:
-        quants = StockQuant.objects.filter(
-            tenant=tenant, item=item,
-        ).aggregate(
-            on_hand=Coalesce(Sum('quantity'), Decimal('0')),
-            reserved=Coalesce(Sum('reserved_quantity'), Decimal('0')),
-        )
-        available = (quants['on_hand'] or 0) - (quants['reserved'] or 0)
-        if available < item.reorder_point:
-            rows.append({
-                'item_sku': item.sku,
-                'item_name': item.name,
-                'reorder_point': item.reorder_point,
-                'qty_available': str(available),
-                'shortage': str(item.reorder_point - available),
-            })
+    ).annotate(
+        available=Coalesce(F('stock_summary__on_hand'), Decimal('0'), output_field=qty)
+        - Coalesce(F('stock_summary__reserved'), Decimal('0'), output_field=qty),
+    ).filter(
+        available__lt=F('reorder_point'),
+    ).annotate(
+        shortage=ExpressionWrapper(F('reorder_point') - F('available'), output_field=qty),
+    ).order_by('-shortage').values('sku', 'name', 'reorder_point', 'available', 'shortage')
 
-    return sorted(rows, key=lambda x: float(x['shortage']), reverse=True)
+    return [
+        {
+            'item_sku': row['sku'],
+            'item_name': row['name'],
+            'reorder_point': row['reorder_point'],
+            'qty_available': str(row['available']),
+            'shortage': str(row['shortage']),
+        }
+        for row in items
+    ]
 
 
-def dead_stock(tenant, days=180):
-    """Items with Qty > 0 but last sale > N days ago."""
-    from apps.warehousing.models import StockQuant
+def iter_dead_stock(tenant, days=180):
+    """Yield items with Qty > 0 but no sale in ``days`` days, longest idle first."""
     from apps.orders.models import SalesOrderLine
 
-    cutoff = date.today() - timedelta(days=days)
+    today = date.today()
+    cutoff = today - timedelta(days=days)
 
-    # Items with stock
-    stocked = StockQuant.objects.filter(
-        tenant=tenant, quantity__gt=0,
-    ).values(
-        'item_id',
-        item_sku=F('item__sku'),
-        item_name=F('item__name'),
-    ).annotate(
-        qty_on_hand=Sum('quantity'),
+    last_sale = Subquery(
+        SalesOrderLine.objects.filter(tenant=tenant, item=OuterRef('pk')).order_by().values('item').annotate(
+            last=Max('sales_order__order_date'),
+        ).values('last')[:1],
     )
-
-    # Last sale date per item
-    last_sales = SalesOrderLine.objects.filter(
-        tenant=tenant,
-    ).values('item_id').annotate(
-        last_sale=Max('sales_order__order_date'),
+    rows = _stocked_items(tenant, last_sale=last_sale).filter(
+        Q(last_sale__isnull=True) | Q(last_sale__lt=cutoff),
+    ).order_by(F('last_sale').asc(nulls_first=True), 'sku').values(
+        'sku', 'name', 'qty_on_hand', 'last_sale',
     )
-    sale_map = {r['item_id']: r['last_sale'] for r in last_sales}
 
-    rows = []
-    for item in stocked:
-        last_sale = sale_map.get(item['item_id'])
-        if last_sale is None or last_sale < cutoff:
-            rows.append({
-                'item_sku': item['item_sku'],
-                'item_name': item['item_name'],
-                'qty_on_hand': str(item['qty_on_hand']),
-                'last_sale_date': str(last_sale) if last_sale else 'Never',
-                'days_since_sale': (date.today() - last_sale).days if last_sale else 999,
-            })
-
-    return sorted(rows, key=lambda x: x['days_since_sale'], reverse=True)
+    for row in rows.iterator(chunk_size=500):
+        last = row['last_sale']
+        yield {
+            'item_sku': row['sku'],
+            'item_name': row['name'],
+            'qty_on_hand': str(row['qty_on_hand']),
+            'last_sale_date': str(last) if last else 'Never',
+            'days_since_sale': (today - last).days if last else 999,
+        }
+
+
+def dead_stock(tenant, days=180):
+    """Items with Qty > 0 but last sale > N days ago."""
+    return list(iter_dead_stock(tenant, days))
 
 
 # ==================== FINANCIAL REPORTS ====================
@@ -664,7 +664,7 @@ from apps.accounting.models import (
     Account, AccountType, JournalEntryLine,
     DEBIT_NORMAL_TYPES, CREDIT_NORMAL_TYPES,
 )
-from apps.invoicing.models import Invoice
+from apps.invoicing.models import Invoice, OpenItem
 
 
 def _make_aging_buckets(interval: int, through: int):
@@ -708,6 +708,39 @@ def _assign_bucket(days_overdue: int, buckets: list) -> str:
     return buckets[-1]["key"]  # fallback to over
 
 
+def _aging_party_rows(open_items, as_of_date, buckets, party_key, name_key, doc_key):
+    """Group OpenItem ``values()`` rows into per-party aging rows (Decimal amounts)."""
+    bucket_keys = [b["key"] for b in buckets]
+    party_map = {}
+    for item in open_items:
+        balance = item['open_amount']
+        pid = item[party_key]
+        days_overdue = (as_of_date - item['due_date']).days
+        bucket_key = _assign_bucket(days_overdue, buckets)
+
+        if pid not in party_map:
+            party_map[pid] = {
+                'party_id': pid,
+                'party_name': item[name_key],
+                'amounts': [Decimal('0.00')] * len(buckets),
+                'total': Decimal('0.00'),
+                'detail': [],
+            }
+        row = party_map[pid]
+        row['amounts'][bucket_keys.index(bucket_key)] += balance
+        row['total'] += balance
+        row['detail'].append({
+            'id': item[doc_key],
+            'number': item['document_number'],
+            'date': str(item['document_date']),
+            'due_date': str(item['due_date']),
+            'balance': f"{balance:.2f}",
+            'days_overdue': max(days_overdue, 0),
+            'bucket_key': bucket_key,
+        })
+    return party_map
+
+
 class FinancialReportService:
     """
     Generates financial statements from GL data.
@@ -1043,8 +1076,8 @@ class FinancialReportService:
         """
         A/R Aging report with configurable buckets and optional customer filter.
 
-        Source: Invoice model (not GL).
-        Filters: posted/sent/partial/overdue invoices with outstanding balance.
+        Source: OpenItem ledger (posted/sent/partial/overdue invoices with an
+        outstanding balance, maintained by OpenItemService) - not GL.
         Buckets by days past due_date.
 
         Returns new shape:
@@ -1071,54 +1104,25 @@ class FinancialReportService:
         }
         """
         buckets = _make_aging_buckets(interval, through)
-        bucket_keys = [b["key"] for b in buckets]
 
         qs = (
-            Invoice.objects
-            .filter(
-                tenant=tenant,
-                status__in=('posted', 'sent', 'partial', 'overdue'),
-            )
-            .select_related('customer__party')
+            OpenItem.objects
+            .filter(tenant=tenant, side=OpenItem.SIDE_AR)
             .order_by('customer__party__display_name', 'due_date')
+            .values(
+                'invoice_id', 'customer_id', 'customer__party__display_name',
+                'document_number', 'document_date', 'due_date', 'open_amount',
+            )
         )
         if customer_id is not None:
             qs = qs.filter(customer_id=customer_id)
 
-        # Group by party
-        party_map = {}  # party_id -> {party_id, party_name, amounts: list, total, detail}
-
-        for inv in qs:
-            balance = inv.total_amount - inv.amount_paid
-            if balance <= 0:
-                continue
-
-            pid = inv.customer_id
-            pname = inv.customer.party.display_name
-            days_overdue = (as_of_date - inv.due_date).days
-            bucket_key = _assign_bucket(days_overdue, buckets)
-
-            if pid not in party_map:
-                party_map[pid] = {
-                    'party_id': pid,
-                    'party_name': pname,
-                    'amounts': [Decimal('0.00')] * len(buckets),
-                    'total': Decimal('0.00'),
-                    'detail': [],
-                }
-            row = party_map[pid]
-            idx = bucket_keys.index(bucket_key)
-            row['amounts'][idx] += balance
-            row['total'] += balance
-            row['detail'].append({
-                'id': inv.id,
-                'number': inv.invoice_number,
-                'date': str(inv.invoice_date),
-                'due_date': str(inv.due_date),
-                'balance': f"{balance:.2f}",
-                'days_overdue': max(days_overdue, 0),
-                'bucket_key': bucket_key,
-            })
+        party_map = _aging_party_rows(
+            qs, as_of_date, buckets,
+            party_key='customer_id',
+            name_key='customer__party__display_name',
+            doc_key='invoice_id',
+        )
 
         rows = sorted(party_map.values(), key=lambda r: r['party_name'])
 
@@ -1155,65 +1159,31 @@ class FinancialReportService:
         """
         A/P Aging report with configurable buckets and optional vendor filter.
 
-        Source: VendorBill model.
-        Filters: posted/partial bills with outstanding balance.
+        Source: OpenItem ledger (posted/partial bills with an outstanding balance).
         Buckets by days past due_date.
 
         Returns same shape as get_ar_aging but with filters.vendor instead of filters.customer.
         """
-        from apps.invoicing.models import VendorBill
-
         buckets = _make_aging_buckets(interval, through)
-        bucket_keys = [b["key"] for b in buckets]
 
         qs = (
-            VendorBill.objects
-            .filter(
-                tenant=tenant,
-                status__in=('posted', 'partial'),
-            )
-            .select_related('vendor__party')
+            OpenItem.objects
+            .filter(tenant=tenant, side=OpenItem.SIDE_AP)
             .order_by('vendor__party__display_name', 'due_date')
+            .values(
+                'vendor_bill_id', 'vendor_id', 'vendor__party__display_name',
+                'document_number', 'document_date', 'due_date', 'open_amount',
+            )
         )
         if vendor_id is not None:
             qs = qs.filter(vendor_id=vendor_id)
 
-        party_map = {}
-
-        for bill in qs:
-            balance = bill.total_amount - bill.amount_paid
-            if balance <= 0:
-                continue
-
-            pid = bill.vendor_id
-            pname = bill.vendor.party.display_name
-            days_overdue = (as_of_date - bill.due_date).days
-            bucket_key = _assign_bucket(days_overdue, buckets)
-
-            if pid not in party_map:
-                party_map[pid] = {
-                    'party_id': pid,
-                    'party_name': pname,
-                    'amounts': [Decimal('0.00')] * len(buckets),
-                    'total': Decimal('0.00'),
-                    'detail': [],
-                }
-            row = party_map[pid]
-            idx = bucket_keys.index(bucket_key)
-            row['amounts'][idx] += balance
-            row['total'] += balance
-            number = bill.bill_number
-            if bill.vendor_invoice_number:
-                number = f"{bill.bill_number} / {bill.vendor_invoice_number}"
-            row['detail'].append({
-                'id': bill.id,
-                'number': number,
-                'date': str(bill.bill_date),
-                'due_date': str(bill.due_date),
-                'balance': f"{balance:.2f}",
-                'days_overdue': max(days_overdue, 0),
-                'bucket_key': bucket_key,
-            })
+        party_map = _aging_party_rows(
+            qs, as_of_date, buckets,
+            party_key='vendor_id',
+            name_key='vendor__party__display_name',
+            doc_key='vendor_bill_id',
+        )
 
         rows = sorted(party_map.values(), key=lambda r: r['party_name'])
 
@@ -1871,80 +1841,59 @@ class ItemReportService:
         Item QuickReport — financial and order activity for a single item.
 
         Returns dict with 3 sections:
-        - financials: InvoiceLine (sales) + VendorBillLine (costs) for this item
-        - purchase_orders: PurchaseOrderLine records for this item
-        - sales_orders: SalesOrderLine records for this item
+        - financials: invoice lines (sales) + vendor bill lines (costs)
+        - purchase_orders: purchase order lines
+        - sales_orders: sales order lines
 
-        Each section has 'rows' (list of dicts) and 'summary' totals.
+        Each section has 'rows' (list of dicts) and 'summary' totals. All
+        sections come from one range scan of the item activity index; money
+        stays Decimal.
         """
-        from apps.invoicing.models import InvoiceLine, VendorBillLine
-        from apps.orders.models import PurchaseOrderLine, SalesOrderLine
-
-        # ── Section 1: Financials ─────────────────────────────────────────
-
-        # Invoice lines (sales)
-        invoice_lines = (
-            InvoiceLine.objects
-            .filter(
-                tenant=tenant,
-                item_id=item_id,
-                invoice__invoice_date__gte=start_date,
-                invoice__invoice_date__lte=end_date,
-            )
-            .exclude(invoice__status__in=('draft', 'void'))
-            .select_related('invoice__customer__party')
-            .order_by('invoice__invoice_date')
+        from apps.items.activity import SOURCES, ItemActivityService
+        from apps.items.models import ItemActivity
+
+        def quantity(value):
+            return int(value) if value == value.to_integral_value() else value.normalize()
+
+        def status_display(row):
+            return SOURCES[row.doc_type].status_label(row.status)
+
+        financial_types = [ItemActivity.INVOICE, ItemActivity.VENDOR_BILL]
+        order_types = [ItemActivity.PURCHASE_ORDER, ItemActivity.SALES_ORDER]
+        activity = ItemActivityService(tenant).between(
+            item_id, start_date, end_date, financial_types + order_types,
+        ).exclude(
+            Q(doc_type__in=financial_types, status__in=('draft', 'void'))
+            | Q(doc_type__in=order_types, status='cancelled')
         )
 
-        sale_rows = [
-            {
-                'date': line.invoice.invoice_date.isoformat(),
-                'type': 'Sale',
-                'document_number': line.invoice.invoice_number,
-                'party_name': line.invoice.customer.party.display_name,
-                'quantity': line.quantity,
-                'unit_price': float(line.unit_price),
-                'total': float(line.line_total),
-            }
-            for line in invoice_lines
-        ]
+        rows_by_type = defaultdict(list)
+        for row in activity:
+            rows_by_type[row.doc_type].append(row)
 
-        # Vendor bill lines (costs)
-        bill_lines = (
-            VendorBillLine.objects
-            .filter(
-                tenant=tenant,
-                item_id=item_id,
-                item__isnull=False,
-                bill__bill_date__gte=start_date,
-                bill__bill_date__lte=end_date,
-            )
-            .exclude(bill__status__in=('draft', 'void'))
-            .select_related('bill__vendor__party')
-            .order_by('bill__bill_date')
-        )
+        def party_name(row):
+            return row.party.display_name if row.party else ''
 
-        cost_rows = [
+        # ── Section 1: Financials ─────────────────────────────────────────
+
+        financial_rows = [
             {
-                'date': line.bill.bill_date.isoformat(),
-                'type': 'Cost',
-                'document_number': line.bill.bill_number,
-                'party_name': line.bill.vendor.party.display_name,
-                'quantity': float(line.quantity),
-                'unit_price': float(line.unit_price),
-                'total': float(line.amount),
+                'date': row.date.isoformat(),
+                'type': 'Sale' if row.doc_type == ItemActivity.INVOICE else 'Cost',
+                'document_number': row.doc_number,
+                'party_name': party_name(row),
+                'quantity': quantity(row.quantity),
+                'unit_price': row.price,
+                'total': row.amount or Decimal('0'),
             }
-            for line in bill_lines
+            for row in sorted(
+                rows_by_type[ItemActivity.INVOICE] + rows_by_type[ItemActivity.VENDOR_BILL],
+                key=lambda r: (r.date, r.pk),
+            )
         ]
 
-        # Combine and sort by date ascending (oldest first)
-        financial_rows = sorted(
-            sale_rows + cost_rows,
-            key=lambda x: x['date'],
-        )
-
-        total_sales = sum(row['total'] for row in sale_rows)
-        total_costs = sum(row['total'] for row in cost_rows)
+        total_sales = sum((r['total'] for r in financial_rows if r['type'] == 'Sale'), Decimal('0'))
+        total_costs = sum((r['total'] for r in financial_rows if r['type'] == 'Cost'), Decimal('0'))
 
         financial_summary = {
             'total_sales': total_sales,
@@ -1955,79 +1904,49 @@ class ItemReportService:
 
         # ── Section 2: Purchase Orders ────────────────────────────────────
 
-        po_lines = (
-            PurchaseOrderLine.objects
-            .filter(
-                tenant=tenant,
-                item_id=item_id,
-                purchase_order__order_date__gte=start_date,
-                purchase_order__order_date__lte=end_date,
-            )
-            .exclude(purchase_order__status='cancelled')
-            .select_related('purchase_order__vendor__party')
-            .order_by('purchase_order__order_date')
-        )
-
+        po_lines = rows_by_type[ItemActivity.PURCHASE_ORDER]
         po_rows = [
             {
-                'date': line.purchase_order.order_date.isoformat(),
-                'po_number': line.purchase_order.po_number,
-                'vendor_name': line.purchase_order.vendor.party.display_name,
-                'status': line.purchase_order.status,
-                'status_display': line.purchase_order.get_status_display(),
-                'quantity_ordered': line.quantity_ordered,
-                'unit_cost': float(line.unit_cost),
-                'line_total': float(line.line_total),
+                'date': row.date.isoformat(),
+                'po_number': row.doc_number,
+                'vendor_name': party_name(row),
+                'status': row.status,
+                'status_display': status_display(row),
+                'quantity_ordered': quantity(row.quantity),
+                'unit_cost': row.price,
+                'line_total': row.amount or Decimal('0'),
             }
-            for line in po_lines
+            for row in po_lines
         ]
 
-        # Count distinct POs
-        distinct_pos = set(line.purchase_order_id for line in po_lines)
-
         po_summary = {
             'total_quantity': sum(row['quantity_ordered'] for row in po_rows),
-            'total_value': sum(row['line_total'] for row in po_rows),
-            'po_count': len(distinct_pos),
+            'total_value': sum((row['line_total'] for row in po_rows), Decimal('0')),
+            'po_count': len({row.doc_id for row in po_lines}),
             'row_count': len(po_rows),
         }
 
         # ── Section 3: Sales Orders ───────────────────────────────────────
 
-        so_lines = (
-            SalesOrderLine.objects
-            .filter(
-                tenant=tenant,
-                item_id=item_id,
-                sales_order__order_date__gte=start_date,
-                sales_order__order_date__lte=end_date,
-            )
-            .exclude(sales_order__status='cancelled')
-            .select_related('sales_order__customer__party')
-            .order_by('sales_order__order_date')
-        )
-
+        so_lines = rows_by_type[ItemActivity.SALES_ORDER]
         so_rows = [
             {
-                'date': line.sales_order.order_date.isoformat(),
-                'order_number': line.sales_order.order_number,
-                'customer_name': line.sales_order.customer.party.display_name,
-                'status': line.sales_order.status,
-                'status_display': line.sales_order.get_status_display(),
-                'quantity_ordered': line.quantity_ordered,
-                'unit_price': float(line.unit_price),
-                'line_total': float(line.line_total),
+                'date': row.date.isoformat(),
+                'order_number': row.doc_number,
+                'customer_name': party_name(row),
+                'status': row.status,
+                'status_display': status_display(row),
+                'quantity_ordered': quantity(row.quantity),
+                'unit_price': row.price,
+                'line_total': row.amount or Decimal('0'),
             }
-            for line in so_lines
+            for row in so_lines
         ]
 
-        # Count distinct SOs
-        distinct_sos = set(line.sales_order_id for line in so_lines)
-
         so_summary = {
             'total_quantity': sum(row['quantity_ordered'] for row in so_rows),
-            'total_value': sum(row['line_total'] for row in so_rows),
-            'so_count': len(distinct_sos),
+            'total_value': sum((row['line_total'] for row in so_rows), Decimal('0')),
+            'so_count': len({row.doc_id for row in so_lines}),
             'row_count': len(so_rows),
         }
 
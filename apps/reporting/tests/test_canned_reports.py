@@ -15,6 +15,7 @@ Test coverage:
 from decimal import Decimal
 from datetime import date, timedelta
 from django.test import TestCase
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -494,6 +495,80 @@ class InventoryReportQueryTests(CannedReportsTestCase):
         self.assertIn('days_since_sale', row)
         self.assertEqual(row['last_sale_date'], 'Never')
 
+    def _layer(self, item, qty, cost, days_ago):
+        from apps.inventory.models import InventoryLayer
+        return InventoryLayer.objects.create(
+            tenant=self.tenant, item=item, warehouse=self.warehouse,
+            quantity_original=qty, quantity_remaining=qty, unit_cost=Decimal(cost),
+            date_received=timezone.now() - timedelta(days=days_ago),
+        )
+
+    def test_inventory_valuation_fifo_uses_open_layers(self):
+        """FIFO valuation costs from remaining layers; items without layers fall back to PO average."""
+        self._layer(self.item, Decimal('20'), '4.00', days_ago=10)
+        self._layer(self.item, Decimal('30'), '6.00', days_ago=5)
+        spent = self._layer(self.item, Decimal('0'), '100.00', days_ago=20)
+        spent.quantity_original = Decimal('10')
+        spent.save()
+
+        data = inventory_valuation(self.tenant, method='fifo')
+
+        row = next(r for r in data['rows'] if r['item_sku'] == 'ITEM-001')
+        # (20 * 4 + 30 * 6) / 50 = 5.20 per unit, 50 on hand
+        self.assertEqual(Decimal(row['unit_cost']), Decimal('5.2'))
+        self.assertEqual(Decimal(row['total_value']), Decimal('260'))
+        other = next(r for r in data['rows'] if r['item_sku'] == 'ITEM-002')
+        self.assertEqual(Decimal(other['total_value']), Decimal('0'))
+        self.assertEqual(Decimal(data['grand_total']), Decimal('260'))
+
+    def test_inventory_valuation_rejects_unknown_method(self):
+        with self.assertRaises(ValueError):
+            inventory_valuation(self.tenant, method='lifo')
+
+    def test_warehouse_reports_are_single_queries(self):
+        """Each report is one statement regardless of item count."""
+        for i in range(5):
+            extra = Item.objects.create(
+                tenant=self.tenant, sku=f'EXTRA-{i}', name=f'Extra {i}', base_uom=self.uom,
+            )
+            StockQuant.objects.create(
+                tenant=self.tenant, item=extra, location=self.wh_location, quantity=Decimal('3'),
+            )
+
+        for report in (
+            lambda: inventory_valuation(self.tenant),
+            lambda: inventory_valuation(self.tenant, method='fifo'),
+            lambda: stock_status(self.tenant),
+            lambda: dead_stock(self.tenant, days=180),
+        ):
+            with self.assertNumQueries(1):
+                rows = report()
+            rows = rows['rows'] if isinstance(rows, dict) else rows
+            self.assertEqual(len(rows), 7)
+
+    def test_dead_stock_excludes_recent_sales_and_orders_oldest_first(self):
+        order = SalesOrder.objects.create(
+            tenant=self.tenant, customer=self.customer, order_number='SO-DEAD-1',
+            order_date=date.today() - timedelta(days=400), ship_to=self.customer_location,
+        )
+        SalesOrderLine.objects.create(
+            tenant=self.tenant, sales_order=order, line_number=10, item=self.item2,
+            quantity_ordered=1, uom=self.uom, unit_price=Decimal('1.00'),
+        )
+
+        rows = dead_stock(self.tenant, days=180)
+        self.assertEqual([r['item_sku'] for r in rows], ['ITEM-001', 'ITEM-002'])
+        self.assertEqual(rows[1]['days_since_sale'], 400)
+        self.assertEqual(dead_stock(self.tenant, days=500), [r for r in rows if r['item_sku'] == 'ITEM-001'])
+
+    def test_stock_status_csv_streams(self):
+        response = self.client.get('/api/v1/reports/stock-status/', {'format': 'csv'})
+
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(',')[0], 'item_sku')
+        self.assertIn('ITEM-001,', '\n'.join(lines))
+
 
 # =============================================================================
 # FINANCIAL REPORT QUERY TESTS
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('new_scheduling', '0003_priority_list_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deliveryrun',
+            name='estimated_miles',
+            field=models.DecimalField(blank=True, decimal_places=1, help_text='Route length from the last stop sequencing (located stops only)', max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicaldeliveryrun',
+            name='estimated_miles',
+            field=models.DecimalField(blank=True, decimal_places=1, help_text='Route length from the last stop sequencing (located stops only)', max_digits=8, null=True),
+        ),
+    ]
@@ -11,7 +11,7 @@ Models:
 """
 from django.db import models
 from django.utils import timezone
-from simple_history.models import HistoricalRecords
+from shared.history import BatchedHistoricalRecords
 from shared.models import TenantMixin, TimestampMixin
 
 
@@ -52,9 +52,16 @@ class DeliveryRun(TenantMixin, TimestampMixin):
         default=False,
         help_text="Whether this run has been completed"
     )
+    estimated_miles = models.DecimalField(
+        max_digits=8,
+        decimal_places=1,
+        null=True,
+        blank=True,
+        help_text="Route length from the last stop sequencing (located stops only)"
+    )
 
     # Audit trail
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'truck', 'scheduled_date', 'sequence')]
@@ -158,7 +165,7 @@ class SchedulerNote(TenantMixin, TimestampMixin):
         help_text="Pinned notes appear at the top"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         ordering = ['-is_pinned', '-created_at']
@@ -234,7 +241,7 @@ class PriorityLinePriority(TenantMixin, TimestampMixin):
         help_text="Priority order within bin (0 = top/hottest)"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'purchase_order_line')]
@@ -270,7 +277,7 @@ class VendorKickAllotment(TenantMixin, TimestampMixin):
         help_text="Default daily kick allotment"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'vendor', 'box_type')]
@@ -307,7 +314,7 @@ class DailyKickOverride(TenantMixin, TimestampMixin):
         help_text="Override allotment for this date"
     )
 
-    history = HistoricalRecords()
+    history = BatchedHistoricalRecords()
 
     class Meta:
         unique_together = [('tenant', 'vendor', 'box_type', 'date')]
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.search'
+    verbose_name = 'Search Index'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        from apps.search import signals
+        signals.connect()
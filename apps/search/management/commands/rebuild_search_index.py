@@ -0,0 +1,43 @@
+"""Management command to rebuild the search index from the indexed models."""
+from django.core.management.base import BaseCommand, CommandError
+from apps.tenants.models import Tenant
+from apps.search.registry import ENTITIES
+from apps.search.services import SearchIndexService
+from shared.managers import set_current_tenant
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild SearchDocument/SearchKey rows from scratch. Run once after '
+        'deploying the search index, or after changing the registry.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity-type', action='append', dest='entity_types', default=None,
+            help='Only rebuild this entity type (repeatable)',
+        )
+        parser.add_argument(
+            '--tenant', type=str, default=None,
+            help='Only process the tenant with this subdomain',
+        )
+
+    def handle(self, *args, **options):
+        entity_types = options['entity_types']
+        unknown = sorted(set(entity_types or []) - set(ENTITIES))
+        if unknown:
+            raise CommandError(f"Unknown entity type(s): {', '.join(unknown)}")
+
+        tenants = Tenant.objects.all()
+        if options['tenant']:
+            tenants = tenants.filter(subdomain=options['tenant'])
+
+        total = 0
+        for tenant in tenants:
+            set_current_tenant(tenant)
+            counts = SearchIndexService(tenant).rebuild(entity_types)
+            for entity_type, count in counts.items():
+                self.stdout.write(f"  {tenant.name}: {entity_type} {count}")
+            total += sum(counts.values())
+
+        self.stdout.write(self.style.SUCCESS(f"Done. Indexed {total} documents."))
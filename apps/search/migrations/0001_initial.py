@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(max_length=30)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('search_text', models.TextField(help_text='Normalized field values, each preceded by a newline')),
+                ('sort_key', models.CharField(blank=True, help_text='Normalized first field; orders results within a rank', max_length=100)),
+                ('rank', models.SmallIntegerField(default=0, help_text='Ranking hint; higher sorts first (e.g. active over inactive)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(max_length=30)),
+                ('kind', models.CharField(choices=[('t', 'Trigram'), ('p', 'Word prefix')], max_length=1)),
+                ('key', models.CharField(max_length=8)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keys', to='search.searchdocument')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=models.Index(fields=['tenant', 'entity_type', 'sort_key'], name='search_sear_tenant__8c0428_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='searchdocument',
+            unique_together={('tenant', 'entity_type', 'object_id')},
+        ),
+        migrations.AddIndex(
+            model_name='searchkey',
+            index=models.Index(fields=['tenant', 'entity_type', 'kind', 'key'], name='search_sear_tenant__b5b0d6_idx'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# apps/search/models.py
+"""
+Search index models.
+
+SearchDocument: One row per searchable record (customer, item, order, ...)
+    holding its normalized field values and ranking hints.
+SearchKey: Lookup keys for a document. Trigrams answer substring queries;
+    one- and two-character word prefixes answer queries too short to have
+    a trigram. Every search is an equality match on the
+    (tenant, entity_type, kind, key) index, never a table scan.
+
+Maintained by signals on the indexed models (see apps.search.registry) and
+rebuilt with ``manage.py rebuild_search_index``.
+"""
+from django.db import models
+from shared.models import TenantMixin
+
+
+class SearchDocument(TenantMixin):
+    """Normalized, searchable text for one record."""
+    entity_type = models.CharField(max_length=30)
+    object_id = models.PositiveBigIntegerField()
+    search_text = models.TextField(
+        help_text="Normalized field values, each preceded by a newline"
+    )
+    sort_key = models.CharField(
+        max_length=100, blank=True,
+        help_text="Normalized first field; orders results within a rank"
+    )
+    rank = models.SmallIntegerField(
+        default=0,
+        help_text="Ranking hint; higher sorts first (e.g. active over inactive)"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [('tenant', 'entity_type', 'object_id')]
+        indexes = [
+            models.Index(fields=['tenant', 'entity_type', 'sort_key']),
+        ]
+
+    def __str__(self):
+        return f'{self.entity_type}:{self.object_id}'
+
+
+class SearchKey(TenantMixin):
+    """A trigram or word-prefix key pointing at a SearchDocument."""
+    TRIGRAM = 't'
+    PREFIX = 'p'
+    KIND_CHOICES = [
+        (TRIGRAM, 'Trigram'),
+        (PREFIX, 'Word prefix'),
+    ]
+
+    document = models.ForeignKey(
+        SearchDocument,
+        on_delete=models.CASCADE,
+        related_name='keys',
+    )
+    entity_type = models.CharField(max_length=30)
+    kind = models.CharField(max_length=1, choices=KIND_CHOICES)
+    key = models.CharField(max_length=8)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['tenant', 'entity_type', 'kind', 'key']),
+        ]
+
+    def __str__(self):
+        return f'{self.kind}:{self.key} -> {self.document_id}'
@@ -0,0 +1,79 @@
+# apps/search/registry.py
+"""
+Which models are indexed for search, and by which fields.
+
+Entity types match apps.favorites ENTITY_TYPE_CHOICES, so the suggestions
+endpoint and global search look records up under the same names.
+"""
+from dataclasses import dataclass
+
+from django.apps import apps
+
+
+@dataclass(frozen=True)
+class SearchEntity:
+    """Index definition for one entity type."""
+    model: str                  # 'app_label.ModelName'
+    fields: tuple               # ORM paths; the first one is the sort key
+    rank_field: str = ''        # Boolean path; True ranks ahead of False
+    select_related: tuple = ()
+
+    def get_model(self):
+        return apps.get_model(self.model)
+
+
+ENTITIES = {
+    'customer': SearchEntity(
+        'parties.Customer',
+        ('party__display_name', 'party__code', 'party__legal_name'),
+        rank_field='party__is_active',
+        select_related=('party',),
+    ),
+    'vendor': SearchEntity(
+        'parties.Vendor',
+        ('party__display_name', 'party__code', 'party__legal_name'),
+        rank_field='party__is_active',
+        select_related=('party',),
+    ),
+    'item': SearchEntity('items.Item', ('sku', 'name'), rank_field='is_active'),
+    'contact': SearchEntity('contacts.Contact', ('first_name', 'last_name', 'email')),
+    'contract': SearchEntity('contracts.Contract', ('contract_number', 'blanket_po')),
+    'sales_order': SearchEntity('orders.SalesOrder', ('order_number', 'customer_po')),
+    'purchase_order': SearchEntity('orders.PurchaseOrder', ('po_number',)),
+    'rfq': SearchEntity('orders.RFQ', ('rfq_number',)),
+    'estimate': SearchEntity('orders.Estimate', ('estimate_number',)),
+    'invoice': SearchEntity('invoicing.Invoice', ('invoice_number',)),
+    'design_request': SearchEntity('design.DesignRequest', ('file_number', 'ident')),
+    'account': SearchEntity('accounting.Account', ('code', 'name'), rank_field='is_active'),
+    'journal_entry': SearchEntity('accounting.JournalEntry', ('entry_number', 'memo')),
+}
+
+# Saving one of these models changes indexed text of other entities:
+# model -> [(entity_type, lookup from that entity to the saved model)]
+DEPENDENTS = {
+    'parties.Party': [('customer', 'party'), ('vendor', 'party')],
+}
+
+
+def entity_types_for(model):
+    """
+    Entity types indexed from ``model`` or a model it inherits from
+    (e.g. DCItem and the other Item subclasses index as 'item').
+    """
+    labels = {model._meta.label} | {parent._meta.label for parent in model._meta.get_parent_list()}
+    return [name for name, entity in ENTITIES.items() if entity.model in labels]
+
+
+def indexed_models():
+    """
+    Every model whose saves must reach the index: the registered models and
+    their concrete subclasses. Multi-table inheritance sends post_save with
+    the subclass as sender, so receivers for the parent alone miss them.
+    """
+    roots = {entity.get_model() for entity in ENTITIES.values()}
+    return [
+        model for model in apps.get_models()
+        if model in roots or (
+            not model._meta.proxy and any(issubclass(model, root) for root in roots)
+        )
+    ]
@@ -0,0 +1,322 @@
+# apps/search/services.py
+"""
+Search index maintenance and queries.
+
+Text is normalized (case-folded, accents and repeated whitespace removed)
+and broken into keys:
+
+- every trigram of every field value, so a query of 3+ characters matches
+  documents holding all of its trigrams, then is confirmed with a
+  substring test on that small candidate set;
+- the first one and two characters of every word, for 1-2 character
+  queries, which match words starting with the query.
+
+Results rank like shared.search.prefix_ranked: documents with a field that
+*starts* with the query first, then the rank hint, then the sort key.
+
+Usage:
+    svc = SearchIndexService(tenant)
+    ids = svc.search('acme', 'customer', limit=20)
+    grouped = svc.top_matches('10', ['item', 'invoice'], per_type=5)
+"""
+import re
+import unicodedata
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Value, When, Window
+from django.db.models.functions import RowNumber
+
+from .models import SearchDocument, SearchKey
+from .registry import DEPENDENTS, ENTITIES
+
+# Query trigrams beyond this many add little selectivity; the substring
+# check on the candidates enforces the full term.
+MAX_QUERY_TRIGRAMS = 8
+REBUILD_CHUNK_SIZE = 1000
+READY_CACHE_SECONDS = 300
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def normalize(value):
+    """Case-fold, strip accents and collapse whitespace."""
+    text = unicodedata.normalize('NFKD', str(value or '')).casefold()
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return ' '.join(text.split())
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _word_prefixes(text):
+    prefixes = set()
+    for word in _WORD_RE.findall(text):
+        prefixes.add(word[:1])
+        prefixes.add(word[:2])
+    return prefixes
+
+
+def _resolve(obj, path):
+    for attr in path.split('__'):
+        obj = getattr(obj, attr, None)
+        if obj is None:
+            return None
+    return obj
+
+
+class SearchIndexService:
+    """
+    Maintain and query the per-tenant search index.
+
+    Signal handlers call the static maintenance methods, which work from the
+    record's tenant_id without loading the tenant; queries and rebuilds are
+    scoped to ``self.tenant``.
+    """
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    # ===== MAINTENANCE =====
+
+    @staticmethod
+    def build_document(entity_type, obj):
+        """Return (search_text, sort_key, rank, keys) for ``obj``."""
+        entity = ENTITIES[entity_type]
+        values = [normalize(_resolve(obj, path)) for path in entity.fields]
+        keys = set()
+        for value in values:
+            keys.update((SearchKey.TRIGRAM, gram) for gram in _trigrams(value))
+            keys.update((SearchKey.PREFIX, prefix) for prefix in _word_prefixes(value))
+        rank = 1 if entity.rank_field and _resolve(obj, entity.rank_field) else 0
+        search_text = ''.join(f'\n{value}' for value in values)
+        return search_text, values[0][:100], rank, keys
+
+    @staticmethod
+    def index_object(entity_type, obj):
+        """Create or refresh the document for one record."""
+        search_text, sort_key, rank, keys = SearchIndexService.build_document(entity_type, obj)
+        documents = SearchDocument.objects.all_tenants()
+        with transaction.atomic():
+            document, created = documents.get_or_create(
+                tenant_id=obj.tenant_id,
+                entity_type=entity_type,
+                object_id=obj.pk,
+                defaults={'search_text': search_text, 'sort_key': sort_key, 'rank': rank},
+            )
+            if not created:
+                if (document.search_text, document.sort_key, document.rank) == (search_text, sort_key, rank):
+                    return document
+                document.search_text, document.sort_key, document.rank = search_text, sort_key, rank
+                document.save(update_fields=['search_text', 'sort_key', 'rank', 'updated_at'])
+                SearchKey.objects.all_tenants().filter(document=document).delete()
+            SearchKey.objects.all_tenants().bulk_create(
+                SearchIndexService._key_rows(document, keys)
+            )
+        return document
+
+    @staticmethod
+    def remove_object(entity_type, tenant_id, object_id):
+        """Drop the document for a deleted record."""
+        SearchDocument.objects.all_tenants().filter(
+            tenant_id=tenant_id, entity_type=entity_type, object_id=object_id,
+        ).delete()
+
+    @staticmethod
+    def reindex_dependents(model_label, obj):
+        """Refresh documents whose text comes from ``obj`` (e.g. a Party's customers)."""
+        for entity_type, lookup in DEPENDENTS.get(model_label, []):
+            entity = ENTITIES[entity_type]
+            related = entity.get_model().objects.all_tenants().filter(
+                **{lookup: obj}
+            ).select_related(*entity.select_related)
+            for record in related:
+                SearchIndexService.index_object(entity_type, record)
+
+    @staticmethod
+    def _key_rows(document, keys):
+        return [
+            SearchKey(
+                tenant_id=document.tenant_id,
+                document=document,
+                entity_type=document.entity_type,
+                kind=kind,
+                key=key,
+            )
+            for kind, key in keys
+        ]
+
+    def rebuild(self, entity_types=None):
+        """
+        Re-index every record of ``entity_types`` (default: all) for the
+        tenant from scratch. Returns {entity_type: documents indexed}.
+        """
+        counts = {}
+        for entity_type in entity_types or ENTITIES:
+            entity = ENTITIES[entity_type]
+            records = entity.get_model().objects.all_tenants().filter(
+                tenant=self.tenant,
+            ).select_related(*entity.select_related).order_by('pk')
+
+            with transaction.atomic():
+                SearchDocument.objects.all_tenants().filter(
+                    tenant=self.tenant, entity_type=entity_type,
+                ).delete()
+                counts[entity_type] = 0
+                batch = []
+                for record in records.iterator(chunk_size=REBUILD_CHUNK_SIZE):
+                    batch.append(record)
+                    if len(batch) >= REBUILD_CHUNK_SIZE:
+                        counts[entity_type] += self._bulk_index(entity_type, batch)
+                        batch = []
+                if batch:
+                    counts[entity_type] += self._bulk_index(entity_type, batch)
+            cache.delete(self._ready_key(entity_type))
+        return counts
+
+    def index_created(self, entity_type, records):
+        """
+        Index records inserted with ``bulk_create``, which skips post_save.
+
+        A no-op until the tenant's index for ``entity_type`` has been built,
+        so a partial index never passes is_ready().
+        """
+        if not records or not self.is_ready(entity_type):
+            return 0
+        return self._bulk_index(entity_type, records)
+
+    def index_updated(self, entity_type, records):
+        """
+        Re-index records changed with ``bulk_update``, which skips post_save.
+
+        Same readiness rule as index_created().
+        """
+        if not records or not self.is_ready(entity_type):
+            return 0
+        SearchDocument.objects.all_tenants().filter(
+            tenant=self.tenant,
+            entity_type=entity_type,
+            object_id__in=[record.pk for record in records],
+        ).delete()
+        return self._bulk_index(entity_type, records)
+
+    def index_dependents_updated(self, model_label, records):
+        """Bulk counterpart of reindex_dependents() for ``bulk_update`` callers."""
+        count = 0
+        for entity_type, lookup in DEPENDENTS.get(model_label, []):
+            if not records or not self.is_ready(entity_type):
+                continue
+            entity = ENTITIES[entity_type]
+            related = entity.get_model().objects.all_tenants().filter(
+                tenant=self.tenant, **{f'{lookup}__in': records},
+            ).select_related(*entity.select_related)
+            count += self.index_updated(entity_type, list(related))
+        return count
+
+    def _bulk_index(self, entity_type, records):
+        built = [(record, self.build_document(entity_type, record)) for record in records]
+        documents = SearchDocument.objects.all_tenants().bulk_create([
+            SearchDocument(
+                tenant=self.tenant,
+                entity_type=entity_type,
+                object_id=record.pk,
+                search_text=search_text,
+                sort_key=sort_key,
+                rank=rank,
+            )
+            for record, (search_text, sort_key, rank, _) in built
+        ])
+        rows = []
+        for document, (_, (_, _, _, keys)) in zip(documents, built):
+            rows.extend(self._key_rows(document, keys))
+        SearchKey.objects.all_tenants().bulk_create(rows, batch_size=5000)
+        return len(documents)
+
+    # ===== QUERIES =====
+
+    def is_ready(self, entity_type):
+        """
+        True once the tenant has indexed documents of ``entity_type``.
+
+        Callers fall back to direct queries until the index has been built
+        (e.g. right after deploying, before rebuild_search_index has run).
+        """
+        key = self._ready_key(entity_type)
+        if cache.get(key):
+            return True
+        ready = SearchDocument.objects.all_tenants().filter(
+            tenant=self.tenant, entity_type=entity_type,
+        ).exists()
+        if ready:
+            cache.set(key, True, READY_CACHE_SECONDS)
+        return ready
+
+    def search(self, term, entity_type, exclude_ids=(), offset=0, limit=20):
+        """Object ids of ``entity_type`` matching ``term``, best first."""
+        documents = self._matching(term, [entity_type])
+        if documents is None:
+            return []
+        if exclude_ids:
+            documents = documents.exclude(object_id__in=exclude_ids)
+        return list(documents.values_list('object_id', flat=True)[offset:offset + limit])
+
+    def top_matches(self, term, entity_types, per_type=5):
+        """
+        The best ``per_type`` matches for each entity type, in one query.
+
+        Returns {entity_type: [object_id, ...]}.
+        """
+        grouped = {entity_type: [] for entity_type in entity_types}
+        documents = self._matching(term, entity_types)
+        if documents is None:
+            return grouped
+        documents = documents.annotate(
+            _position=Window(
+                RowNumber(),
+                partition_by=[F('entity_type')],
+                order_by=documents.query.order_by,
+            )
+        ).filter(_position__lte=per_type)
+        for entity_type, object_id in documents.values_list('entity_type', 'object_id'):
+            grouped[entity_type].append(object_id)
+        return grouped
+
+    def _matching(self, term, entity_types):
+        """Ranked queryset of documents matching ``term``, or None for no match."""
+        query = normalize(term)
+        if len(query) >= 3:
+            kind = SearchKey.TRIGRAM
+            keys = sorted(_trigrams(query))
+            step = max(1, len(keys) // MAX_QUERY_TRIGRAMS)
+            keys = keys[::step][:MAX_QUERY_TRIGRAMS]
+        else:
+            kind = SearchKey.PREFIX
+            keys = sorted({word[:2] for word in _WORD_RE.findall(query)})
+        if not keys:
+            return None
+
+        candidates = SearchKey.objects.all_tenants().filter(
+            tenant=self.tenant,
+            entity_type__in=entity_types,
+            kind=kind,
+            key__in=keys,
+        ).values('document_id').annotate(hits=Count('id')).filter(hits=len(keys))
+
+        documents = SearchDocument.objects.all_tenants().filter(
+            tenant=self.tenant,
+            entity_type__in=entity_types,
+            pk__in=candidates.values('document_id'),
+        )
+        if kind == SearchKey.TRIGRAM:
+            documents = documents.filter(search_text__contains=query)
+        return documents.annotate(
+            _prefix_rank=Case(
+                When(search_text__contains=f'\n{query}', then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            )
+        ).order_by('_prefix_rank', '-rank', 'sort_key', 'object_id')
+
+    def _ready_key(self, entity_type):
+        return f'search:ready:{self.tenant.pk}:{entity_type}'
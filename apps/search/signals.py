@@ -0,0 +1,50 @@
+# apps/search/signals.py
+"""
+Signals that keep SearchDocument rows in step with the indexed models.
+
+Receivers are connected in ``connect()`` (called from SearchConfig.ready)
+for every model in apps.search.registry and its concrete subclasses, so
+adding an entity type there is all that is needed to index it.
+
+Bulk writes skip these signals; the importers and batch services call
+SearchIndexService.index_created/index_updated instead.
+"""
+from django.db.models.signals import post_save, post_delete
+
+from .registry import DEPENDENTS, entity_types_for, indexed_models
+
+
+def index_on_save(sender, instance, raw=False, **kwargs):
+    """Refresh the saved record's search document."""
+    if raw:
+        return
+    from .services import SearchIndexService
+    for entity_type in entity_types_for(sender):
+        SearchIndexService.index_object(entity_type, instance)
+
+
+def remove_on_delete(sender, instance, **kwargs):
+    """Drop the deleted record's search document."""
+    from .services import SearchIndexService
+    for entity_type in entity_types_for(sender):
+        SearchIndexService.remove_object(entity_type, instance.tenant_id, instance.pk)
+
+
+def reindex_dependents_on_save(sender, instance, raw=False, **kwargs):
+    """Refresh documents whose text is drawn from the saved record."""
+    if raw:
+        return
+    from .services import SearchIndexService
+    SearchIndexService.reindex_dependents(sender._meta.label, instance)
+
+
+def connect():
+    """Connect receivers for every indexed and dependent model."""
+    for model in indexed_models():
+        label = model._meta.label
+        post_save.connect(index_on_save, sender=model, dispatch_uid=f'search_index_{label}')
+        post_delete.connect(remove_on_delete, sender=model, dispatch_uid=f'search_remove_{label}')
+    for label in DEPENDENTS:
+        post_save.connect(
+            reindex_dependents_on_save, sender=label, dispatch_uid=f'search_dependents_{label}',
+        )
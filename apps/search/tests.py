@@ -0,0 +1,235 @@
+# apps/search/tests.py
+"""
+Tests for the search index.
+
+Coverage:
+- Normalization and key generation
+- Signals: documents follow saves, deletes and Party renames
+- Item subclasses and bulk CSV imports reach the index
+- Queries: substring and short-prefix matching, ranking, tenant isolation
+- rebuild_search_index command and the legacy fallback before a rebuild
+- GlobalSearchView and suggestions served from the index
+"""
+import io
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.core.importers import CustomerImporter, ItemImporter
+from apps.items.models import DCItem, Item, UnitOfMeasure
+from apps.parties.models import Customer, Party
+from apps.search.models import SearchDocument, SearchKey
+from apps.search.services import SearchIndexService, normalize
+from apps.tenants.models import Tenant
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class SearchTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Search Co', subdomain='search-t', is_default=True)
+        cls.other_tenant = Tenant.objects.create(name='Other Co', subdomain='search-o')
+        cls.user = User.objects.create_user(username='search_user', password='x')
+        set_current_tenant(cls.tenant)
+        cls.uom, _ = UnitOfMeasure.objects.get_or_create(
+            tenant=cls.tenant, code='ea', defaults={'name': 'Each'},
+        )
+
+    def setUp(self):
+        cache.clear()
+        set_current_tenant(self.tenant)
+        self.index = SearchIndexService(self.tenant)
+
+    def _item(self, sku, name, tenant=None, **kwargs):
+        tenant = tenant or self.tenant
+        uom = self.uom if tenant == self.tenant else UnitOfMeasure.objects.all_tenants().get_or_create(
+            tenant=tenant, code='ea', defaults={'name': 'Each'},
+        )[0]
+        return Item.objects.create(tenant=tenant, sku=sku, name=name, base_uom=uom, **kwargs)
+
+    def _customer(self, code, name):
+        party = Party.objects.create(
+            tenant=self.tenant, party_type='CUSTOMER', code=code, display_name=name,
+        )
+        return Customer.objects.create(tenant=self.tenant, party=party)
+
+
+class NormalizeTest(TestCase):
+
+    def test_casefolds_strips_accents_and_whitespace(self):
+        self.assertEqual(normalize('  Café   CRÈME '), 'cafe creme')
+        self.assertEqual(normalize(None), '')
+
+
+class IndexMaintenanceTest(SearchTestCase):
+
+    def test_save_indexes_and_delete_removes(self):
+        item = self._item('BX-100', 'Shipping Box')
+        doc = SearchDocument.objects.get(entity_type='item', object_id=item.pk)
+        self.assertEqual(doc.search_text, '\nbx-100\nshipping box')
+        self.assertTrue(doc.keys.filter(kind=SearchKey.TRIGRAM, key='hip').exists())
+        self.assertTrue(doc.keys.filter(kind=SearchKey.PREFIX, key='sh').exists())
+
+        item.delete()
+        self.assertFalse(SearchDocument.objects.filter(entity_type='item', object_id=item.pk).exists())
+        self.assertFalse(SearchKey.objects.filter(document=doc.pk).exists())
+
+    def test_unchanged_save_does_not_rewrite_keys(self):
+        item = self._item('BX-100', 'Shipping Box')
+        with CaptureQueriesContext(connection) as ctx:
+            item.save()
+        key_table = SearchKey._meta.db_table
+        self.assertFalse([q for q in ctx.captured_queries if key_table in q['sql']])
+
+    def test_rename_replaces_keys(self):
+        item = self._item('BX-100', 'Shipping Box')
+        item.name = 'Mailer'
+        item.save()
+        self.assertEqual(self.index.search('shipping', 'item'), [])
+        self.assertEqual(self.index.search('mailer', 'item'), [item.pk])
+
+    def test_party_rename_reindexes_customer(self):
+        customer = self._customer('C-1', 'Acme Corrugated')
+        party = customer.party
+        party.display_name = 'Zenith Packaging'
+        party.save()
+        self.assertEqual(self.index.search('zenith', 'customer'), [customer.pk])
+        self.assertEqual(self.index.search('acme', 'customer'), [])
+
+    def test_item_subclass_save_indexes_and_delete_removes(self):
+        item = DCItem.objects.create(
+            tenant=self.tenant, sku='DC-100', name='Die Cut Tray', base_uom=self.uom,
+            test='ect32', flute='b', length=Decimal('12'), width=Decimal('8'),
+        )
+        self.assertEqual(self.index.search('tray', 'item'), [item.pk])
+
+        item.delete()
+        self.assertFalse(SearchDocument.objects.filter(entity_type='item', object_id=item.pk).exists())
+
+    def _csv(self, *lines):
+        f = io.BytesIO('\n'.join(lines).encode('utf-8'))
+        f.name = 'test.csv'
+        return f
+
+    def test_bulk_item_import_indexes_new_items(self):
+        self._item('BX-100', 'Shipping Box')
+        f = self._csv('SKU,Name,UOM,Division', 'MLR-1,Padded Mailer,ea,')
+
+        ItemImporter(self.tenant, self.user).run(f, commit=True, bulk=True)
+
+        self.assertEqual(self.index.search('mailer', 'item'), [Item.objects.get(sku='MLR-1').pk])
+
+    def test_bulk_customer_import_indexes_new_and_renamed(self):
+        existing = self._customer('C-1', 'Acme Corrugated')
+        f = self._csv(
+            'Code,Name,PaymentTerms,Email,Address1,City,State,PostalCode',
+            'C-1,Zenith Packaging,NET30,,,,,',
+            'C-2,Harbor Foods,NET30,,,,,',
+        )
+
+        CustomerImporter(self.tenant, self.user).run(f, commit=True, bulk=True)
+
+        self.assertEqual(self.index.search('zenith', 'customer'), [existing.pk])
+        self.assertEqual(self.index.search('acme', 'customer'), [])
+        self.assertEqual(
+            self.index.search('harbor', 'customer'), [Customer.objects.get(party__code='C-2').pk],
+        )
+
+
+class IndexQueryTest(SearchTestCase):
+
+    def test_substring_match_is_verified(self):
+        box = self._item('BX-100', 'Shipping Box')
+        self._item('SP-200', 'Spin Bottle')   # shares trigrams, not the term
+        self.assertEqual(self.index.search('ping', 'item'), [box.pk])
+        self.assertEqual(self.index.search('SHIPPING BOX', 'item'), [box.pk])
+        self.assertEqual(self.index.search('shipping crate', 'item'), [])
+
+    def test_prefix_matches_rank_first_then_active(self):
+        inner = self._item('A-1', 'Big Tape Roll')
+        inactive = self._item('A-2', 'Tape Dispenser', is_active=False)
+        active = self._item('A-3', 'Tape Gun')
+        self.assertEqual(self.index.search('tape', 'item'), [active.pk, inactive.pk, inner.pk])
+
+    def test_short_query_matches_word_prefixes(self):
+        tape = self._item('A-1', 'Big Tape Roll')
+        self._item('A-2', 'Stapler')
+        self.assertEqual(self.index.search('ta', 'item'), [tape.pk])
+
+    def test_exclude_offset_and_limit(self):
+        items = [self._item(f'TP-{n}', f'Tape {n}') for n in range(5)]
+        ids = self.index.search('tape', 'item', exclude_ids={items[0].pk}, offset=1, limit=2)
+        self.assertEqual(ids, [items[2].pk, items[3].pk])
+
+    def test_tenant_isolation(self):
+        self._item('BX-1', 'Shipping Box', tenant=self.other_tenant)
+        self.assertEqual(self.index.search('shipping', 'item'), [])
+
+    def test_top_matches_caps_each_type(self):
+        items = [self._item(f'AC-{n}', f'Acme part {n}') for n in range(4)]
+        customer = self._customer('C-1', 'Acme Corrugated')
+        grouped = self.index.top_matches('acme', ['item', 'customer'], per_type=2)
+        self.assertEqual(grouped, {'item': [items[0].pk, items[1].pk], 'customer': [customer.pk]})
+
+
+class RebuildTest(SearchTestCase):
+
+    def test_rebuild_restores_index(self):
+        item = self._item('BX-100', 'Shipping Box')
+        customer = self._customer('C-1', 'Acme Corrugated')
+        SearchDocument.objects.all().delete()
+        self.assertFalse(self.index.is_ready('item'))
+
+        out = StringIO()
+        call_command('rebuild_search_index', '--tenant', 'search-t', stdout=out)
+
+        self.assertIn('Done.', out.getvalue())
+        self.assertTrue(self.index.is_ready('item'))
+        self.assertEqual(self.index.search('shipping', 'item'), [item.pk])
+        self.assertEqual(self.index.search('acme', 'customer'), [customer.pk])
+
+    def test_unknown_entity_type_rejected(self):
+        from django.core.management.base import CommandError
+        with self.assertRaises(CommandError):
+            call_command('rebuild_search_index', '--entity-type', 'widget', stdout=StringIO())
+
+
+class SearchApiTest(SearchTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_global_search_uses_index(self):
+        item = self._item('BX-100', 'Acme Box')
+        customer = self._customer('C-1', 'Acme Corrugated')
+        resp = self.client.get('/api/v1/search/?q=acme')
+        self.assertEqual(resp.status_code, 200)
+        found = {(r['category'], r['id']) for r in resp.json()['results']}
+        self.assertEqual(found, {('Items', item.pk), ('Customers', customer.pk)})
+
+    def test_global_search_falls_back_before_rebuild(self):
+        item = self._item('BX-100', 'Acme Box')
+        SearchDocument.objects.all().delete()
+        resp = self.client.get('/api/v1/search/?q=acme')
+        self.assertEqual([r['id'] for r in resp.json()['results']], [item.pk])
+
+    def test_suggestions_search_uses_index(self):
+        items = [self._item(f'TP-{n}', f'Tape {n}') for n in range(3)]
+        self._item('BX-1', 'Box')
+        resp = self.client.get('/api/v1/suggestions/?entity_type=item&search=tape&page=1&page_size=2')
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual([r['id'] for r in data['results']], [items[0].pk, items[1].pk])
+        self.assertTrue(data['has_more'])
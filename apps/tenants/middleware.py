@@ -9,26 +9,66 @@ Resolution order:
 1. HTTP_X_TENANT_ID header (for API requests, mobile app)
 2. Subdomain (e.g., acme.ravensaas.com -> acme)
 3. Default tenant (for development)
+
+The middleware is both sync- and async-capable, so under ASGI async views
+run without a thread hop; the tenant is scoped with ``tenant_context`` and
+so stays per-request even when requests share a thread.
 """
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.http import HttpResponseForbidden
-from shared.managers import set_current_tenant, get_current_tenant
-from .models import Tenant
+from apps.api.principals import get_cached_tenant
+from shared.managers import tenant_context
 
 
 class TenantMiddleware:
     """
-    Middleware to resolve tenant from request and set in thread-local storage.
+    Middleware to resolve tenant from request and set the tenant context.
 
     This enables automatic query scoping via TenantManager.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
         # Resolve tenant from request
         tenant = self.get_tenant_from_request(request)
+        forbidden = self.check_tenant(request, tenant)
+        if forbidden:
+            return forbidden
+
+        # Scope the tenant to this request (for TenantManager automatic
+        # scoping); the previous value is restored when the request completes.
+        with tenant_context(tenant):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        # Tenant lookup touches the DB and request.user, so run it in a thread
+        tenant = await sync_to_async(self.get_tenant_from_request)(request)
+        forbidden = self.check_tenant(request, tenant)
+        if forbidden:
+            return forbidden
+
+        with tenant_context(tenant):
+            return await self.get_response(request)
+
+    def check_tenant(self, request, tenant):
+        """
+        Store the resolved tenant on the request.
 
+        Returns:
+            HttpResponseForbidden if no tenant was found for a tenant-scoped
+            path, else None.
+        """
         if not tenant:
             # No tenant found and not an admin/static request
             if not request.path.startswith(('/admin/', '/static/', '/media/')):
@@ -38,22 +78,15 @@ class TenantMiddleware:
 
         # Store tenant on request object (for views to access)
         request.tenant = tenant
-
-        # Store tenant in thread-local storage (for TenantManager automatic scoping)
-        set_current_tenant(tenant)
-
-        try:
-            response = self.get_response(request)
-        finally:
-            # Always clear tenant after request completes (important for thread pools)
-            set_current_tenant(None)
-
-        return response
+        return None
 
     def get_tenant_from_request(self, request):
         """
         Resolve tenant from request using multiple strategies.
 
+        Lookups go through the short-lived principal cache, which is
+        invalidated whenever a Tenant is saved or deleted.
+
         Returns:
             Tenant instance or None
         """
@@ -69,11 +102,11 @@ class TenantMiddleware:
                 user = getattr(request, 'user', None)
                 if user and user.is_authenticated:
                     if user.is_superuser:
-                        return Tenant.objects.filter(id=tenant_id_int, is_active=True).first()
+                        return get_cached_tenant(id=tenant_id_int)
                     # Regular user must belong to the requested tenant
                     user_tenant_id = getattr(user, 'tenant_id', None)
                     if user_tenant_id == tenant_id_int:
-                        return Tenant.objects.filter(id=tenant_id_int, is_active=True).first()
+                        return get_cached_tenant(id=tenant_id_int)
                 # If validation fails, fall through to other strategies (don't return None yet)
             except (ValueError, TypeError):
                 pass
@@ -93,10 +126,7 @@ class TenantMiddleware:
 
             # Skip common non-tenant subdomains
             if subdomain not in ['www', 'api', 'admin', 'localhost', '127']:
-                matched = Tenant.objects.filter(
-                    subdomain=subdomain,
-                    is_active=True
-                ).first()
+                matched = get_cached_tenant(subdomain=subdomain)
                 if matched:
                     return matched
                 # No match — fall through to the default-tenant fallback
@@ -104,4 +134,4 @@ class TenantMiddleware:
 
         # Strategy 3: Fallback to default tenant (for development and
         # IP-only / single-tenant deploys like the pilot).
-        return Tenant.objects.filter(is_default=True, is_active=True).first()
+        return get_cached_tenant(is_default=True)
@@ -251,6 +251,31 @@ def get_next_sequence_number(tenant, sequence_type):
         return number
 
 
+def reserve_sequence_numbers(tenant, sequence_type, count):
+    """
+    Atomically consume ``count`` consecutive numbers for a bulk insert.
+
+    Costs one locked read and one write however many numbers are taken.
+
+    Returns:
+        list[str]: Formatted numbers, in order
+    """
+    if count <= 0:
+        return []
+    with transaction.atomic():
+        seq = TenantSequence.objects.select_for_update().get(
+            tenant=tenant,
+            sequence_type=sequence_type
+        )
+        first = seq.next_value
+        seq.next_value += count
+        seq.save()
+        return [
+            f"{seq.prefix}{str(value).zfill(seq.padding)}"
+            for value in range(first, first + count)
+        ]
+
+
 def peek_next_sequence_number(tenant, sequence_type):
     """
     Read the next sequential number without consuming it.
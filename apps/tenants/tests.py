@@ -1,13 +1,19 @@
 # apps/tenants/tests.py
 """
-Tests for Tenant, TenantSettings, and TenantSequence models.
+Tests for Tenant, TenantSettings, and TenantSequence models, and the
+contextvars-based tenant context.
 """
-from django.test import TestCase
+import asyncio
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
 from django.db import IntegrityError
 
+from apps.tenants.middleware import TenantMiddleware
 from apps.tenants.models import Tenant, TenantSettings, TenantSequence
 from apps.parties.models import Party
-from shared.managers import set_current_tenant
+from shared.managers import set_current_tenant, get_current_tenant, tenant_context
 from users.models import User
 
 
@@ -87,3 +93,63 @@ class TenantModelTestCase(TestCase):
         set_current_tenant(tenant_a)
         visible = Party.objects.filter(tenant=tenant_a, code='ISO-CUST').exists()
         self.assertTrue(visible)
+
+
+class TenantContextTestCase(TestCase):
+    """Tests for tenant_context and the async TenantMiddleware path."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant_a = Tenant.objects.create(name='Ctx A', subdomain='test-ctx-a', is_default=True)
+        cls.tenant_b = Tenant.objects.create(name='Ctx B', subdomain='test-ctx-b')
+        for tenant in (cls.tenant_a, cls.tenant_b):
+            Party.objects.create(
+                tenant=tenant, party_type='CUSTOMER', code=f'CTX-{tenant.pk}',
+                display_name=tenant.name,
+            )
+
+    def setUp(self):
+        set_current_tenant(None)
+
+    def test_nested_context_restores_previous(self):
+        with tenant_context(self.tenant_a):
+            with tenant_context(self.tenant_b):
+                self.assertEqual(get_current_tenant(), self.tenant_b)
+            self.assertEqual(get_current_tenant(), self.tenant_a)
+        self.assertIsNone(get_current_tenant())
+
+    def test_concurrent_tasks_are_isolated(self):
+        """Interleaved tasks on one thread each see only their own tenant."""
+        def visible_parties():
+            return list(Party.objects.values_list('display_name', flat=True))
+
+        async def request(tenant):
+            with tenant_context(tenant):
+                await asyncio.sleep(0)  # let the other task run
+                seen = await sync_to_async(visible_parties)()
+                return get_current_tenant(), seen
+
+        async def both():
+            return await asyncio.gather(request(self.tenant_a), request(self.tenant_b))
+
+        (tenant_a, seen_a), (tenant_b, seen_b) = async_to_sync(both)()
+
+        self.assertEqual((tenant_a, seen_a), (self.tenant_a, ['Ctx A']))
+        self.assertEqual((tenant_b, seen_b), (self.tenant_b, ['Ctx B']))
+        self.assertIsNone(get_current_tenant())
+
+    def test_async_middleware_scopes_request(self):
+        seen = []
+
+        async def view(request):
+            seen.append((request.tenant, get_current_tenant()))
+            return HttpResponse('ok')
+
+        middleware = TenantMiddleware(view)
+        request = RequestFactory().get('/api/v1/items/')
+
+        response = async_to_sync(middleware)(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(seen, [(self.tenant_a, self.tenant_a)])
+        self.assertIsNone(get_current_tenant())
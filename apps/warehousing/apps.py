@@ -6,3 +6,7 @@ class WarehouseConfig(AppConfig):
     name = 'apps.warehousing'
     label = 'new_warehousing'  # Avoid conflict with legacy 'warehousing' app
     verbose_name = 'Warehousing'
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.warehousing.signals
@@ -5,22 +5,43 @@ Supports:
 - PDF sheets (Avery 5160: 30 labels per sheet, 3 columns x 10 rows)
 - ZPL (Zebra Programming Language for thermal printers)
 - Code 128 barcodes via python-barcode
+
+Large jobs: barcode SVGs are memoized per (symbology, data); PDF sheets
+over LABEL_PDF_CHUNK_PAGES pages are rendered in page-sized chunks across
+a process pool (LABEL_PDF_WORKERS) and concatenated with pypdf; ZPL can
+be streamed label by label (``iter_bin_labels_zpl``).
 """
 import io
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import repeat
+
+from django.conf import settings
 from django.template.loader import render_to_string
 
 logger = logging.getLogger(__name__)
 
+LABELS_PER_ROW = 3
+ROWS_PER_PAGE = 10
+
+# Distinct barcodes kept in memory per process (one SVG is a few KB)
+BARCODE_CACHE_SIZE = 4096
 
-def _render_barcode_svg(data: str) -> str:
-    """Generate Code 128 barcode as inline SVG string."""
+DEFAULT_PDF_CHUNK_PAGES = 10
+
+
+@lru_cache(maxsize=BARCODE_CACHE_SIZE)
+def _barcode_svg(symbology: str, data: str) -> str:
+    """Render a barcode as an SVG string (memoized)."""
     try:
         import barcode
         from barcode.writer import SVGWriter
-        code128 = barcode.get('code128', data, writer=SVGWriter())
+        code = barcode.get(symbology, data, writer=SVGWriter())
         buffer = io.BytesIO()
-        code128.write(buffer, options={
+        code.write(buffer, options={
             'module_width': 0.3,
             'module_height': 8,
             'font_size': 8,
@@ -38,6 +59,69 @@ def _render_barcode_svg(data: str) -> str:
         )
 
 
+def _render_barcode_svg(data: str, symbology: str = 'code128') -> str:
+    """Generate a barcode (Code 128 by default) as inline SVG string."""
+    return _barcode_svg(symbology, data)
+
+
+def _sheet_pages(labels):
+    """Lay labels out as Avery 5160 pages: lists of rows of 3 (None-padded)."""
+    labels = list(labels)
+    while len(labels) % LABELS_PER_ROW != 0:
+        labels.append(None)
+    rows = [labels[i:i + LABELS_PER_ROW] for i in range(0, len(labels), LABELS_PER_ROW)]
+    return [rows[i:i + ROWS_PER_PAGE] for i in range(0, len(rows), ROWS_PER_PAGE)]
+
+
+def _render_label_pages(template_name, pages):
+    """
+    Render sheet pages to PDF bytes, filling in barcode SVGs.
+
+    Runs in label worker processes for large jobs, so barcodes are rendered
+    in parallel too; each process keeps its own barcode cache.
+    """
+    from apps.documents.pdf import _render_pdf_bytes
+
+    for row in (row for page in pages for row in page):
+        for label in row:
+            if label and 'barcode_svg' not in label:
+                label['barcode_svg'] = _render_barcode_svg(label['barcode_data'])
+    return _render_pdf_bytes(render_to_string(template_name, {'pages': pages}))
+
+
+def _init_label_worker():
+    """Make sure Django is configured in pool workers (spawn/forkserver)."""
+    import django
+    django.setup()
+
+
+def _can_concat_pdfs():
+    return find_spec('pypdf') is not None
+
+
+def _concat_pdfs(parts):
+    """Concatenate PDF documents (bytes) in order."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(io.BytesIO(part))
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _zpl_2x1_label(label):
+    """ZPL for one standard 2x1 thermal label."""
+    return (
+        f"^XA\n"
+        f"^FO20,20^A0N,28,28^FD{label['line1']}^FS\n"
+        f"^FO20,55^A0N,20,20^FD{label['line2']}^FS\n"
+        f"^FO20,85^BY2^BCN,60,Y,N,N^FD{label['barcode_data']}^FS\n"
+        f"^XZ"
+    )
+
+
 class LabelService:
     """Service for generating printable barcode labels."""
 
@@ -59,14 +143,13 @@ class LabelService:
         from apps.items.models import Item
         item = Item.objects.get(pk=item_id, tenant=self.tenant)
 
-        labels = []
-        for _ in range(qty):
-            labels.append({
-                'line1': item.sku,
-                'line2': (item.name[:35] + '...') if len(item.name) > 35 else item.name,
-                'barcode_data': item.sku,
-                'barcode_svg': _render_barcode_svg(item.sku),
-            })
+        # Every copy is identical; barcodes are rendered (once) at PDF time
+        label = {
+            'line1': item.sku,
+            'line2': (item.name[:35] + '...') if len(item.name) > 35 else item.name,
+            'barcode_data': item.sku,
+        }
+        labels = [dict(label) for _ in range(qty)]
 
         if fmt == 'ZPL':
             return self._render_zpl_labels(labels, label_type='item')
@@ -84,32 +167,47 @@ class LabelService:
         Returns:
             bytes (PDF) or str (ZPL)
         """
+        if fmt == 'ZPL':
+            return '\n'.join(self.iter_bin_labels_zpl(warehouse_id, location_ids))
+        return self._render_pdf_sheet(
+            self._bin_label(loc) for loc in self._bin_locations(warehouse_id, location_ids)
+        )
+
+    def iter_bin_labels_zpl(self, warehouse_id=None, location_ids=None):
+        """
+        Return an iterator of bin label ZPL, one label at a time.
+
+        Locations are read with a server-side iterator, so relabeling a whole
+        warehouse never holds every location or the full ZPL in memory.
+        Callers joining the output should separate labels with newlines.
+        Raises ValueError up front (not on first iteration) for bad params.
+        """
+        locations = self._bin_locations(warehouse_id, location_ids)
+        return (
+            _zpl_2x1_label(self._bin_label(loc))
+            for loc in locations.iterator(chunk_size=500)
+        )
+
+    def _bin_locations(self, warehouse_id, location_ids):
         from apps.warehousing.models import WarehouseLocation
 
         if location_ids:
-            locations = WarehouseLocation.objects.filter(
+            return WarehouseLocation.objects.filter(
                 pk__in=location_ids, tenant=self.tenant
             ).select_related('warehouse').order_by('name')
         elif warehouse_id:
-            locations = WarehouseLocation.objects.filter(
+            return WarehouseLocation.objects.filter(
                 warehouse_id=warehouse_id, tenant=self.tenant, is_active=True,
             ).select_related('warehouse').order_by('name')
-        else:
-            raise ValueError("Must provide warehouse_id or location_ids")
-
-        labels = []
-        for loc in locations:
-            barcode_val = loc.barcode or loc.name
-            labels.append({
-                'line1': loc.name,
-                'line2': f'{loc.warehouse.code} - {loc.get_type_display()}',
-                'barcode_data': barcode_val,
-                'barcode_svg': _render_barcode_svg(barcode_val),
-            })
+        raise ValueError("Must provide warehouse_id or location_ids")
 
-        if fmt == 'ZPL':
-            return self._render_zpl_labels(labels, label_type='bin')
-        return self._render_pdf_sheet(labels)
+    @staticmethod
+    def _bin_label(loc):
+        return {
+            'line1': loc.name,
+            'line2': f'{loc.warehouse.code} - {loc.get_type_display()}',
+            'barcode_data': loc.barcode or loc.name,
+        }
 
     def generate_lpn_labels(self, lpn_ids, fmt='ZPL'):
         """
@@ -164,22 +262,36 @@ class LabelService:
         return '\n'.join(zpl_parts)
 
     def _render_pdf_sheet(self, labels):
-        """Render labels to Avery 5160 PDF sheet (30 per page, 3x10 grid)."""
-        from apps.documents.pdf import PDFService
-
-        # Pad labels to fill complete rows
-        while len(labels) % 3 != 0:
-            labels.append(None)
-
-        # Split into rows of 3
-        rows = [labels[i:i + 3] for i in range(0, len(labels), 3)]
+        """
+        Render labels to Avery 5160 PDF sheet (30 per page, 3x10 grid).
 
-        # Split into pages of 10 rows
-        pages = [rows[i:i + 10] for i in range(0, len(rows), 10)]
+        Jobs longer than LABEL_PDF_CHUNK_PAGES pages are rendered in chunks
+        of that many pages, in parallel across LABEL_PDF_WORKERS processes,
+        and concatenated. Without pypdf the sheet is rendered in one piece.
+        """
+        template_name = 'labels/avery_5160.html'
+        pages = _sheet_pages(labels)
+        chunk_pages = getattr(settings, 'LABEL_PDF_CHUNK_PAGES', DEFAULT_PDF_CHUNK_PAGES)
+        chunks = [pages[i:i + chunk_pages] for i in range(0, len(pages), chunk_pages)]
+
+        if len(chunks) <= 1 or not _can_concat_pdfs():
+            return _render_label_pages(template_name, pages)
+
+        workers = min(self._pdf_workers(), len(chunks))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_label_worker) as pool:
+                parts = list(pool.map(_render_label_pages, repeat(template_name), chunks))
+        else:
+            parts = [_render_label_pages(template_name, chunk) for chunk in chunks]
+        logger.info('Rendered %d label pages in %d chunks', len(pages), len(chunks))
+        return _concat_pdfs(parts)
 
-        return PDFService.render_to_pdf('labels/avery_5160.html', {
-            'pages': pages,
-        })
+    @staticmethod
+    def _pdf_workers():
+        workers = getattr(settings, 'LABEL_PDF_WORKERS', None)
+        if workers is None:
+            workers = min(4, os.cpu_count() or 1)
+        return workers
 
     def _render_pdf_4x6(self, labels):
         """Render 4x6 shipping labels as PDF."""
@@ -190,16 +302,7 @@ class LabelService:
 
     def _render_zpl_labels(self, labels, label_type='item'):
         """Render labels as ZPL for standard 2x1 thermal labels."""
-        zpl_parts = []
-        for label in labels:
-            zpl_parts.append(
-                f"^XA\n"
-                f"^FO20,20^A0N,28,28^FD{label['line1']}^FS\n"
-                f"^FO20,55^A0N,20,20^FD{label['line2']}^FS\n"
-                f"^FO20,85^BY2^BCN,60,Y,N,N^FD{label['barcode_data']}^FS\n"
-                f"^XZ"
-            )
-        return '\n'.join(zpl_parts)
+        return '\n'.join(_zpl_2x1_label(label) for label in labels)
 
     def _zpl_4x6_label(self, lpn_code, customer_name, order_number, weight='0'):
         """Generate ZPL for a single 4x6 shipping label."""
@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-18 22:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_stock_summary(apps, schema_editor):
+    StockQuant = apps.get_model('new_warehousing', 'StockQuant')
+    StockSummary = apps.get_model('new_warehousing', 'StockSummary')
+    rows = (
+        StockQuant.objects.values('tenant_id', 'item_id')
+        .annotate(on_hand=Sum('quantity'), reserved=Sum('reserved_quantity'))
+        .order_by()
+    )
+    StockSummary.objects.bulk_create([StockSummary(**row) for row in rows], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0016_historicalitem_extra_info_lines_and_more'),
+        ('new_warehousing', '0006_bin_height_bin_length_bin_max_capacity_bin_width'),
+        ('tenants', '0009_alter_tenantsequence_sequence_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('on_hand', models.DecimalField(decimal_places=4, default=0, help_text='Total quantity across all quants', max_digits=14)),
+                ('reserved', models.DecimalField(decimal_places=4, default=0, help_text='Total reserved quantity across all quants', max_digits=14)),
+                ('below_reorder', models.BooleanField(default=False, help_text='On hand was at or below the reorder point at the last check')),
+                ('reorder_alerted_at', models.DateTimeField(blank=True, help_text='When the last reorder alert was sent', null=True)),
+                ('item', models.OneToOneField(help_text='Item these totals are for', on_delete=django.db.models.deletion.CASCADE, related_name='stock_summary', to='items.item')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_set', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name_plural': 'stock summaries',
+                'indexes': [models.Index(fields=['tenant', 'below_reorder'], name='new_warehou_tenant__1e2d57_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_stock_summary, migrations.RunPython.noop),
+    ]
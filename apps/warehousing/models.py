@@ -8,6 +8,8 @@ Models:
 
 Note: Truck model is in apps.parties (scheduling resource).
 """
+from decimal import Decimal
+
 from django.db import models
 from django.conf import settings
 from shared.models import TenantMixin, TimestampMixin
@@ -377,10 +379,82 @@ class StockQuant(TenantMixin, TimestampMixin):
         """Unreserved stock available for new orders."""
         return self.quantity - self.reserved_quantity
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_stock()
+        return instance
+
+    def remember_stock(self):
+        """
+        Record the quantities as last saved, so the StockSummary signal
+        handlers can apply just the change.
+        """
+        self._saved_stock = (
+            Decimal(str(self.__dict__.get('quantity') or 0)),
+            Decimal(str(self.__dict__.get('reserved_quantity') or 0)),
+        )
+
     def __str__(self):
         return f"{self.item.sku} @ {self.location.name}: {self.quantity}"
 
 
+class StockSummary(TenantMixin, TimestampMixin):
+    """
+    Per-item stock totals across all quants (one row per tenant/item).
+
+    Maintained incrementally from StockQuant saves and deletes (see
+    apps.warehousing.signals) so reorder checks and low-stock reports read
+    one row instead of summing every quant. Queryset ``update()`` and
+    ``bulk_create`` on StockQuant bypass this; the ``rebuild_stock_summary``
+    command recomputes the table from quants.
+
+    ``below_reorder``/``reorder_alerted_at`` drive edge-triggered reorder
+    alerts: an alert is sent when stock falls to the reorder point, not on
+    every move while it stays there.
+    """
+    item = models.OneToOneField(
+        'items.Item',
+        on_delete=models.CASCADE,
+        related_name='stock_summary',
+        help_text="Item these totals are for"
+    )
+    on_hand = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        default=0,
+        help_text="Total quantity across all quants"
+    )
+    reserved = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        default=0,
+        help_text="Total reserved quantity across all quants"
+    )
+    below_reorder = models.BooleanField(
+        default=False,
+        help_text="On hand was at or below the reorder point at the last check"
+    )
+    reorder_alerted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the last reorder alert was sent"
+    )
+
+    class Meta:
+        verbose_name_plural = 'stock summaries'
+        indexes = [
+            models.Index(fields=['tenant', 'below_reorder']),
+        ]
+
+    @property
+    def available(self):
+        return self.on_hand - self.reserved
+
+    def __str__(self):
+        return f"{self.item.sku}: {self.on_hand} on hand"
+
+
 class StockMoveLog(TenantMixin, TimestampMixin):
     """
     Audit trail for all stock movements between locations.
@@ -0,0 +1,290 @@
+# apps/warehousing/pick_path.py
+"""
+Walk-path planning for picking.
+
+Orders picks by a serpentine (S-shape) traversal: visited aisles are walked
+in order, up the first, back down the next, and so on, with levels bottom to
+top inside each bay. Each pick location is placed using the structured
+``Bin.aisle``/``rack``/``level`` of the bin whose code matches the location
+name, falling back to parsing names like ``A-01-03``; anything unplaceable is
+visited last, by name.
+
+Usage:
+    planner = PickPathPlanner(tenant)
+    route = planner.plan_orders([so1, so2, so3])   # wave pick
+    for stop in route['stops']:
+        ...
+"""
+import re
+from collections import OrderedDict, defaultdict
+from decimal import Decimal
+
+from django.db import models
+
+from .models import Bin, StockQuant
+
+# Location names like A-01-03, A01-03, 12-4-B
+_SLOT_RE = re.compile(r'^\s*([A-Za-z]+|\d+)[-_. ]?(\d+)(?:[-_. ]+(\w+))?')
+
+# Location types stock is picked from (same as StockMoveService.get_picking_list)
+PICKABLE_LOCATION_TYPES = ['STORAGE', 'PICKING']
+
+
+def _natural_key(value):
+    """Sort key treating digit runs numerically: A2 < A10, 2 < 10."""
+    parts = re.split(r'(\d+)', str(value or '').strip().lower())
+    return tuple((0, int(p), '') if p.isdigit() else (1, 0, p) for p in parts if p)
+
+
+class PickPathPlanner:
+    """
+    Sequence pick locations into a serpentine walk and estimate travel.
+
+    Travel model: aisles are ``aisle_spacing_ft`` apart, bays
+    ``bay_width_ft`` wide; the picker starts and ends at the front of the
+    first aisle and changes aisles at the end the serpentine leaves from.
+    """
+
+    AISLE_SPACING_FT = 10
+    BAY_WIDTH_FT = 4
+
+    def __init__(self, tenant, aisle_spacing_ft=None, bay_width_ft=None):
+        self.tenant = tenant
+        self.aisle_spacing_ft = aisle_spacing_ft or self.AISLE_SPACING_FT
+        self.bay_width_ft = bay_width_ft or self.BAY_WIDTH_FT
+
+    # -- Placement ---------------------------------------------------------
+
+    def slots_for(self, locations):
+        """
+        Return {location.pk: (aisle, rack, level) or None} for
+        WarehouseLocation instances, with one Bin query.
+        """
+        locations = [loc for loc in locations if loc is not None]
+        bins = Bin.objects.filter(
+            tenant=self.tenant,
+            warehouse_id__in={loc.warehouse_id for loc in locations},
+            code__in={loc.name for loc in locations},
+        ).exclude(aisle='').values_list('warehouse_id', 'code', 'aisle', 'rack', 'level')
+        by_code = {(wh, code): (aisle, rack, level) for wh, code, aisle, rack, level in bins}
+
+        slots = {}
+        for loc in locations:
+            slot = by_code.get((loc.warehouse_id, loc.name))
+            if slot is None:
+                match = _SLOT_RE.match(loc.name or '')
+                if match:
+                    slot = (match.group(1), match.group(2), match.group(3) or '')
+            slots[loc.pk] = slot
+        return slots
+
+    def order(self, entries, location_of=lambda entry: entry['location']):
+        """Return ``entries`` sorted into walk order (stable for ties)."""
+        locations = {location_of(e).pk: location_of(e) for e in entries if location_of(e)}
+        slots = self.slots_for(locations.values())
+        keys = self._walk_keys(locations.values(), slots)
+        return sorted(
+            entries,
+            key=lambda e: keys[location_of(e).pk] if location_of(e) else (2,),
+        )
+
+    @staticmethod
+    def _layout(slots):
+        """Rank the aisles and racks present in ``slots`` (natural order)."""
+        placed = [slot for slot in slots.values() if slot]
+        aisles = sorted({slot[0] for slot in placed}, key=_natural_key)
+        racks = sorted({slot[1] for slot in placed}, key=_natural_key)
+        return (
+            {aisle: rank for rank, aisle in enumerate(aisles)},
+            {rack: index for index, rack in enumerate(racks)},
+        )
+
+    def _walk_keys(self, locations, slots):
+        """Map location pk -> sort key implementing the serpentine."""
+        aisle_rank, rack_index = self._layout(slots)
+        keys = {}
+        for loc in locations:
+            slot = slots[loc.pk]
+            if slot is None:
+                keys[loc.pk] = (1, _natural_key(loc.name))
+                continue
+            aisle, rack, level = slot
+            rank = aisle_rank[aisle]
+            # Walk odd-ranked aisles back to front.
+            rack_order = -rack_index[rack] if rank % 2 else rack_index[rack]
+            keys[loc.pk] = (0, rank, rack_order, _natural_key(level), loc.name)
+        return keys
+
+    # -- Routes ------------------------------------------------------------
+
+    def build_route(self, picks):
+        """
+        Group picks into stops in walk order and estimate travel.
+
+        Args:
+            picks: list of dicts with 'location' (WarehouseLocation or None),
+                'item', 'quantity', and optional 'lot', 'uom', 'order_number',
+                'line_number'. Picks without a location are returned in
+                'unlocated'.
+
+        Returns:
+            dict: {
+                'stops': [{'sequence', 'location', 'location_name', 'aisle',
+                           'rack', 'level', 'distance_ft', 'picks': [...]}],
+                'unlocated': [...],
+                'total_distance_ft': Decimal,
+                'stop_count': int,
+            }
+        """
+        located = [p for p in picks if p.get('location') is not None]
+        unlocated = [p for p in picks if p.get('location') is None]
+
+        stops = OrderedDict()
+        for pick in self.order(located):
+            loc = pick['location']
+            stop = stops.setdefault(loc.pk, {'location': loc, 'picks': OrderedDict()})
+            # Same item/lot at the same location across orders: one pick.
+            key = (pick['item'].pk, getattr(pick.get('lot'), 'pk', None))
+            merged = stop['picks'].get(key)
+            if merged is None:
+                merged = stop['picks'][key] = {
+                    'item': pick['item'],
+                    'sku': pick['item'].sku,
+                    'item_name': pick['item'].name,
+                    'lot': pick.get('lot'),
+                    'uom': pick.get('uom', ''),
+                    'quantity': Decimal('0'),
+                    'orders': [],
+                }
+            merged['quantity'] += Decimal(str(pick['quantity']))
+            if pick.get('order_number'):
+                merged['orders'].append({
+                    'order_number': pick['order_number'],
+                    'line_number': pick.get('line_number'),
+                    'quantity': Decimal(str(pick['quantity'])),
+                })
+
+        slots = self.slots_for([stop['location'] for stop in stops.values()])
+        positions, back_bay = self._positions(slots)
+        route_stops = []
+        total = Decimal('0')
+        previous = (0, 0)
+        for sequence, (loc_pk, stop) in enumerate(stops.items(), start=1):
+            slot = slots[loc_pk] or ('', '', '')
+            position = positions.get(loc_pk, previous)
+            distance = self._travel(previous, position, back_bay)
+            total += distance
+            previous = position
+            route_stops.append({
+                'sequence': sequence,
+                'location': stop['location'],
+                'location_name': stop['location'].name,
+                'aisle': slot[0],
+                'rack': slot[1],
+                'level': slot[2],
+                'distance_ft': distance,
+                'picks': list(stop['picks'].values()),
+            })
+        if route_stops:
+            total += self._travel(previous, (0, 0), back_bay)
+
+        return {
+            'stops': route_stops,
+            'unlocated': unlocated,
+            'total_distance_ft': total,
+            'stop_count': len(route_stops),
+        }
+
+    def _positions(self, slots):
+        """
+        Return ({location pk: (aisle rank, bay)}, back bay) for the travel
+        estimate. Numeric racks are their own bay number.
+        """
+        aisle_rank, rack_index = self._layout(slots)
+        rack_bay = {
+            rack: int(rack) if rack.isdigit() else index + 1
+            for rack, index in rack_index.items()
+        }
+        positions = {
+            pk: (aisle_rank[slot[0]], rack_bay[slot[1]])
+            for pk, slot in slots.items() if slot
+        }
+        return positions, max(rack_bay.values(), default=0)
+
+    def _travel(self, start, end, back_bay):
+        """Feet walked between two (aisle rank, bay) positions."""
+        (from_aisle, from_bay), (to_aisle, to_bay) = start, end
+        if from_aisle == to_aisle:
+            bays = abs(to_bay - from_bay)
+        else:
+            # Leave the aisle at the end the serpentine is heading to.
+            exit_bay = back_bay if from_aisle % 2 == 0 else 0
+            bays = abs(exit_bay - from_bay) + abs(to_bay - exit_bay)
+        feet = bays * self.bay_width_ft + abs(to_aisle - from_aisle) * self.aisle_spacing_ft
+        return Decimal(str(feet))
+
+    # -- Order picking -----------------------------------------------------
+
+    def picks_for_orders(self, sales_orders, warehouse=None):
+        """
+        Allocate pickable stock to sales order lines (FEFO, then FIFO by lot).
+
+        Stock is shared across the orders, so a wave never plans the same
+        units twice. Quantity that can't be located becomes a pick with
+        location None.
+        """
+        from apps.orders.models import SalesOrderLine
+
+        lines = list(
+            SalesOrderLine.objects.filter(
+                tenant=self.tenant, sales_order__in=sales_orders,
+            ).exclude(
+                fulfillment_method='direct',
+            ).select_related('item', 'uom', 'sales_order').order_by(
+                'sales_order__order_number', 'line_number',
+            )
+        )
+
+        quants = StockQuant.objects.filter(
+            tenant=self.tenant,
+            item_id__in={line.item_id for line in lines},
+            quantity__gt=0,
+            location__type__in=PICKABLE_LOCATION_TYPES,
+        ).select_related('location', 'lot').order_by(
+            models.F('lot__expiry_date').asc(nulls_last=True),
+            'lot__created_at',
+            'pk',
+        )
+        if warehouse is not None:
+            quants = quants.filter(location__warehouse=warehouse)
+
+        available = defaultdict(list)
+        for quant in quants:
+            available[quant.item_id].append([quant, quant.quantity])
+
+        picks = []
+        for line in lines:
+            remaining = Decimal(line.quantity_ordered)
+            common = {
+                'item': line.item,
+                'uom': line.uom.code if line.uom else '',
+                'order_number': line.sales_order.order_number,
+                'line_number': line.line_number,
+            }
+            for entry in available[line.item_id]:
+                if remaining <= 0:
+                    break
+                quant, left = entry
+                if left <= 0:
+                    continue
+                take = min(remaining, left)
+                entry[1] -= take
+                remaining -= take
+                picks.append({**common, 'location': quant.location, 'lot': quant.lot, 'quantity': take})
+            if remaining > 0:
+                picks.append({**common, 'location': None, 'lot': None, 'quantity': remaining})
+        return picks
+
+    def plan_orders(self, sales_orders, warehouse=None):
+        """Wave plan: allocate, merge same-bin picks across orders, route."""
+        return self.build_route(self.picks_for_orders(sales_orders, warehouse))
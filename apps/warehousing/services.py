@@ -5,13 +5,16 @@ Service layer for warehouse stock movements.
 Provides transactional stock movement operations with full audit trail
 and concurrency safety.
 """
+from datetime import timedelta
 from decimal import Decimal
-from django.db import transaction, models
+from django.conf import settings
+from django.db import IntegrityError, transaction, models
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from .models import (
     WarehouseLocation, Lot, StockQuant, StockMoveLog,
-    CycleCount, CycleCountLine,
+    CycleCount, CycleCountLine, StockSummary,
 )
 
 
@@ -90,21 +93,9 @@ class StockMoveService:
                 reference=reference,
             )
 
-            # Check reorder point
+            # Alert Purchasing when stock crosses the reorder point
             try:
-                from apps.notifications.services import notify_group
-                total_on_hand = StockQuant.objects.filter(
-                    tenant=self.tenant, item=item,
-                ).aggregate(total=models.Sum('quantity'))['total'] or 0
-                if item.reorder_point and total_on_hand <= item.reorder_point:
-                    notify_group(
-                        tenant=self.tenant,
-                        group_name='Purchasing',
-                        title=f'Reorder Alert: {item.sku}',
-                        message=f'{item.name} is at {total_on_hand} (reorder point: {item.reorder_point})',
-                        link=f'/items/{item.id}',
-                        notification_type='WARNING',
-                    )
+                StockSummaryService(self.tenant, self.user).check_reorder(item)
             except Exception:
                 pass
 
@@ -122,9 +113,13 @@ class StockMoveService:
         """
         Generate a pick list using FEFO (First Expired, First Out) strategy.
         Falls back to FIFO by lot creation date for items without expiry.
+        The selected quants are returned in serpentine walk order (see
+        PickPathPlanner), not allocation order.
 
         Returns list of dicts: [{'quant': StockQuant, 'pick_qty': Decimal}, ...]
         """
+        from .pick_path import PickPathPlanner
+
         qty_needed = Decimal(str(qty_needed))
         quants = StockQuant.objects.filter(
             tenant=self.tenant,
@@ -136,7 +131,7 @@ class StockMoveService:
         if warehouse:
             quants = quants.filter(location__warehouse=warehouse)
 
-        # Order: lots with expiry first (soonest first), then by location name for efficient path
+        # Allocation order: lots with expiry first (soonest first), then oldest lot
         quants = quants.order_by(
             models.F('lot__expiry_date').asc(nulls_last=True),
             'lot__created_at',
@@ -158,7 +153,9 @@ class StockMoveService:
                 f"Needed: {qty_needed}, Short: {remaining}"
             )
 
-        return picks
+        return PickPathPlanner(self.tenant).order(
+            picks, location_of=lambda pick: pick['quant'].location,
+        )
 
     def reserve_stock(self, item, qty, warehouse=None):
         """
@@ -273,9 +270,192 @@ class StockMoveService:
             )
             quant.quantity += qty
             quant.save(update_fields=['quantity', 'updated_at'])
+
+            # Re-arms the reorder alert once stock is back above the point
+            try:
+                StockSummaryService(self.tenant, self.user).check_reorder(item)
+            except Exception:
+                pass
             return quant
 
 
+class StockSummaryService:
+    """
+    Maintains StockSummary (per-item totals over StockQuant) and the
+    edge-triggered reorder alerts built on it.
+
+    StockQuant saves/deletes call ``apply_delta`` through signals (see
+    apps.warehousing.signals); ``rebuild`` recomputes the table from quants
+    for repair or after bulk quant writes.
+
+    Usage:
+        svc = StockSummaryService(tenant)
+        svc.check_reorder(item)
+        problems = svc.rebuild(verify_only=True)
+    """
+
+    def __init__(self, tenant, user=None):
+        self.tenant = tenant
+        self.user = user
+
+    # ===== MAINTENANCE =====
+
+    @staticmethod
+    def apply_delta(tenant_id, item_id, on_hand=0, reserved=0):
+        """
+        Add a change in on-hand/reserved quantity to an item's summary.
+
+        Takes ids so the quant signal handlers never load the tenant or item.
+        """
+        on_hand, reserved = Decimal(str(on_hand)), Decimal(str(reserved))
+        if not on_hand and not reserved:
+            return
+        summaries = StockSummary.objects.all_tenants().filter(tenant_id=tenant_id, item_id=item_id)
+        changes = {
+            'on_hand': models.F('on_hand') + on_hand,
+            'reserved': models.F('reserved') + reserved,
+            'updated_at': timezone.now(),
+        }
+        if summaries.update(**changes):
+            return
+
+        # First change for this item: seed the row from its quants, which
+        # already include this change.
+        totals = StockQuant.objects.all_tenants().filter(
+            tenant_id=tenant_id, item_id=item_id,
+        ).aggregate(**_quant_totals())
+        try:
+            with transaction.atomic():
+                StockSummary.objects.all_tenants().create(
+                    tenant_id=tenant_id, item_id=item_id, **totals,
+                )
+        except IntegrityError:
+            # Seeded concurrently by a transaction that couldn't see this change
+            summaries.update(**changes)
+
+    def refresh(self, item_ids):
+        """
+        Recompute the summaries of the given items from their quants, after
+        bulk quant writes, and re-arm reorder alerts for items now back
+        above their reorder point.
+        """
+        self.rebuild(item_ids=item_ids)
+        StockSummary.objects.all_tenants().filter(
+            tenant=self.tenant,
+            item_id__in=item_ids,
+            below_reorder=True,
+            on_hand__gt=models.F('item__reorder_point'),
+        ).update(below_reorder=False, updated_at=timezone.now())
+
+    def rebuild(self, verify_only=False, item_ids=None):
+        """
+        Recompute StockSummary totals for this tenant from StockQuant.
+
+        Args:
+            verify_only: Only report differences; write nothing.
+            item_ids: Limit to these items (default: every item with stock
+                or a summary row).
+
+        Returns:
+            list of str describing summaries that were missing or stale
+            (empty when the table was correct)
+        """
+        quants = StockQuant.objects.all_tenants().filter(tenant=self.tenant)
+        summaries = StockSummary.objects.all_tenants().filter(tenant=self.tenant)
+        if item_ids is not None:
+            quants = quants.filter(item_id__in=item_ids)
+            summaries = summaries.filter(item_id__in=item_ids)
+
+        expected = {
+            row.pop('item_id'): row
+            for row in quants.values('item_id').annotate(**_quant_totals()).order_by()
+        }
+        existing = {summary.item_id: summary for summary in summaries.select_related('item')}
+
+        problems = []
+        stale, missing = [], []
+        for item_id, summary in existing.items():
+            want = expected.get(item_id, {'on_hand': Decimal('0'), 'reserved': Decimal('0')})
+            if summary.on_hand != want['on_hand'] or summary.reserved != want['reserved']:
+                problems.append(
+                    f"stale summary for {summary.item.sku}: "
+                    f"{summary.on_hand}/{summary.reserved} != {want['on_hand']}/{want['reserved']}"
+                )
+                summary.on_hand, summary.reserved = want['on_hand'], want['reserved']
+                summary.updated_at = timezone.now()
+                stale.append(summary)
+        for item_id, want in expected.items():
+            if item_id not in existing:
+                problems.append(f"missing summary for item {item_id}")
+                missing.append(StockSummary(tenant=self.tenant, item_id=item_id, **want))
+
+        if verify_only:
+            return problems
+
+        with transaction.atomic():
+            StockSummary.objects.bulk_update(stale, ['on_hand', 'reserved', 'updated_at'], batch_size=500)
+            StockSummary.objects.bulk_create(missing, batch_size=500)
+        return problems
+
+    # ===== REORDER ALERTS =====
+
+    def check_reorder(self, item):
+        """
+        Alert Purchasing when ``item`` crosses down to its reorder point.
+
+        Fires once per crossing: the summary remembers that stock is below
+        the point, and the flag is cleared when stock recovers. A crossing
+        within REORDER_ALERT_DEBOUNCE_MINUTES of the previous alert (stock
+        bouncing around the threshold) is recorded without notifying.
+
+        Returns:
+            bool: True if an alert was sent
+        """
+        if not item.reorder_point:
+            return False
+
+        with transaction.atomic():
+            summary, _ = StockSummary.objects.all_tenants().select_for_update().get_or_create(
+                tenant=self.tenant, item=item,
+            )
+            below = summary.on_hand <= item.reorder_point
+            if below == summary.below_reorder:
+                return False
+
+            now = timezone.now()
+            debounce = timedelta(minutes=getattr(settings, 'REORDER_ALERT_DEBOUNCE_MINUTES', 60))
+            send = below and (
+                summary.reorder_alerted_at is None
+                or now - summary.reorder_alerted_at >= debounce
+            )
+            summary.below_reorder = below
+            if send:
+                summary.reorder_alerted_at = now
+            summary.save(update_fields=['below_reorder', 'reorder_alerted_at', 'updated_at'])
+
+        if send:
+            from apps.notifications.services import notify_group
+            notify_group(
+                tenant=self.tenant,
+                group_name='Purchasing',
+                title=f'Reorder Alert: {item.sku}',
+                message=f'{item.name} is at {summary.on_hand} (reorder point: {item.reorder_point})',
+                link=f'/items/{item.id}',
+                notification_type='WARNING',
+            )
+        return send
+
+
+def _quant_totals():
+    """Aggregate expressions for StockSummary's on_hand/reserved."""
+    def total(field):
+        return Coalesce(
+            models.Sum(field), models.Value(Decimal('0')),
+            output_field=models.DecimalField(max_digits=14, decimal_places=4),
+        )
+    return {'on_hand': total('quantity'), 'reserved': total('reserved_quantity')}
+
+
 class CycleCountService:
     """Service for managing inventory cycle counts (audits)."""
 
@@ -338,18 +518,12 @@ class CycleCountService:
                 'location__warehouse': cycle_count.warehouse,
                 'quantity__gt': 0,
             }
-            if cycle_count.zone:
-                # Include zone and its children
-                zone_ids = [cycle_count.zone.id]
-                children = WarehouseLocation.objects.filter(
-                    tenant=self.tenant, parent=cycle_count.zone
-                ).values_list('id', flat=True)
-                zone_ids.extend(children)
-                loc_filter['location_id__in'] = zone_ids
-
             quants = StockQuant.objects.filter(**loc_filter).select_related(
                 'item', 'location', 'lot'
             )
+            if cycle_count.zone:
+                # Include the zone and everything beneath it
+                quants = quants.filter(self._zone_subtree_q(cycle_count.zone, 'location__'))
 
             lines = []
             for quant in quants:
@@ -393,7 +567,22 @@ class CycleCountService:
         line.save()
         return line
 
-    def finalize_count(self, cycle_count):
+    @staticmethod
+    def _zone_subtree_q(zone, prefix=''):
+        """
+        Q matching ``zone`` and every location beneath it: children linked by
+        ``parent`` plus locations whose materialized ``parent_path`` is the
+        zone's path ("Zone A / Aisle 1") or starts with it.
+        """
+        zone_path = f"{zone.parent_path} / {zone.name}" if zone.parent_path else zone.name
+        return (
+            models.Q(**{f'{prefix}pk': zone.pk})
+            | models.Q(**{f'{prefix}parent': zone})
+            | models.Q(**{f'{prefix}parent_path': zone_path})
+            | models.Q(**{f'{prefix}parent_path__startswith': f"{zone_path} / "})
+        )
+
+    def finalize_count(self, cycle_count, bulk=True):
         """
         Finalize a cycle count: generate adjustment moves for variances.
 
@@ -402,6 +591,10 @@ class CycleCountService:
         - Negative variance (shortage): Move stock from actual location to ADJUSTMENT location
 
         Uses a virtual 'INVENTORY_ADJUSTMENT' location as the counterpart.
+
+        With ``bulk=True`` (default) all quant changes are computed in memory
+        and applied with one locked read, bulk writes and one StockMoveLog
+        insert; ``bulk=False`` replays each line through StockMoveService.
         """
         if cycle_count.status != 'in_progress':
             raise ValidationError(f"Cannot finalize count with status: {cycle_count.status}")
@@ -410,8 +603,6 @@ class CycleCountService:
         if uncounted > 0:
             raise ValidationError(f"{uncounted} lines have not been counted yet.")
 
-        move_svc = StockMoveService(self.tenant, self.user)
-
         with transaction.atomic():
             # Get or create the adjustment location
             adj_loc, _ = WarehouseLocation.objects.get_or_create(
@@ -425,41 +616,129 @@ class CycleCountService:
                 },
             )
 
-            lines_with_variance = cycle_count.lines.filter(~models.Q(variance=0))
-            for line in lines_with_variance.select_related('item', 'location', 'lot'):
-                ref = f"{cycle_count.count_number} adjustment"
-
-                if line.variance > 0:
-                    # Overage: stock appeared — create at adjustment loc, move to real loc
-                    move_svc.create_putaway_quant(
-                        item=line.item,
-                        qty=line.variance,
-                        receiving_loc=adj_loc,
-                        lot=line.lot,
-                        reference=ref,
-                    )
-                    move_svc.execute_stock_move(
-                        item=line.item,
-                        qty=line.variance,
-                        source_loc=adj_loc,
-                        dest_loc=line.location,
-                        lot=line.lot,
-                        reference=ref,
-                    )
-                elif line.variance < 0:
-                    # Shortage: stock missing — move from real loc to adjustment
-                    shortage = abs(line.variance)
-                    move_svc.execute_stock_move(
-                        item=line.item,
-                        qty=shortage,
-                        source_loc=line.location,
-                        dest_loc=adj_loc,
-                        lot=line.lot,
-                        reference=ref,
-                    )
+            lines_with_variance = cycle_count.lines.filter(
+                ~models.Q(variance=0),
+            ).select_related('item', 'location', 'lot')
+            if bulk:
+                self._apply_variances_bulk(cycle_count, list(lines_with_variance), adj_loc)
+            else:
+                self._apply_variances(cycle_count, lines_with_variance, adj_loc)
 
             cycle_count.status = 'completed'
             cycle_count.completed_at = timezone.now()
             cycle_count.save(update_fields=['status', 'completed_at', 'updated_at'])
 
         return cycle_count
+
+    def _apply_variances(self, cycle_count, lines, adj_loc):
+        """Post each variance line as individual stock moves."""
+        move_svc = StockMoveService(self.tenant, self.user)
+        ref = f"{cycle_count.count_number} adjustment"
+        for line in lines:
+            if line.variance > 0:
+                # Overage: stock appeared — create at adjustment loc, move to real loc
+                move_svc.create_putaway_quant(
+                    item=line.item,
+                    qty=line.variance,
+                    receiving_loc=adj_loc,
+                    lot=line.lot,
+                    reference=ref,
+                )
+                move_svc.execute_stock_move(
+                    item=line.item,
+                    qty=line.variance,
+                    source_loc=adj_loc,
+                    dest_loc=line.location,
+                    lot=line.lot,
+                    reference=ref,
+                )
+            elif line.variance < 0:
+                # Shortage: stock missing — move from real loc to adjustment
+                shortage = abs(line.variance)
+                move_svc.execute_stock_move(
+                    item=line.item,
+                    qty=shortage,
+                    source_loc=line.location,
+                    dest_loc=adj_loc,
+                    lot=line.lot,
+                    reference=ref,
+                )
+
+    def _apply_variances_bulk(self, cycle_count, lines, adj_loc):
+        """
+        Same end state as _apply_variances: overages land at the counted
+        location, shortages move to the adjustment location. Quants are
+        read once under lock, then updated/created/deleted in bulk.
+        """
+        if not lines:
+            return
+        ref = f"{cycle_count.count_number} adjustment"
+
+        # (item_id, location_id, lot_id) -> quantity change
+        deltas = {}
+        logs = []
+        for line in lines:
+            key = (line.item_id, line.location_id, line.lot_id)
+            deltas[key] = deltas.get(key, Decimal('0')) + line.variance
+            if line.variance > 0:
+                source, dest, qty = adj_loc, line.location, line.variance
+            else:
+                qty = -line.variance
+                adj_key = (line.item_id, adj_loc.pk, line.lot_id)
+                deltas[adj_key] = deltas.get(adj_key, Decimal('0')) + qty
+                source, dest = line.location, adj_loc
+            logs.append(StockMoveLog(
+                tenant=self.tenant,
+                item_id=line.item_id,
+                source_location=source,
+                destination_location=dest,
+                lot_id=line.lot_id,
+                quantity=qty,
+                moved_by=self.user,
+                reference=ref,
+            ))
+
+        existing = {
+            (q.item_id, q.location_id, q.lot_id): q
+            for q in StockQuant.objects.select_for_update().filter(
+                tenant=self.tenant,
+                item_id__in={key[0] for key in deltas},
+                location_id__in={key[1] for key in deltas},
+            )
+        }
+        line_for = {(line.item_id, line.location_id, line.lot_id): line for line in lines}
+
+        now = timezone.now()
+        to_update, to_create, to_delete = [], [], []
+        for key, delta in deltas.items():
+            if not delta:
+                continue
+            quant = existing.get(key)
+            current = quant.quantity if quant else Decimal('0')
+            new_qty = current + delta
+            if new_qty < 0 or (quant and new_qty < quant.reserved_quantity):
+                line = line_for[key]
+                raise ValidationError(
+                    f"Insufficient stock at {line.location.name} for {line.item.sku}. "
+                    f"Available: {current}, Requested: {-delta}"
+                )
+            if quant is None:
+                to_create.append(StockQuant(
+                    tenant=self.tenant, item_id=key[0], location_id=key[1], lot_id=key[2],
+                    quantity=new_qty,
+                ))
+            elif new_qty == 0:
+                to_delete.append(quant.pk)
+            else:
+                quant.quantity = new_qty
+                quant.updated_at = now
+                to_update.append(quant)
+
+        StockQuant.objects.bulk_update(to_update, ['quantity', 'updated_at'], batch_size=500)
+        StockQuant.objects.bulk_create(to_create, batch_size=500)
+        if to_delete:
+            StockQuant.objects.filter(tenant=self.tenant, pk__in=to_delete).delete()
+        StockMoveLog.objects.bulk_create(logs, batch_size=500)
+
+        # Bulk writes skip the per-quant signals; recount the touched items.
+        StockSummaryService(self.tenant, self.user).refresh({key[0] for key in deltas})
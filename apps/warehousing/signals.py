@@ -0,0 +1,43 @@
+# apps/warehousing/signals.py
+"""
+Signals that keep StockSummary in step with StockQuant.
+
+Each save/delete applies only the change in quantity/reserved_quantity
+since the quant was loaded (or last saved), as one UPDATE of the item's
+summary row; nothing is re-summed.
+"""
+from decimal import Decimal
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import StockQuant
+
+
+@receiver(post_save, sender=StockQuant)
+def apply_quant_save(sender, instance, created, raw=False, **kwargs):
+    """Add the quant's change since it was loaded to its item's summary."""
+    if raw:
+        return
+    from .services import StockSummaryService
+    before = (0, 0) if created else getattr(instance, '_saved_stock', None)
+    if before is None:
+        # Instance built outside the ORM loaders; fall back to a recount.
+        StockSummaryService(instance.tenant).refresh([instance.item_id])
+    else:
+        StockSummaryService.apply_delta(
+            instance.tenant_id, instance.item_id,
+            on_hand=Decimal(str(instance.quantity)) - before[0],
+            reserved=Decimal(str(instance.reserved_quantity)) - before[1],
+        )
+    instance.remember_stock()
+
+
+@receiver(post_delete, sender=StockQuant)
+def apply_quant_delete(sender, instance, **kwargs):
+    """Remove the deleted quant's stock from its item's summary."""
+    from .services import StockSummaryService
+    before = getattr(instance, '_saved_stock', (instance.quantity, instance.reserved_quantity))
+    StockSummaryService.apply_delta(
+        instance.tenant_id, instance.item_id, on_hand=-before[0], reserved=-before[1],
+    )
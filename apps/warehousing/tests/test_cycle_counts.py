@@ -0,0 +1,134 @@
+# apps/warehousing/tests/test_cycle_counts.py
+"""
+Tests for bulk cycle count finalization and subtree zone selection.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.items.models import UnitOfMeasure, Item
+from apps.tenants.models import Tenant
+from apps.warehousing.models import (
+    Warehouse, WarehouseLocation, StockQuant, StockMoveLog, StockSummary,
+)
+from apps.warehousing.services import CycleCountService
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class CycleCountFinalizeTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Count Co', subdomain='test-cycle-bulk')
+        cls.user = User.objects.create_user(username='counter', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        cls.warehouse = Warehouse.objects.create(tenant=cls.tenant, code='MAIN', name='Main')
+        cls.items = [
+            Item.objects.create(tenant=cls.tenant, sku=f'CC-{i}', name=f'Counted {i}', base_uom=cls.uom)
+            for i in range(12)
+        ]
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.svc = CycleCountService(self.tenant, self.user)
+
+    def _location(self, name, parent_path='', parent=None, loc_type='STORAGE'):
+        return WarehouseLocation.objects.create(
+            tenant=self.tenant, warehouse=self.warehouse, name=name, barcode=f'B-{name}',
+            type=loc_type, parent_path=parent_path, parent=parent,
+        )
+
+    def _count(self, counts, zone=None, bulk=True):
+        """Start a count, record {(item, location): counted} and finalize it."""
+        count = self.svc.start_count(self.svc.create_count(self.warehouse, zone=zone))
+        for line in count.lines.all():
+            counted = counts.get((line.item_id, line.location_id), line.expected_quantity)
+            self.svc.record_count(line.pk, counted)
+        return self.svc.finalize_count(count, bulk=bulk)
+
+    def _state(self):
+        return sorted(
+            StockQuant.objects.filter(tenant=self.tenant).values_list('item__sku', 'location__name', 'quantity')
+        )
+
+    def _stock_and_counts(self, shelf, n):
+        counts = {}
+        for i, item in enumerate(self.items[:n]):
+            StockQuant.objects.create(tenant=self.tenant, item=item, location=shelf, quantity=10)
+            counts[(item.pk, shelf.pk)] = Decimal(12 if i % 2 else 7)
+        return counts
+
+    def test_bulk_matches_per_line_postings(self):
+        shelf = self._location('A-01')
+        counts = self._stock_and_counts(shelf, 4)
+        self._count(counts, bulk=False)
+        expected_state = self._state()
+        expected_logs = sorted(StockMoveLog.objects.values_list(
+            'item__sku', 'source_location__name', 'destination_location__name', 'quantity',
+        ))
+
+        StockQuant.objects.all().delete()
+        StockMoveLog.objects.all().delete()
+        counts = self._stock_and_counts(shelf, 4)
+        self._count(counts, bulk=True)
+
+        self.assertEqual(self._state(), expected_state)
+        self.assertEqual(sorted(StockMoveLog.objects.values_list(
+            'item__sku', 'source_location__name', 'destination_location__name', 'quantity',
+        )), expected_logs)
+        # Overages add to on hand; shortages move to the adjustment location
+        self.assertEqual(StockSummary.objects.get(item=self.items[1]).on_hand, Decimal('12'))
+        self.assertEqual(StockSummary.objects.get(item=self.items[0]).on_hand, Decimal('10'))
+
+    def test_bulk_query_count_independent_of_lines(self):
+        self._location('INVENTORY-ADJUSTMENT', loc_type='INTERNAL')
+        query_counts = []
+        for name, n in (('A-01', 3), ('B-01', 12)):
+            StockQuant.objects.all().delete()
+            shelf = self._location(name)
+            counts = self._stock_and_counts(shelf, n)
+            count = self.svc.start_count(self.svc.create_count(self.warehouse, zone=shelf))
+            for line in count.lines.all():
+                self.svc.record_count(line.pk, counts[(line.item_id, line.location_id)])
+            with CaptureQueriesContext(connection) as ctx:
+                self.svc.finalize_count(count)
+            query_counts.append(len(ctx.captured_queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_shortage_beyond_stock_rolls_back(self):
+        shelf = self._location('A-01')
+        StockQuant.objects.create(tenant=self.tenant, item=self.items[0], location=shelf, quantity=10)
+        count = self.svc.start_count(self.svc.create_count(self.warehouse))
+        line = count.lines.get()
+        self.svc.record_count(line.pk, 2)
+        StockQuant.objects.filter(item=self.items[0]).update(quantity=5)  # picked meanwhile
+
+        with self.assertRaises(ValidationError):
+            self.svc.finalize_count(count)
+
+        count.refresh_from_db()
+        self.assertEqual(count.status, 'in_progress')
+        self.assertFalse(StockMoveLog.objects.exists())
+
+    def test_zone_includes_subtree_by_parent_path(self):
+        zone = self._location('Zone A', loc_type='VIEW')
+        direct = self._location('A-DIRECT', parent=zone)
+        aisle = self._location('A-01', parent_path='Zone A')
+        deep = self._location('A-01-03', parent_path='Zone A / Aisle 1')
+        outside = self._location('AB-01', parent_path='Zone AB')
+        for i, loc in enumerate((direct, aisle, deep, outside)):
+            StockQuant.objects.create(tenant=self.tenant, item=self.items[i], location=loc, quantity=1)
+
+        count = self.svc.start_count(self.svc.create_count(self.warehouse, zone=zone))
+
+        self.assertEqual(
+            sorted(count.lines.values_list('location__name', flat=True)),
+            ['A-01', 'A-01-03', 'A-DIRECT'],
+        )
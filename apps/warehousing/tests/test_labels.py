@@ -11,8 +11,9 @@ import os
 from decimal import Decimal
 from datetime import date
 from unittest import skipIf
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -23,6 +24,7 @@ from apps.items.models import UnitOfMeasure, Item
 from apps.warehousing.models import Warehouse, WarehouseLocation
 from apps.orders.models import SalesOrder
 from apps.logistics.models import LicensePlate
+from apps.warehousing import labels
 from apps.warehousing.labels import LabelService
 from shared.managers import set_current_tenant
 
@@ -307,6 +309,67 @@ class LabelServiceLPNTests(LabelsTestCase):
         self.assertIn('LPN-LBL-002', result)
 
 
+# =============================================================================
+# LABEL SERVICE - LARGE JOBS
+# =============================================================================
+
+def _fake_pdf(html):
+    """Stand-in PDF backend: one 'page' marker per sheet page."""
+    pages = html.count('class="page"')
+    return f'PDF[{pages}]'.encode()
+
+
+@patch('apps.documents.pdf._render_pdf_bytes', side_effect=_fake_pdf)
+class LabelServiceLargeJobTests(LabelsTestCase):
+    """Tests for barcode memoization, chunked PDF sheets and ZPL streaming."""
+
+    def setUp(self):
+        super().setUp()
+        labels._barcode_svg.cache_clear()
+
+    def test_item_label_copies_render_barcode_once(self, mock_pdf):
+        self.service.generate_item_labels(self.item.id, qty=60, fmt='PDF')
+
+        info = labels._barcode_svg.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 59))
+        self.assertEqual(mock_pdf.call_count, 1)
+
+    @override_settings(LABEL_PDF_CHUNK_PAGES=2, LABEL_PDF_WORKERS=1)
+    @patch('apps.warehousing.labels._can_concat_pdfs', return_value=True)
+    @patch('apps.warehousing.labels._concat_pdfs', side_effect=b'+'.join)
+    def test_large_sheet_rendered_in_chunks(self, mock_concat, mock_can_concat, mock_pdf):
+        result = self.service._render_pdf_sheet(
+            {'line1': f'L{i}', 'line2': '', 'barcode_data': f'L{i}'} for i in range(151)
+        )
+
+        # 151 labels -> 6 pages -> chunks of 2, 2, 2
+        self.assertEqual(result, b'PDF[2]+PDF[2]+PDF[2]')
+        self.assertEqual(labels._barcode_svg.cache_info().misses, 151)
+
+    @override_settings(LABEL_PDF_CHUNK_PAGES=2)
+    @patch('apps.warehousing.labels._can_concat_pdfs', return_value=False)
+    def test_sheet_without_pdf_merger_renders_once(self, mock_can_concat, mock_pdf):
+        result = self.service._render_pdf_sheet(
+            {'line1': f'L{i}', 'line2': '', 'barcode_data': f'L{i}'} for i in range(151)
+        )
+        self.assertEqual(result, b'PDF[6]')
+
+    def test_zpl_stream_matches_generated_labels(self, mock_pdf):
+        stream = self.service.iter_bin_labels_zpl(warehouse_id=self.warehouse.id)
+
+        self.assertNotIsInstance(stream, (str, list))
+        self.assertEqual(
+            '\n'.join(stream),
+            self.service.generate_bin_labels(warehouse_id=self.warehouse.id, fmt='ZPL'),
+        )
+        # ZPL never renders SVG barcodes
+        self.assertEqual(labels._barcode_svg.cache_info().misses, 0)
+
+    def test_zpl_stream_validates_eagerly(self, mock_pdf):
+        with self.assertRaises(ValueError):
+            self.service.iter_bin_labels_zpl()
+
+
 # =============================================================================
 # API ENDPOINT - ITEM LABELS
 # =============================================================================
@@ -372,7 +435,10 @@ class BinLabelsAPITests(LabelsTestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response['Content-Type'], 'text/plain')
-        self.assertIn(b'^XA', response.content)
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content)
+        self.assertIn(b'^XA', content)
+        self.assertEqual(content.count(b'^XA'), 2)
 
     def test_post_bin_labels_missing_params(self):
         """POST without warehouse_id or location_ids returns 400."""
@@ -0,0 +1,148 @@
+# apps/warehousing/tests/test_pick_path.py
+"""
+Tests for walk-path pick planning (PickPathPlanner).
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.items.models import UnitOfMeasure, Item
+from apps.orders.models import SalesOrder, SalesOrderLine
+from apps.parties.models import Customer, Location, Party
+from apps.tenants.models import Tenant
+from apps.warehousing.models import Bin, Warehouse, WarehouseLocation, StockQuant
+from apps.warehousing.pick_path import PickPathPlanner
+from apps.warehousing.services import StockMoveService
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class PickPathTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Path Co', subdomain='test-pick-path', is_default=True)
+        cls.user = User.objects.create_user(username='pathuser', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        cls.item = Item.objects.create(tenant=cls.tenant, sku='P-1', name='Part 1', base_uom=cls.uom)
+        cls.item2 = Item.objects.create(tenant=cls.tenant, sku='P-2', name='Part 2', base_uom=cls.uom)
+        cls.warehouse = Warehouse.objects.create(tenant=cls.tenant, code='MAIN', name='Main')
+
+        party = Party.objects.create(tenant=cls.tenant, party_type='CUSTOMER', code='C1', display_name='Cust')
+        cls.customer = Customer.objects.create(tenant=cls.tenant, party=party)
+        cls.ship_to = Location.objects.create(
+            tenant=cls.tenant, party=party, code='SHIP', name='Dock', location_type='SHIP_TO',
+        )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+
+    def _location(self, name):
+        return WarehouseLocation.objects.create(
+            tenant=self.tenant, warehouse=self.warehouse, name=name,
+            barcode=f'LOC-{name}', type='STORAGE',
+        )
+
+    def _stock(self, location, item, qty):
+        return StockQuant.objects.create(tenant=self.tenant, item=item, location=location, quantity=qty)
+
+    def _order(self, number, *lines):
+        so = SalesOrder.objects.create(
+            tenant=self.tenant, order_number=number, customer=self.customer, ship_to=self.ship_to,
+        )
+        for line_number, (item, qty) in enumerate(lines, start=1):
+            SalesOrderLine.objects.create(
+                tenant=self.tenant, sales_order=so, line_number=line_number * 10,
+                item=item, quantity_ordered=qty, uom=self.uom, unit_price=Decimal('1.00'),
+            )
+        return so
+
+    def test_serpentine_order(self):
+        names = ['B-05-1', 'A-10-1', 'B-01-1', 'A-02-1', 'C-03-1', 'A-02-3']
+        locations = [self._location(name) for name in names]
+
+        ordered = PickPathPlanner(self.tenant).order(
+            [{'location': loc} for loc in locations],
+        )
+
+        # Up aisle A, down aisle B, up aisle C; levels bottom to top
+        self.assertEqual(
+            [entry['location'].name for entry in ordered],
+            ['A-02-1', 'A-02-3', 'A-10-1', 'B-05-1', 'B-01-1', 'C-03-1'],
+        )
+
+    def test_bin_coordinates_override_name(self):
+        dock = self._location('DOCK-FLOOR')
+        far = self._location('ZZ-99-1')
+        unplaced = self._location('Overflow')
+        Bin.objects.create(
+            tenant=self.tenant, warehouse=self.warehouse, code='DOCK-FLOOR',
+            aisle='A', rack='01', level='1',
+        )
+
+        ordered = PickPathPlanner(self.tenant).order(
+            [{'location': loc} for loc in (unplaced, far, dock)],
+        )
+
+        self.assertEqual([e['location'] for e in ordered], [dock, far, unplaced])
+
+    def test_wave_merges_bins_across_orders(self):
+        a1 = self._location('A-01-1')
+        b3 = self._location('B-03-1')
+        self._stock(b3, self.item, 10)
+        self._stock(a1, self.item2, 10)
+        so1 = self._order('SO-1', (self.item, 3), (self.item2, 1))
+        so2 = self._order('SO-2', (self.item, 4))
+
+        route = PickPathPlanner(self.tenant).plan_orders([so1, so2])
+
+        self.assertEqual(route['stop_count'], 2)
+        self.assertEqual([stop['location'] for stop in route['stops']], [a1, b3])
+        merged = route['stops'][1]['picks']
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0]['quantity'], Decimal('7'))
+        self.assertEqual([o['order_number'] for o in merged[0]['orders']], ['SO-1', 'SO-2'])
+        # In to bay 1 (4), up to bay 3 and across (8 + 10), back down and across (12 + 10)
+        self.assertEqual(route['total_distance_ft'], Decimal('44'))
+        self.assertEqual(route['unlocated'], [])
+
+    def test_wave_shares_stock_and_reports_shortage(self):
+        self._stock(self._location('A-01-1'), self.item, 5)
+        so1 = self._order('SO-1', (self.item, 4))
+        so2 = self._order('SO-2', (self.item, 4))
+
+        route = PickPathPlanner(self.tenant).plan_orders([so1, so2])
+
+        self.assertEqual(route['stops'][0]['picks'][0]['quantity'], Decimal('5'))
+        self.assertEqual(len(route['unlocated']), 1)
+        self.assertEqual(route['unlocated'][0]['order_number'], 'SO-2')
+        self.assertEqual(route['unlocated'][0]['quantity'], Decimal('3'))
+
+    def test_get_picking_list_returns_walk_order(self):
+        far = self._location('B-09-1')
+        near = self._location('A-01-1')
+        self._stock(far, self.item, 5)
+        self._stock(near, self.item, 5)
+
+        picks = StockMoveService(self.tenant, self.user).get_picking_list(self.item, 8)
+
+        self.assertEqual([p['quant'].location for p in picks], [near, far])
+        self.assertEqual(sum(p['pick_qty'] for p in picks), Decimal('8'))
+
+    def test_pick_wave_api(self):
+        self._stock(self._location('A-01-1'), self.item, 5)
+        so = self._order('SO-1', (self.item, 2))
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.post(
+            '/api/v1/warehouse/pick-wave/', {'sales_orders': [so.pk]}, format='json',
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['stops'][0]['location_name'], 'A-01-1')
+        self.assertEqual(response.data['stops'][0]['picks'][0]['quantity'], '2')
@@ -0,0 +1,130 @@
+# apps/warehousing/tests/test_stock_summary.py
+"""
+Tests for StockSummary maintenance and edge-triggered reorder alerts.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.items.models import UnitOfMeasure, Item
+from apps.reporting.queries import low_stock_alert
+from apps.tenants.models import Tenant
+from apps.warehousing.models import Warehouse, WarehouseLocation, StockQuant, StockSummary
+from apps.warehousing.services import StockMoveService, StockSummaryService
+from shared.managers import set_current_tenant
+
+User = get_user_model()
+
+
+class StockSummaryTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name='Summary Co', subdomain='test-stock-summary')
+        cls.user = User.objects.create_user(username='summaryuser', password='pass')
+        set_current_tenant(cls.tenant)
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code='ea', name='Each')
+        cls.item = Item.objects.create(
+            tenant=cls.tenant, sku='S-1', name='Sprocket', base_uom=cls.uom, reorder_point=10,
+        )
+        cls.warehouse = Warehouse.objects.create(tenant=cls.tenant, code='MAIN', name='Main')
+        cls.dock = WarehouseLocation.objects.create(
+            tenant=cls.tenant, warehouse=cls.warehouse, name='DOCK', barcode='DOCK', type='RECEIVING',
+        )
+        cls.shelf = WarehouseLocation.objects.create(
+            tenant=cls.tenant, warehouse=cls.warehouse, name='A-01-1', barcode='A011', type='STORAGE',
+        )
+        cls.scrap = WarehouseLocation.objects.create(
+            tenant=cls.tenant, warehouse=cls.warehouse, name='SCRAP', barcode='SCRAP', type='INTERNAL',
+        )
+
+    def setUp(self):
+        set_current_tenant(self.tenant)
+        self.svc = StockMoveService(self.tenant, self.user)
+
+    def summary(self):
+        return StockSummary.objects.get(item=self.item)
+
+    def test_totals_follow_quant_changes(self):
+        self.svc.create_putaway_quant(self.item, 30, self.dock)
+        self.svc.execute_stock_move(self.item, 30, self.dock, self.shelf)  # deletes the dock quant
+        self.svc.reserve_stock(self.item, 12)
+        StockQuant.objects.create(tenant=self.tenant, item=self.item, location=self.scrap, quantity=5)
+
+        summary = self.summary()
+        self.assertEqual(summary.on_hand, Decimal('35'))
+        self.assertEqual(summary.reserved, Decimal('12'))
+        self.assertEqual(StockSummaryService(self.tenant).rebuild(verify_only=True), [])
+
+    def test_move_does_not_resum_quants(self):
+        self.svc.create_putaway_quant(self.item, 30, self.dock)
+        with CaptureQueriesContext(connection) as ctx:
+            self.svc.execute_stock_move(self.item, 5, self.dock, self.shelf)
+        self.assertFalse([q for q in ctx.captured_queries if 'SUM(' in q['sql'].upper()])
+
+    @patch('apps.notifications.services.notify_group')
+    def test_alert_fires_once_per_crossing(self, mock_notify):
+        self.svc.create_putaway_quant(self.item, 15, self.shelf)
+        self.svc.execute_stock_move(self.item, 6, self.shelf, self.scrap)
+        mock_notify.assert_not_called()  # total on hand is still 15
+
+        StockQuant.objects.filter(location=self.scrap).get().delete()  # scrapped: 9 left
+        for _ in range(3):
+            self.svc.execute_stock_move(self.item, 1, self.shelf, self.dock)
+            self.svc.execute_stock_move(self.item, 1, self.dock, self.shelf)
+
+        mock_notify.assert_called_once()
+        self.assertEqual(mock_notify.call_args.kwargs['title'], 'Reorder Alert: S-1')
+        self.assertTrue(self.summary().below_reorder)
+
+    @patch('apps.notifications.services.notify_group')
+    def test_replenishment_rearms_and_debounce_applies(self, mock_notify):
+        summaries = StockSummaryService(self.tenant)
+        self.svc.create_putaway_quant(self.item, 5, self.shelf)
+        self.assertEqual(mock_notify.call_count, 1)
+
+        # Back above the point, then straight back down: within the window
+        self.svc.create_putaway_quant(self.item, 20, self.shelf)
+        self.assertFalse(self.summary().below_reorder)
+        StockQuant.objects.filter(item=self.item).update(quantity=3)
+        summaries.refresh([self.item.pk])
+        self.assertFalse(summaries.check_reorder(self.item))
+        self.assertEqual(mock_notify.call_count, 1)
+
+        # Next crossing after the window alerts again
+        StockSummary.objects.filter(item=self.item).update(
+            below_reorder=False, reorder_alerted_at=timezone.now() - timedelta(hours=2),
+        )
+        self.assertTrue(summaries.check_reorder(self.item))
+        self.assertEqual(mock_notify.call_count, 2)
+
+    def test_rebuild_repairs_bulk_writes(self):
+        StockQuant.objects.create(tenant=self.tenant, item=self.item, location=self.shelf, quantity=8)
+        StockQuant.objects.filter(item=self.item).update(quantity=2)
+        summaries = StockSummaryService(self.tenant)
+
+        problems = summaries.rebuild(verify_only=True)
+        self.assertEqual(len(problems), 1)
+        self.assertEqual(self.summary().on_hand, Decimal('8'))
+
+        summaries.rebuild()
+        self.assertEqual(self.summary().on_hand, Decimal('2'))
+
+    def test_low_stock_alert_reads_summary(self):
+        other = Item.objects.create(
+            tenant=self.tenant, sku='S-2', name='Spring', base_uom=self.uom, reorder_point=4,
+        )
+        StockQuant.objects.create(tenant=self.tenant, item=self.item, location=self.shelf, quantity=6)
+        StockQuant.objects.create(tenant=self.tenant, item=other, location=self.shelf, quantity=9)
+
+        with self.assertNumQueries(1):
+            rows = low_stock_alert(self.tenant)
+
+        self.assertEqual([r['item_sku'] for r in rows], ['S-1'])
+        self.assertEqual(Decimal(rows[0]['shortage']), Decimal('4'))
@@ -2,7 +2,7 @@ import { useQuery } from '@tanstack/react-query'
 import api from './client'
 import type { PipelineNode, PipelineStageKey } from '../components/pipeline/PipelineProgress'
 
-/** One lineage edge as returned by GET /document-links/for-object/. */
+/** One lineage edge as returned by GET /document-links/for-object/ and /lineage/. */
 export interface DocumentLink {
   id: number
   relation: string
@@ -18,6 +18,14 @@ export interface DocumentLink {
   created_by: number | null
   created_by_name: string | null
   created_at: string
+  /** Lineage only: which way from the viewed record, and how many hops. */
+  direction?: 'upstream' | 'downstream'
+  depth?: number
+}
+
+/** GET /document-links/lineage/: every edge reachable from a record. */
+interface DocumentLineage {
+  links: DocumentLink[]
 }
 
 /**
@@ -72,15 +80,15 @@ export function nodesFromLinks(links: DocumentLink[]): PipelineNode[] {
   return Array.from(seen.values())
 }
 
-/** Fetch the full lineage chain for a document (links where it is source OR target). */
+/** Fetch the full upstream/downstream lineage chain for a document in one request. */
 export function useDocumentLinks(appLabel: string, modelName: string, objectId: number) {
   return useQuery({
     queryKey: ['document-links', appLabel, modelName, objectId],
     queryFn: async () => {
-      const { data } = await api.get<DocumentLink[]>('/document-links/for-object/', {
+      const { data } = await api.get<DocumentLineage>('/document-links/lineage/', {
         params: { app_label: appLabel, model: modelName, object_id: objectId },
       })
-      return data
+      return data.links
     },
     enabled: !!objectId,
   })
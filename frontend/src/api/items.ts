@@ -34,7 +34,7 @@ export function useAllItems(
 ) {
   return useQuery({
     queryKey: ['items', 'all', params],
-    queryFn: () => fetchAllPages<Item>(api, '/items/', params as Record<string, unknown> | undefined),
+    queryFn: () => fetchAllPages<Item>(api, '/items/', params as Record<string, unknown> | undefined, { keyset: true }),
     staleTime: 60_000,
     enabled: options?.enabled ?? true,
   })
@@ -593,13 +593,27 @@ export function useSimilarItems(itemId: number | null) {
 // ITEM HISTORY (Item 360)
 // =============================================================================
 
-export function useItemHistory(itemId: number | null) {
-  return useQuery({
-    queryKey: ['item-history', itemId],
-    queryFn: async () => {
-      const { data } = await api.get<ItemHistoryEntry[]>(`/items/${itemId}/history/`)
+interface ItemHistoryPage {
+  next: string | null
+  results: ItemHistoryEntry[]
+}
+
+/**
+ * Item 360 history, newest first, in keyset pages (`?cursor=`). Popular SKUs
+ * have tens of thousands of lines, so pages load on demand via fetchNextPage.
+ */
+export function useItemHistory(itemId: number | null, pageSize = 100) {
+  return useInfiniteQuery({
+    queryKey: ['item-history', itemId, pageSize],
+    initialPageParam: '',
+    queryFn: async ({ pageParam }) => {
+      const { data } = await api.get<ItemHistoryPage>(`/items/${itemId}/history/`, {
+        params: { cursor: pageParam, page_size: pageSize },
+      })
       return data
     },
+    getNextPageParam: (lastPage) =>
+      lastPage.next ? new URL(lastPage.next).searchParams.get('cursor') ?? undefined : undefined,
     enabled: !!itemId,
   })
 }
@@ -247,6 +247,38 @@ export function useInitializeRun() {
   })
 }
 
+export interface RunSequenceResult {
+  run: number
+  estimated_miles: string | null
+  stops: DeliveryStopListItem[]
+  unlocated_stops: number[]
+}
+
+export function useSequenceRun() {
+  const queryClient = useQueryClient()
+  return useMutation({
+    mutationFn: async (runId: number) => {
+      const { data } = await api.post<RunSequenceResult>(`/logistics/runs/${runId}/sequence/`)
+      return data
+    },
+    onSuccess: (data) => {
+      queryClient.invalidateQueries({ queryKey: ['delivery-stops'] })
+      if (data.stops.length === 0) {
+        toast.info('No delivery stops yet. Initialize the run first.')
+        return
+      }
+      const miles = data.estimated_miles ? ` (~${data.estimated_miles} mi)` : ''
+      const unlocated = data.unlocated_stops.length
+        ? `; ${data.unlocated_stops.length} without coordinates placed last`
+        : ''
+      toast.success(`Stops sequenced${miles}${unlocated}`)
+    },
+    onError: (error: ApiError) => {
+      toast.error(getApiErrorMessage(error, 'Failed to sequence run'))
+    },
+  })
+}
+
 export function useDriverManifest() {
   return useQuery({
     queryKey: ['driver-manifest'],
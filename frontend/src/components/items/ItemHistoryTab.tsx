@@ -2,6 +2,7 @@ import { useMemo } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { type ColumnDef } from '@tanstack/react-table'
 import { Badge } from '@/components/ui/badge'
+import { Button } from '@/components/ui/button'
 import { DataTable } from '@/components/ui/data-table'
 import { useItemHistory, type ItemHistoryEntry } from '@/api/items'
 
@@ -20,7 +21,8 @@ const typeRoutes: Record<string, string> = {
 }
 
 export function ItemHistoryTab({ itemId }: { itemId: number }) {
-  const { data: history, isLoading } = useItemHistory(itemId)
+  const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } = useItemHistory(itemId)
+  const history = useMemo(() => data?.pages.flatMap((page) => page.results) ?? [], [data])
   const navigate = useNavigate()
 
   const columns: ColumnDef<ItemHistoryEntry>[] = useMemo(
@@ -98,7 +100,7 @@ export function ItemHistoryTab({ itemId }: { itemId: number }) {
     )
   }
 
-  if (!history || history.length === 0) {
+  if (history.length === 0) {
     return (
       <div className="text-center py-12 text-muted-foreground">
         No transaction history found for this item.
@@ -107,15 +109,24 @@ export function ItemHistoryTab({ itemId }: { itemId: number }) {
   }
 
   return (
-    <DataTable
-      columns={columns}
-      data={history}
-      searchColumn="party_name"
-      searchPlaceholder="Search by party name..."
-      onRowClick={(row) => {
-        const route = typeRoutes[row.type]
-        if (route) navigate(route)
-      }}
-    />
+    <div className="space-y-3">
+      <DataTable
+        columns={columns}
+        data={history}
+        searchColumn="party_name"
+        searchPlaceholder="Search by party name..."
+        onRowClick={(row) => {
+          const route = typeRoutes[row.type]
+          if (route) navigate(route)
+        }}
+      />
+      {hasNextPage && (
+        <div className="flex justify-center">
+          <Button variant="outline" size="sm" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+            {isFetchingNextPage ? 'Loading...' : 'Load older history'}
+          </Button>
+        </div>
+      )}
+    </div>
   )
 }
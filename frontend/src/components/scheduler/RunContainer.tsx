@@ -5,6 +5,7 @@ import { CSS } from '@dnd-kit/utilities'
 import { useSchedulerStore, selectRun } from './useSchedulerStore'
 import { ManifestLine, type CollapsedGroup } from './ManifestLine'
 import { useUpdateDeliveryRun, useDeleteDeliveryRun } from '@/api/scheduling'
+import { useSequenceRun } from '@/api/logistics'
 
 // ─── RunContainer ────────────────────────────────────────────────────────────
 
@@ -20,6 +21,7 @@ export const RunContainer = memo(function RunContainer({ runId, isInbound }: Run
   const deleteRunStore = useSchedulerStore((s) => s.deleteRun)
   const updateRunMutation = useUpdateDeliveryRun()
   const deleteRunMutation = useDeleteDeliveryRun()
+  const sequenceRunMutation = useSequenceRun()
   const [showNoteMenu, setShowNoteMenu] = useState(false)
   const [showDeleteConfirm, setShowDeleteConfirm] = useState(false)
   const [noteInput, setNoteInput] = useState('')
@@ -193,6 +195,8 @@ export const RunContainer = memo(function RunContainer({ runId, isInbound }: Run
   if (!run) return null
 
   const isEmptyRun = run.orderIds.length === 0
+  // Local-only runs (e.g. "run-1234567890-1") have no delivery stops yet
+  const persistedRunId = parseInt(runId, 10)
 
   const sortableOrderIds = run.orderIds
 
@@ -282,6 +286,23 @@ export const RunContainer = memo(function RunContainer({ runId, isInbound }: Run
               )}
             </>
           )}
+          {/* Route button - orders the run's delivery stops by distance */}
+          {!isEmptyRun && !isInbound && !isNaN(persistedRunId) && (
+            <button
+              type="button"
+              onClick={(e) => {
+                e.stopPropagation()
+                sequenceRunMutation.mutate(persistedRunId)
+              }}
+              disabled={sequenceRunMutation.isPending}
+              className="p-0.5 rounded hover:bg-white/20 transition-colors disabled:opacity-40"
+              title="Sequence delivery stops by route"
+            >
+              <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" fill="currentColor" className="w-3.5 h-3.5 opacity-70 hover:opacity-100">
+                <path fillRule="evenodd" d="M4 2.5a1.5 1.5 0 1 0 0 3 1.5 1.5 0 0 0 0-3ZM1 4a3 3 0 0 1 5.83-1H10a3 3 0 0 1 0 6H6a1.5 1.5 0 0 0 0 3h3.17a3 3 0 1 1 0 1.5H6a3 3 0 0 1 0-6h4a1.5 1.5 0 0 0 0-3H6.83A3 3 0 0 1 1 4Zm11 7.5a1.5 1.5 0 1 0 0 3 1.5 1.5 0 0 0 0-3Z" clipRule="evenodd" />
+              </svg>
+            </button>
+          )}
           {/* Delete button - only shown for empty runs */}
           {isEmptyRun && !isInbound && (
             <button
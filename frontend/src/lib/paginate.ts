@@ -1,7 +1,9 @@
 import { type AxiosInstance } from 'axios'
 
 export interface DrfPaginatedResponse<T> {
-  count: number
+  // Absent on keyset pages, which skip COUNT(*).
+  count?: number
+  count_estimate?: number
   next: string | null
   previous: string | null
   results: T[]
@@ -10,6 +12,18 @@ export interface DrfPaginatedResponse<T> {
 const DEFAULT_PAGE_SIZE = 200
 const DEFAULT_MAX_PAGES = 50
 
+function parseNextUrl(nextUrl: string): URL | null {
+  try {
+    // URL constructor needs an absolute URL; DRF always returns absolute next URLs,
+    // but fall back to a synthetic base if a relative URL ever shows up.
+    return nextUrl.startsWith('http')
+      ? new URL(nextUrl)
+      : new URL(nextUrl, 'http://localhost')
+  } catch {
+    return null
+  }
+}
+
 /**
  * Extract the `page` query parameter from a DRF `next` URL.
  *
@@ -20,19 +34,18 @@ const DEFAULT_MAX_PAGES = 50
  * Returns null if the URL has no `page` query parameter (i.e. it's the first page).
  */
 function parseNextPage(nextUrl: string): number | null {
-  try {
-    // URL constructor needs an absolute URL; DRF always returns absolute next URLs,
-    // but fall back to a synthetic base if a relative URL ever shows up.
-    const url = nextUrl.startsWith('http')
-      ? new URL(nextUrl)
-      : new URL(nextUrl, 'http://localhost')
-    const page = url.searchParams.get('page')
-    if (!page) return null
-    const parsed = parseInt(page, 10)
-    return Number.isFinite(parsed) && parsed > 0 ? parsed : null
-  } catch {
-    return null
-  }
+  const page = parseNextUrl(nextUrl)?.searchParams.get('page')
+  if (!page) return null
+  const parsed = parseInt(page, 10)
+  return Number.isFinite(parsed) && parsed > 0 ? parsed : null
+}
+
+/**
+ * Extract the `cursor` query parameter from a keyset-paginated `next` URL, or
+ * null when the endpoint answered with page numbers instead.
+ */
+function parseNextCursor(nextUrl: string): string | null {
+  return parseNextUrl(nextUrl)?.searchParams.get('cursor') || null
 }
 
 /**
@@ -45,22 +58,28 @@ function parseNextPage(nextUrl: string): number | null {
  *      configured axios interceptors (auth, token refresh) still run.
  *   3. Caps total pages at `opts?.maxPages ?? 50` (10,000 rows by default); throws
  *      a clear error if exceeded, so callers know they need server-side filtering.
+ *
+ * With `opts.keyset`, the first request sends an empty `cursor` and each following
+ * request sends the cursor from `next`, so endpoints using KeysetPagination serve
+ * every page without COUNT(*) or a growing OFFSET. Endpoints without keyset support
+ * ignore the cursor and answer with page numbers, which are followed as before.
  */
 export async function fetchAllPages<T>(
   api: AxiosInstance,
   url: string,
   params?: Record<string, unknown>,
-  opts?: { maxPages?: number }
+  opts?: { maxPages?: number; keyset?: boolean }
 ): Promise<T[]> {
   const maxPages = opts?.maxPages ?? DEFAULT_MAX_PAGES
   const baseParams = { ...(params ?? {}), page_size: DEFAULT_PAGE_SIZE }
 
   const results: T[] = []
   let page = 1
+  let cursor: string | null = opts?.keyset ? '' : null
 
   while (page <= maxPages) {
     const { data } = await api.get<DrfPaginatedResponse<T>>(url, {
-      params: { ...baseParams, page },
+      params: cursor !== null ? { ...baseParams, cursor } : { ...baseParams, page },
     })
     if (Array.isArray(data?.results)) {
       results.push(...data.results)
@@ -68,6 +87,17 @@ export async function fetchAllPages<T>(
     if (!data?.next) {
       return results
     }
+    if (cursor !== null) {
+      const nextCursor = parseNextCursor(data.next)
+      if (nextCursor !== null) {
+        if (nextCursor === cursor) return results
+        cursor = nextCursor
+        page += 1
+        continue
+      }
+      // Endpoint fell back to page numbers; follow those instead.
+      cursor = null
+    }
     const nextPage = parseNextPage(data.next)
     // If we can't parse a page number, assume the response is malformed and stop.
     if (nextPage === null || nextPage <= page) {
@@ -396,7 +396,7 @@ export default function Items() {
                 const all = await fetchAllPages<Item>(api, '/items/', {
                   ...(lifecycleFilter === 'all' ? {} : { lifecycle_status: lifecycleFilter }),
                   ...(debouncedSearch ? { search: debouncedSearch } : {}),
-                })
+                }, { keyset: true })
                 return all as unknown as Record<string, unknown>[]
               }}
               filename="items"
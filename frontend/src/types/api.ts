@@ -135,6 +135,9 @@ export interface Location {
   is_default: boolean
   is_active: boolean
   full_address: string
+  latitude: string | null
+  longitude: string | null
+  geo_source: '' | 'postal' | 'delivery' | 'manual'
   created_at: string
   updated_at: string
 }
@@ -3,16 +3,51 @@
 Gunicorn configuration for Raven SaaS production deployment.
 
 Handles HTTP requests. WebSocket connections are served by Daphne separately.
+
+Worker profile (GUNICORN_PROFILE env var):
+- sync (default): cpu*2+1 single-threaded processes. Simple, but every slow
+  PDF/report request pins a whole process and each one holds a DB connection.
+- gthread: fewer processes (cpu+1) with GUNICORN_THREADS threads each, so a
+  slow request only ties up a thread. Best RAM/concurrency trade-off on the
+  1 vCPU / 2 GB pilot droplet.
+- uvicorn: ASGI (raven.asgi) under uvicorn workers; async views run without
+  a thread hop. Needs the uvicorn package.
+
+GUNICORN_WORKERS / GUNICORN_THREADS override the per-profile defaults.
+Pair gthread/uvicorn with the pgbouncer service (docker-compose profile
+"pooled") so the extra threads share a small pool of Postgres connections.
+Compare profiles with scripts/loadtest.py.
 """
 import multiprocessing
+import os
+
+profile = os.environ.get('GUNICORN_PROFILE', 'sync').lower()
+cpus = multiprocessing.cpu_count()
 
 # Server socket
 bind = '0.0.0.0:8000'
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = 'sync'
+if profile == 'gthread':
+    wsgi_app = 'raven.wsgi:application'
+    worker_class = 'gthread'
+    workers = cpus + 1
+    threads = 8
+elif profile == 'uvicorn':
+    wsgi_app = 'raven.asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+    workers = cpus + 1
+elif profile == 'sync':
+    wsgi_app = 'raven.wsgi:application'
+    worker_class = 'sync'
+    workers = cpus * 2 + 1
+else:
+    raise RuntimeError(f'Unknown GUNICORN_PROFILE {profile!r} (expected sync, gthread or uvicorn)')
+
+workers = int(os.environ.get('GUNICORN_WORKERS', workers))
+if 'GUNICORN_THREADS' in os.environ:
+    threads = int(os.environ['GUNICORN_THREADS'])
 worker_connections = 1000
 timeout = 120
 keepalive = 5
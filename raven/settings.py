@@ -83,6 +83,7 @@ INSTALLED_APPS = [
     'apps.collaboration',
     'apps.assets',
     'apps.favorites',
+    'apps.search',
     'apps.api',
     # User management
     'users',
@@ -145,6 +146,10 @@ DATABASES = {
         # dropped connection doesn't surface as a request error.
         'CONN_MAX_AGE': config('CONN_MAX_AGE', default=60, cast=int),
         'CONN_HEALTH_CHECKS': True,
+        # Required when DB_HOST points at PgBouncer in transaction pooling mode
+        # (docker-compose profile "pooled"): server-side cursors used by
+        # QuerySet.iterator() can't span pooled transactions.
+        'DISABLE_SERVER_SIDE_CURSORS': config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
     }
 }
 
@@ -285,6 +290,15 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# How long an authenticated user/tenant lookup is reused across requests
+# (apps.api.principals). Invalidated on user/group/tenant changes; 0 disables.
+# Forced to 0 below unless CACHES is shared across worker processes.
+JWT_PRINCIPAL_CACHE_SECONDS = config('JWT_PRINCIPAL_CACHE_SECONDS', default=60, cast=int)
+
+# Longest a driver manifest snapshot (apps.logistics RunManifest) is served
+# before being rebuilt, bounding staleness from edits no signal invalidates.
+DRIVER_MANIFEST_MAX_AGE = config('DRIVER_MANIFEST_MAX_AGE', default=300, cast=int)
+
 # drf-spectacular (OpenAPI/Swagger)
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Raven SaaS API',
@@ -413,6 +427,10 @@ else:
             'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         }
     }
+    # LocMemCache is per process: an invalidation (deactivated user, changed
+    # password, tenant edit) would only reach the worker that made it, and
+    # the others would keep serving the stale principal until it expired.
+    JWT_PRINCIPAL_CACHE_SECONDS = 0
 
 # Sentry (crash + error monitoring)
 # Dormant unless SENTRY_DSN is set, so the user can flip this on without
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Load test the API and compare gunicorn worker profiles.
+
+Hammers a set of existing endpoints from N concurrent clients for a fixed
+duration, then reports throughput and p50/p95/p99 latency per endpoint.
+Standard library only, so it runs from a laptop or the droplet itself.
+
+Typical comparison on the droplet:
+
+    # in .env: GUNICORN_PROFILE=sync, then `docker compose up -d web`
+    python3 scripts/loadtest.py --label sync -o /tmp/sync.json
+
+    # in .env: GUNICORN_PROFILE=gthread (+ COMPOSE_PROFILES=pooled,
+    # WEB_DB_HOST=pgbouncer, DB_DISABLE_SERVER_SIDE_CURSORS=True)
+    python3 scripts/loadtest.py --label gthread -o /tmp/gthread.json
+
+    python3 scripts/loadtest.py --compare /tmp/sync.json /tmp/gthread.json
+
+Credentials come from --username/--password (exchanged for a JWT via
+/api/v1/auth/token/) or --token. Use --endpoint (repeatable) to replace the
+default endpoint mix, e.g. to include a PDF or report URL.
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_ENDPOINTS = [
+    '/api/v1/health/',
+    '/api/v1/items/',
+    '/api/v1/customers/',
+    '/api/v1/sales-orders/',
+    '/api/v1/inventory/balances/',
+    '/api/v1/users/me/',
+]
+
+
+def obtain_token(base_url, username, password):
+    """Exchange credentials for an access token."""
+    request = urllib.request.Request(
+        f'{base_url}/api/v1/auth/token/',
+        data=json.dumps({'username': username, 'password': password}).encode(),
+        headers={'Content-Type': 'application/json'},
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.load(response)['access']
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list (0 for empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(base_url, endpoints, headers, concurrency, duration, timeout):
+    """Run the load and return {endpoint: [(ok, seconds), ...]}."""
+    samples = defaultdict(list)
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(offset):
+        # Each client walks the endpoint list from a different starting point
+        local = []
+        i = offset
+        while time.monotonic() < deadline:
+            path = endpoints[i % len(endpoints)]
+            i += 1
+            request = urllib.request.Request(f'{base_url}{path}', headers=headers)
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    response.read()
+                    ok = 200 <= response.status < 400
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                ok = False
+            local.append((path, ok, time.perf_counter() - started))
+        with lock:
+            for path, ok, seconds in local:
+                samples[path].append((ok, seconds))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(client, range(concurrency)))
+    return samples
+
+
+def summarize(samples, duration, label, concurrency):
+    """Per-endpoint and overall throughput/latency summary (milliseconds)."""
+    def stats(rows):
+        latencies = [seconds * 1000 for ok, seconds in rows if ok]
+        return {
+            'requests': len(rows),
+            'errors': sum(1 for ok, _ in rows if not ok),
+            'rps': round(len(rows) / duration, 2),
+            'p50_ms': round(percentile(latencies, 50), 1),
+            'p95_ms': round(percentile(latencies, 95), 1),
+            'p99_ms': round(percentile(latencies, 99), 1),
+            'mean_ms': round(statistics.fmean(latencies), 1) if latencies else 0.0,
+        }
+
+    all_rows = [row for rows in samples.values() for row in rows]
+    return {
+        'label': label,
+        'concurrency': concurrency,
+        'duration_s': duration,
+        'overall': stats(all_rows),
+        'endpoints': {path: stats(rows) for path, rows in sorted(samples.items())},
+    }
+
+
+def print_summary(summary):
+    print(f"\n{summary['label']}: {summary['concurrency']} clients, {summary['duration_s']}s")
+    print(f"{'endpoint':<34} {'req':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    rows = list(summary['endpoints'].items()) + [('TOTAL', summary['overall'])]
+    for path, s in rows:
+        print(
+            f"{path:<34} {s['requests']:>7} {s['errors']:>5} {s['rps']:>8.1f} "
+            f"{s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f}"
+        )
+
+
+def print_comparison(a, b):
+    """Side-by-side throughput and p95 for two saved runs."""
+    print(f"\n{'endpoint':<34} {'rps ' + a['label']:>14} {'rps ' + b['label']:>14} "
+          f"{'p95 ' + a['label']:>14} {'p95 ' + b['label']:>14}")
+    paths = sorted(set(a['endpoints']) | set(b['endpoints']))
+    empty = {'rps': 0.0, 'p95_ms': 0.0}
+    rows = [(p, a['endpoints'].get(p, empty), b['endpoints'].get(p, empty)) for p in paths]
+    rows.append(('TOTAL', a['overall'], b['overall']))
+    for path, sa, sb in rows:
+        print(f"{path:<34} {sa['rps']:>14.1f} {sb['rps']:>14.1f} {sa['p95_ms']:>14.1f} {sb['p95_ms']:>14.1f}")
+    if a['overall']['rps']:
+        change = (b['overall']['rps'] / a['overall']['rps'] - 1) * 100
+        print(f"\nThroughput {b['label']} vs {a['label']}: {change:+.0f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--base-url', default=os.environ.get('LOADTEST_BASE_URL', 'http://localhost'))
+    parser.add_argument('--username', default=os.environ.get('LOADTEST_USERNAME'))
+    parser.add_argument('--password', default=os.environ.get('LOADTEST_PASSWORD'))
+    parser.add_argument('--token', default=os.environ.get('LOADTEST_TOKEN'))
+    parser.add_argument('--tenant-id', help='Send X-Tenant-ID (superusers / multi-tenant hosts)')
+    parser.add_argument('--endpoint', action='append', dest='endpoints',
+                        help='Path to request (repeatable); defaults to a mix of list endpoints')
+    parser.add_argument('-c', '--concurrency', type=int, default=20)
+    parser.add_argument('-d', '--duration', type=float, default=30.0, help='Seconds')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-request timeout (seconds)')
+    parser.add_argument('--label', default=os.environ.get('GUNICORN_PROFILE', 'run'))
+    parser.add_argument('-o', '--output', help='Write the summary as JSON')
+    parser.add_argument('--compare', nargs=2, metavar=('A.json', 'B.json'),
+                        help='Compare two saved summaries instead of running')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        runs = []
+        for path in args.compare:
+            with open(path) as fh:
+                runs.append(json.load(fh))
+        for summary in runs:
+            print_summary(summary)
+        print_comparison(*runs)
+        return 0
+
+    base_url = args.base_url.rstrip('/')
+    token = args.token
+    if not token:
+        if not (args.username and args.password):
+            parser.error('provide --token or --username/--password')
+        token = obtain_token(base_url, args.username, args.password)
+    headers = {'Authorization': f'Bearer {token}', 'Accept': 'application/json'}
+    if args.tenant_id:
+        headers['X-Tenant-ID'] = args.tenant_id
+
+    samples = run(base_url, args.endpoints or DEFAULT_ENDPOINTS, headers,
+                  args.concurrency, args.duration, args.timeout)
+    summary = summarize(samples, args.duration, args.label, args.concurrency)
+    print_summary(summary)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(summary, fh, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+# shared/history.py
+"""
+Batched django-simple-history writes.
+
+Every model with ``HistoricalRecords()`` issues a second INSERT per ``save()``,
+and Django's ``bulk_create``/``bulk_update`` bypass the ``post_save`` signal,
+so bulk paths silently lose their audit trail. This module provides:
+
+- BatchedHistoricalRecords: drop-in replacement for ``HistoricalRecords`` that
+  honours ``deferred_history()`` and a per-model ``bulk_history`` opt-out
+- deferred_history(): context manager that buffers historical rows and writes
+  them with one ``bulk_create`` per history model on transaction commit
+- bulk_create_with_history / bulk_update_with_history: bulk writes that keep
+  history (or skip it for opted-out models)
+
+Usage:
+    from shared.history import deferred_history, bulk_update_with_history
+
+    with transaction.atomic(), deferred_history():
+        for balance in balances:
+            balance.save()          # history rows buffered, not inserted
+        bulk_update_with_history(lines, InvoiceLine, ['quantity'])
+
+    # After commit: one INSERT per history table.
+
+High-churn models declare ``history = BatchedHistoricalRecords(bulk_history=False)``.
+Their single ``save()`` calls outside a batch still write history as usual,
+but bulk helpers and ``deferred_history()`` blocks skip it entirely.
+"""
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from simple_history import utils as history_utils
+from simple_history.models import HistoricalRecords
+
+# Batch size for the deferred history INSERTs
+HISTORY_BATCH_SIZE = 500
+
+_thread_locals = threading.local()
+
+
+def _get_buffer():
+    """Return the active deferred-history buffer, or None."""
+    return getattr(_thread_locals, 'history_buffer', None)
+
+
+def history_enabled_for(model):
+    """
+    Return True if ``model`` writes history in bulk/deferred paths.
+
+    False for models without ``HistoricalRecords`` and for models declared
+    with ``BatchedHistoricalRecords(bulk_history=False)``.
+    """
+    if not getattr(settings, 'SIMPLE_HISTORY_ENABLED', True):
+        return False
+    if not hasattr(model._meta, 'simple_history_manager_attribute'):
+        return False
+    return getattr(model, '_bulk_history', True)
+
+
+class BatchedHistoricalRecords(HistoricalRecords):
+    """
+    ``HistoricalRecords`` that can buffer its INSERTs.
+
+    Inside ``deferred_history()`` the historical row is built as usual but
+    appended to the active buffer instead of being saved. Outside a batch
+    it behaves exactly like ``HistoricalRecords``.
+
+    Args:
+        bulk_history: Set False for high-churn models (e.g. InventoryBalance)
+            to skip history in bulk helpers and deferred blocks.
+    """
+
+    def __init__(self, *args, bulk_history=True, **kwargs):
+        self.bulk_history = bulk_history
+        super().__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name):
+        super().contribute_to_class(cls, name)
+        cls._bulk_history = self.bulk_history
+
+    def create_historical_record(self, instance, history_type, using=None):
+        buffer = _get_buffer()
+        if buffer is None or self.m2m_fields:
+            return super().create_historical_record(instance, history_type, using=using)
+        if not self.bulk_history:
+            return None
+
+        manager = getattr(instance, self.manager_name)
+        attrs = {
+            field.attname: getattr(instance, field.attname)
+            for field in self.fields_included(instance)
+        }
+        if getattr(manager.model, 'history_relation', None) is not None:
+            attrs['history_relation'] = instance
+
+        buffer.add(manager.model(
+            history_date=getattr(instance, '_history_date', timezone.now()),
+            history_type=history_type,
+            history_user=self.get_history_user(instance),
+            history_change_reason=self.get_change_reason_for_object(
+                instance, history_type, using,
+            ),
+            **attrs,
+        ))
+        return None
+
+
+class _HistoryBuffer:
+    """Historical rows pending insertion, grouped by history model."""
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.rows = {}
+
+    def add(self, row):
+        self.rows.setdefault(type(row), []).append(row)
+
+    def extend(self, rows):
+        for row in rows:
+            self.add(row)
+
+    def flush(self):
+        rows, self.rows = self.rows, {}
+        for history_model, history_rows in rows.items():
+            history_model.objects.bulk_create(history_rows, batch_size=self.batch_size)
+
+
+@contextmanager
+def deferred_history(batch_size=HISTORY_BATCH_SIZE):
+    """
+    Buffer historical rows created in this block and insert them in bulk.
+
+    Inside an atomic block the buffer is flushed via ``transaction.on_commit``
+    (so a rollback writes no history); otherwise it is flushed on exit.
+    Nested calls share the outermost buffer.
+    """
+    if _get_buffer() is not None:
+        yield _get_buffer()
+        return
+
+    buffer = _HistoryBuffer(batch_size)
+    _thread_locals.history_buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _thread_locals.history_buffer = None
+
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(buffer.flush)
+    else:
+        buffer.flush()
+
+
+def _build_history_rows(objs, model, history_type, default_user=None, default_change_reason=''):
+    """Build unsaved historical rows for already-written ``objs``."""
+    history_model = history_utils.get_history_model_for_model(model)
+    now = timezone.now()
+    rows = []
+    for obj in objs:
+        row = history_model(
+            history_date=getattr(obj, '_history_date', now),
+            history_user=getattr(obj, '_history_user', default_user),
+            history_change_reason=(
+                history_utils.get_change_reason_from_object(obj) or default_change_reason
+            ),
+            history_type=history_type,
+            **{field.attname: getattr(obj, field.attname) for field in history_model.tracked_fields},
+        )
+        if hasattr(history_model, 'history_relation'):
+            row.history_relation_id = obj.pk
+        rows.append(row)
+    return rows
+
+
+def bulk_create_with_history(objs, model, batch_size=None, default_user=None,
+                             default_change_reason=''):
+    """
+    ``bulk_create`` that also records a '+' historical row per object.
+
+    Inside ``deferred_history()`` the historical rows join the buffer;
+    otherwise they are inserted in the same transaction. Opted-out models
+    get a plain ``bulk_create``.
+
+    Returns:
+        List of created objects (with PKs on backends that support it)
+    """
+    if not history_enabled_for(model):
+        return model._default_manager.bulk_create(objs, batch_size=batch_size)
+
+    buffer = _get_buffer()
+    if buffer is None:
+        return history_utils.bulk_create_with_history(
+            objs, model,
+            batch_size=batch_size,
+            default_user=default_user,
+            default_change_reason=default_change_reason,
+        )
+
+    created = model._default_manager.bulk_create(objs, batch_size=batch_size)
+    buffer.extend(_build_history_rows(
+        created, model, '+', default_user, default_change_reason,
+    ))
+    return created
+
+
+def bulk_update_with_history(objs, model, fields, batch_size=None, default_user=None,
+                             default_change_reason=''):
+    """
+    ``bulk_update`` that also records a '~' historical row per object.
+
+    Same buffering and opt-out rules as ``bulk_create_with_history``.
+
+    Returns:
+        Number of rows updated (history rows not included)
+    """
+    if not history_enabled_for(model):
+        return model._default_manager.bulk_update(objs, fields, batch_size=batch_size)
+
+    buffer = _get_buffer()
+    if buffer is None:
+        return history_utils.bulk_update_with_history(
+            objs, model, fields,
+            batch_size=batch_size,
+            default_user=default_user,
+            default_change_reason=default_change_reason,
+        )
+
+    updated = model._default_manager.bulk_update(objs, fields, batch_size=batch_size)
+    buffer.extend(_build_history_rows(
+        objs, model, '~', default_user, default_change_reason,
+    ))
+    return updated
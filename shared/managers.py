@@ -3,23 +3,55 @@
 Tenant-scoped manager with automatic query filtering.
 
 CRITICAL: This prevents data leaks between tenants by automatically
-filtering all queries to the current tenant from thread-local storage.
+filtering all queries to the current tenant from the tenant context.
+
+The current tenant lives in a ``contextvars.ContextVar`` rather than a
+thread-local, so it is isolated per request under ASGI (where many requests
+share one thread) and follows the call through ``sync_to_async`` /
+``database_sync_to_async``, which copy the caller's context.
 """
+import contextvars
+from contextlib import contextmanager
+
 from django.db import models
-import threading
 
-# Thread-local storage for current tenant
-_thread_locals = threading.local()
+# Context-local storage for current tenant
+_current_tenant = contextvars.ContextVar('current_tenant', default=None)
 
 
 def set_current_tenant(tenant):
-    """Set the current tenant in thread-local storage."""
-    _thread_locals.tenant = tenant
+    """
+    Set the current tenant for the rest of the current context.
+
+    Prefer ``tenant_context`` where the scope has a clear end; this is kept
+    for callers (tests, management commands) that set it once up front.
+    """
+    _current_tenant.set(tenant)
 
 
 def get_current_tenant():
-    """Get the current tenant from thread-local storage."""
-    return getattr(_thread_locals, 'tenant', None)
+    """Get the current tenant from the current context."""
+    return _current_tenant.get()
+
+
+@contextmanager
+def tenant_context(tenant):
+    """
+    Scope the current tenant to a block, restoring the previous one on exit.
+
+    Works in sync and async code alike; the tenant is visible inside
+    ``sync_to_async``/``database_sync_to_async`` calls made from the block
+    and never leaks into concurrently running requests or tasks.
+
+    Usage:
+        with tenant_context(tenant):
+            Customer.objects.all()  # scoped to tenant
+    """
+    token = _current_tenant.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _current_tenant.reset(token)
 
 
 class TenantManager(models.Manager):
@@ -27,7 +59,7 @@ class TenantManager(models.Manager):
     Manager that automatically filters all queries by current tenant.
 
     CRITICAL: This prevents accidental data leaks between tenants.
-    Every query will be scoped to the current tenant from thread-local storage.
+    Every query will be scoped to the current tenant from the tenant context.
 
     Usage:
         class MyModel(TenantMixin):
@@ -0,0 +1,96 @@
+# shared/tests.py
+"""
+Tests for shared helpers: batched simple_history writes.
+"""
+from django.db import transaction
+
+from apps.items.models import Item
+from apps.inventory.models import InventoryBalance
+from apps.parties.models import Party, Location
+from apps.warehousing.models import Warehouse
+from shared.history import (
+    deferred_history, bulk_create_with_history, bulk_update_with_history,
+    history_enabled_for,
+)
+from shared.testing import BaseTestCase
+
+
+class BatchedHistoryTestCase(BaseTestCase):
+    """Tests for shared.history."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        party = Party.objects.create(
+            tenant=cls.tenant, party_type='VENDOR', code='HV1', display_name='History Vendor',
+        )
+        location = Location.objects.create(
+            tenant=cls.tenant, party=party, location_type='WAREHOUSE',
+            name='WH', address_line1='1 Main', city='Chicago', state='IL', postal_code='60601',
+        )
+        cls.warehouse = Warehouse.objects.create(
+            tenant=cls.tenant, name='Main', code='MAIN', location=location,
+        )
+
+    def _items(self, count, prefix='H'):
+        return [
+            Item(tenant=self.tenant, sku=f'{prefix}-{i}', name=f'Item {i}', base_uom=self.uom)
+            for i in range(count)
+        ]
+
+    def test_opt_out_flag(self):
+        self.assertTrue(history_enabled_for(Item))
+        self.assertFalse(history_enabled_for(InventoryBalance))
+
+    def test_bulk_create_writes_history(self):
+        items = bulk_create_with_history(self._items(3), Item)
+        self.assertEqual(len(items), 3)
+        self.assertEqual(Item.history.filter(history_type='+').count(), 3)
+
+    def test_bulk_update_writes_history(self):
+        items = bulk_create_with_history(self._items(2), Item)
+        for item in items:
+            item.name = 'Renamed'
+        bulk_update_with_history(items, Item, ['name'])
+        changed = Item.history.filter(history_type='~')
+        self.assertEqual(changed.count(), 2)
+        self.assertTrue(all(h.name == 'Renamed' for h in changed))
+
+    def test_deferred_saves_flush_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            with transaction.atomic(), deferred_history():
+                for item in self._items(4, prefix='D'):
+                    item.save()
+                self.assertEqual(Item.history.count(), 0)
+        self.assertEqual(len(callbacks), 1)
+
+        with self.assertNumQueries(1):
+            callbacks[0]()
+        self.assertEqual(Item.history.filter(history_type='+').count(), 4)
+
+    def test_deferred_skips_opted_out_model(self):
+        item = Item.objects.create(tenant=self.tenant, sku='BAL-1', name='Bal', base_uom=self.uom)
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic(), deferred_history():
+                InventoryBalance.objects.create(
+                    tenant=self.tenant, item=item, warehouse=self.warehouse, on_hand=5,
+                )
+        self.assertEqual(InventoryBalance.history.count(), 0)
+
+    def test_single_save_outside_batch_still_tracked(self):
+        item = Item.objects.create(tenant=self.tenant, sku='BAL-2', name='Bal', base_uom=self.uom)
+        InventoryBalance.objects.create(
+            tenant=self.tenant, item=item, warehouse=self.warehouse, on_hand=5,
+        )
+        self.assertEqual(InventoryBalance.history.count(), 1)
+
+    def test_rollback_discards_buffer(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic(), deferred_history():
+                    self._items(1, prefix='R')[0].save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(callbacks, [])
+        self.assertEqual(Item.history.filter(sku='R-0').count(), 0)